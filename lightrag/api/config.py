@@ -348,6 +348,18 @@ def parse_args() -> argparse.Namespace:
     args.entity_types = get_env_value("ENTITY_TYPES", DEFAULT_ENTITY_TYPES, list)
     args.whitelist_paths = get_env_value("WHITELIST_PATHS", "/health,/api/*")
 
+    # Compression of large JSON responses (graph and document listings)
+    args.response_compression = get_env_value("RESPONSE_COMPRESSION", True, bool)
+    args.response_compression_min_size = get_env_value(
+        "RESPONSE_COMPRESSION_MIN_SIZE", 1024, int
+    )
+
+    # Coalescing of small LLM token chunks into fewer stream frames (0 disables)
+    args.stream_coalesce_min_chars = get_env_value("STREAM_COALESCE_MIN_CHARS", 0, int)
+    args.stream_coalesce_max_delay = get_env_value(
+        "STREAM_COALESCE_MAX_DELAY", 0.05, float
+    )
+
     # For JWT Auth
     args.auth_accounts = get_env_value("AUTH_ACCOUNTS", "")
     args.token_secret = get_env_value("TOKEN_SECRET", "lightrag-jwt-default-secret")
@@ -28,6 +28,7 @@ from lightrag.api.utils_api import (
     get_combined_auth_dependency,
     display_splash_screen,
     check_env_file,
+    FastJSONResponse,
 )
 from .config import (
     global_args,
@@ -364,6 +365,8 @@ def create_app(args):
         "docs_url": "/docs",  # Explicitly set docs URL
         "redoc_url": "/redoc",  # Explicitly set redoc URL
         "lifespan": lifespan,
+        # Serialize JSON responses with orjson when it is installed
+        "default_response_class": FastJSONResponse,
     }
 
     # Configure Swagger UI parameters
@@ -900,6 +903,8 @@ def create_app(args):
                 "auth_mode": auth_mode,
                 "pipeline_busy": pipeline_status.get("busy", False),
                 "keyed_locks": keyed_lock_info,
+                "keyword_cache": rag.get_keyword_cache_stats(),
+                "rerank_cache": rag.get_rerank_cache_stats(),
                 "core_version": core_version,
                 "api_version": __api_version__,
                 "webui_title": webui_title,
@@ -3,6 +3,7 @@ This module contains all document-related routes for the LightRAG API.
 """
 
 import asyncio
+import json
 from lightrag.utils import logger, get_pinyin_sort_key
 import aiofiles
 import shutil
@@ -17,6 +18,7 @@ from fastapi import (
     Depends,
     File,
     HTTPException,
+    Request,
     UploadFile,
 )
 from pydantic import BaseModel, Field, field_validator
@@ -24,7 +26,13 @@ from pydantic import BaseModel, Field, field_validator
 from lightrag import LightRAG
 from lightrag.base import DeletionResult, DocProcessingStatus, DocStatus
 from lightrag.utils import generate_track_id
-from lightrag.api.utils_api import get_combined_auth_dependency
+from lightrag.api.utils_api import (
+    get_combined_auth_dependency,
+    is_not_modified,
+    json_response,
+    make_revision_etag,
+    not_modified_response,
+)
 from ..config import global_args
 
 
@@ -713,6 +721,7 @@ class PipelineStatusResponse(BaseModel):
         latest_message: Latest message from pipeline processing
         history_messages: List of history messages
         update_status: Status of update flags for all namespaces
+        gleaning_stats: Adaptive gleaning counters, including saved LLM calls (optional)
     """
 
     autoscanned: bool = False
@@ -726,6 +735,7 @@ class PipelineStatusResponse(BaseModel):
     latest_message: str = ""
     history_messages: Optional[List[str]] = None
     update_status: Optional[dict] = None
+    gleaning_stats: Optional[dict] = None
 
     @field_validator("job_start", mode="before")
     @classmethod
@@ -1449,6 +1459,49 @@ async def pipeline_index_texts(
     await rag.apipeline_process_enqueue_documents()
 
 
+async def iter_ndjson_texts(request: Request):
+    """Yield the documents of an NDJSON request body as it is received
+
+    Each non-empty line is a JSON string or an object with "text" and the optional
+    "file_source" and "id" fields.
+
+    Raises:
+        ValueError: On a line that is not valid JSON or has no text
+    """
+    buffer = b""
+    line_number = 0
+
+    def parse(line: bytes) -> dict[str, Any] | None:
+        line = line.strip()
+        if not line:
+            return None
+        try:
+            item = json.loads(line)
+        except ValueError as e:
+            raise ValueError(f"Invalid JSON on line {line_number}: {e}") from e
+        if isinstance(item, str):
+            item = {"text": item}
+        if not isinstance(item, dict) or not isinstance(item.get("text"), str):
+            raise ValueError(f"Line {line_number} has no text")
+        item["text"] = item["text"].strip()
+        if isinstance(item.get("file_source"), str):
+            item["file_source"] = item["file_source"].strip()
+        return item
+
+    async for data in request.stream():
+        buffer += data
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            line_number += 1
+            item = parse(line)
+            if item is not None:
+                yield item
+    line_number += 1
+    item = parse(buffer)
+    if item is not None:
+        yield item
+
+
 async def run_scanning_process(
     rag: LightRAG, doc_manager: DocumentManager, track_id: str = None
 ):
@@ -1985,6 +2038,61 @@ def create_document_routes(
             logger.error(traceback.format_exc())
             raise HTTPException(status_code=500, detail=str(e))
 
+    @router.post(
+        "/texts/stream",
+        response_model=InsertResponse,
+        dependencies=[Depends(combined_auth)],
+    )
+    async def insert_texts_stream(request: Request):
+        """
+        Insert texts streamed as NDJSON, one document per line.
+
+        Each line is a JSON string or an object like
+        `{"text": "...", "file_source": "...", "id": "..."}` where file_source and id
+        are optional. The body is read incrementally: documents are enqueued in
+        batches and indexed while the upload is still running. Reading pauses while
+        INSERT_STREAM_MAX_IN_FLIGHT documents are waiting to be processed, which
+        slows the upload down instead of buffering it in memory. The response is
+        returned once the whole body is enqueued, processing continues in background.
+
+        Args:
+            request (Request): The request with an NDJSON body (application/x-ndjson)
+
+        Returns:
+            InsertResponse: A response object containing the status of the operation.
+
+        Raises:
+            HTTPException: If a line is not valid (400) or an error occurs (500).
+        """
+        track_id = generate_track_id("insert")
+        received = 0
+
+        async def counted_texts():
+            nonlocal received
+            async for item in iter_ndjson_texts(request):
+                received += 1
+                yield item
+
+        try:
+            await rag.ainsert_stream(
+                counted_texts(), track_id=track_id, wait_for_completion=False
+            )
+            return InsertResponse(
+                status="success",
+                message=f"{received} texts successfully received. Processing will continue in background.",
+                track_id=track_id,
+            )
+        except ValueError as e:
+            logger.error(f"Error /documents/texts/stream: {str(e)}")
+            raise HTTPException(
+                status_code=400,
+                detail=f"{e}. {received} texts before it were enqueued (track_id: {track_id}).",
+            )
+        except Exception as e:
+            logger.error(f"Error /documents/texts/stream: {str(e)}")
+            logger.error(traceback.format_exc())
+            raise HTTPException(status_code=500, detail=str(e))
+
     @router.delete(
         "", response_model=ClearDocumentsResponse, dependencies=[Depends(combined_auth)]
     )
@@ -2272,7 +2380,7 @@ def create_document_routes(
     @router.get(
         "", response_model=DocsStatusesResponse, dependencies=[Depends(combined_auth)]
     )
-    async def documents() -> DocsStatusesResponse:
+    async def documents(request: Request) -> DocsStatusesResponse:
         """
         Get the status of all documents in the system. This endpoint is deprecated; use /documents/paginated instead.
         To prevent excessive resource consumption, a maximum of 1,000 records is returned.
@@ -2286,11 +2394,17 @@ def create_document_routes(
                                 DocStatus values and values are lists of DocStatusResponse
                                 objects representing documents in each status category.
                                 Maximum 1000 documents total will be returned.
+                                Returns 304 Not Modified when If-None-Match matches the
+                                ETag and no document status has changed since.
 
         Raises:
             HTTPException: If an error occurs while retrieving document statuses (500).
         """
         try:
+            etag = make_revision_etag("documents", rag.doc_status.get_revision())
+            if is_not_modified(request, etag):
+                return not_modified_response(etag)
+
             statuses = (
                 DocStatus.PENDING,
                 DocStatus.PROCESSING,
@@ -2364,7 +2478,7 @@ def create_document_routes(
                 # Move to next status (round-robin)
                 current_status_idx = (current_status_idx + 1) % len(status_documents)
 
-            return response
+            return await json_response(request, response, etag)
         except Exception as e:
             logger.error(f"Error GET /documents: {str(e)}")
             logger.error(traceback.format_exc())
@@ -4,11 +4,17 @@ This module contains all graph-related routes for the LightRAG API.
 
 from typing import Optional, Dict, Any
 import traceback
-from fastapi import APIRouter, Depends, Query, HTTPException
+from fastapi import APIRouter, Depends, Query, HTTPException, Request
 from pydantic import BaseModel, Field
 
 from lightrag.utils import logger
-from ..utils_api import get_combined_auth_dependency
+from ..utils_api import (
+    get_combined_auth_dependency,
+    is_not_modified,
+    json_response,
+    make_revision_etag,
+    not_modified_response,
+)
 
 router = APIRouter(tags=["graph"])
 
@@ -89,15 +95,23 @@ def create_graph_routes(rag, api_key: Optional[str] = None):
     combined_auth = get_combined_auth_dependency(api_key)
 
     @router.get("/graph/label/list", dependencies=[Depends(combined_auth)])
-    async def get_graph_labels():
+    async def get_graph_labels(request: Request):
         """
         Get all graph labels
 
+        Supports conditional requests: an If-None-Match matching the returned ETag
+        yields 304 Not Modified while the graph is unchanged.
+
         Returns:
             List[str]: List of graph labels
         """
         try:
-            return await rag.get_graph_labels()
+            etag = make_revision_etag(
+                "labels", rag.chunk_entity_relation_graph.get_revision()
+            )
+            if is_not_modified(request, etag):
+                return not_modified_response(etag)
+            return await json_response(request, await rag.get_graph_labels(), etag)
         except Exception as e:
             logger.error(f"Error getting graph labels: {str(e)}")
             logger.error(traceback.format_exc())
@@ -157,6 +171,7 @@ def create_graph_routes(rag, api_key: Optional[str] = None):
 
     @router.get("/graphs", dependencies=[Depends(combined_auth)])
     async def get_knowledge_graph(
+        request: Request,
         label: str = Query(..., description="Label to get knowledge graph for"),
         max_depth: int = Query(3, description="Maximum depth of graph", ge=1),
         max_nodes: int = Query(1000, description="Maximum nodes to return", ge=1),
@@ -172,6 +187,9 @@ def create_graph_routes(rag, api_key: Optional[str] = None):
             max_depth (int, optional): Maximum depth of the subgraph,Defaults to 3
             max_nodes: Maxiumu nodes to return
 
+        Supports conditional requests: an If-None-Match matching the returned ETag
+        yields 304 Not Modified while the graph is unchanged.
+
         Returns:
             Dict[str, List[str]]: Knowledge graph for label
         """
@@ -181,11 +199,22 @@ def create_graph_routes(rag, api_key: Optional[str] = None):
                 f"get_knowledge_graph called with label: '{label}' (length: {len(label)}, repr: {repr(label)})"
             )
 
-            return await rag.get_knowledge_graph(
+            etag = make_revision_etag(
+                "graph",
+                rag.chunk_entity_relation_graph.get_revision(),
+                label,
+                max_depth,
+                max_nodes,
+            )
+            if is_not_modified(request, etag):
+                return not_modified_response(etag)
+
+            knowledge_graph = await rag.get_knowledge_graph(
                 node_label=label,
                 max_depth=max_depth,
                 max_nodes=max_nodes,
             )
+            return await json_response(request, knowledge_graph, etag)
         except Exception as e:
             logger.error(f"Error getting knowledge graph for label '{label}': {str(e)}")
             logger.error(traceback.format_exc())
@@ -11,7 +11,11 @@ import asyncio
 from ascii_colors import trace_exception
 from lightrag import LightRAG, QueryParam
 from lightrag.utils import TiktokenTokenizer
-from lightrag.api.utils_api import get_combined_auth_dependency
+from lightrag.api.utils_api import (
+    coalesce_stream,
+    get_combined_auth_dependency,
+    ndjson_line,
+)
 from fastapi import Depends
 
 
@@ -327,7 +331,7 @@ class OllamaAPI:
                                     "response": response,
                                     "done": False,
                                 }
-                                yield f"{json.dumps(data, ensure_ascii=False)}\n"
+                                yield ndjson_line(data)
 
                                 completion_tokens = estimate_tokens(total_response)
                                 total_time = last_chunk_time - start_time
@@ -348,10 +352,10 @@ class OllamaAPI:
                                     "eval_count": completion_tokens,
                                     "eval_duration": eval_time,
                                 }
-                                yield f"{json.dumps(data, ensure_ascii=False)}\n"
+                                yield ndjson_line(data)
                             else:
                                 try:
-                                    async for chunk in response:
+                                    async for chunk in coalesce_stream(response):
                                         if chunk:
                                             if first_chunk_time is None:
                                                 first_chunk_time = time.time_ns()
@@ -365,7 +369,7 @@ class OllamaAPI:
                                                 "response": chunk,
                                                 "done": False,
                                             }
-                                            yield f"{json.dumps(data, ensure_ascii=False)}\n"
+                                            yield ndjson_line(data)
                                 except (asyncio.CancelledError, Exception) as e:
                                     error_msg = str(e)
                                     if isinstance(e, asyncio.CancelledError):
@@ -383,7 +387,7 @@ class OllamaAPI:
                                         "error": f"\n\nError: {error_msg}",
                                         "done": False,
                                     }
-                                    yield f"{json.dumps(error_data, ensure_ascii=False)}\n"
+                                    yield ndjson_line(error_data)
 
                                     # Send final message to close the stream
                                     final_data = {
@@ -392,7 +396,7 @@ class OllamaAPI:
                                         "response": "",
                                         "done": True,
                                     }
-                                    yield f"{json.dumps(final_data, ensure_ascii=False)}\n"
+                                    yield ndjson_line(final_data)
                                     return
                                 if first_chunk_time is None:
                                     first_chunk_time = start_time
@@ -415,7 +419,7 @@ class OllamaAPI:
                                     "eval_count": completion_tokens,
                                     "eval_duration": eval_time,
                                 }
-                                yield f"{json.dumps(data, ensure_ascii=False)}\n"
+                                yield ndjson_line(data)
                                 return
 
                         except Exception as e:
@@ -557,7 +561,7 @@ class OllamaAPI:
                                     },
                                     "done": False,
                                 }
-                                yield f"{json.dumps(data, ensure_ascii=False)}\n"
+                                yield ndjson_line(data)
 
                                 completion_tokens = estimate_tokens(total_response)
                                 total_time = last_chunk_time - start_time
@@ -581,10 +585,10 @@ class OllamaAPI:
                                     "eval_count": completion_tokens,
                                     "eval_duration": eval_time,
                                 }
-                                yield f"{json.dumps(data, ensure_ascii=False)}\n"
+                                yield ndjson_line(data)
                             else:
                                 try:
-                                    async for chunk in response:
+                                    async for chunk in coalesce_stream(response):
                                         if chunk:
                                             if first_chunk_time is None:
                                                 first_chunk_time = time.time_ns()
@@ -602,7 +606,7 @@ class OllamaAPI:
                                                 },
                                                 "done": False,
                                             }
-                                            yield f"{json.dumps(data, ensure_ascii=False)}\n"
+                                            yield ndjson_line(data)
                                 except (asyncio.CancelledError, Exception) as e:
                                     error_msg = str(e)
                                     if isinstance(e, asyncio.CancelledError):
@@ -624,7 +628,7 @@ class OllamaAPI:
                                         "error": f"\n\nError: {error_msg}",
                                         "done": False,
                                     }
-                                    yield f"{json.dumps(error_data, ensure_ascii=False)}\n"
+                                    yield ndjson_line(error_data)
 
                                     # Send final message to close the stream
                                     final_data = {
@@ -637,7 +641,7 @@ class OllamaAPI:
                                         },
                                         "done": True,
                                     }
-                                    yield f"{json.dumps(final_data, ensure_ascii=False)}\n"
+                                    yield ndjson_line(final_data)
                                     return
 
                                 if first_chunk_time is None:
@@ -664,7 +668,7 @@ class OllamaAPI:
                                     "eval_count": completion_tokens,
                                     "eval_duration": eval_time,
                                 }
-                                yield f"{json.dumps(data, ensure_ascii=False)}\n"
+                                yield ndjson_line(data)
 
                         except Exception as e:
                             trace_exception(e)
@@ -2,13 +2,17 @@
 This module contains all query-related routes for the LightRAG API.
 """
 
-import json
 import logging
 from typing import Any, Dict, List, Literal, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from lightrag.base import QueryParam
-from lightrag.api.utils_api import get_combined_auth_dependency
+from lightrag.api.utils_api import (
+    coalesce_stream,
+    get_combined_auth_dependency,
+    ndjson_line,
+)
 from pydantic import BaseModel, Field, field_validator
 
 from ascii_colors import trace_exception
@@ -174,6 +178,19 @@ class StreamChunkResponse(BaseModel):
     )
 
 
+class QueryBatchRequest(BaseModel):
+    queries: List[QueryRequest] = Field(
+        min_length=1,
+        description="Queries to answer. The stream parameter of each query is ignored.",
+    )
+
+    max_concurrency: Optional[int] = Field(
+        default=None,
+        ge=1,
+        description="Maximum number of queries answered concurrently. Defaults to QUERY_BATCH_MAX_CONCURRENCY.",
+    )
+
+
 def create_query_routes(rag, api_key: Optional[str] = None, top_k: int = 60):
     combined_auth = get_combined_auth_dependency(api_key)
 
@@ -603,17 +620,17 @@ def create_query_routes(rag, api_key: Optional[str] = None, top_k: int = 60):
                 if llm_response.get("is_streaming"):
                     # Streaming mode: send references first, then stream response chunks
                     if request.include_references:
-                        yield f"{json.dumps({'references': references})}\n"
+                        yield ndjson_line({"references": references})
 
                     response_stream = llm_response.get("response_iterator")
                     if response_stream:
                         try:
-                            async for chunk in response_stream:
-                                if chunk:  # Only send non-empty content
-                                    yield f"{json.dumps({'response': chunk})}\n"
+                            # Only non-empty content is sent, small chunks may be merged
+                            async for chunk in coalesce_stream(response_stream):
+                                yield ndjson_line({"response": chunk})
                         except Exception as e:
                             logging.error(f"Streaming error: {str(e)}")
-                            yield f"{json.dumps({'error': str(e)})}\n"
+                            yield ndjson_line({"error": str(e)})
                 else:
                     # Non-streaming mode: send complete response in one message
                     response_content = llm_response.get("content", "")
@@ -625,7 +642,7 @@ def create_query_routes(rag, api_key: Optional[str] = None, top_k: int = 60):
                     if request.include_references:
                         complete_response["references"] = references
 
-                    yield f"{json.dumps(complete_response)}\n"
+                    yield ndjson_line(complete_response)
 
             return StreamingResponse(
                 stream_generator(),
@@ -1058,4 +1075,66 @@ def create_query_routes(rag, api_key: Optional[str] = None, top_k: int = 60):
             trace_exception(e)
             raise HTTPException(status_code=500, detail=str(e))
 
+    @router.post("/query/batch", dependencies=[Depends(combined_auth)])
+    async def query_batch(request: QueryBatchRequest):
+        """
+        Answer many queries in one request, streaming each answer as NDJSON when it completes.
+
+        Keyword extraction runs once per distinct query text, embeddings of all
+        queries and keyword sets are computed in shared batches, and retrieval runs
+        concurrently up to max_concurrency queries at a time.
+
+        Each line refers to a query by its position in the request:
+        ```
+        {"index": 1, "response": "...", "references": [...]}
+        {"index": 0, "error": "Query failed: ..."}
+        ```
+        references is present only when include_references is True for that query.
+        """
+        try:
+            queries = [
+                (query_request.query, query_request.to_query_params(False))
+                for query_request in request.queries
+            ]
+            results = rag.aquery_batch(queries, max_concurrency=request.max_concurrency)
+
+            async def stream_generator():
+                try:
+                    async for index, result in results:
+                        llm_response = result.get("llm_response", {})
+                        content = llm_response.get("content")
+                        if result.get("status") == "failure" and content is None:
+                            yield ndjson_line(
+                                {"index": index, "error": result.get("message")}
+                            )
+                            continue
+
+                        frame = {
+                            "index": index,
+                            "response": content
+                            or "No relevant context found for the query.",
+                        }
+                        if request.queries[index].include_references:
+                            frame["references"] = result.get("data", {}).get(
+                                "references", []
+                            )
+                        yield ndjson_line(frame)
+                finally:
+                    # Cancel unanswered queries when the client disconnects
+                    await results.aclose()
+
+            return StreamingResponse(
+                stream_generator(),
+                media_type="application/x-ndjson",
+                headers={
+                    "Cache-Control": "no-cache",
+                    "Connection": "keep-alive",
+                    "Content-Type": "application/x-ndjson",
+                    "X-Accel-Buffering": "no",  # Ensure proper handling of streaming response when proxied by Nginx
+                },
+            )
+        except Exception as e:
+            trace_exception(e)
+            raise HTTPException(status_code=500, detail=str(e))
+
     return router
@@ -4,7 +4,12 @@ Utility functions for the LightRAG API.
 
 import os
 import argparse
-from typing import Optional, List, Tuple
+import asyncio
+import gzip
+import hashlib
+import json
+import time
+from typing import Any, AsyncIterator, Optional, List, Tuple
 import sys
 from ascii_colors import ASCIIColors
 from lightrag.api import __api_version__ as api_version
@@ -12,12 +17,121 @@ from lightrag import __version__ as core_version
 from lightrag.constants import (
     DEFAULT_FORCE_LLM_SUMMARY_ON_MERGE,
 )
-from fastapi import HTTPException, Security, Request, status
+from fastapi import HTTPException, Security, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from fastapi.security import APIKeyHeader, OAuth2PasswordBearer
 from starlette.status import HTTP_403_FORBIDDEN
 from .auth import auth_handler
 from .config import ollama_server_infos, global_args, get_env_value
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import orjson
+
+    def json_dumps(content: Any) -> bytes:
+        """Serialize content to compact UTF-8 JSON bytes"""
+        return orjson.dumps(
+            content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+except ImportError:
+
+    def json_dumps(content: Any) -> bytes:
+        """Serialize content to compact UTF-8 JSON bytes"""
+        return json.dumps(
+            content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode("utf-8")
+
+
+def ndjson_line(content: Any) -> bytes:
+    """Serialize content as one NDJSON frame"""
+    return json_dumps(content) + b"\n"
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson when available, the stdlib json otherwise"""
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
+
+
+async def coalesce_stream(
+    chunks: AsyncIterator[str],
+    min_chars: Optional[int] = None,
+    max_delay: Optional[float] = None,
+) -> AsyncIterator[str]:
+    """
+    Merge small text chunks of an LLM stream into fewer, larger chunks.
+
+    Buffered text is emitted once it reaches min_chars characters, max_delay seconds
+    after the first buffered chunk arrived (also while the stream is silent), and at
+    the end of the stream. Empty chunks are dropped. min_chars <= 0 disables
+    coalescing. Defaults come from STREAM_COALESCE_MIN_CHARS and
+    STREAM_COALESCE_MAX_DELAY.
+    """
+    if min_chars is None:
+        min_chars = global_args.stream_coalesce_min_chars
+    if max_delay is None:
+        max_delay = global_args.stream_coalesce_max_delay
+
+    if min_chars <= 0:
+        async for chunk in chunks:
+            if chunk:
+                yield chunk
+        return
+
+    iterator = chunks.__aiter__()
+    buffer: List[str] = []
+    buffered_chars = 0
+    flush_at = 0.0
+    # Read ahead in a task, so waiting for the next chunk can time out
+    next_chunk: Optional[asyncio.Future] = None
+    try:
+        while True:
+            if next_chunk is None:
+                next_chunk = asyncio.ensure_future(iterator.__anext__())
+            if buffer:
+                done, _ = await asyncio.wait(
+                    {next_chunk}, timeout=max(flush_at - time.monotonic(), 0)
+                )
+                if not done:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    buffered_chars = 0
+                    continue
+            try:
+                chunk = await next_chunk
+            except StopAsyncIteration:
+                break
+            finally:
+                next_chunk = None
+            if not chunk:
+                continue
+            if not buffer:
+                flush_at = time.monotonic() + max_delay
+            buffer.append(chunk)
+            buffered_chars += len(chunk)
+            if buffered_chars >= min_chars or time.monotonic() >= flush_at:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered_chars = 0
+    except Exception:
+        # Deliver text received before the failure, then let the caller report it
+        if buffer:
+            yield "".join(buffer)
+        raise
+    finally:
+        if next_chunk is not None:
+            # The consumer stopped early, stop reading the stream as well
+            next_chunk.cancel()
+            await asyncio.gather(next_chunk, return_exceptions=True)
+    if buffer:
+        yield "".join(buffer)
+
 
 def check_env_file():
     """
@@ -166,6 +280,96 @@ def get_combined_auth_dependency(api_key: Optional[str] = None):
     return combined_dependency
 
 
+def make_revision_etag(*parts: Any) -> str:
+    """
+    Build a weak ETag from storage revisions and the request parameters of a view.
+
+    Revisions change whenever the underlying storage is written, so a matching
+    ETag means the view is unchanged and can be answered without querying storage.
+    """
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=12)
+    return f'W/"{digest.hexdigest()}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Check the If-None-Match header of a request against an ETag (weak comparison)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    tag = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == tag for candidate in header.split(",")
+    )
+
+
+def _cache_headers(etag: str) -> dict:
+    # Clients may store the response but must revalidate it on every use
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+
+def not_modified_response(etag: str) -> Response:
+    """Return an empty 304 response for an unchanged view"""
+    return Response(status_code=304, headers=_cache_headers(etag))
+
+
+def _select_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick brotli (if installed) or gzip from an Accept-Encoding header"""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[coding.strip().lower()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    if brotli is not None and accepted.get("br", wildcard) > 0:
+        return "br"
+    if accepted.get("gzip", wildcard) > 0:
+        return "gzip"
+    return None
+
+
+def _compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6)
+
+
+async def json_response(
+    request: Request, content: Any, etag: Optional[str] = None
+) -> Response:
+    """
+    Render content as a JSON response, compressed according to Accept-Encoding.
+
+    Bodies smaller than RESPONSE_COMPRESSION_MIN_SIZE are sent uncompressed. If
+    etag is given it is attached together with revalidation cache headers.
+    """
+    body = json_dumps(jsonable_encoder(content))
+    headers = {"Vary": "Accept-Encoding"}
+    if etag:
+        headers.update(_cache_headers(etag))
+
+    encoding = None
+    if (
+        global_args.response_compression
+        and len(body) >= global_args.response_compression_min_size
+    ):
+        encoding = _select_encoding(request.headers.get("accept-encoding", ""))
+    if encoding:
+        # Large subgraphs take tens of milliseconds to compress, keep the event loop free
+        body = await asyncio.to_thread(_compress, body, encoding)
+        headers["Content-Encoding"] = encoding
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 def display_splash_screen(args: argparse.Namespace) -> None:
     """
     Display a colorful splash screen showing LightRAG server configuration
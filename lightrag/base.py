@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextvars import ContextVar
 from enum import Enum
+import functools
 import os
 from dotenv import load_dotenv
 from dataclasses import dataclass, field
@@ -18,6 +20,7 @@ from typing import (
 )
 from .utils import EmbeddingFunc
 from .types import KnowledgeGraph
+from .kg.shared_storage import bump_storage_revision, get_storage_revision
 from .constants import (
     GRAPH_FIELD_SEP,
     DEFAULT_TOP_K,
@@ -169,6 +172,51 @@ class QueryParam:
     containing citation information for the retrieved content.
     """
 
+    speculative_retrieval: bool = (
+        os.getenv("SPECULATIVE_RETRIEVAL", "false").lower() == "true"
+    )
+    """Start the query embedding and the chunk vector search of mix mode while keywords
+    are still being extracted, instead of after. Results are the same, only sooner.
+    The work is wasted when the query ends before retrieval (e.g. no keywords found).
+    """
+
+    speculative_entity_lookup: bool = (
+        os.getenv("SPECULATIVE_ENTITY_LOOKUP", "false").lower() == "true"
+    )
+    """With speculative_retrieval, also look up entities by the raw query of short queries.
+    The result is used when the query itself becomes the low-level keywords, and is wasted otherwise.
+    """
+
+
+# Storages with a write in progress in the current task, see _bumps_revision
+_storages_in_write: ContextVar[frozenset[int]] = ContextVar(
+    "_storages_in_write", default=frozenset()
+)
+
+
+def _bumps_revision(method):
+    """Wrap a storage write method to bump the storage revision once it completes
+
+    Writes made by another write of the same storage (e.g. the default
+    upsert_nodes_batch calling upsert_node) only bump once, from the outer call.
+    The revision is bumped even if the write fails, as it may have been partial.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        in_write = _storages_in_write.get()
+        if id(self) in in_write:
+            return await method(self, *args, **kwargs)
+        token = _storages_in_write.set(in_write | {id(self)})
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            _storages_in_write.reset(token)
+            await self.bump_revision()
+
+    wrapper._bumps_revision = True
+    return wrapper
+
 
 @dataclass
 class StorageNameSpace(ABC):
@@ -176,6 +224,21 @@ class StorageNameSpace(ABC):
     workspace: str
     global_config: dict[str, Any]
 
+    # Write methods bumping the revision, set by storage types the API server caches
+    _revision_methods = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        for name in cls._revision_methods:
+            method = cls.__dict__.get(name)
+            if (
+                method is None
+                or getattr(method, "__isabstractmethod__", False)
+                or getattr(method, "_bumps_revision", False)
+            ):
+                continue
+            setattr(cls, name, _bumps_revision(method))
+
     async def initialize(self):
         """Initialize the storage"""
         pass
@@ -184,6 +247,21 @@ class StorageNameSpace(ABC):
         """Finalize the storage"""
         pass
 
+    async def bump_revision(self) -> None:
+        """Mark the storage data as changed
+
+        Called automatically after the methods listed in _revision_methods.
+        """
+        await bump_storage_revision(f"{self.workspace}:{self.namespace}")
+
+    def get_revision(self) -> int:
+        """Return a counter that changes whenever the storage data changes
+
+        Shared by all workers, it lets the API server answer conditional requests
+        for unchanged views without querying the storage.
+        """
+        return get_storage_revision(f"{self.workspace}:{self.namespace}")
+
     @abstractmethod
     async def index_done_callback(self) -> None:
         """Commit the storage operations after indexing"""
@@ -370,6 +448,18 @@ class BaseGraphStorage(StorageNameSpace, ABC):
 
     embedding_func: EmbeddingFunc
 
+    _revision_methods = (
+        "upsert_node",
+        "upsert_edge",
+        "upsert_nodes_batch",
+        "upsert_edges_batch",
+        "delete_node",
+        "remove_nodes",
+        "remove_edges",
+        "index_done_callback",
+        "drop",
+    )
+
     @abstractmethod
     async def has_node(self, node_id: str) -> bool:
         """Check if a node exists in the graph.
@@ -609,6 +699,35 @@ class BaseGraphStorage(StorageNameSpace, ABC):
             edge_data: A dictionary of edge properties
         """
 
+    async def upsert_nodes_batch(self, nodes: dict[str, dict[str, str]]) -> None:
+        """Insert or update nodes as a batch
+
+        Default implementation upserts nodes one by one.
+        Override this method for better performance in storage backends
+        that support batch operations.
+
+        Args:
+            nodes: Mapping of node ID to node properties
+        """
+        for node_id, node_data in nodes.items():
+            await self.upsert_node(node_id, node_data)
+
+    async def upsert_edges_batch(
+        self, edges: list[tuple[str, str, dict[str, str]]]
+    ) -> None:
+        """Insert or update edges as a batch
+
+        Default implementation upserts edges one by one.
+        Override this method for better performance in storage backends
+        that support batch operations. Both endpoints of every edge must
+        already exist in the graph.
+
+        Args:
+            edges: List of (source_node_id, target_node_id, edge_data) tuples
+        """
+        for source_node_id, target_node_id, edge_data in edges:
+            await self.upsert_edge(source_node_id, target_node_id, edge_data)
+
     @abstractmethod
     async def delete_node(self, node_id: str) -> None:
         """Delete a node from the graph.
@@ -776,6 +895,8 @@ class DocProcessingStatus:
 class DocStatusStorage(BaseKVStorage, ABC):
     """Base class for document status storage"""
 
+    _revision_methods = ("upsert", "delete", "index_done_callback", "drop")
+
     @abstractmethod
     async def get_status_counts(self) -> dict[str, int]:
         """Get counts of documents in each status"""
@@ -10,11 +10,28 @@ consistency and makes maintenance easier.
 DEFAULT_WOKERS = 2
 DEFAULT_MAX_GRAPH_NODES = 1000
 
+# Document chunking executor: "thread", "process" or "none" (inline on the event loop)
+DEFAULT_CHUNKING_EXECUTOR = "thread"
+DEFAULT_CHUNKING_MAX_WORKERS = 4
+
 # Default values for extraction settings
 DEFAULT_SUMMARY_LANGUAGE = "English"  # Default language for document processing
 DEFAULT_MAX_GLEANING = 1
 DEFAULT_ENTITY_NAME_MAX_LENGTH = 256
 
+# Multi-chunk extraction: max chunks per LLM request (1 disables batching), token budget
+# of the packed chunk texts, largest chunk eligible for packing and max wait in seconds
+DEFAULT_EXTRACT_BATCH_SIZE = 1
+DEFAULT_EXTRACT_BATCH_MAX_TOKENS = 2000
+DEFAULT_EXTRACT_BATCH_CHUNK_TOKENS = 300
+DEFAULT_EXTRACT_BATCH_WAIT = 0.1
+
+# Adaptive gleaning: chunks shorter than this (tokens) skip the gleaning round
+DEFAULT_GLEANING_MIN_CHUNK_TOKENS = 150
+
+# Per-chunk extraction checkpoints: chunks written to the LLM cache storage per group
+DEFAULT_EXTRACTION_CHECKPOINT_BATCH = 50
+
 # Number of description fragments to trigger LLM summary
 DEFAULT_FORCE_LLM_SUMMARY_ON_MERGE = 8
 # Max description token size to trigger LLM summary
@@ -51,12 +68,32 @@ DEFAULT_COSINE_THRESHOLD = 0.2
 DEFAULT_RELATED_CHUNK_NUMBER = 5
 DEFAULT_KG_CHUNK_PICK_METHOD = "VECTOR"
 
+# Streaming ingestion (ainsert_stream): documents enqueued per batch and max documents
+# enqueued but not yet processed before reading from the stream pauses
+DEFAULT_INSERT_STREAM_BATCH_SIZE = 100
+DEFAULT_INSERT_STREAM_MAX_IN_FLIGHT = 1000
+# Documents sanitized, deduplicated against doc status and stored per enqueue batch
+DEFAULT_ENQUEUE_BATCH_SIZE = 1000
+
+# Query keyword cache: in-memory entries kept per instance and their lifetime in seconds
+DEFAULT_KEYWORD_CACHE_SIZE = 2000
+DEFAULT_KEYWORD_CACHE_TTL = 3600
+# Batched keyword extraction under load: max queries per LLM call and max wait in seconds
+DEFAULT_KEYWORD_BATCH_SIZE = 8
+DEFAULT_KEYWORD_BATCH_WAIT = 0.05
+
 # TODO: Deprated. All conversation_history messages is send to LLM.
 DEFAULT_HISTORY_TURNS = 0
 
 # Rerank configuration defaults
 DEFAULT_MIN_RERANK_SCORE = 0.0
 DEFAULT_RERANK_BINDING = "null"
+# Rerank score cache: in-memory (query, chunk) scores kept per instance and their lifetime in seconds
+DEFAULT_RERANK_CACHE_SIZE = 20000
+DEFAULT_RERANK_CACHE_TTL = 3600
+# Coalesced rerank calls: max documents per merged call and max wait in seconds
+DEFAULT_RERANK_BATCH_SIZE = 256
+DEFAULT_RERANK_BATCH_WAIT = 0.02
 
 # Default source ids limit in meta data for entity and relation
 DEFAULT_MAX_SOURCE_IDS_PER_ENTITY = 300
@@ -86,11 +123,23 @@ DEFAULT_TEMPERATURE = 1.0
 # Async configuration defaults
 DEFAULT_MAX_ASYNC = 4  # Default maximum async operations
 DEFAULT_MAX_PARALLEL_INSERT = 2  # Default maximum parallel insert operations
+DEFAULT_QUERY_BATCH_MAX_CONCURRENCY = 8  # Default concurrent queries of a query batch
 
 # Embedding configuration defaults
 DEFAULT_EMBEDDING_FUNC_MAX_ASYNC = 8  # Default max async for embedding functions
 DEFAULT_EMBEDDING_BATCH_NUM = 10  # Default batch size for embedding computations
 
+# Graph write batching: buffered node/edge upserts flushed per batch during merge
+DEFAULT_GRAPH_UPSERT_BATCH_SIZE = 500
+
+# Group commit of processed documents: persist after this many documents, seconds or content bytes
+DEFAULT_PERSIST_BATCH_DOCS = 50
+DEFAULT_PERSIST_INTERVAL = 60
+DEFAULT_PERSIST_MAX_DIRTY_BYTES = 64 * 1024 * 1024
+
+# Storage warm-up: number of top-degree entities and recent chunks prefetched at startup
+DEFAULT_STORAGE_WARMUP_SIZE = 200
+
 # Gunicorn worker timeout
 DEFAULT_TIMEOUT = 300
 
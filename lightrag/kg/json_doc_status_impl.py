@@ -1,3 +1,4 @@
+import asyncio
 from dataclasses import dataclass
 import os
 from typing import Any, Union, final
@@ -17,11 +18,15 @@ from lightrag.exceptions import StorageNotInitializedError
 from .shared_storage import (
     get_namespace_data,
     get_storage_lock,
-    get_data_init_lock,
+    get_storage_keyed_lock,
     get_update_flag,
     set_all_update_flags,
     clear_all_update_flags,
     try_initialize_namespace,
+    register_namespace_snapshot,
+    publish_namespace_snapshot,
+    get_namespace_snapshot,
+    NamespaceSnapshot,
 )
 
 
@@ -47,27 +52,40 @@ class JsonDocStatusStorage(DocStatusStorage):
         self._data = None
         self._storage_lock = None
         self.storage_updated = None
+        self._snapshot: NamespaceSnapshot | None = None
 
     async def initialize(self):
         """Initialize storage data"""
         self._storage_lock = get_storage_lock()
         self.storage_updated = await get_update_flag(self.final_namespace)
-        async with get_data_init_lock():
+        # Multi-process mode: serve reads from shared-memory snapshots when possible
+        await register_namespace_snapshot(self.final_namespace)
+        # Keyed by namespace so different storages can initialize concurrently
+        async with get_storage_keyed_lock(self.final_namespace, namespace="data_init"):
             # check need_init must before get_namespace_data
             need_init = await try_initialize_namespace(self.final_namespace)
             self._data = await get_namespace_data(self.final_namespace)
             if need_init:
-                loaded_data = load_json(self._file_name) or {}
+                loaded_data = await asyncio.to_thread(load_json, self._file_name) or {}
                 async with self._storage_lock:
                     self._data.update(loaded_data)
+                    await publish_namespace_snapshot(self.final_namespace, loaded_data)
                     logger.info(
                         f"[{self.workspace}] Process {os.getpid()} doc status load {self.namespace} with {len(loaded_data)} records"
                     )
 
+    def _get_snapshot(self) -> NamespaceSnapshot | None:
+        """Return the up-to-date shared-memory snapshot, None if reads must use self._data"""
+        self._snapshot = get_namespace_snapshot(self.final_namespace, self._snapshot)
+        return self._snapshot
+
     async def filter_keys(self, keys: set[str]) -> set[str]:
         """Return keys that should be processed (not in storage or not successfully processed)"""
         if self._storage_lock is None:
             raise StorageNotInitializedError("JsonDocStatusStorage")
+        snapshot = self._get_snapshot()
+        if snapshot is not None:
+            return {key for key in keys if key not in snapshot}
         async with self._storage_lock:
             return set(keys) - set(self._data.keys())
 
@@ -75,6 +93,10 @@ class JsonDocStatusStorage(DocStatusStorage):
         ordered_results: list[dict[str, Any] | None] = []
         if self._storage_lock is None:
             raise StorageNotInitializedError("JsonDocStatusStorage")
+        snapshot = self._get_snapshot()
+        if snapshot is not None:
+            # Records decoded from the snapshot are already private copies
+            return [snapshot.get(id) or None for id in ids]
         async with self._storage_lock:
             for id in ids:
                 data = self._data.get(id, None)
@@ -162,6 +184,7 @@ class JsonDocStatusStorage(DocStatusStorage):
                     f"[{self.workspace}] Process {os.getpid()} doc status writting {len(data_dict)} records to {self.namespace}"
                 )
                 write_json(data_dict, self._file_name)
+                await publish_namespace_snapshot(self.final_namespace, data_dict)
                 await clear_all_update_flags(self.final_namespace)
 
     async def upsert(self, data: dict[str, dict[str, Any]]) -> None:
@@ -202,6 +225,9 @@ class JsonDocStatusStorage(DocStatusStorage):
             return len(self._data) == 0
 
     async def get_by_id(self, id: str) -> Union[dict[str, Any], None]:
+        snapshot = self._get_snapshot()
+        if snapshot is not None:
+            return snapshot.get(id)
         async with self._storage_lock:
             return self._data.get(id)
 
@@ -1,6 +1,10 @@
+import asyncio
+import json
+import mmap
 import os
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, final
+from typing import Any, Iterable, final
 
 from lightrag.base import (
     BaseKVStorage,
@@ -14,13 +18,248 @@ from lightrag.exceptions import StorageNotInitializedError
 from .shared_storage import (
     get_namespace_data,
     get_storage_lock,
-    get_data_init_lock,
+    get_storage_keyed_lock,
     get_update_flag,
     set_all_update_flags,
     clear_all_update_flags,
     try_initialize_namespace,
+    register_namespace_snapshot,
+    publish_namespace_snapshot,
+    get_namespace_snapshot,
+    NamespaceSnapshot,
 )
 
+# Namespaces opened in lazy mode: records stay on disk and are decoded on demand.
+# Comma separated list of namespaces (e.g. "full_docs,llm_response_cache"), or "*" for all
+JSON_KV_LAZY_NAMESPACES = {
+    ns.strip()
+    for ns in os.getenv("JSON_KV_LAZY_NAMESPACES", "").split(",")
+    if ns.strip()
+}
+# Number of decoded records kept in memory per lazy namespace
+JSON_KV_LAZY_CACHE_SIZE = int(os.getenv("JSON_KV_LAZY_CACHE_SIZE", 1024))
+
+
+def _encode_json_value(value: Any) -> bytes:
+    """Encode a record exactly as write_json lays it out inside the top level object"""
+    return (
+        json.dumps(value, indent=2, ensure_ascii=False)
+        .replace("\n", "\n  ")
+        .encode("utf-8")
+    )
+
+
+def write_indexed_json(
+    items: Iterable[tuple[str, bytes]], file_name: str
+) -> dict[str, tuple[int, int]]:
+    """Write encoded records as a JSON object and return the byte span of every value
+
+    The output is byte-for-byte what write_json produces for the same data, so files
+    stay interchangeable between eager and lazy mode. The file is written to a
+    temporary path and then moved into place, so readers still mapping the old file
+    keep a consistent view.
+
+    Args:
+        items: (key, encoded value) pairs, values encoded by _encode_json_value
+        file_name: Target JSON file
+
+    Returns:
+        Mapping of key -> (start, end) byte offsets of the value in the file
+    """
+    offsets: dict[str, tuple[int, int]] = {}
+    tmp_file_name = f"{file_name}.tmp"
+    with open(tmp_file_name, "wb") as f:
+        pos = 0
+        for key, raw_value in items:
+            prefix = (
+                ("{\n  " if pos == 0 else ",\n  ")
+                + json.dumps(key, ensure_ascii=False)
+                + ": "
+            ).encode("utf-8")
+            f.write(prefix)
+            f.write(raw_value)
+            start = pos + len(prefix)
+            pos = start + len(raw_value)
+            offsets[key] = (start, pos)
+        f.write(b"\n}" if pos else b"{}")
+    os.replace(tmp_file_name, file_name)
+    return offsets
+
+
+class _LazyJsonKVStore:
+    """On-disk KV store backed by a memory-mapped JSON file and a byte offset index
+
+    Records are decoded only when requested and the most recently used ones are kept
+    in a bounded LRU. Upserts and deletions are held in memory until flush() rewrites
+    the file, copying untouched records as raw bytes without decoding them.
+    """
+
+    def __init__(self, file_name: str, cache_size: int):
+        self._file_name = file_name
+        self._index_file_name = f"{os.path.splitext(file_name)[0]}.idx.json"
+        self._cache_size = max(cache_size, 0)
+        self._offsets: dict[str, tuple[int, int]] = {}
+        self._mmap: mmap.mmap | None = None
+        self._cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._deleted: set[str] = set()
+
+    @property
+    def dirty(self) -> bool:
+        return bool(self._pending or self._deleted)
+
+    def open(self) -> bool:
+        """Map the data file if its offset index is present and up to date
+
+        Returns:
+            False if the index is missing or stale and rebuild() must be called first
+        """
+        self.close()
+        offsets = self._load_index()
+        if offsets is None:
+            return False
+
+        self._offsets = offsets
+        with open(self._file_name, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return True
+
+    def rebuild(self, data: dict[str, dict[str, Any]]) -> None:
+        """Rewrite the data file from fully loaded data and create its offset index"""
+        self.close()
+        offsets = write_indexed_json(
+            ((k, _encode_json_value(v)) for k, v in data.items()), self._file_name
+        )
+        self._save_index(offsets)
+
+    def close(self) -> None:
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self._offsets = {}
+        self._cache.clear()
+
+    def _load_index(self) -> dict[str, tuple[int, int]] | None:
+        if not os.path.exists(self._file_name):
+            return None
+        index = load_json(self._index_file_name)
+        if not index:
+            return None
+        stat = os.stat(self._file_name)
+        if (
+            index.get("file_size") != stat.st_size
+            or index.get("mtime_ns") != stat.st_mtime_ns
+        ):
+            return None
+        return {k: tuple(v) for k, v in index.get("offsets", {}).items()}
+
+    def _save_index(self, offsets: dict[str, tuple[int, int]]) -> None:
+        stat = os.stat(self._file_name)
+        with open(self._index_file_name, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "file_size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "offsets": offsets,
+                },
+                f,
+                ensure_ascii=False,
+            )
+
+    def _read_raw(self, key: str) -> bytes:
+        start, end = self._offsets[key]
+        return self._mmap[start:end]
+
+    def __contains__(self, key: str) -> bool:
+        if key in self._pending:
+            return True
+        return key in self._offsets and key not in self._deleted
+
+    def __len__(self) -> int:
+        new_keys = sum(1 for k in self._pending if k not in self._offsets)
+        return len(self._offsets) - len(self._deleted) + new_keys
+
+    def keys(self) -> set[str]:
+        return (self._offsets.keys() - self._deleted) | self._pending.keys()
+
+    def get(self, key: str, default: Any = None) -> dict[str, Any] | None:
+        if key in self._pending:
+            return self._pending[key]
+        if key not in self._offsets or key in self._deleted:
+            return default
+
+        record = self._cache.get(key)
+        if record is not None:
+            self._cache.move_to_end(key)
+            return record
+
+        record = json.loads(self._read_raw(key))
+        if self._cache_size:
+            self._cache[key] = record
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return record
+
+    def update(self, data: dict[str, dict[str, Any]]) -> None:
+        for key, value in data.items():
+            self._pending[key] = value
+            self._deleted.discard(key)
+            self._cache.pop(key, None)
+
+    def pop(self, key: str, default: Any = None) -> dict[str, Any] | None:
+        record = self.get(key)
+        if record is None:
+            return default
+        self._pending.pop(key, None)
+        self._cache.pop(key, None)
+        if key in self._offsets:
+            self._deleted.add(key)
+        return record
+
+    def clear(self) -> None:
+        self._pending.clear()
+        self._cache.clear()
+        self._deleted = set(self._offsets.keys())
+
+    def flush(self) -> int:
+        """Rewrite the data file with pending changes applied and remap it
+
+        Returns:
+            Number of records written
+        """
+
+        def merged_items():
+            for key in self._offsets:
+                if key in self._deleted or key in self._pending:
+                    continue
+                yield key, self._read_raw(key)
+            # Untouched records are copied; release the mapping before the file is
+            # replaced (required on Windows, where a mapped file cannot be replaced)
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            for key, value in self._pending.items():
+                yield key, _encode_json_value(value)
+
+        try:
+            offsets = write_indexed_json(merged_items(), self._file_name)
+        except Exception:
+            # The original file is untouched, map it again before re-raising
+            self.open()
+            raise
+        self._save_index(offsets)
+        self._pending.clear()
+        self._deleted.clear()
+        self.open()
+        return len(offsets)
+
+    def reload(self) -> None:
+        """Remap the file after another process rewrote it, keeping local pending changes"""
+        if not self.open():
+            self.rebuild(load_json(self._file_name) or {})
+            self.open()
+        self._deleted = {k for k in self._deleted if k in self._offsets}
+
 
 @final
 @dataclass
@@ -43,17 +282,27 @@ class JsonKVStorage(BaseKVStorage):
         self._data = None
         self._storage_lock = None
         self.storage_updated = None
+        self._snapshot: NamespaceSnapshot | None = None
+        self._lazy = (
+            "*" in JSON_KV_LAZY_NAMESPACES or self.namespace in JSON_KV_LAZY_NAMESPACES
+        )
 
     async def initialize(self):
         """Initialize storage data"""
         self._storage_lock = get_storage_lock()
         self.storage_updated = await get_update_flag(self.final_namespace)
-        async with get_data_init_lock():
+        if self._lazy:
+            await self._initialize_lazy()
+            return
+        # Multi-process mode: serve reads from shared-memory snapshots when possible
+        await register_namespace_snapshot(self.final_namespace)
+        # Keyed by namespace so different storages can initialize concurrently
+        async with get_storage_keyed_lock(self.final_namespace, namespace="data_init"):
             # check need_init must before get_namespace_data
             need_init = await try_initialize_namespace(self.final_namespace)
             self._data = await get_namespace_data(self.final_namespace)
             if need_init:
-                loaded_data = load_json(self._file_name) or {}
+                loaded_data = await asyncio.to_thread(load_json, self._file_name) or {}
                 async with self._storage_lock:
                     # Migrate legacy cache structure if needed
                     if self.namespace.endswith("_cache"):
@@ -63,12 +312,72 @@ class JsonKVStorage(BaseKVStorage):
 
                     self._data.update(loaded_data)
                     data_count = len(loaded_data)
+                    await publish_namespace_snapshot(self.final_namespace, loaded_data)
 
                     logger.info(
                         f"[{self.workspace}] Process {os.getpid()} KV load {self.namespace} with {data_count} records"
                     )
 
+    async def _initialize_lazy(self):
+        """Open the namespace as a process-local indexed on-disk store
+
+        The lazy store is used in place of the shared namespace dict and offers the
+        same mapping operations, so read and write paths stay shared with eager mode.
+        In lazy mode the update flag signals that another process has rewritten the
+        file, and pending changes are only visible to other processes after
+        index_done_callback.
+        """
+        lazy_store = _LazyJsonKVStore(self._file_name, JSON_KV_LAZY_CACHE_SIZE)
+        async with get_storage_keyed_lock(self.final_namespace, namespace="data_init"):
+            async with self._storage_lock:
+                if not lazy_store.open():
+                    loaded_data = load_json(self._file_name) or {}
+                    # Migrate legacy cache structure if needed
+                    if self.namespace.endswith("_cache"):
+                        loaded_data = await self._migrate_legacy_cache_structure(
+                            loaded_data
+                        )
+                    lazy_store.rebuild(loaded_data)
+                    del loaded_data
+                    lazy_store.open()
+                    logger.info(
+                        f"[{self.workspace}] Process {os.getpid()} KV built offset index for {self.namespace}"
+                    )
+                self._data = lazy_store
+                self.storage_updated.value = False
+
+        logger.info(
+            f"[{self.workspace}] Process {os.getpid()} KV lazy load {self.namespace} with {len(lazy_store)} records"
+        )
+
+    def _sync_lazy_store(self):
+        """Remap lazy store if another process rewrote the file (call with storage lock held)"""
+        if self._lazy and self.storage_updated.value:
+            logger.info(
+                f"[{self.workspace}] Process {os.getpid()} reloading {self.namespace} due to update by another process"
+            )
+            self._data.reload()
+            self.storage_updated.value = False
+
+    async def _set_update_flags(self):
+        """Flag pending changes; lazy stores track them locally until index_done_callback"""
+        if not self._lazy:
+            await set_all_update_flags(self.final_namespace)
+
     async def index_done_callback(self) -> None:
+        if self._lazy:
+            async with self._storage_lock:
+                self._sync_lazy_store()
+                if self._data.dirty:
+                    data_count = self._data.flush()
+                    logger.debug(
+                        f"[{self.workspace}] Process {os.getpid()} KV writting {data_count} records to {self.namespace}"
+                    )
+                    # Notify other processes to remap the file, then skip our own reload
+                    await set_all_update_flags(self.final_namespace)
+                    self.storage_updated.value = False
+            return
+
         async with self._storage_lock:
             if self.storage_updated.value:
                 data_dict = (
@@ -82,41 +391,63 @@ class JsonKVStorage(BaseKVStorage):
                     f"[{self.workspace}] Process {os.getpid()} KV writting {data_count} records to {self.namespace}"
                 )
                 write_json(data_dict, self._file_name)
+                await publish_namespace_snapshot(self.final_namespace, data_dict)
                 await clear_all_update_flags(self.final_namespace)
 
+    def _get_snapshot(self) -> NamespaceSnapshot | None:
+        """Return the up-to-date shared-memory snapshot, None if reads must use self._data"""
+        if self._lazy:
+            return None
+        self._snapshot = get_namespace_snapshot(self.final_namespace, self._snapshot)
+        return self._snapshot
+
+    @staticmethod
+    def _prepare_record(id: str, data: dict[str, Any]) -> dict[str, Any]:
+        # Create a copy to avoid modifying the original data
+        result = dict(data)
+        # Ensure time fields are present, provide default values for old data
+        result.setdefault("create_time", 0)
+        result.setdefault("update_time", 0)
+        # Ensure _id field contains the clean ID
+        result["_id"] = id
+        return result
+
     async def get_by_id(self, id: str) -> dict[str, Any] | None:
+        # Snapshots are immutable, reading them needs neither the lock nor IPC
+        snapshot = self._get_snapshot()
+        if snapshot is not None:
+            result = snapshot.get(id)
+            return self._prepare_record(id, result) if result else result
+
         async with self._storage_lock:
+            self._sync_lazy_store()
             result = self._data.get(id)
-            if result:
-                # Create a copy to avoid modifying the original data
-                result = dict(result)
-                # Ensure time fields are present, provide default values for old data
-                result.setdefault("create_time", 0)
-                result.setdefault("update_time", 0)
-                # Ensure _id field contains the clean ID
-                result["_id"] = id
-            return result
+            return self._prepare_record(id, result) if result else result
 
     async def get_by_ids(self, ids: list[str]) -> list[dict[str, Any]]:
+        snapshot = self._get_snapshot()
+        if snapshot is not None:
+            results = []
+            for id in ids:
+                data = snapshot.get(id)
+                results.append(self._prepare_record(id, data) if data else None)
+            return results
+
         async with self._storage_lock:
+            self._sync_lazy_store()
             results = []
             for id in ids:
                 data = self._data.get(id, None)
-                if data:
-                    # Create a copy to avoid modifying the original data
-                    result = {k: v for k, v in data.items()}
-                    # Ensure time fields are present, provide default values for old data
-                    result.setdefault("create_time", 0)
-                    result.setdefault("update_time", 0)
-                    # Ensure _id field contains the clean ID
-                    result["_id"] = id
-                    results.append(result)
-                else:
-                    results.append(None)
+                results.append(self._prepare_record(id, data) if data else None)
             return results
 
     async def filter_keys(self, keys: set[str]) -> set[str]:
+        snapshot = self._get_snapshot()
+        if snapshot is not None:
+            return {key for key in keys if key not in snapshot}
+
         async with self._storage_lock:
+            self._sync_lazy_store()
             return set(keys) - set(self._data.keys())
 
     async def upsert(self, data: dict[str, dict[str, Any]]) -> None:
@@ -138,6 +469,7 @@ class JsonKVStorage(BaseKVStorage):
         if self._storage_lock is None:
             raise StorageNotInitializedError("JsonKVStorage")
         async with self._storage_lock:
+            self._sync_lazy_store()
             # Add timestamps to data based on whether key exists
             for k, v in data.items():
                 # For text_chunks namespace, ensure llm_cache_list field exists
@@ -155,7 +487,7 @@ class JsonKVStorage(BaseKVStorage):
                 v["_id"] = k
 
             self._data.update(data)
-            await set_all_update_flags(self.final_namespace)
+            await self._set_update_flags()
 
     async def delete(self, ids: list[str]) -> None:
         """Delete specific records from storage by their IDs
@@ -171,6 +503,7 @@ class JsonKVStorage(BaseKVStorage):
             None
         """
         async with self._storage_lock:
+            self._sync_lazy_store()
             any_deleted = False
             for doc_id in ids:
                 result = self._data.pop(doc_id, None)
@@ -178,7 +511,7 @@ class JsonKVStorage(BaseKVStorage):
                     any_deleted = True
 
             if any_deleted:
-                await set_all_update_flags(self.final_namespace)
+                await self._set_update_flags()
 
     async def is_empty(self) -> bool:
         """Check if the storage is empty
@@ -187,6 +520,7 @@ class JsonKVStorage(BaseKVStorage):
             bool: True if storage contains no data, False otherwise
         """
         async with self._storage_lock:
+            self._sync_lazy_store()
             return len(self._data) == 0
 
     async def drop(self) -> dict[str, str]:
@@ -205,8 +539,9 @@ class JsonKVStorage(BaseKVStorage):
         """
         try:
             async with self._storage_lock:
+                self._sync_lazy_store()
                 self._data.clear()
-                await set_all_update_flags(self.final_namespace)
+                await self._set_update_flags()
 
             await self.index_done_callback()
             logger.info(
@@ -272,3 +607,8 @@ class JsonKVStorage(BaseKVStorage):
         """
         if self.namespace.endswith("_cache"):
             await self.index_done_callback()
+        if self._lazy and self._data is not None:
+            self._data.close()
+        if self._snapshot is not None:
+            self._snapshot.close()
+            self._snapshot = None
@@ -249,6 +249,48 @@ class MemgraphStorage(BaseGraphStorage):
                 )
                 raise
 
+    async def get_nodes_batch(self, node_ids: list[str]) -> dict[str, dict]:
+        """
+        Retrieve multiple nodes in one query using UNWIND.
+
+        Args:
+            node_ids: List of node entity IDs to fetch.
+
+        Returns:
+            A dictionary mapping each found node_id to its node data.
+        """
+        if self._driver is None:
+            raise RuntimeError(
+                "Memgraph driver is not initialized. Call 'await initialize()' first."
+            )
+        if not node_ids:
+            return {}
+        workspace_label = self._get_workspace_label()
+        async with self._driver.session(
+            database=self._DATABASE, default_access_mode="READ"
+        ) as session:
+            query = f"""
+            UNWIND $node_ids AS id
+            MATCH (n:`{workspace_label}` {{entity_id: id}})
+            RETURN n.entity_id AS entity_id, n
+            """
+            result = await session.run(query, node_ids=node_ids)
+            nodes = {}
+            try:
+                async for record in result:
+                    node_dict = dict(record["n"])
+                    # Remove workspace label from labels list if it exists
+                    if "labels" in node_dict:
+                        node_dict["labels"] = [
+                            label
+                            for label in node_dict["labels"]
+                            if label != workspace_label
+                        ]
+                    nodes[record["entity_id"]] = node_dict
+            finally:
+                await result.consume()  # Ensure result is fully consumed
+            return nodes
+
     async def node_degree(self, node_id: str) -> int:
         """Get the degree (number of relationships) of a node with the given label.
         If multiple nodes have the same label, returns the degree of the first node.
@@ -297,6 +339,51 @@ class MemgraphStorage(BaseGraphStorage):
                 )
                 raise
 
+    async def node_degrees_batch(self, node_ids: list[str]) -> dict[str, int]:
+        """
+        Retrieve the degree for multiple nodes in a single query using UNWIND.
+
+        Args:
+            node_ids: List of node labels (entity_id values) to look up.
+
+        Returns:
+            A dictionary mapping each node_id to its degree (number of relationships).
+            If a node is not found, its degree will be set to 0.
+        """
+        if self._driver is None:
+            raise RuntimeError(
+                "Memgraph driver is not initialized. Call 'await initialize()' first."
+            )
+        if not node_ids:
+            return {}
+        workspace_label = self._get_workspace_label()
+        async with self._driver.session(
+            database=self._DATABASE, default_access_mode="READ"
+        ) as session:
+            query = f"""
+                UNWIND $node_ids AS id
+                MATCH (n:`{workspace_label}` {{entity_id: id}})
+                OPTIONAL MATCH (n)-[r]-()
+                RETURN n.entity_id AS entity_id, COUNT(r) AS degree
+            """
+            # Deduplicate ids so aggregation does not count a node's edges twice
+            result = await session.run(query, node_ids=list(dict.fromkeys(node_ids)))
+            degrees = {}
+            try:
+                async for record in result:
+                    degrees[record["entity_id"]] = record["degree"]
+            finally:
+                await result.consume()  # Ensure result is fully consumed
+
+            # For any node_id that did not return a record, set degree to 0.
+            for nid in node_ids:
+                if nid not in degrees:
+                    logger.warning(
+                        f"[{self.workspace}] No node found with label '{nid}'"
+                    )
+                    degrees[nid] = 0
+            return degrees
+
     async def get_all_labels(self) -> list[str]:
         """
         Get all existing node labels in the database
@@ -398,6 +485,58 @@ class MemgraphStorage(BaseGraphStorage):
             )
             raise
 
+    async def get_nodes_edges_batch(
+        self, node_ids: list[str]
+    ) -> dict[str, list[tuple[str, str]]]:
+        """
+        Batch retrieve edges for multiple nodes in one query using UNWIND.
+        For each node, returns both outgoing and incoming edges with their actual direction.
+
+        Args:
+            node_ids: List of node IDs (entity_id) for which to retrieve edges.
+
+        Returns:
+            A dictionary mapping each node ID to its list of edge tuples (source, target).
+        """
+        if self._driver is None:
+            raise RuntimeError(
+                "Memgraph driver is not initialized. Call 'await initialize()' first."
+            )
+        edges_dict = {node_id: [] for node_id in node_ids}
+        if not node_ids:
+            return edges_dict
+        workspace_label = self._get_workspace_label()
+        async with self._driver.session(
+            database=self._DATABASE, default_access_mode="READ"
+        ) as session:
+            query = f"""
+                UNWIND $node_ids AS id
+                MATCH (n:`{workspace_label}` {{entity_id: id}})
+                OPTIONAL MATCH (n)-[r]-(connected:`{workspace_label}`)
+                RETURN id AS queried_id, n.entity_id AS node_entity_id,
+                       connected.entity_id AS connected_entity_id,
+                       startNode(r).entity_id AS start_entity_id
+            """
+            result = await session.run(query, node_ids=node_ids)
+            try:
+                async for record in result:
+                    node_entity_id = record["node_entity_id"]
+                    connected_entity_id = record["connected_entity_id"]
+
+                    # Skip if either node is None
+                    if not node_entity_id or not connected_entity_id:
+                        continue
+
+                    # Keep the stored direction: outgoing if the queried node is the start node
+                    if record["start_entity_id"] == node_entity_id:
+                        edge = (node_entity_id, connected_entity_id)
+                    else:
+                        edge = (connected_entity_id, node_entity_id)
+                    edges_dict[record["queried_id"]].append(edge)
+            finally:
+                await result.consume()  # Ensure results are fully consumed
+            return edges_dict
+
     async def get_edge(
         self, source_node_id: str, target_node_id: str
     ) -> dict[str, str] | None:
@@ -455,6 +594,55 @@ class MemgraphStorage(BaseGraphStorage):
                 await result.consume()  # Ensure the result is consumed even on error
                 raise
 
+    async def get_edges_batch(
+        self, pairs: list[dict[str, str]]
+    ) -> dict[tuple[str, str], dict]:
+        """
+        Retrieve edge properties for multiple (src, tgt) pairs in one query.
+
+        Args:
+            pairs: List of dictionaries, e.g. [{"src": "node1", "tgt": "node2"}, ...]
+
+        Returns:
+            A dictionary mapping (src, tgt) tuples of existing edges to their properties.
+        """
+        if self._driver is None:
+            raise RuntimeError(
+                "Memgraph driver is not initialized. Call 'await initialize()' first."
+            )
+        if not pairs:
+            return {}
+        workspace_label = self._get_workspace_label()
+        async with self._driver.session(
+            database=self._DATABASE, default_access_mode="READ"
+        ) as session:
+            query = f"""
+            UNWIND $pairs AS pair
+            MATCH (start:`{workspace_label}` {{entity_id: pair.src}})-[r]-(end:`{workspace_label}` {{entity_id: pair.tgt}})
+            RETURN pair.src AS src_id, pair.tgt AS tgt_id, collect(properties(r)) AS edges
+            """
+            result = await session.run(query, pairs=pairs)
+            edges_dict = {}
+            try:
+                async for record in result:
+                    edges = record["edges"]
+                    if not edges:
+                        continue
+                    edge_props = dict(edges[0])  # choose the first if multiple exist
+                    # Ensure required keys exist with defaults
+                    for key, default in {
+                        "weight": 1.0,
+                        "source_id": None,
+                        "description": None,
+                        "keywords": None,
+                    }.items():
+                        if key not in edge_props:
+                            edge_props[key] = default
+                    edges_dict[(record["src_id"], record["tgt_id"])] = edge_props
+            finally:
+                await result.consume()  # Ensure result is fully consumed
+            return edges_dict
+
     async def upsert_node(self, node_id: str, node_data: dict[str, str]) -> None:
         """
         Upsert a node in the Memgraph database with manual transaction-level retry logic for transient errors.
@@ -646,6 +834,128 @@ class MemgraphStorage(BaseGraphStorage):
                 )
                 raise
 
+    async def _execute_write_with_retry(self, execute_fn, operation: str) -> None:
+        """Run a write transaction with the same transient-error retry policy as upsert_node"""
+        max_retries = 100
+        initial_wait_time = 0.2
+        backoff_factor = 1.1
+        jitter_factor = 0.1
+
+        for attempt in range(max_retries):
+            try:
+                async with self._driver.session(database=self._DATABASE) as session:
+                    await session.execute_write(execute_fn)
+                    return
+            except (TransientError, ResultFailedError) as e:
+                root_cause = e
+                while hasattr(root_cause, "__cause__") and root_cause.__cause__:
+                    root_cause = root_cause.__cause__
+
+                is_transient = (
+                    isinstance(root_cause, TransientError)
+                    or isinstance(e, TransientError)
+                    or "TransientError" in str(e)
+                    or "Cannot resolve conflicting transactions" in str(e)
+                )
+                if not is_transient:
+                    logger.error(
+                        f"[{self.workspace}] Non-transient error during {operation}: {str(e)}"
+                    )
+                    raise
+                if attempt >= max_retries - 1:
+                    logger.error(
+                        f"[{self.workspace}] Memgraph transient error during {operation} after {max_retries} retries: {str(e)}"
+                    )
+                    raise
+                jitter = random.uniform(0, jitter_factor) * initial_wait_time
+                wait_time = initial_wait_time * (backoff_factor**attempt) + jitter
+                logger.warning(
+                    f"[{self.workspace}] {operation} failed. Attempt #{attempt + 1} retrying in {wait_time:.3f} seconds... Error: {str(e)}"
+                )
+                await asyncio.sleep(wait_time)
+            except Exception as e:
+                logger.error(
+                    f"[{self.workspace}] Unexpected error during {operation}: {str(e)}"
+                )
+                raise
+
+    async def upsert_nodes_batch(self, nodes: dict[str, dict[str, str]]) -> None:
+        """
+        Upsert multiple nodes in a single write transaction using UNWIND.
+
+        One UNWIND statement is issued per distinct entity_type, since labels
+        cannot be passed as query parameters.
+
+        Args:
+            nodes: Mapping of node ID to node properties
+        """
+        if self._driver is None:
+            raise RuntimeError(
+                "Memgraph driver is not initialized. Call 'await initialize()' first."
+            )
+        if not nodes:
+            return
+
+        workspace_label = self._get_workspace_label()
+        rows_by_type: dict[str, list[dict]] = {}
+        for node_id, node_data in nodes.items():
+            if "entity_id" not in node_data:
+                raise ValueError(
+                    "Memgraph: node properties must contain an 'entity_id' field"
+                )
+            rows_by_type.setdefault(node_data["entity_type"], []).append(
+                {"entity_id": node_id, "properties": node_data}
+            )
+
+        async def execute_upsert(tx: AsyncManagedTransaction):
+            for entity_type, rows in rows_by_type.items():
+                query = f"""
+                UNWIND $rows AS row
+                MERGE (n:`{workspace_label}` {{entity_id: row.entity_id}})
+                SET n += row.properties
+                SET n:`{entity_type}`
+                """
+                result = await tx.run(query, rows=rows)
+                await result.consume()  # Ensure result is fully consumed
+
+        await self._execute_write_with_retry(execute_upsert, "batch node upsert")
+
+    async def upsert_edges_batch(
+        self, edges: list[tuple[str, str, dict[str, str]]]
+    ) -> None:
+        """
+        Upsert multiple edges in a single write transaction using UNWIND.
+        Edges whose source or target node does not exist are skipped, matching upsert_edge.
+
+        Args:
+            edges: List of (source_node_id, target_node_id, edge_data) tuples
+        """
+        if self._driver is None:
+            raise RuntimeError(
+                "Memgraph driver is not initialized. Call 'await initialize()' first."
+            )
+        if not edges:
+            return
+
+        workspace_label = self._get_workspace_label()
+        rows = [
+            {"source_entity_id": src, "target_entity_id": tgt, "properties": data}
+            for src, tgt, data in edges
+        ]
+
+        async def execute_upsert(tx: AsyncManagedTransaction):
+            query = f"""
+            UNWIND $rows AS row
+            MATCH (source:`{workspace_label}` {{entity_id: row.source_entity_id}})
+            MATCH (target:`{workspace_label}` {{entity_id: row.target_entity_id}})
+            MERGE (source)-[r:DIRECTED]-(target)
+            SET r += row.properties
+            """
+            result = await tx.run(query, rows=rows)
+            await result.consume()  # Ensure result is fully consumed
+
+        await self._execute_write_with_retry(execute_upsert, "batch edge upsert")
+
     async def delete_node(self, node_id: str) -> None:
         """Delete a node with the specified label
 
@@ -784,6 +1094,29 @@ class MemgraphStorage(BaseGraphStorage):
         degrees = int(src_degree) + int(trg_degree)
         return degrees
 
+    async def edge_degrees_batch(
+        self, edge_pairs: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], int]:
+        """
+        Calculate the combined degree for each edge (sum of the source and target node degrees)
+        in batch using node_degrees_batch.
+
+        Args:
+            edge_pairs: List of (src, tgt) tuples.
+
+        Returns:
+            A dictionary mapping each (src, tgt) tuple to the sum of their degrees.
+        """
+        unique_node_ids = {src for src, _ in edge_pairs}
+        unique_node_ids.update({tgt for _, tgt in edge_pairs})
+
+        degrees = await self.node_degrees_batch(list(unique_node_ids))
+
+        return {
+            (src, tgt): degrees.get(src, 0) + degrees.get(tgt, 0)
+            for src, tgt in edge_pairs
+        }
+
     async def get_nodes_by_chunk_ids(self, chunk_ids: list[str]) -> list[dict]:
         """Get all nodes that are associated with the given chunk_ids.
 
@@ -1,5 +1,7 @@
 import asyncio
 import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any, final
 from dataclasses import dataclass
 import numpy as np
@@ -18,6 +20,20 @@ from pymilvus import MilvusClient, DataType, CollectionSchema, FieldSchema  # ty
 config = configparser.ConfigParser()
 config.read("config.ini", "utf-8")
 
+# MilvusClient is synchronous; its calls run on a bounded thread pool shared by all
+# Milvus storages so they never block the event loop
+MILVUS_MAX_WORKERS = int(os.getenv("MILVUS_MAX_WORKERS", "16"))
+_milvus_executor: ThreadPoolExecutor | None = None
+
+
+def _get_milvus_executor() -> ThreadPoolExecutor:
+    global _milvus_executor
+    if _milvus_executor is None:
+        _milvus_executor = ThreadPoolExecutor(
+            max_workers=MILVUS_MAX_WORKERS, thread_name_prefix="milvus"
+        )
+    return _milvus_executor
+
 
 @final
 @dataclass
@@ -981,6 +997,13 @@ class MilvusVectorDBStorage(BaseVectorStorage):
         self._max_batch_size = self.global_config["embedding_batch_num"]
         self._initialized = False
 
+    async def _run_in_executor(self, func, *args, **kwargs):
+        """Run a blocking Milvus client call on the shared Milvus thread pool"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            _get_milvus_executor(), partial(func, *args, **kwargs)
+        )
+
     async def initialize(self):
         """Initialize Milvus collection"""
         async with get_data_init_lock(enable_logging=True):
@@ -990,7 +1013,8 @@ class MilvusVectorDBStorage(BaseVectorStorage):
             try:
                 # Create MilvusClient if not already created
                 if self._client is None:
-                    self._client = MilvusClient(
+                    self._client = await self._run_in_executor(
+                        MilvusClient,
                         uri=os.environ.get(
                             "MILVUS_URI",
                             config.get(
@@ -1021,7 +1045,7 @@ class MilvusVectorDBStorage(BaseVectorStorage):
                     )
 
                 # Create collection and check compatibility
-                self._create_collection_if_not_exist()
+                await self._run_in_executor(self._create_collection_if_not_exist)
                 self._initialized = True
                 logger.info(
                     f"[{self.workspace}] Milvus collection '{self.namespace}' initialized successfully"
@@ -1038,7 +1062,7 @@ class MilvusVectorDBStorage(BaseVectorStorage):
             return
 
         # Ensure collection is loaded before upserting
-        self._ensure_collection_loaded()
+        await self._run_in_executor(self._ensure_collection_loaded)
 
         import time
 
@@ -1064,8 +1088,8 @@ class MilvusVectorDBStorage(BaseVectorStorage):
         embeddings = np.concatenate(embeddings_list)
         for i, d in enumerate(list_data):
             d["vector"] = embeddings[i]
-        results = self._client.upsert(
-            collection_name=self.final_namespace, data=list_data
+        results = await self._run_in_executor(
+            self._client.upsert, collection_name=self.final_namespace, data=list_data
         )
         return results
 
@@ -1073,7 +1097,7 @@ class MilvusVectorDBStorage(BaseVectorStorage):
         self, query: str, top_k: int, query_embedding: list[float] = None
     ) -> list[dict[str, Any]]:
         # Ensure collection is loaded before querying
-        self._ensure_collection_loaded()
+        await self._run_in_executor(self._ensure_collection_loaded)
 
         # Use provided embedding or compute it
         if query_embedding is not None:
@@ -1086,7 +1110,8 @@ class MilvusVectorDBStorage(BaseVectorStorage):
         # Include all meta_fields (created_at is now always included)
         output_fields = list(self.meta_fields)
 
-        results = self._client.search(
+        results = await self._run_in_executor(
+            self._client.search,
             collection_name=self.final_namespace,
             data=embedding,
             limit=top_k,
@@ -1124,8 +1149,10 @@ class MilvusVectorDBStorage(BaseVectorStorage):
             )
 
             # Delete the entity from Milvus collection
-            result = self._client.delete(
-                collection_name=self.final_namespace, pks=[entity_id]
+            result = await self._run_in_executor(
+                self._client.delete,
+                collection_name=self.final_namespace,
+                pks=[entity_id],
             )
 
             if result and result.get("delete_count", 0) > 0:
@@ -1148,14 +1175,17 @@ class MilvusVectorDBStorage(BaseVectorStorage):
         """
         try:
             # Ensure collection is loaded before querying
-            self._ensure_collection_loaded()
+            await self._run_in_executor(self._ensure_collection_loaded)
 
             # Search for relations where entity is either source or target
             expr = f'src_id == "{entity_name}" or tgt_id == "{entity_name}"'
 
             # Find all relations involving this entity
-            results = self._client.query(
-                collection_name=self.final_namespace, filter=expr, output_fields=["id"]
+            results = await self._run_in_executor(
+                self._client.query,
+                collection_name=self.final_namespace,
+                filter=expr,
+                output_fields=["id"],
             )
 
             if not results or len(results) == 0:
@@ -1172,8 +1202,10 @@ class MilvusVectorDBStorage(BaseVectorStorage):
 
             # Delete the relations
             if relation_ids:
-                delete_result = self._client.delete(
-                    collection_name=self.final_namespace, pks=relation_ids
+                delete_result = await self._run_in_executor(
+                    self._client.delete,
+                    collection_name=self.final_namespace,
+                    pks=relation_ids,
                 )
 
                 logger.debug(
@@ -1193,10 +1225,12 @@ class MilvusVectorDBStorage(BaseVectorStorage):
         """
         try:
             # Ensure collection is loaded before deleting
-            self._ensure_collection_loaded()
+            await self._run_in_executor(self._ensure_collection_loaded)
 
             # Delete vectors by IDs
-            result = self._client.delete(collection_name=self.final_namespace, pks=ids)
+            result = await self._run_in_executor(
+                self._client.delete, collection_name=self.final_namespace, pks=ids
+            )
 
             if result and result.get("delete_count", 0) > 0:
                 logger.debug(
@@ -1223,13 +1257,14 @@ class MilvusVectorDBStorage(BaseVectorStorage):
         """
         try:
             # Ensure collection is loaded before querying
-            self._ensure_collection_loaded()
+            await self._run_in_executor(self._ensure_collection_loaded)
 
             # Include all meta_fields (created_at is now always included) plus id
             output_fields = list(self.meta_fields) + ["id"]
 
             # Query Milvus for a specific ID
-            result = self._client.query(
+            result = await self._run_in_executor(
+                self._client.query,
                 collection_name=self.final_namespace,
                 filter=f'id == "{id}"',
                 output_fields=output_fields,
@@ -1259,7 +1294,7 @@ class MilvusVectorDBStorage(BaseVectorStorage):
 
         try:
             # Ensure collection is loaded before querying
-            self._ensure_collection_loaded()
+            await self._run_in_executor(self._ensure_collection_loaded)
 
             # Include all meta_fields (created_at is now always included) plus id
             output_fields = list(self.meta_fields) + ["id"]
@@ -1269,7 +1304,8 @@ class MilvusVectorDBStorage(BaseVectorStorage):
             filter_expr = f'id in ["{id_list}"]'
 
             # Query Milvus with the filter
-            result = self._client.query(
+            result = await self._run_in_executor(
+                self._client.query,
                 collection_name=self.final_namespace,
                 filter=filter_expr,
                 output_fields=output_fields,
@@ -1312,14 +1348,15 @@ class MilvusVectorDBStorage(BaseVectorStorage):
 
         try:
             # Ensure collection is loaded before querying
-            self._ensure_collection_loaded()
+            await self._run_in_executor(self._ensure_collection_loaded)
 
             # Prepare the ID filter expression
             id_list = '", "'.join(ids)
             filter_expr = f'id in ["{id_list}"]'
 
             # Query Milvus with the filter, requesting only vector field
-            result = self._client.query(
+            result = await self._run_in_executor(
+                self._client.query,
                 collection_name=self.final_namespace,
                 filter=filter_expr,
                 output_fields=["vector"],
@@ -1354,11 +1391,15 @@ class MilvusVectorDBStorage(BaseVectorStorage):
         async with get_storage_lock():
             try:
                 # Drop the collection and recreate it
-                if self._client.has_collection(self.final_namespace):
-                    self._client.drop_collection(self.final_namespace)
+                if await self._run_in_executor(
+                    self._client.has_collection, self.final_namespace
+                ):
+                    await self._run_in_executor(
+                        self._client.drop_collection, self.final_namespace
+                    )
 
                 # Recreate the collection
-                self._create_collection_if_not_exist()
+                await self._run_in_executor(self._create_collection_if_not_exist)
 
                 logger.info(
                     f"[{self.workspace}] Process {os.getpid()} drop Milvus collection {self.namespace}"
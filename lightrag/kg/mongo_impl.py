@@ -403,16 +403,15 @@ class MongoDocStatusStorage(DocStatusStorage):
         logger.debug(f"[{self.workspace}] Inserting {len(data)} to {self.namespace}")
         if not data:
             return
-        update_tasks: list[Any] = []
+        operations = []
         for k, v in data.items():
             # Ensure chunks_list field exists and is an array
             if "chunks_list" not in v:
                 v["chunks_list"] = []
             data[k]["_id"] = k
-            update_tasks.append(
-                self._data.update_one({"_id": k}, {"$set": v}, upsert=True)
-            )
-        await asyncio.gather(*update_tasks)
+            operations.append(UpdateOne({"_id": k}, {"$set": v}, upsert=True))
+        # One round trip per batch, documents are independent so order does not matter
+        await self._data.bulk_write(operations, ordered=False)
 
     async def get_status_counts(self) -> dict[str, int]:
         """Get counts of documents in each status"""
@@ -793,6 +792,9 @@ class MongoGraphStorage(BaseGraphStorage):
                 self.db, self._edge_collection_name
             )
 
+            # Index edge endpoints so neighbourhood lookups do not scan the edge collection
+            await self.create_edge_indexes_if_not_exists()
+
             # Create Atlas Search index for better search performance if possible
             await self.create_search_index_if_not_exists()
 
@@ -1282,6 +1284,27 @@ class MongoGraphStorage(BaseGraphStorage):
 
         return result
 
+    async def _rank_nodes_by_degree(self, node_ids: list[str], limit: int) -> list[str]:
+        """Return up to `limit` of node_ids, highest degree first"""
+        pipeline = [
+            {"$match": {"source_node_id": {"$in": node_ids}}},
+            {"$group": {"_id": "$source_node_id", "degree": {"$sum": 1}}},
+            {
+                "$unionWith": {
+                    "coll": self._edge_collection_name,
+                    "pipeline": [
+                        {"$match": {"target_node_id": {"$in": node_ids}}},
+                        {"$group": {"_id": "$target_node_id", "degree": {"$sum": 1}}},
+                    ],
+                }
+            },
+            {"$group": {"_id": "$_id", "degree": {"$sum": "$degree"}}},
+            {"$sort": {"degree": -1, "_id": 1}},
+            {"$limit": limit},
+        ]
+        cursor = await self.edge_collection.aggregate(pipeline, allowDiskUse=True)
+        return [str(doc["_id"]) async for doc in cursor]
+
     async def _bidirectional_bfs_nodes(
         self,
         node_labels: list[str],
@@ -1291,41 +1314,72 @@ class MongoGraphStorage(BaseGraphStorage):
         max_depth: int,
         max_nodes: int,
     ) -> KnowledgeGraph:
-        if depth > max_depth or len(result.nodes) > max_nodes:
-            return result
-
-        cursor = self.collection.find({"_id": {"$in": node_labels}})
-
-        async for node in cursor:
-            node_id = node["_id"]
-            if node_id not in seen_nodes:
-                seen_nodes.add(node_id)
-                result.nodes.append(self._construct_graph_node(node_id, node))
-                if len(result.nodes) > max_nodes:
-                    return result
-
-        # Collect neighbors
-        # Get both inbound and outbound one hop nodes
-        cursor = self.edge_collection.find(
-            {
-                "$or": [
-                    {"source_node_id": {"$in": node_labels}},
-                    {"target_node_id": {"$in": node_labels}},
-                ]
-            }
-        )
+        """
+        Expand the BFS one whole level per round trip and stop as soon as max_nodes is reached.
 
-        neighbor_nodes = []
-        async for edge in cursor:
-            if edge["source_node_id"] not in seen_nodes:
-                neighbor_nodes.append(edge["source_node_id"])
-            if edge["target_node_id"] not in seen_nodes:
-                neighbor_nodes.append(edge["target_node_id"])
-
-        if neighbor_nodes:
-            result = await self._bidirectional_bfs_nodes(
-                neighbor_nodes, seen_nodes, result, depth + 1, max_depth, max_nodes
+        Each level is a single aggregation over the edge collection that returns only the
+        unseen neighbour ids of the frontier. When a level would overflow max_nodes, its
+        candidates are ranked by degree and only the best connected ones are kept. Node
+        documents are fetched once at the end, without their source_ids arrays.
+        """
+        # Only nodes that actually exist can seed the traversal
+        frontier = [
+            doc["_id"]
+            async for doc in self.collection.find(
+                {"_id": {"$in": list(dict.fromkeys(node_labels))}}, {"_id": 1}
             )
+        ]
+        frontier = [node_id for node_id in frontier if node_id not in seen_nodes]
+        if len(seen_nodes) + len(frontier) > max_nodes:
+            frontier = frontier[: max(max_nodes - len(seen_nodes), 0)]
+            result.is_truncated = True
+        seen_nodes.update(frontier)
+        ordered_ids = list(frontier)
+
+        while frontier and depth < max_depth and not result.is_truncated:
+            pipeline = [
+                {
+                    "$match": {
+                        "$or": [
+                            {"source_node_id": {"$in": frontier}},
+                            {"target_node_id": {"$in": frontier}},
+                        ]
+                    }
+                },
+                {"$project": {"_id": 0, "ids": ["$source_node_id", "$target_node_id"]}},
+                {"$unwind": "$ids"},
+                {"$match": {"ids": {"$nin": list(seen_nodes)}}},
+                {"$group": {"_id": "$ids"}},
+            ]
+            cursor = await self.edge_collection.aggregate(pipeline, allowDiskUse=True)
+            neighbor_nodes = sorted([str(doc["_id"]) async for doc in cursor])
+
+            remaining = max_nodes - len(seen_nodes)
+            if len(neighbor_nodes) > remaining:
+                neighbor_nodes = (
+                    await self._rank_nodes_by_degree(neighbor_nodes, remaining)
+                    if remaining > 0
+                    else []
+                )
+                result.is_truncated = True
+
+            seen_nodes.update(neighbor_nodes)
+            ordered_ids.extend(neighbor_nodes)
+            frontier = neighbor_nodes
+            depth += 1
+
+        if ordered_ids:
+            node_docs = {
+                doc["_id"]: doc
+                async for doc in self.collection.find(
+                    {"_id": {"$in": ordered_ids}}, {"source_ids": 0}
+                )
+            }
+            for node_id in ordered_ids:
+                if node_id in node_docs:
+                    result.nodes.append(
+                        self._construct_graph_node(node_id, node_docs[node_id])
+                    )
 
         return result
 
@@ -1352,7 +1406,8 @@ class MongoGraphStorage(BaseGraphStorage):
                     {"source_node_id": {"$in": all_node_ids}},
                     {"target_node_id": {"$in": all_node_ids}},
                 ]
-            }
+            },
+            {"source_ids": 0},
         )
 
         async for edge in cursor:
@@ -2010,6 +2065,18 @@ class MongoGraphStorage(BaseGraphStorage):
             f"[{self.workspace}] Index will be built asynchronously, using regex fallback until ready."
         )
 
+    async def create_edge_indexes_if_not_exists(self):
+        """Creates indexes on edge source/target node ids used by graph traversal."""
+        for field_name in ("source_node_id", "target_node_id"):
+            try:
+                await self.edge_collection.create_index(
+                    field_name, name=f"{field_name}_idx"
+                )
+            except PyMongoError as e:
+                logger.warning(
+                    f"[{self.workspace}] Could not create index on {field_name} for {self._edge_collection_name}: {e}"
+                )
+
     async def create_search_index_if_not_exists(self):
         """Creates an improved Atlas Search index for entity search, rebuilding if necessary."""
         index_name = "entity_id_search_idx"
@@ -1517,6 +1517,27 @@ class PostgreSQLDB:
             logger.error(f"PostgreSQL database,\nsql:{sql},\ndata:{data},\nerror:{e}")
             raise
 
+    async def executemany(self, sql: str, data: list[dict[str, Any]]) -> None:
+        """Execute a statement for every row in data in a single round trip
+
+        Rows are applied atomically, a failing row rolls back the whole batch.
+        """
+        if not data:
+            return
+
+        async def _operation(connection: asyncpg.Connection) -> Any:
+            args = [tuple(row.values()) for row in data]
+            async with connection.transaction():
+                return await connection.executemany(sql, args)
+
+        try:
+            await self._run_with_retry(_operation)
+        except Exception as e:
+            logger.error(
+                f"PostgreSQL database,\nsql:{sql},\nrows:{len(data)},\nerror:{e}"
+            )
+            raise
+
 
 class ClientManager:
     _instances: dict[str, Any] = {"db": None, "ref_count": 0}
@@ -1969,9 +1990,9 @@ class PGKVStorage(BaseKVStorage):
         try:
             res = await self.db.query(sql, list(params.values()), multirows=True)
             if res:
-                exist_keys = [key["id"] for key in res]
+                exist_keys = {key["id"] for key in res}
             else:
-                exist_keys = []
+                exist_keys = set()
             new_keys = set([s for s in keys if s not in exist_keys])
             return new_keys
         except Exception as e:
@@ -2005,15 +2026,16 @@ class PGKVStorage(BaseKVStorage):
                 }
                 await self.db.execute(upsert_sql, _data)
         elif is_namespace(self.namespace, NameSpace.KV_STORE_FULL_DOCS):
-            for k, v in data.items():
-                upsert_sql = SQL_TEMPLATES["upsert_doc_full"]
-                _data = {
+            rows = [
+                {
                     "id": k,
                     "content": v["content"],
                     "doc_name": v.get("file_path", ""),  # Map file_path to doc_name
                     "workspace": self.workspace,
                 }
-                await self.db.execute(upsert_sql, _data)
+                for k, v in data.items()
+            ]
+            await self.db.executemany(SQL_TEMPLATES["upsert_doc_full"], rows)
         elif is_namespace(self.namespace, NameSpace.KV_STORE_LLM_RESPONSE_CACHE):
             for k, v in data.items():
                 upsert_sql = SQL_TEMPLATES["upsert_llm_response_cache"]
@@ -2603,9 +2625,9 @@ class PGDocStatusStorage(DocStatusStorage):
         try:
             res = await self.db.query(sql, list(params.values()), multirows=True)
             if res:
-                exist_keys = [key["id"] for key in res]
+                exist_keys = {key["id"] for key in res}
             else:
-                exist_keys = []
+                exist_keys = set()
             new_keys = set([s for s in keys if s not in exist_keys])
             # print(f"keys: {keys}")
             # print(f"new_keys: {new_keys}")
@@ -3136,14 +3158,14 @@ class PGDocStatusStorage(DocStatusStorage):
                   error_msg = EXCLUDED.error_msg,
                   created_at = EXCLUDED.created_at,
                   updated_at = EXCLUDED.updated_at"""
+        rows = []
         for k, v in data.items():
             # Remove timezone information, store utc time in db
             created_at = parse_datetime(v.get("created_at"))
             updated_at = parse_datetime(v.get("updated_at"))
 
             # chunks_count, chunks_list, track_id, metadata, and error_msg are optional
-            await self.db.execute(
-                sql,
+            rows.append(
                 {
                     "workspace": self.workspace,
                     "id": k,
@@ -3160,8 +3182,9 @@ class PGDocStatusStorage(DocStatusStorage):
                     "error_msg": v.get("error_msg"),  # Add error_msg support
                     "created_at": created_at,  # Use the converted datetime object
                     "updated_at": updated_at,  # Use the converted datetime object
-                },
+                }
             )
+        await self.db.executemany(sql, rows)
 
     async def drop(self) -> dict[str, str]:
         """Drop the storage"""
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 import numpy as np
 import hashlib
 import uuid
-from ..utils import logger
+from ..utils import logger, get_env_value
 from ..base import BaseVectorStorage
 from ..kg.shared_storage import get_data_init_lock, get_storage_lock
 import configparser
@@ -14,11 +14,14 @@ import pipmaster as pm
 if not pm.is_installed("qdrant-client"):
     pm.install("qdrant-client")
 
-from qdrant_client import QdrantClient, models  # type: ignore
+from qdrant_client import AsyncQdrantClient, models  # type: ignore
 
 config = configparser.ConfigParser()
 config.read("config.ini", "utf-8")
 
+# Payload fields filtered on by deletes; indexed whenever the collection stores them
+INDEXED_PAYLOAD_FIELDS = ("full_doc_id", "src_id", "tgt_id")
+
 
 def compute_mdhash_id_for_qdrant(
     content: str, prefix: str = "", style: str = "simple"
@@ -64,24 +67,24 @@ class QdrantVectorDBStorage(BaseVectorStorage):
         self.__post_init__()
 
     @staticmethod
-    def create_collection_if_not_exist(
-        client: QdrantClient, collection_name: str, **kwargs
+    async def create_collection_if_not_exist(
+        client: AsyncQdrantClient, collection_name: str, **kwargs
     ):
         exists = False
         if hasattr(client, "collection_exists"):
             try:
-                exists = client.collection_exists(collection_name)
+                exists = await client.collection_exists(collection_name)
             except Exception:
                 exists = False
         else:
             try:
-                client.get_collection(collection_name)
+                await client.get_collection(collection_name)
                 exists = True
             except Exception:
                 exists = False
 
         if not exists:
-            client.create_collection(collection_name, **kwargs)
+            await client.create_collection(collection_name, **kwargs)
 
     def __post_init__(self):
         # Check for QDRANT_WORKSPACE environment variable first (higher priority)
@@ -122,6 +125,51 @@ class QdrantVectorDBStorage(BaseVectorStorage):
             )
         self.cosine_better_than_threshold = cosine_threshold
 
+        # Optional memory savings: quantized vectors kept in RAM, originals on disk,
+        # and oversampled quantized search rescored against the original vectors
+        quantization = kwargs.get(
+            "qdrant_quantization", get_env_value("QDRANT_QUANTIZATION", None, str)
+        )
+        quantization = (quantization or "").strip().lower() or None
+        always_ram = kwargs.get(
+            "qdrant_quantization_always_ram",
+            get_env_value("QDRANT_QUANTIZATION_ALWAYS_RAM", True, bool),
+        )
+        if quantization == "scalar":
+            self._quantization_config = models.ScalarQuantization(
+                scalar=models.ScalarQuantizationConfig(
+                    type=models.ScalarType.INT8, always_ram=always_ram
+                )
+            )
+        elif quantization == "binary":
+            self._quantization_config = models.BinaryQuantization(
+                binary=models.BinaryQuantizationConfig(always_ram=always_ram)
+            )
+        elif quantization is None:
+            self._quantization_config = None
+        else:
+            raise ValueError(
+                f"Unsupported qdrant_quantization '{quantization}', expected 'scalar' or 'binary'"
+            )
+
+        self._on_disk = kwargs.get(
+            "qdrant_on_disk", get_env_value("QDRANT_ON_DISK", False, bool)
+        )
+        self._search_params = None
+        if self._quantization_config is not None:
+            self._search_params = models.SearchParams(
+                quantization=models.QuantizationSearchParams(
+                    ignore=False,
+                    rescore=kwargs.get(
+                        "qdrant_rescore", get_env_value("QDRANT_RESCORE", True, bool)
+                    ),
+                    oversampling=kwargs.get(
+                        "qdrant_oversampling",
+                        get_env_value("QDRANT_OVERSAMPLING", 2.0, float),
+                    ),
+                )
+            )
+
         # Initialize client as None - will be created in initialize() method
         self._client = None
         self._max_batch_size = self.global_config["embedding_batch_num"]
@@ -134,9 +182,9 @@ class QdrantVectorDBStorage(BaseVectorStorage):
                 return
 
             try:
-                # Create QdrantClient if not already created
+                # Create the async client so requests never block the event loop
                 if self._client is None:
-                    self._client = QdrantClient(
+                    self._client = AsyncQdrantClient(
                         url=os.environ.get(
                             "QDRANT_URL", config.get("qdrant", "uri", fallback=None)
                         ),
@@ -146,18 +194,15 @@ class QdrantVectorDBStorage(BaseVectorStorage):
                         ),
                     )
                     logger.debug(
-                        f"[{self.workspace}] QdrantClient created successfully"
+                        f"[{self.workspace}] AsyncQdrantClient created successfully"
                     )
 
                 # Create collection if not exists
-                QdrantVectorDBStorage.create_collection_if_not_exist(
-                    self._client,
-                    self.final_namespace,
-                    vectors_config=models.VectorParams(
-                        size=self.embedding_func.embedding_dim,
-                        distance=models.Distance.COSINE,
-                    ),
+                await QdrantVectorDBStorage.create_collection_if_not_exist(
+                    self._client, self.final_namespace, **self._collection_config()
                 )
+                await self._apply_quantization_to_existing_collection()
+                await self._create_payload_indexes()
                 self._initialized = True
                 logger.info(
                     f"[{self.workspace}] Qdrant collection '{self.namespace}' initialized successfully"
@@ -168,6 +213,60 @@ class QdrantVectorDBStorage(BaseVectorStorage):
                 )
                 raise
 
+    def _collection_config(self) -> dict[str, Any]:
+        """Collection creation arguments, including optional quantization and on-disk storage"""
+        collection_config: dict[str, Any] = {
+            "vectors_config": models.VectorParams(
+                size=self.embedding_func.embedding_dim,
+                distance=models.Distance.COSINE,
+                on_disk=self._on_disk,
+            )
+        }
+        if self._quantization_config is not None:
+            collection_config["quantization_config"] = self._quantization_config
+        return collection_config
+
+    async def _apply_quantization_to_existing_collection(self):
+        """Enable the configured quantization on a collection created without it"""
+        if self._quantization_config is None:
+            return
+        info = await self._client.get_collection(self.final_namespace)
+        if info.config.quantization_config is not None:
+            return
+        await self._client.update_collection(
+            collection_name=self.final_namespace,
+            quantization_config=self._quantization_config,
+        )
+        logger.info(
+            f"[{self.workspace}] Enabled quantization on existing Qdrant collection '{self.namespace}'"
+        )
+
+    async def _create_payload_indexes(self):
+        """Index payload fields used by filtered deletes so they avoid full scans"""
+        for field_name in INDEXED_PAYLOAD_FIELDS:
+            if field_name not in self.meta_fields:
+                continue
+            try:
+                await self._client.create_payload_index(
+                    collection_name=self.final_namespace,
+                    field_name=field_name,
+                    field_schema=models.PayloadSchemaType.KEYWORD,
+                )
+            except Exception as e:
+                logger.warning(
+                    f"[{self.workspace}] Failed to create payload index on '{field_name}' for {self.namespace}: {e}"
+                )
+
+    async def finalize(self):
+        """Close the async Qdrant client"""
+        if self._client is not None:
+            try:
+                await self._client.close()
+            except Exception as e:
+                logger.warning(f"[{self.workspace}] Error closing Qdrant client: {e}")
+            self._client = None
+            self._initialized = False
+
     async def upsert(self, data: dict[str, dict[str, Any]]) -> None:
         logger.debug(f"[{self.workspace}] Inserting {len(data)} to {self.namespace}")
         if not data:
@@ -206,7 +305,7 @@ class QdrantVectorDBStorage(BaseVectorStorage):
                 )
             )
 
-        results = self._client.upsert(
+        results = await self._client.upsert(
             collection_name=self.final_namespace, points=list_points, wait=True
         )
         return results
@@ -222,12 +321,13 @@ class QdrantVectorDBStorage(BaseVectorStorage):
             )  # higher priority for query
             embedding = embedding_result[0]
 
-        results = self._client.search(
+        results = await self._client.search(
             collection_name=self.final_namespace,
             query_vector=embedding,
             limit=top_k,
             with_payload=True,
             score_threshold=self.cosine_better_than_threshold,
+            search_params=self._search_params,
         )
 
         # logger.debug(f"[{self.workspace}] query result: {results}")
@@ -255,7 +355,7 @@ class QdrantVectorDBStorage(BaseVectorStorage):
             # Convert regular ids to Qdrant compatible ids
             qdrant_ids = [compute_mdhash_id_for_qdrant(id) for id in ids]
             # Delete points from the collection
-            self._client.delete(
+            await self._client.delete(
                 collection_name=self.final_namespace,
                 points_selector=models.PointIdsList(
                     points=qdrant_ids,
@@ -284,7 +384,7 @@ class QdrantVectorDBStorage(BaseVectorStorage):
             # )
 
             # Delete the entity point from the collection
-            self._client.delete(
+            await self._client.delete(
                 collection_name=self.final_namespace,
                 points_selector=models.PointIdsList(
                     points=[entity_id],
@@ -305,7 +405,7 @@ class QdrantVectorDBStorage(BaseVectorStorage):
         """
         try:
             # Find relations where the entity is either source or target
-            results = self._client.scroll(
+            results = await self._client.scroll(
                 collection_name=self.final_namespace,
                 scroll_filter=models.Filter(
                     should=[
@@ -327,7 +427,7 @@ class QdrantVectorDBStorage(BaseVectorStorage):
 
             if ids_to_delete:
                 # Delete the relations
-                self._client.delete(
+                await self._client.delete(
                     collection_name=self.final_namespace,
                     points_selector=models.PointIdsList(
                         points=ids_to_delete,
@@ -360,7 +460,7 @@ class QdrantVectorDBStorage(BaseVectorStorage):
             qdrant_id = compute_mdhash_id_for_qdrant(id)
 
             # Retrieve the point by ID
-            result = self._client.retrieve(
+            result = await self._client.retrieve(
                 collection_name=self.final_namespace,
                 ids=[qdrant_id],
                 with_payload=True,
@@ -398,7 +498,7 @@ class QdrantVectorDBStorage(BaseVectorStorage):
             qdrant_ids = [compute_mdhash_id_for_qdrant(id) for id in ids]
 
             # Retrieve the points by IDs
-            results = self._client.retrieve(
+            results = await self._client.retrieve(
                 collection_name=self.final_namespace,
                 ids=qdrant_ids,
                 with_payload=True,
@@ -453,7 +553,7 @@ class QdrantVectorDBStorage(BaseVectorStorage):
             qdrant_ids = [compute_mdhash_id_for_qdrant(id) for id in ids]
 
             # Retrieve the points by IDs with vectors
-            results = self._client.retrieve(
+            results = await self._client.retrieve(
                 collection_name=self.final_namespace,
                 ids=qdrant_ids,
                 with_vectors=True,  # Important: request vectors
@@ -495,28 +595,26 @@ class QdrantVectorDBStorage(BaseVectorStorage):
                 exists = False
                 if hasattr(self._client, "collection_exists"):
                     try:
-                        exists = self._client.collection_exists(self.final_namespace)
+                        exists = await self._client.collection_exists(
+                            self.final_namespace
+                        )
                     except Exception:
                         exists = False
                 else:
                     try:
-                        self._client.get_collection(self.final_namespace)
+                        await self._client.get_collection(self.final_namespace)
                         exists = True
                     except Exception:
                         exists = False
 
                 if exists:
-                    self._client.delete_collection(self.final_namespace)
+                    await self._client.delete_collection(self.final_namespace)
 
                 # Recreate the collection
-                QdrantVectorDBStorage.create_collection_if_not_exist(
-                    self._client,
-                    self.final_namespace,
-                    vectors_config=models.VectorParams(
-                        size=self.embedding_func.embedding_dim,
-                        distance=models.Distance.COSINE,
-                    ),
+                await QdrantVectorDBStorage.create_collection_if_not_exist(
+                    self._client, self.final_namespace, **self._collection_config()
                 )
+                await self._create_payload_indexes()
 
                 logger.info(
                     f"[{self.workspace}] Process {os.getpid()} drop Qdrant collection {self.namespace}"
@@ -1,4 +1,5 @@
 import os
+import asyncio
 import logging
 from typing import Any, final, Union
 from dataclasses import dataclass
@@ -42,6 +43,86 @@ SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "30.0"))
 SOCKET_CONNECT_TIMEOUT = float(os.getenv("REDIS_CONNECT_TIMEOUT", "10.0"))
 RETRY_ATTEMPTS = int(os.getenv("REDIS_RETRY_ATTEMPTS", "3"))
 
+# Batched KV reads: keys per MGET command inside a single pipeline, and the
+# batch size above which JSON decoding is moved off the event loop
+BATCH_SIZE = int(os.getenv("REDIS_BATCH_SIZE", "500"))
+DECODE_OFFLOAD_THRESHOLD = int(os.getenv("REDIS_DECODE_OFFLOAD_THRESHOLD", "64"))
+
+# Optional zstd compression of KV payloads (set REDIS_COMPRESSION=zstd to enable).
+# Values shorter than REDIS_COMPRESSION_MIN_SIZE bytes are stored as plain JSON.
+COMPRESSION = os.getenv("REDIS_COMPRESSION", "").strip().lower()
+COMPRESSION_LEVEL = int(os.getenv("REDIS_COMPRESSION_LEVEL", "3"))
+COMPRESSION_MIN_SIZE = int(os.getenv("REDIS_COMPRESSION_MIN_SIZE", "1024"))
+
+# zstd frames always start with this magic number, which can never begin a JSON document
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+if COMPRESSION == "zstd" and not pm.is_installed("zstandard"):
+    pm.install("zstandard")
+
+try:
+    import orjson
+
+    def _json_dumps(value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    _json_loads = orjson.loads
+except ImportError:
+
+    def _json_dumps(value: Any) -> bytes:
+        return json.dumps(value).encode("utf-8")
+
+    _json_loads = json.loads
+
+_zstd_compressor = None
+_zstd_decompressor = None
+
+
+def _encode_value(value: dict[str, Any]) -> bytes:
+    """Serialize a KV record, compressing it when zstd compression is enabled"""
+    global _zstd_compressor
+    payload = _json_dumps(value)
+    if COMPRESSION == "zstd" and len(payload) >= COMPRESSION_MIN_SIZE:
+        if _zstd_compressor is None:
+            import zstandard
+
+            _zstd_compressor = zstandard.ZstdCompressor(level=COMPRESSION_LEVEL)
+        payload = _zstd_compressor.compress(payload)
+    return payload
+
+
+def _decode_value(raw: bytes | str) -> Any:
+    """Deserialize a KV record written either as plain JSON or as a zstd frame.
+
+    Compressed records are always readable, even after REDIS_COMPRESSION is turned off.
+    """
+    global _zstd_decompressor
+    if isinstance(raw, bytes) and raw.startswith(_ZSTD_MAGIC):
+        if _zstd_decompressor is None:
+            if not pm.is_installed("zstandard"):
+                pm.install("zstandard")
+            import zstandard
+
+            _zstd_decompressor = zstandard.ZstdDecompressor()
+        raw = _zstd_decompressor.decompress(raw)
+    return _json_loads(raw)
+
+
+def _decode_values(raws: list[bytes | str | None]) -> list[Any]:
+    """Decode a batch of raw values, mapping missing or corrupt entries to None"""
+    results = []
+    for raw in raws:
+        if raw is None:
+            results.append(None)
+            continue
+        try:
+            results.append(_decode_value(raw))
+        except Exception as e:
+            logger.error(f"Decode error in Redis batch read: {e}")
+            results.append(None)
+    return results
+
+
 # Tenacity retry decorator for Redis operations
 redis_retry = retry(
     stop=stop_after_attempt(RETRY_ATTEMPTS),
@@ -62,32 +143,42 @@ class RedisConnectionManager:
     _pool_refs = {}  # Track reference count for each pool
     _lock = threading.Lock()
 
+    @staticmethod
+    def _pool_key(redis_url: str, decode_responses: bool) -> str:
+        return redis_url if decode_responses else f"{redis_url}#raw"
+
     @classmethod
-    def get_pool(cls, redis_url: str) -> ConnectionPool:
-        """Get or create a connection pool for the given Redis URL"""
+    def get_pool(cls, redis_url: str, decode_responses: bool = True) -> ConnectionPool:
+        """Get or create a connection pool for the given Redis URL
+
+        Pools returning raw bytes (decode_responses=False) are tracked separately
+        from the default text pools.
+        """
+        pool_key = cls._pool_key(redis_url, decode_responses)
         with cls._lock:
-            if redis_url not in cls._pools:
-                cls._pools[redis_url] = ConnectionPool.from_url(
+            if pool_key not in cls._pools:
+                cls._pools[pool_key] = ConnectionPool.from_url(
                     redis_url,
                     max_connections=MAX_CONNECTIONS,
-                    decode_responses=True,
+                    decode_responses=decode_responses,
                     socket_timeout=SOCKET_TIMEOUT,
                     socket_connect_timeout=SOCKET_CONNECT_TIMEOUT,
                 )
-                cls._pool_refs[redis_url] = 0
-                logger.info(f"Created shared Redis connection pool for {redis_url}")
+                cls._pool_refs[pool_key] = 0
+                logger.info(f"Created shared Redis connection pool for {pool_key}")
 
             # Increment reference count
-            cls._pool_refs[redis_url] += 1
+            cls._pool_refs[pool_key] += 1
             logger.debug(
-                f"Redis pool {redis_url} reference count: {cls._pool_refs[redis_url]}"
+                f"Redis pool {pool_key} reference count: {cls._pool_refs[pool_key]}"
             )
 
-        return cls._pools[redis_url]
+        return cls._pools[pool_key]
 
     @classmethod
-    def release_pool(cls, redis_url: str):
+    def release_pool(cls, redis_url: str, decode_responses: bool = True):
         """Release a reference to the connection pool"""
+        redis_url = cls._pool_key(redis_url, decode_responses)
         with cls._lock:
             if redis_url in cls._pool_refs:
                 cls._pool_refs[redis_url] -= 1
@@ -161,19 +252,31 @@ class RedisKVStorage(BaseKVStorage):
         )
         self._pool = None
         self._redis = None
+        # Values are read and written as raw bytes so zstd-compressed payloads survive
+        self._raw_pool = None
+        self._raw_redis = None
         self._initialized = False
 
         try:
             # Use shared connection pool
             self._pool = RedisConnectionManager.get_pool(self._redis_url)
             self._redis = Redis(connection_pool=self._pool)
+            self._raw_pool = RedisConnectionManager.get_pool(
+                self._redis_url, decode_responses=False
+            )
+            self._raw_redis = Redis(connection_pool=self._raw_pool)
             logger.info(
                 f"[{self.workspace}] Initialized Redis KV storage for {self.namespace} using shared connection pool"
             )
         except Exception as e:
             # Clean up on initialization failure
             if self._redis_url:
-                RedisConnectionManager.release_pool(self._redis_url)
+                if self._pool is not None:
+                    RedisConnectionManager.release_pool(self._redis_url)
+                if self._raw_pool is not None:
+                    RedisConnectionManager.release_pool(
+                        self._redis_url, decode_responses=False
+                    )
             logger.error(
                 f"[{self.workspace}] Failed to initialize Redis KV storage: {e}"
             )
@@ -247,10 +350,24 @@ class RedisKVStorage(BaseKVStorage):
             finally:
                 self._redis = None
 
+        if getattr(self, "_raw_redis", None):
+            try:
+                await self._raw_redis.close()
+            except Exception as e:
+                logger.error(f"[{self.workspace}] Error closing Redis connection: {e}")
+            finally:
+                self._raw_redis = None
+
         # Release the pool reference (will auto-close pool if no more references)
         if hasattr(self, "_redis_url") and self._redis_url:
-            RedisConnectionManager.release_pool(self._redis_url)
-            self._pool = None
+            if self._pool is not None:
+                RedisConnectionManager.release_pool(self._redis_url)
+                self._pool = None
+            if getattr(self, "_raw_pool", None) is not None:
+                RedisConnectionManager.release_pool(
+                    self._redis_url, decode_responses=False
+                )
+                self._raw_pool = None
             logger.debug(
                 f"[{self.workspace}] Released Redis connection pool reference for {self.namespace}"
             )
@@ -263,54 +380,63 @@ class RedisKVStorage(BaseKVStorage):
         """Ensure Redis resources are cleaned up when exiting context."""
         await self.close()
 
+    async def _exists_many(self, redis: Redis, keys: list[str]) -> list[bool]:
+        """Check key existence with one EXISTS per key, sent in a single pipeline round trip"""
+        pipe = redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.exists(f"{self.final_namespace}:{key}")
+        return [bool(exists) for exists in await pipe.execute()]
+
     @redis_retry
     async def get_by_id(self, id: str) -> dict[str, Any] | None:
-        async with self._get_redis_connection() as redis:
-            try:
-                data = await redis.get(f"{self.final_namespace}:{id}")
-                if data:
-                    result = json.loads(data)
-                    # Ensure time fields are present, provide default values for old data
-                    result.setdefault("create_time", 0)
-                    result.setdefault("update_time", 0)
-                    return result
+        async with self._get_redis_connection():
+            data = await self._raw_redis.get(f"{self.final_namespace}:{id}")
+            if not data:
                 return None
-            except json.JSONDecodeError as e:
+            try:
+                result = _decode_value(data)
+            except Exception as e:
                 logger.error(f"[{self.workspace}] JSON decode error for id {id}: {e}")
                 return None
+            # Ensure time fields are present, provide default values for old data
+            result.setdefault("create_time", 0)
+            result.setdefault("update_time", 0)
+            return result
 
     @redis_retry
     async def get_by_ids(self, ids: list[str]) -> list[dict[str, Any]]:
-        async with self._get_redis_connection() as redis:
-            try:
-                pipe = redis.pipeline()
-                for id in ids:
-                    pipe.get(f"{self.final_namespace}:{id}")
-                results = await pipe.execute()
+        if not ids:
+            return []
+
+        async with self._get_redis_connection():
+            # One MGET per BATCH_SIZE ids, all flushed in a single round trip
+            pipe = self._raw_redis.pipeline(transaction=False)
+            for i in range(0, len(ids), BATCH_SIZE):
+                pipe.mget(
+                    [f"{self.final_namespace}:{id}" for id in ids[i : i + BATCH_SIZE]]
+                )
+            raws = [raw for chunk in await pipe.execute() for raw in chunk]
 
-                processed_results = []
-                for result in results:
-                    if result:
-                        data = json.loads(result)
-                        # Ensure time fields are present for all documents
-                        data.setdefault("create_time", 0)
-                        data.setdefault("update_time", 0)
-                        processed_results.append(data)
-                    else:
-                        processed_results.append(None)
+        # Large batches are decoded in a worker thread to keep the event loop responsive
+        if len(raws) >= DECODE_OFFLOAD_THRESHOLD:
+            processed_results = await asyncio.to_thread(_decode_values, raws)
+        else:
+            processed_results = _decode_values(raws)
 
-                return processed_results
-            except json.JSONDecodeError as e:
-                logger.error(f"[{self.workspace}] JSON decode error in batch get: {e}")
-                return [None] * len(ids)
+        for data in processed_results:
+            if data is not None:
+                # Ensure time fields are present for all documents
+                data.setdefault("create_time", 0)
+                data.setdefault("update_time", 0)
+        return processed_results
 
     async def filter_keys(self, keys: set[str]) -> set[str]:
+        if not keys:
+            return set()
+
         async with self._get_redis_connection() as redis:
-            pipe = redis.pipeline()
             keys_list = list(keys)  # Convert set to list for indexing
-            for key in keys_list:
-                pipe.exists(f"{self.final_namespace}:{key}")
-            results = await pipe.execute()
+            results = await self._exists_many(redis, keys_list)
 
             existing_ids = {keys_list[i] for i, exists in enumerate(results) if exists}
             return set(keys) - existing_ids
@@ -327,10 +453,7 @@ class RedisKVStorage(BaseKVStorage):
         async with self._get_redis_connection() as redis:
             try:
                 # Check which keys already exist to determine create vs update
-                pipe = redis.pipeline()
-                for k in data.keys():
-                    pipe.exists(f"{self.final_namespace}:{k}")
-                exists_results = await pipe.execute()
+                exists_results = await self._exists_many(redis, list(data.keys()))
 
                 # Add timestamps to data
                 for i, (k, v) in enumerate(data.items()):
@@ -349,9 +472,9 @@ class RedisKVStorage(BaseKVStorage):
                     v["_id"] = k
 
                 # Store the data
-                pipe = redis.pipeline()
+                pipe = self._raw_redis.pipeline(transaction=False)
                 for k, v in data.items():
-                    pipe.set(f"{self.final_namespace}:{k}", json.dumps(v))
+                    pipe.set(f"{self.final_namespace}:{k}", _encode_value(v))
                 await pipe.execute()
 
             except json.JSONDecodeError as e:
@@ -469,17 +592,17 @@ class RedisKVStorage(BaseKVStorage):
                     break  # Early exit - migration already done
 
                 # Get the data to check if it's a legacy nested structure
-                data = await redis.get(key)
+                data = await self._raw_redis.get(key)
                 if data:
                     try:
-                        parsed_data = json.loads(data)
+                        parsed_data = _decode_value(data)
                         # Check if this looks like a legacy cache mode with nested structure
                         if isinstance(parsed_data, dict) and all(
                             isinstance(v, dict) and "return" in v
                             for v in parsed_data.values()
                         ):
                             keys_to_migrate.append((key, key_id, parsed_data))
-                    except json.JSONDecodeError:
+                    except Exception:
                         continue
 
             # If we found any flattened keys, assume migration is already done
@@ -1,9 +1,15 @@
 import os
 import sys
 import asyncio
+import pickle
+import struct
+import threading
+import zlib
 import multiprocessing as mp
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing.synchronize import Lock as ProcessLock
-from multiprocessing import Manager
+from multiprocessing import shared_memory
+from multiprocessing.managers import SyncManager
 import time
 import logging
 from typing import Any, Dict, List, Optional, Union, TypeVar, Generic
@@ -55,21 +61,18 @@ _is_multiprocess = None
 _workers = None
 _manager = None
 
-# Global singleton data for multi-process keyed locks
-_lock_registry: Optional[Dict[str, mp.synchronize.Lock]] = None
-_lock_registry_count: Optional[Dict[str, int]] = None
-_lock_cleanup_data: Optional[Dict[str, time.time]] = None
-_registry_guard = None
+# Shared lock table for multi-process keyed locks (served by the Manager process)
+_keyed_lock_table: Optional["_KeyedLockTable"] = None
+# Number of lock stripes keys are hashed onto in multi-process mode (Default 4096)
+KEYED_LOCK_STRIPES = int(os.getenv("KEYED_LOCK_STRIPES", 4096))
+# Threads per process waiting for stripes held by other processes (Default 8)
+KEYED_LOCK_WAIT_THREADS = int(os.getenv("KEYED_LOCK_WAIT_THREADS", 8))
 # Timeout for keyed locks in seconds (Default 300)
 CLEANUP_KEYED_LOCKS_AFTER_SECONDS = 300
 # Cleanup pending list threshold for triggering cleanup (Default 500)
 CLEANUP_THRESHOLD = 500
 # Minimum interval between cleanup operations in seconds (Default 30)
 MIN_CLEANUP_INTERVAL_SECONDS = 30
-# Track the earliest cleanup time for efficient cleanup triggering (multiprocess locks only)
-_earliest_mp_cleanup_time: Optional[float] = None
-# Track the last cleanup time to enforce minimum interval (multiprocess locks only)
-_last_mp_cleanup_time: Optional[float] = None
 
 _initialized = None
 
@@ -77,6 +80,9 @@ _initialized = None
 _shared_dicts: Optional[Dict[str, Any]] = None
 _init_flags: Optional[Dict[str, bool]] = None  # namespace -> initialized
 _update_flags: Optional[Dict[str, bool]] = None  # namespace -> updated
+_storage_revisions: Optional[Dict[str, int]] = None  # namespace -> revision
+# Revisions start from the Shared-Data creation time so they never repeat across restarts
+_storage_revision_base: int = 0
 
 # locks for mutex access
 _storage_lock: Optional[LockType] = None
@@ -90,6 +96,16 @@ _storage_keyed_lock: Optional["KeyedUnifiedLock"] = None
 # async locks for coroutine synchronization in multiprocess mode
 _async_locks: Optional[Dict[str, asyncio.Lock]] = None
 
+# Shared-memory namespace snapshots for IPC-free reads in multiprocess mode
+# Maximum number of namespaces that can publish snapshots (Default 256)
+MAX_SNAPSHOT_NAMESPACES = 256
+# [data_version, snapshot_version] pairs per slot, lives in memory shared across forks
+_snapshot_versions: Optional[Any] = None
+_snapshot_slots: Optional[Dict[str, int]] = None  # namespace -> slot
+# namespace -> (shm name, version)
+_snapshot_segments: Optional[Dict[str, tuple]] = None
+_local_snapshot_slots: Dict[str, int] = {}  # per-process cache of _snapshot_slots
+
 DEBUG_LOCKS = False
 _debug_n_locks_acquired: int = 0
 
@@ -414,98 +430,82 @@ def _perform_lock_cleanup(
         return 0, earliest_cleanup_time, last_cleanup_time
 
 
-def _get_or_create_shared_raw_mp_lock(
-    factory_name: str, key: str
-) -> Optional[mp.synchronize.Lock]:
-    """Return the *singleton* manager.Lock() proxy for keyed lock, creating if needed."""
-    if not _is_multiprocess:
-        return None
+def _get_lock_stripes(namespace: str, keys: list[str]) -> list[int]:
+    """Map keys onto sorted, de-duplicated stripe ids (stable across processes)"""
+    return sorted(
+        {
+            zlib.crc32(_get_combined_key(namespace, key).encode("utf-8"))
+            % KEYED_LOCK_STRIPES
+            for key in keys
+        }
+    )
 
-    with _registry_guard:
-        combined_key = _get_combined_key(factory_name, key)
-        raw = _lock_registry.get(combined_key)
-        count = _lock_registry_count.get(combined_key)
-        if raw is None:
-            raw = _manager.Lock()
-            _lock_registry[combined_key] = raw
-            count = 0
-        else:
-            if count is None:
-                raise RuntimeError(
-                    f"Shared-Data lock registry for {factory_name} is corrupted for key {key}"
-                )
-            if (
-                count == 0 and combined_key in _lock_cleanup_data
-            ):  # Reusing an key waiting for cleanup, remove it from cleanup list
-                _lock_cleanup_data.pop(combined_key)
-        count += 1
-        _lock_registry_count[combined_key] = count
-        return raw
 
+class _KeyedLockTable:
+    """
+    Table of held lock stripes living in the Manager process.
 
-def _release_shared_raw_mp_lock(factory_name: str, key: str):
-    """Release the *singleton* manager.Lock() proxy for *key*."""
-    if not _is_multiprocess:
-        return
+    A whole set of stripes is reserved all-or-nothing in a single call, so a
+    multi-key lock costs one IPC round trip to acquire and one to release, and
+    no per-key lock objects or cleanup are needed. Acquiring the set atomically
+    also rules out lock-order deadlocks.
 
-    global _earliest_mp_cleanup_time, _last_mp_cleanup_time
+    Stripes are owned by processes: a process may reserve a stripe it already
+    holds again (the holders are counted), keys of the same process are kept
+    apart by KeyedUnifiedLock itself.
+    """
 
-    with _registry_guard:
-        combined_key = _get_combined_key(factory_name, key)
-        raw = _lock_registry.get(combined_key)
-        count = _lock_registry_count.get(combined_key)
-        if raw is None and count is None:
-            return
-        elif raw is None or count is None:
-            raise RuntimeError(
-                f"Shared-Data lock registry for {factory_name} is corrupted for key {key}"
-            )
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._owners: dict[int, int] = {}  # stripe -> owner process id
+        self._holders: dict[int, int] = {}  # stripe -> number of holders
+
+    def _available(self, stripes: list[int], owner: int) -> bool:
+        return all(self._owners.get(stripe, owner) == owner for stripe in stripes)
+
+    def acquire(self, stripes: list[int], owner: int, blocking: bool = True) -> bool:
+        with self._cond:
+            if not blocking and not self._available(stripes, owner):
+                return False
+            self._cond.wait_for(lambda: self._available(stripes, owner))
+            for stripe in stripes:
+                self._owners[stripe] = owner
+                self._holders[stripe] = self._holders.get(stripe, 0) + 1
+            return True
 
-        count -= 1
-        if count < 0:
-            raise RuntimeError(
-                f"Attempting to release lock for {key} more times than it was acquired"
-            )
+    def release(self, stripes: list[int], owner: int) -> None:
+        with self._cond:
+            for stripe in stripes:
+                if self._owners.get(stripe) != owner:
+                    continue
+                holders = self._holders[stripe] - 1
+                if holders:
+                    self._holders[stripe] = holders
+                else:
+                    del self._owners[stripe], self._holders[stripe]
+            self._cond.notify_all()
 
-        _lock_registry_count[combined_key] = count
+    def held_count(self) -> int:
+        with self._cond:
+            return len(self._owners)
 
-        current_time = time.time()
-        if count == 0:
-            _lock_cleanup_data[combined_key] = current_time
 
-            # Update earliest multiprocess cleanup time (only when earlier)
-            if (
-                _earliest_mp_cleanup_time is None
-                or current_time < _earliest_mp_cleanup_time
-            ):
-                _earliest_mp_cleanup_time = current_time
+class _SharedDataManager(SyncManager):
+    """SyncManager that also serves the keyed lock table"""
 
-        # Use generic cleanup function
-        cleaned_count, new_earliest_time, new_last_cleanup_time = _perform_lock_cleanup(
-            lock_type="mp",
-            cleanup_data=_lock_cleanup_data,
-            lock_registry=_lock_registry,
-            lock_count=_lock_registry_count,
-            earliest_cleanup_time=_earliest_mp_cleanup_time,
-            last_cleanup_time=_last_mp_cleanup_time,
-            current_time=current_time,
-            threshold_check=True,
-        )
 
-        # Update global state if cleanup was performed
-        if cleaned_count > 0:
-            _earliest_mp_cleanup_time = new_earliest_time
-            _last_mp_cleanup_time = new_last_cleanup_time
+_SharedDataManager.register("KeyedLockTable", _KeyedLockTable)
 
 
 class KeyedUnifiedLock:
     """
     Manager for unified keyed locks, supporting both single and multi-process
 
-    • Keeps only a table of async keyed locks locally
-    • Fetches the multi-process keyed lock on every acquire
-    • Builds a fresh `UnifiedLock` each time, so `enable_logging`
-      (or future options) can vary per call.
+    • Single process: keeps a table of async keyed locks locally and builds a
+      fresh `UnifiedLock` each time, so `enable_logging` can vary per call.
+    • Multi-process: keys are excluded per key among the coroutines of a worker
+      (without blocking the event loop) and per lock stripe across workers: the
+      whole sorted stripe set is reserved in one call to the shared lock table.
     • Supports dynamic namespaces specified at lock usage time
     """
 
@@ -518,9 +518,11 @@ class KeyedUnifiedLock:
         self._async_lock_cleanup_data: Dict[
             str, time.time
         ] = {}  # local keyed locks timeout
-        self._mp_locks: Dict[
-            str, mp.synchronize.Lock
-        ] = {}  # multi-process lock proxies
+        self._local_keys: set[str] = set()  # combined keys held by this process
+        self._stripe_cond: Optional[asyncio.Condition] = None
+        # Bounded pool for waits on stripes held by other processes
+        self._wait_executor: Optional[ThreadPoolExecutor] = None
+        self._wait_executor_pid: Optional[int] = None
         self._earliest_async_cleanup_time: Optional[float] = (
             None  # track earliest async cleanup time
         )
@@ -594,53 +596,111 @@ class KeyedUnifiedLock:
     def _get_lock_for_key(
         self, namespace: str, key: str, enable_logging: bool = False
     ) -> UnifiedLock:
+        """Build the keyed lock used in single process mode"""
         # 1. Create combined key for this namespace:key combination
         combined_key = _get_combined_key(namespace, key)
 
-        # 2. get (or create) the per‑process async gate for this combined key
+        # 2. get (or create) the async lock for this combined key
         # Is synchronous, so no need to acquire a lock
         async_lock = self._get_or_create_async_lock(combined_key)
 
-        # 3. fetch the shared raw lock
-        raw_lock = _get_or_create_shared_raw_mp_lock(namespace, key)
-        is_multiprocess = raw_lock is not None
-        if not is_multiprocess:
-            raw_lock = async_lock
-
-        # 4. build a *fresh* UnifiedLock with the chosen logging flag
-        if is_multiprocess:
-            return UnifiedLock(
-                lock=raw_lock,
-                is_async=False,  # manager.Lock is synchronous
-                name=combined_key,
-                enable_logging=enable_logging,
-                async_lock=async_lock,  # prevents event‑loop blocking
-            )
-        else:
-            return UnifiedLock(
-                lock=raw_lock,
-                is_async=True,
-                name=combined_key,
-                enable_logging=enable_logging,
-                async_lock=None,  # No need for async lock in single process mode
-            )
+        # 3. build a *fresh* UnifiedLock with the chosen logging flag
+        return UnifiedLock(
+            lock=async_lock,
+            is_async=True,
+            name=combined_key,
+            enable_logging=enable_logging,
+            async_lock=None,  # No need for async lock in single process mode
+        )
 
     def _release_lock_for_key(self, namespace: str, key: str):
         combined_key = _get_combined_key(namespace, key)
         self._release_async_lock(combined_key)
-        _release_shared_raw_mp_lock(namespace, key)
+
+    def _get_stripe_condition(self) -> asyncio.Condition:
+        if self._stripe_cond is None:
+            self._stripe_cond = asyncio.Condition()
+        return self._stripe_cond
+
+    def _get_wait_executor(self) -> ThreadPoolExecutor:
+        # Threads do not survive a fork, every worker process gets its own pool
+        if self._wait_executor is None or self._wait_executor_pid != os.getpid():
+            self._wait_executor = ThreadPoolExecutor(
+                max_workers=KEYED_LOCK_WAIT_THREADS,
+                thread_name_prefix="keyed_lock_wait",
+            )
+            self._wait_executor_pid = os.getpid()
+        return self._wait_executor
+
+    def shutdown_wait_executor(self):
+        if self._wait_executor is not None and self._wait_executor_pid == os.getpid():
+            self._wait_executor.shutdown(wait=False, cancel_futures=True)
+        self._wait_executor = None
+        self._wait_executor_pid = None
+
+    async def _acquire_stripes(self, combined_keys: list[str], stripes: list[int]):
+        """Reserve keys locally, then their stripes in the shared lock table (multi-process mode)
+
+        Coroutines of this process are excluded per key and other processes per stripe.
+        As the table counts holders per process, a key hashing onto a stripe this process
+        already holds never waits for that stripe, whichever task or namespace holds it
+        (e.g. a child task locking another key while its parent holds a keyed lock).
+        Locking a key its own task or lock context already holds still waits forever,
+        like the asyncio locks of single process mode.
+        """
+        cond = self._get_stripe_condition()
+        async with cond:
+            await cond.wait_for(lambda: self._local_keys.isdisjoint(combined_keys))
+            self._local_keys.update(combined_keys)
+
+        owner = os.getpid()
+        try:
+            # Uncontended case: a single non-blocking round trip
+            if _keyed_lock_table.acquire(stripes, owner, False):
+                return
+            # Held by another process: wait in a thread to keep the event loop free
+            loop = asyncio.get_running_loop()
+            acquire_future = loop.run_in_executor(
+                self._get_wait_executor(),
+                _keyed_lock_table.acquire,
+                stripes,
+                owner,
+                True,
+            )
+            try:
+                await asyncio.shield(acquire_future)
+            except asyncio.CancelledError:
+                # The blocking call cannot be interrupted, give the stripes back once it returns
+                def _release_when_acquired(future):
+                    if not future.cancelled() and future.exception() is None:
+                        _keyed_lock_table.release(stripes, owner)
+
+                acquire_future.add_done_callback(_release_when_acquired)
+                raise
+        except BaseException:
+            await self._release_local_keys(combined_keys)
+            raise
+
+    async def _release_stripes(self, combined_keys: list[str], stripes: list[int]):
+        try:
+            _keyed_lock_table.release(stripes, os.getpid())
+        finally:
+            await self._release_local_keys(combined_keys)
+
+    async def _release_local_keys(self, combined_keys: list[str]):
+        cond = self._get_stripe_condition()
+        async with cond:
+            self._local_keys.difference_update(combined_keys)
+            cond.notify_all()
 
     def cleanup_expired_locks(self) -> Dict[str, Any]:
         """
-        Cleanup expired locks for both async and multiprocess locks following the same
-        conditions as _release_shared_raw_mp_lock and _release_async_lock functions.
+        Cleanup expired async locks following the same conditions as _release_async_lock.
+        Multiprocess keyed locks are striped and never need cleanup.
 
         Only performs cleanup when both has_expired_locks and interval_satisfied conditions are met
         to avoid too frequent cleanup operations.
 
-        Since async and multiprocess locks work together, this method cleans up
-        both types of expired locks and returns comprehensive statistics.
-
         Returns:
             Dict containing cleanup statistics and current status:
             {
@@ -657,50 +717,13 @@ class KeyedUnifiedLock:
                 }
             }
         """
-        global _lock_registry, _lock_registry_count, _lock_cleanup_data
-        global _registry_guard, _earliest_mp_cleanup_time, _last_mp_cleanup_time
-
         cleanup_stats = {"mp_cleaned": 0, "async_cleaned": 0}
 
         current_time = time.time()
 
-        # 1. Cleanup multiprocess locks using generic function
-        if (
-            _is_multiprocess
-            and _lock_registry is not None
-            and _registry_guard is not None
-        ):
-            try:
-                with _registry_guard:
-                    if _lock_cleanup_data is not None:
-                        # Use generic cleanup function without threshold check
-                        cleaned_count, new_earliest_time, new_last_cleanup_time = (
-                            _perform_lock_cleanup(
-                                lock_type="mp",
-                                cleanup_data=_lock_cleanup_data,
-                                lock_registry=_lock_registry,
-                                lock_count=_lock_registry_count,
-                                earliest_cleanup_time=_earliest_mp_cleanup_time,
-                                last_cleanup_time=_last_mp_cleanup_time,
-                                current_time=current_time,
-                                threshold_check=False,  # Force cleanup in cleanup_expired_locks
-                            )
-                        )
+        # Multiprocess locks are fixed stripes in the shared lock table, nothing to clean up
 
-                        # Update global state if cleanup was performed
-                        if cleaned_count > 0:
-                            _earliest_mp_cleanup_time = new_earliest_time
-                            _last_mp_cleanup_time = new_last_cleanup_time
-                            cleanup_stats["mp_cleaned"] = cleaned_count
-
-            except Exception as e:
-                direct_log(
-                    f"Error during multiprocess lock cleanup: {e}",
-                    level="ERROR",
-                    enable_output=True,
-                )
-
-        # 2. Cleanup async locks using generic function
+        # 1. Cleanup async locks using generic function
         try:
             # Use generic cleanup function without threshold check
             cleaned_count, new_earliest_time, new_last_cleanup_time = (
@@ -729,7 +752,7 @@ class KeyedUnifiedLock:
                 enable_output=True,
             )
 
-        # 3. Get current status after cleanup
+        # 2. Get current status after cleanup
         current_status = self.get_lock_status()
 
         return {
@@ -754,8 +777,6 @@ class KeyedUnifiedLock:
                 "pending_async_cleanup": 1
             }
         """
-        global _lock_registry_count, _lock_cleanup_data, _registry_guard
-
         status = {
             "total_mp_locks": 0,
             "pending_mp_cleanup": 0,
@@ -764,13 +785,9 @@ class KeyedUnifiedLock:
         }
 
         try:
-            # Count multiprocess locks
-            if _is_multiprocess and _lock_registry_count is not None:
-                if _registry_guard is not None:
-                    with _registry_guard:
-                        status["total_mp_locks"] = len(_lock_registry_count)
-                        if _lock_cleanup_data is not None:
-                            status["pending_mp_cleanup"] = len(_lock_cleanup_data)
+            # Count multiprocess locks (stripes currently held across all processes)
+            if _is_multiprocess and _keyed_lock_table is not None:
+                status["total_mp_locks"] = _keyed_lock_table.held_count()
 
             # Count async locks
             status["total_async_locks"] = len(self._async_lock_count)
@@ -806,12 +823,28 @@ class _KeyedLockContext:
             else parent._default_enable_logging
         )
         self._ul: Optional[List[Dict[str, Any]]] = None  # set in __aenter__
+        self._stripes: Optional[List[int]] = None  # set in __aenter__ (multiprocess)
 
     # ----- enter -----
     async def __aenter__(self):
-        if self._ul is not None:
+        if self._ul is not None or self._stripes is not None:
             raise RuntimeError("KeyedUnifiedLock already acquired in current context")
 
+        if _is_multiprocess and _keyed_lock_table is not None:
+            # Reserve all keys at once: one round trip instead of one lock per key
+            stripes = _get_lock_stripes(self._namespace, self._keys)
+            combined_keys = [
+                _get_combined_key(self._namespace, key) for key in self._keys
+            ]
+            await self._parent._acquire_stripes(combined_keys, stripes)
+            self._stripes = stripes
+            direct_log(
+                f"== Lock == Process {os.getpid()}: Acquired {len(self._keys)} keyed locks in {self._namespace} ({len(stripes)} stripes)",
+                level="INFO",
+                enable_output=self._enable_logging,
+            )
+            return self
+
         self._ul = []
 
         try:
@@ -949,6 +982,20 @@ class _KeyedLockContext:
 
     # ----- exit -----
     async def __aexit__(self, exc_type, exc, tb):
+        if self._stripes is not None:
+            stripes, self._stripes = self._stripes, None
+            combined_keys = [
+                _get_combined_key(self._namespace, key) for key in self._keys
+            ]
+            # Protect the release from cancellation so stripes are never leaked
+            await asyncio.shield(self._parent._release_stripes(combined_keys, stripes))
+            direct_log(
+                f"== Lock == Process {os.getpid()}: Released {len(self._keys)} keyed locks in {self._namespace}",
+                level="INFO",
+                enable_output=self._enable_logging,
+            )
+            return
+
         if self._ul is None:
             return
 
@@ -1167,6 +1214,202 @@ def get_keyed_lock_status() -> Dict[str, Any]:
     return status
 
 
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """Attach to an existing shared memory segment without handing it to the resource tracker"""
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if os.name == "posix":
+        # Before 3.13 attaching registers the segment, and the tracker would unlink
+        # it when this process exits although other workers still publish/read it
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(shm._name, "shared_memory")
+    return shm
+
+
+def _unlink_shared_memory(name: str):
+    """Remove a snapshot segment, processes still attached keep their mapping"""
+    try:
+        shm = _attach_shared_memory(name)
+    except FileNotFoundError:
+        return
+    shm.close()
+    if sys.version_info < (3, 13) and os.name == "posix":
+        # unlink() unregisters the segment from the resource tracker, register it first
+        from multiprocessing import resource_tracker
+
+        resource_tracker.register(shm._name, "shared_memory")
+    shm.unlink()
+
+
+class NamespaceSnapshot:
+    """Immutable view of a namespace published in shared memory
+
+    Every record is pickled separately behind an offset index, so a lookup decodes
+    only the requested record straight from the shared segment without any IPC.
+
+    Segment layout: [index length: 8 bytes][pickled {key: (start, end)}][records]
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, version: int):
+        self._shm = shm
+        self.version = version
+        index_len = struct.unpack_from("<Q", shm.buf, 0)[0]
+        self._index: Dict[str, tuple[int, int]] = pickle.loads(
+            shm.buf[8 : 8 + index_len]
+        )
+        self._base = 8 + index_len
+
+    @staticmethod
+    def create(data: Dict[str, Any]) -> shared_memory.SharedMemory:
+        """Serialize data into a new shared memory segment"""
+        index = {}
+        records = []
+        pos = 0
+        for key, value in data.items():
+            raw = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            index[key] = (pos, pos + len(raw))
+            pos += len(raw)
+            records.append(raw)
+        header = pickle.dumps(index, protocol=pickle.HIGHEST_PROTOCOL)
+
+        shm = shared_memory.SharedMemory(create=True, size=8 + len(header) + pos)
+        struct.pack_into("<Q", shm.buf, 0, len(header))
+        offset = 8
+        for raw in (header, *records):
+            shm.buf[offset : offset + len(raw)] = raw
+            offset += len(raw)
+        return shm
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def keys(self):
+        return self._index.keys()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        span = self._index.get(key)
+        if span is None:
+            return default
+        start, end = span
+        return pickle.loads(self._shm.buf[self._base + start : self._base + end])
+
+    def close(self):
+        try:
+            self._shm.close()
+        except BufferError:
+            pass  # a record is being decoded; the mapping is freed with the object
+
+
+async def register_namespace_snapshot(namespace: str) -> bool:
+    """
+    Reserve a snapshot slot for a namespace so it can publish and read shared-memory snapshots.
+    Must be called by every worker using the namespace. Returns False in single process mode
+    or when all slots are taken (reads then keep going through the shared dict).
+    """
+    if not _is_multiprocess or _snapshot_versions is None:
+        return False
+    if namespace in _local_snapshot_slots:
+        return True
+
+    async with get_internal_lock():
+        slot = _snapshot_slots.get(namespace)
+        if slot is None:
+            if len(_snapshot_slots) >= MAX_SNAPSHOT_NAMESPACES:
+                direct_log(
+                    f"Process {os.getpid()} no snapshot slot left for namespace: [{namespace}]",
+                    level="WARNING",
+                )
+                return False
+            slot = len(_snapshot_slots)
+            _snapshot_slots[namespace] = slot
+    _local_snapshot_slots[namespace] = slot
+    return True
+
+
+def _bump_snapshot_data_version(namespace: str):
+    """Invalidate the published snapshot of a namespace (call with internal lock held)"""
+    if _snapshot_slots is None:
+        return
+    slot = _local_snapshot_slots.get(namespace)
+    if slot is None:
+        # Writers register on initialization, but never miss a bump for a namespace
+        # registered by other workers only
+        slot = _snapshot_slots.get(namespace)
+        if slot is None:
+            return
+        _local_snapshot_slots[namespace] = slot
+    _snapshot_versions[slot * 2] += 1
+
+
+async def publish_namespace_snapshot(namespace: str, data: Dict[str, Any]) -> bool:
+    """
+    Publish an immutable shared-memory snapshot of the namespace data for other workers.
+
+    Must be called while holding the storage lock with a plain dict copy of the namespace,
+    so the snapshot matches the current data version. The previously published segment is
+    unlinked; workers still attached to it keep reading it until they swap.
+    """
+    slot = _local_snapshot_slots.get(namespace)
+    if slot is None:
+        return False
+
+    version = _snapshot_versions[slot * 2]
+    shm = NamespaceSnapshot.create(data)
+    if sys.version_info < (3, 13) and os.name == "posix":
+        # Segment lifetime is managed explicitly, not by the creating process
+        from multiprocessing import resource_tracker
+
+        resource_tracker.unregister(shm._name, "shared_memory")
+    shm.close()
+
+    async with get_internal_lock():
+        previous = _snapshot_segments.get(namespace)
+        _snapshot_segments[namespace] = (shm.name, version)
+        _snapshot_versions[slot * 2 + 1] = version
+
+    if previous is not None:
+        _unlink_shared_memory(previous[0])
+    return True
+
+
+def get_namespace_snapshot(
+    namespace: str, current: Optional[NamespaceSnapshot] = None
+) -> Optional[NamespaceSnapshot]:
+    """
+    Return a snapshot reflecting the latest namespace data for lock-free local reads.
+
+    The version check is a plain shared-memory read; only swapping to a newly published
+    snapshot costs one IPC round trip. Returns None when no up-to-date snapshot exists
+    (single process mode, or writes not yet published), the caller must then read
+    through the shared dict. A stale `current` snapshot is closed.
+    """
+    slot = _local_snapshot_slots.get(namespace)
+    if slot is None:
+        return None
+
+    data_version = _snapshot_versions[slot * 2]
+    if current is not None:
+        if current.version == data_version:
+            return current
+        current.close()
+    if _snapshot_versions[slot * 2 + 1] != data_version:
+        return None
+
+    published = _snapshot_segments.get(namespace)
+    if published is None or published[1] != data_version:
+        return None
+    try:
+        return NamespaceSnapshot(_attach_shared_memory(published[0]), published[1])
+    except FileNotFoundError:
+        # Replaced and unlinked in the meantime, next read picks up the new one
+        return None
+
+
 def initialize_share_data(workers: int = 1):
     """
     Initialize shared storage data for single or multi-process mode.
@@ -1190,10 +1433,7 @@ def initialize_share_data(workers: int = 1):
         _workers, \
         _is_multiprocess, \
         _storage_lock, \
-        _lock_registry, \
-        _lock_registry_count, \
-        _lock_cleanup_data, \
-        _registry_guard, \
+        _keyed_lock_table, \
         _internal_lock, \
         _pipeline_status_lock, \
         _graph_db_lock, \
@@ -1202,10 +1442,13 @@ def initialize_share_data(workers: int = 1):
         _init_flags, \
         _initialized, \
         _update_flags, \
+        _storage_revisions, \
+        _storage_revision_base, \
         _async_locks, \
         _storage_keyed_lock, \
-        _earliest_mp_cleanup_time, \
-        _last_mp_cleanup_time
+        _snapshot_versions, \
+        _snapshot_slots, \
+        _snapshot_segments
 
     # Check if already initialized
     if _initialized:
@@ -1218,11 +1461,9 @@ def initialize_share_data(workers: int = 1):
 
     if workers > 1:
         _is_multiprocess = True
-        _manager = Manager()
-        _lock_registry = _manager.dict()
-        _lock_registry_count = _manager.dict()
-        _lock_cleanup_data = _manager.dict()
-        _registry_guard = _manager.RLock()
+        _manager = _SharedDataManager()
+        _manager.start()
+        _keyed_lock_table = _manager.KeyedLockTable()
         _internal_lock = _manager.Lock()
         _storage_lock = _manager.Lock()
         _pipeline_status_lock = _manager.Lock()
@@ -1231,6 +1472,11 @@ def initialize_share_data(workers: int = 1):
         _shared_dicts = _manager.dict()
         _init_flags = _manager.dict()
         _update_flags = _manager.dict()
+        _storage_revisions = _manager.dict()
+        # Version counters are read on every snapshot lookup, keep them out of the Manager
+        _snapshot_versions = mp.RawArray("Q", MAX_SNAPSHOT_NAMESPACES * 2)
+        _snapshot_slots = _manager.dict()
+        _snapshot_segments = _manager.dict()
 
         _storage_keyed_lock = KeyedUnifiedLock()
 
@@ -1256,14 +1502,13 @@ def initialize_share_data(workers: int = 1):
         _shared_dicts = {}
         _init_flags = {}
         _update_flags = {}
+        _storage_revisions = {}
         _async_locks = None  # No need for async locks in single process mode
 
         _storage_keyed_lock = KeyedUnifiedLock()
         direct_log(f"Process {os.getpid()} Shared-Data created for Single Process")
 
-    # Initialize multiprocess cleanup times
-    _earliest_mp_cleanup_time = None
-    _last_mp_cleanup_time = None
+    _storage_revision_base = time.time_ns()
 
     # Mark as initialized
     _initialized = True
@@ -1345,6 +1590,7 @@ async def set_all_update_flags(namespace: str):
         # Update flags for both modes
         for i in range(len(_update_flags[namespace])):
             _update_flags[namespace][i].value = True
+        _bump_snapshot_data_version(namespace)
 
 
 async def clear_all_update_flags(namespace: str):
@@ -1361,6 +1607,31 @@ async def clear_all_update_flags(namespace: str):
             _update_flags[namespace][i].value = False
 
 
+async def bump_storage_revision(namespace: str):
+    """Advance the revision counter of a namespace after its data has changed"""
+    if _storage_revisions is None:
+        # No shared data means no worker serving cached views of the storage
+        return
+
+    async with get_internal_lock():
+        _storage_revisions[namespace] = (
+            _storage_revisions.get(namespace, _storage_revision_base) + 1
+        )
+
+
+def get_storage_revision(namespace: str) -> int:
+    """
+    Get the revision counter of a namespace.
+
+    The revision changes every time bump_storage_revision is called for the
+    namespace, in any worker, so readers can tell that a cached view of the data
+    is still current without querying the storage.
+    """
+    if _storage_revisions is None:
+        return 0
+    return _storage_revisions.get(namespace, _storage_revision_base)
+
+
 async def get_all_update_flags_status() -> Dict[str, list]:
     """
     Get update flags status for all namespaces.
@@ -1465,7 +1736,12 @@ def finalize_share_data():
         _init_flags, \
         _initialized, \
         _update_flags, \
-        _async_locks
+        _storage_revisions, \
+        _async_locks, \
+        _keyed_lock_table, \
+        _snapshot_versions, \
+        _snapshot_slots, \
+        _snapshot_segments
 
     # Check if already initialized
     if not _initialized:
@@ -1509,6 +1785,16 @@ def finalize_share_data():
                 except Exception:
                     pass  # Ignore any errors during update flags cleanup
                 _update_flags.clear()
+            if _snapshot_segments is not None:
+                try:
+                    for shm_name, _ in _snapshot_segments.values():
+                        _unlink_shared_memory(shm_name)
+                except Exception:
+                    pass  # Ignore any errors during snapshot cleanup
+                _snapshot_segments.clear()
+
+            if _storage_keyed_lock is not None:
+                _storage_keyed_lock.shutdown_wait_executor()
 
             # Shut down the Manager - this will automatically clean up all shared resources
             _manager.shutdown()
@@ -1530,6 +1816,12 @@ def finalize_share_data():
     _graph_db_lock = None
     _data_init_lock = None
     _update_flags = None
+    _storage_revisions = None
     _async_locks = None
+    _keyed_lock_table = None
+    _snapshot_versions = None
+    _snapshot_slots = None
+    _snapshot_segments = None
+    _local_snapshot_slots.clear()
 
     direct_log(f"Process {os.getpid()} storage data finalization complete")
@@ -3,16 +3,22 @@ from __future__ import annotations
 import traceback
 import asyncio
 import configparser
+import multiprocessing
 import os
+import pickle
 import time
 import warnings
-from dataclasses import asdict, dataclass, field
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field, replace
 from datetime import datetime, timezone
 from functools import partial
 from typing import (
     Any,
+    AsyncIterable,
     AsyncIterator,
     Callable,
+    Iterable,
     Iterator,
     cast,
     final,
@@ -25,6 +31,17 @@ from lightrag.prompt import PROMPTS
 from lightrag.exceptions import PipelineCancelledException
 from lightrag.constants import (
     DEFAULT_MAX_GLEANING,
+    DEFAULT_EXTRACT_BATCH_SIZE,
+    DEFAULT_EXTRACT_BATCH_MAX_TOKENS,
+    DEFAULT_EXTRACT_BATCH_CHUNK_TOKENS,
+    DEFAULT_EXTRACT_BATCH_WAIT,
+    DEFAULT_GLEANING_MIN_CHUNK_TOKENS,
+    DEFAULT_EXTRACTION_CHECKPOINT_BATCH,
+    DEFAULT_INSERT_STREAM_BATCH_SIZE,
+    DEFAULT_INSERT_STREAM_MAX_IN_FLIGHT,
+    DEFAULT_ENQUEUE_BATCH_SIZE,
+    DEFAULT_CHUNKING_EXECUTOR,
+    DEFAULT_CHUNKING_MAX_WORKERS,
     DEFAULT_FORCE_LLM_SUMMARY_ON_MERGE,
     DEFAULT_TOP_K,
     DEFAULT_CHUNK_TOP_K,
@@ -40,6 +57,20 @@ from lightrag.constants import (
     DEFAULT_SUMMARY_LENGTH_RECOMMENDED,
     DEFAULT_MAX_ASYNC,
     DEFAULT_MAX_PARALLEL_INSERT,
+    DEFAULT_QUERY_BATCH_MAX_CONCURRENCY,
+    DEFAULT_KEYWORD_CACHE_SIZE,
+    DEFAULT_KEYWORD_CACHE_TTL,
+    DEFAULT_KEYWORD_BATCH_SIZE,
+    DEFAULT_KEYWORD_BATCH_WAIT,
+    DEFAULT_RERANK_CACHE_SIZE,
+    DEFAULT_RERANK_CACHE_TTL,
+    DEFAULT_RERANK_BATCH_SIZE,
+    DEFAULT_RERANK_BATCH_WAIT,
+    DEFAULT_GRAPH_UPSERT_BATCH_SIZE,
+    DEFAULT_PERSIST_BATCH_DOCS,
+    DEFAULT_PERSIST_INTERVAL,
+    DEFAULT_PERSIST_MAX_DIRTY_BYTES,
+    DEFAULT_STORAGE_WARMUP_SIZE,
     DEFAULT_MAX_GRAPH_NODES,
     DEFAULT_MAX_SOURCE_IDS_PER_ENTITY,
     DEFAULT_MAX_SOURCE_IDS_PER_RELATION,
@@ -83,10 +114,19 @@ from lightrag.base import (
 from lightrag.namespace import NameSpace
 from lightrag.operate import (
     chunking_by_token_size,
+    chunk_and_hash,
+    init_chunking_worker,
+    prepare_documents,
     extract_entities,
     merge_nodes_and_edges,
+    KeywordCache,
+    ExtractionBatcher,
+    AdaptiveGleaning,
+    ExtractionCheckpoints,
+    extract_keywords_only,
     kg_query,
     naive_query,
+    precomputed_query_embeddings,
     rebuild_knowledge_from_chunks,
 )
 from lightrag.constants import GRAPH_FIELD_SEP
@@ -94,11 +134,12 @@ from lightrag.utils import (
     Tokenizer,
     TiktokenTokenizer,
     EmbeddingFunc,
+    GroupCommit,
+    RerankCache,
     always_get_an_event_loop,
     compute_mdhash_id,
     lazy_external_import,
     priority_limit_async_func_call,
-    get_content_summary,
     sanitize_text_for_encoding,
     check_storage_env_vars,
     generate_track_id,
@@ -147,6 +188,14 @@ class LightRAG:
     doc_status_storage: str = field(default="JsonDocStatusStorage")
     """Storage type for tracking document processing statuses."""
 
+    storage_warmup: bool = field(default=get_env_value("STORAGE_WARMUP", False, bool))
+    """Prefetch top-degree entities and recently processed chunks after storage initialization."""
+
+    storage_warmup_size: int = field(
+        default=get_env_value("STORAGE_WARMUP_SIZE", DEFAULT_STORAGE_WARMUP_SIZE, int)
+    )
+    """Number of entities and chunks read by the storage warm-up."""
+
     # Workspace
     # ---
 
@@ -207,6 +256,56 @@ class LightRAG:
     )
     """Maximum number of entity extraction attempts for ambiguous content."""
 
+    adaptive_gleaning: bool = field(
+        default=get_env_value("ADAPTIVE_GLEANING", False, bool)
+    )
+    """Decide per chunk whether the gleaning round is worthwhile instead of always running it."""
+
+    gleaning_min_chunk_tokens: int = field(
+        default=get_env_value(
+            "GLEANING_MIN_CHUNK_TOKENS", DEFAULT_GLEANING_MIN_CHUNK_TOKENS, int
+        )
+    )
+    """With adaptive gleaning, chunks shorter than this token count are not gleaned."""
+
+    extraction_checkpoint: bool = field(
+        default=get_env_value("EXTRACTION_CHECKPOINT", True, bool)
+    )
+    """Checkpoint extraction results per chunk so that reprocessing a failed or interrupted document resumes it."""
+
+    extraction_checkpoint_batch: int = field(
+        default=get_env_value(
+            "EXTRACTION_CHECKPOINT_BATCH", DEFAULT_EXTRACTION_CHECKPOINT_BATCH, int
+        )
+    )
+    """Number of chunk checkpoints written to the LLM cache storage together."""
+
+    extract_batch_size: int = field(
+        default=get_env_value("EXTRACT_BATCH_SIZE", DEFAULT_EXTRACT_BATCH_SIZE, int)
+    )
+    """Maximum number of small chunks packed into one extraction LLM request, 1 disables batching.
+    When enabled, the pipeline processes up to extract_batch_size * llm_model_max_async documents in parallel.
+    """
+
+    extract_batch_max_tokens: int = field(
+        default=get_env_value(
+            "EXTRACT_BATCH_MAX_TOKENS", DEFAULT_EXTRACT_BATCH_MAX_TOKENS, int
+        )
+    )
+    """Maximum total chunk tokens packed into one extraction LLM request."""
+
+    extract_batch_chunk_tokens: int = field(
+        default=get_env_value(
+            "EXTRACT_BATCH_CHUNK_TOKENS", DEFAULT_EXTRACT_BATCH_CHUNK_TOKENS, int
+        )
+    )
+    """Largest chunk, in tokens, eligible for multi-chunk extraction requests."""
+
+    extract_batch_wait: float = field(
+        default=get_env_value("EXTRACT_BATCH_WAIT", DEFAULT_EXTRACT_BATCH_WAIT, float)
+    )
+    """Maximum seconds a small chunk waits for others to join its extraction request."""
+
     force_llm_summary_on_merge: int = field(
         default=get_env_value(
             "FORCE_LLM_SUMMARY_ON_MERGE", DEFAULT_FORCE_LLM_SUMMARY_ON_MERGE, int
@@ -224,6 +323,21 @@ class LightRAG:
     )
     """Number of overlapping tokens between consecutive text chunks to preserve context."""
 
+    chunking_executor: str = field(
+        default=get_env_value("CHUNKING_EXECUTOR", DEFAULT_CHUNKING_EXECUTOR, str)
+    )
+    """Where documents are chunked and their chunks hashed, off the event loop:
+    - "thread": a thread pool, tiktoken releases the GIL so chunking runs in parallel.
+    - "process": a process pool, each worker loads chunking_func and the tokenizer once.
+      Both must be picklable, otherwise the thread pool is used.
+    - "none": inline on the event loop.
+    """
+
+    chunking_max_workers: int = field(
+        default=get_env_value("CHUNKING_MAX_WORKERS", DEFAULT_CHUNKING_MAX_WORKERS, int)
+    )
+    """Number of chunking executor workers."""
+
     tokenizer: Optional[Tokenizer] = field(default=None)
     """
     A function that returns a Tokenizer instance.
@@ -321,6 +435,11 @@ class LightRAG:
     )
     """Recommended length of LLM summary output."""
 
+    summary_incremental: bool = field(
+        default=get_env_value("SUMMARY_INCREMENTAL", False, bool)
+    )
+    """Fold new descriptions into the stored summary instead of re-summarizing all fragments on merge."""
+
     llm_model_max_async: int = field(
         default=int(os.getenv("MAX_ASYNC", DEFAULT_MAX_ASYNC))
     )
@@ -344,6 +463,26 @@ class LightRAG:
     )
     """Minimum rerank score threshold for filtering chunks after reranking."""
 
+    rerank_cache_size: int = field(
+        default=get_env_value("RERANK_CACHE_SIZE", DEFAULT_RERANK_CACHE_SIZE, int)
+    )
+    """Maximum number of (query, chunk) rerank scores kept in memory, 0 disables the rerank cache and batching."""
+
+    rerank_cache_ttl: float = field(
+        default=get_env_value("RERANK_CACHE_TTL", DEFAULT_RERANK_CACHE_TTL, float)
+    )
+    """Seconds a rerank score stays in the rerank cache, 0 keeps it until evicted."""
+
+    rerank_batch_size: int = field(
+        default=get_env_value("RERANK_BATCH_SIZE", DEFAULT_RERANK_BATCH_SIZE, int)
+    )
+    """Maximum number of documents in a rerank call merged from concurrent reranks of the same query."""
+
+    rerank_batch_wait: float = field(
+        default=get_env_value("RERANK_BATCH_WAIT", DEFAULT_RERANK_BATCH_WAIT, float)
+    )
+    """Maximum seconds a rerank waits for concurrent reranks of the same query to join it."""
+
     # Storage
     # ---
 
@@ -364,6 +503,76 @@ class LightRAG:
     )
     """Maximum number of parallel insert operations."""
 
+    query_batch_max_concurrency: int = field(
+        default=get_env_value(
+            "QUERY_BATCH_MAX_CONCURRENCY", DEFAULT_QUERY_BATCH_MAX_CONCURRENCY, int
+        )
+    )
+    """Maximum number of queries of a query batch retrieved and answered concurrently."""
+
+    keyword_cache_size: int = field(
+        default=get_env_value("KEYWORD_CACHE_SIZE", DEFAULT_KEYWORD_CACHE_SIZE, int)
+    )
+    """Maximum number of query keyword sets kept in memory, 0 disables the in-memory keyword cache."""
+
+    keyword_cache_ttl: float = field(
+        default=get_env_value("KEYWORD_CACHE_TTL", DEFAULT_KEYWORD_CACHE_TTL, float)
+    )
+    """Seconds a query keyword set stays in the in-memory keyword cache, 0 keeps it until evicted."""
+
+    keyword_batch_size: int = field(
+        default=get_env_value("KEYWORD_BATCH_SIZE", DEFAULT_KEYWORD_BATCH_SIZE, int)
+    )
+    """Maximum number of queries sharing one keyword extraction LLM call under load, 1 disables batching."""
+
+    keyword_batch_wait: float = field(
+        default=get_env_value("KEYWORD_BATCH_WAIT", DEFAULT_KEYWORD_BATCH_WAIT, float)
+    )
+    """Maximum seconds a keyword extraction waits for other queries to join its batch."""
+
+    graph_upsert_batch_size: int = field(
+        default=get_env_value(
+            "GRAPH_UPSERT_BATCH_SIZE", DEFAULT_GRAPH_UPSERT_BATCH_SIZE, int
+        )
+    )
+    """Maximum number of buffered graph node/edge upserts written per batch during merge, and of entities or relations merged under one keyed lock acquisition."""
+
+    persist_batch_docs: int = field(
+        default=get_env_value("PERSIST_BATCH_DOCS", DEFAULT_PERSIST_BATCH_DOCS, int)
+    )
+    """Number of processed documents persisted together by the pipeline, 1 persists after every document."""
+
+    persist_interval: float = field(
+        default=get_env_value("PERSIST_INTERVAL", DEFAULT_PERSIST_INTERVAL, float)
+    )
+    """Maximum seconds a processed document waits to be persisted, 0 disables the time trigger."""
+
+    persist_max_dirty_bytes: int = field(
+        default=get_env_value(
+            "PERSIST_MAX_DIRTY_BYTES", DEFAULT_PERSIST_MAX_DIRTY_BYTES, int
+        )
+    )
+    """Persist once processed documents of this total content length are pending, 0 disables the size trigger."""
+
+    insert_stream_batch_size: int = field(
+        default=get_env_value(
+            "INSERT_STREAM_BATCH_SIZE", DEFAULT_INSERT_STREAM_BATCH_SIZE, int
+        )
+    )
+    """Number of documents ainsert_stream reads from its input and enqueues together."""
+
+    insert_stream_max_in_flight: int = field(
+        default=get_env_value(
+            "INSERT_STREAM_MAX_IN_FLIGHT", DEFAULT_INSERT_STREAM_MAX_IN_FLIGHT, int
+        )
+    )
+    """Maximum documents ainsert_stream keeps enqueued but unprocessed before it stops reading its input."""
+
+    enqueue_batch_size: int = field(
+        default=get_env_value("ENQUEUE_BATCH_SIZE", DEFAULT_ENQUEUE_BATCH_SIZE, int)
+    )
+    """Number of documents apipeline_enqueue_documents hashes, checks for duplicates and stores together."""
+
     max_graph_nodes: int = field(
         default=get_env_value("MAX_GRAPH_NODES", DEFAULT_MAX_GRAPH_NODES, int)
     )
@@ -590,7 +799,6 @@ class LightRAG:
             workspace=self.workspace,
             embedding_func=self.embedding_func,
         )
-
         self.entities_vdb: BaseVectorStorage = self.vector_db_storage_cls(  # type: ignore
             namespace=NameSpace.VECTOR_STORE_ENTITIES,
             workspace=self.workspace,
@@ -634,49 +842,334 @@ class LightRAG:
             )
         )
 
+        # Created on first use, see _get_chunking_pool
+        self._chunking_pool: Executor | None = None
+
+        # Whether this instance holds a reference to the pooled rerank session
+        self._rerank_session_acquired = False
+
+        # Group commit of processed documents, see _insert_done
+        self._processed_docs_commit = GroupCommit(
+            self._commit_processed_docs,
+            max_items=self.persist_batch_docs,
+            max_delay=self.persist_interval,
+            max_bytes=self.persist_max_dirty_bytes,
+        )
+
+        # Batching kicks in once keyword extractions alone fill the LLM concurrency
+        self._keyword_cache = KeywordCache(
+            max_size=self.keyword_cache_size,
+            ttl=self.keyword_cache_ttl,
+            batch_size=self.keyword_batch_size,
+            batch_wait=self.keyword_batch_wait,
+            max_inflight=self.llm_model_max_async,
+        )
+
+        self._rerank_cache = RerankCache(
+            max_size=self.rerank_cache_size,
+            ttl=self.rerank_cache_ttl,
+            batch_size=self.rerank_batch_size,
+            batch_wait=self.rerank_batch_wait,
+        )
+
+        self._extraction_batcher = ExtractionBatcher(
+            batch_size=self.extract_batch_size,
+            max_tokens=self.extract_batch_max_tokens,
+            chunk_tokens=self.extract_batch_chunk_tokens,
+            batch_wait=self.extract_batch_wait,
+        )
+
+        # Stored in the LLM cache storage, see ExtractionCheckpoints
+        self._extraction_checkpoints = ExtractionCheckpoints(
+            self.llm_response_cache,
+            batch_size=self.extraction_checkpoint_batch,
+            persist_interval=self.persist_interval,
+        )
+
+        self._adaptive_gleaning = AdaptiveGleaning(
+            min_chunk_tokens=self.gleaning_min_chunk_tokens
+        )
+
+        # Pipeline runs started by ainsert_stream that outlive the call
+        self._ingest_tasks: set[asyncio.Task] = set()
+
         self._storages_status = StoragesStatus.CREATED
 
+    def _get_chunking_pool(self) -> Executor:
+        """Return the chunking executor, creating it on first use"""
+        if self._chunking_pool is not None:
+            return self._chunking_pool
+
+        max_workers = max(1, self.chunking_max_workers)
+        if self.chunking_executor == "process":
+            try:
+                # Spawned workers receive both pickled, once per worker
+                pickle.dumps((self.chunking_func, self.tokenizer))
+                self._chunking_pool = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=init_chunking_worker,
+                    initargs=(self.chunking_func, self.tokenizer),
+                )
+                return self._chunking_pool
+            except Exception as e:
+                logger.warning(
+                    f"Chunking in threads, chunking_func or tokenizer cannot be sent to worker processes: {e}"
+                )
+                self.chunking_executor = "thread"
+
+        self._chunking_pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="lightrag-chunking"
+        )
+        return self._chunking_pool
+
+    async def _chunk_document(
+        self,
+        content: str,
+        split_by_character: str | None,
+        split_by_character_only: bool,
+    ) -> dict[str, dict[str, Any]]:
+        """Chunk a document and compute its chunk ids, off the event loop unless chunking_executor is "none"
+
+        Returns:
+            Chunks returned by chunking_func, keyed by chunk id
+        """
+        args = (
+            content,
+            split_by_character,
+            split_by_character_only,
+            self.chunk_overlap_token_size,
+            self.chunk_token_size,
+        )
+        if self.chunking_executor == "none":
+            return chunk_and_hash(*args, self.chunking_func, self.tokenizer)
+        return await self._run_in_chunking_pool(
+            chunk_and_hash, *args, thread_args=(self.chunking_func, self.tokenizer)
+        )
+
+    async def _run_in_chunking_pool(
+        self, func: Callable[..., Any], *args: Any, thread_args: tuple = ()
+    ) -> Any:
+        """Run func in the chunking executor
+
+        thread_args are only appended in thread workers, process workers load them
+        once through init_chunking_worker. A broken process pool is replaced by threads.
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._get_chunking_pool()
+        if isinstance(pool, ProcessPoolExecutor):
+            try:
+                return await loop.run_in_executor(pool, func, *args)
+            except BrokenProcessPool as e:
+                logger.warning(f"Chunking process pool failed, using threads: {e}")
+                pool.shutdown(wait=False, cancel_futures=True)
+                self._chunking_pool = None
+                self.chunking_executor = "thread"
+                pool = self._get_chunking_pool()
+
+        return await loop.run_in_executor(pool, partial(func, *args, *thread_args))
+
+    async def _prepare_documents(
+        self, contents: list[str]
+    ) -> list[tuple[str, str, str]]:
+        """Sanitize, hash and summarize documents in a worker thread
+
+        The work is too light to pay for sending the contents to a process worker.
+
+        Returns:
+            (sanitized content, content hash id, content summary) per document, in input order
+        """
+        if self.chunking_executor == "none" or len(contents) < 2:
+            return prepare_documents(contents)
+        return await asyncio.to_thread(prepare_documents, contents)
+
+    def _max_parallel_documents(self) -> int:
+        """Number of documents the pipeline processes concurrently
+
+        Only chunks extracted at the same time share a multi-chunk extraction request.
+        With batching enabled, enough documents run to fill a request per LLM slot, as
+        small documents often have a single chunk. LLM calls stay capped by
+        llm_model_max_async.
+        """
+        if self.extract_batch_size > 1:
+            return max(
+                self.max_parallel_insert,
+                self.extract_batch_size * self.llm_model_max_async,
+            )
+        return self.max_parallel_insert
+
+    async def _chunks_already_stored(self, chunks: dict[str, Any]) -> bool:
+        """Whether an interrupted earlier run of the document stored these chunks
+
+        Extraction checkpoints are only written after the chunks were stored, so
+        their presence marks the first stage of the document as done. Chunk storages
+        are checked as well since they may have been persisted separately.
+        """
+        if not self.extraction_checkpoint or not chunks:
+            return False
+        chunk_ids = list(chunks.keys())
+        if not await self._extraction_checkpoints.has_any(chunk_ids):
+            return False
+        if await self.text_chunks.filter_keys(set(chunk_ids)):
+            return False
+        stored_vectors = await self.chunks_vdb.get_by_ids(chunk_ids)
+        return sum(1 for dp in stored_vectors if dp) == len(chunk_ids)
+
+    def _get_query_config(self) -> dict[str, Any]:
+        """Return asdict(self) for the query functions, with the keyword and rerank caches attached"""
+        global_config = asdict(self)
+        global_config["keyword_cache"] = self._keyword_cache
+        global_config["rerank_cache"] = self._rerank_cache
+        return global_config
+
+    def get_keyword_cache_stats(self) -> dict[str, Any]:
+        """Return size, hit rate and LLM call counters of the in-memory keyword cache"""
+        return self._keyword_cache.stats()
+
+    def get_rerank_cache_stats(self) -> dict[str, Any]:
+        """Return size, hit rate and rerank call counters of the in-memory rerank cache"""
+        return self._rerank_cache.stats()
+
+    def _get_named_storages(self) -> list[tuple[str, StorageNameSpace]]:
+        """Return (name, storage) pairs for all storages in initialization order"""
+        return [
+            ("full_docs", self.full_docs),
+            ("text_chunks", self.text_chunks),
+            ("full_entities", self.full_entities),
+            ("full_relations", self.full_relations),
+            ("entity_chunks", self.entity_chunks),
+            ("relation_chunks", self.relation_chunks),
+            ("entities_vdb", self.entities_vdb),
+            ("relationships_vdb", self.relationships_vdb),
+            ("chunks_vdb", self.chunks_vdb),
+            ("chunk_entity_relation_graph", self.chunk_entity_relation_graph),
+            ("llm_response_cache", self.llm_response_cache),
+            ("doc_status", self.doc_status),
+        ]
+
     async def initialize_storages(self):
-        """Storage initialization must be called one by one to prevent deadlock"""
+        """Initialize all storages concurrently, then optionally warm them up
+
+        Storages of the same backend share its client manager, so the first storage
+        of each backend is initialized before the others: it opens the connection
+        pool and creates the schema once, and the remaining storages then initialize
+        concurrently against the ready client.
+        """
         if self._storages_status == StoragesStatus.CREATED:
-            for storage in (
-                self.full_docs,
-                self.text_chunks,
-                self.full_entities,
-                self.full_relations,
-                self.entity_chunks,
-                self.relation_chunks,
-                self.entities_vdb,
-                self.relationships_vdb,
-                self.chunks_vdb,
-                self.chunk_entity_relation_graph,
-                self.llm_response_cache,
-                self.doc_status,
-            ):
-                if storage:
-                    # logger.debug(f"Initializing storage: {storage}")
-                    await storage.initialize()
+            start_time = time.perf_counter()
+            bootstrap_stage, concurrent_stage = [], []
+            seen_backends = set()
+            for name, storage in self._get_named_storages():
+                if not storage:
+                    continue
+                backend = type(storage).__module__
+                if backend in seen_backends:
+                    concurrent_stage.append((name, storage))
+                else:
+                    seen_backends.add(backend)
+                    bootstrap_stage.append((name, storage))
+
+            timings: dict[str, float] = {}
+            for stage in (bootstrap_stage, concurrent_stage):
+                await self._initialize_storage_stage(stage, timings)
 
             self._storages_status = StoragesStatus.INITIALIZED
             logger.debug("All storage types initialized")
 
+            if self.rerank_model_func is not None:
+                from lightrag.rerank import acquire_rerank_session
+
+                acquire_rerank_session()
+                self._rerank_session_acquired = True
+
+            if self.storage_warmup:
+                warmup_start = time.perf_counter()
+                await self._warm_up_storages()
+                timings["warm-up"] = time.perf_counter() - warmup_start
+
+            slowest = sorted(timings.items(), key=lambda item: item[1], reverse=True)
+            logger.info(
+                f"Storages initialized in {time.perf_counter() - start_time:.2f}s "
+                f"(slowest: {', '.join(f'{name} {elapsed:.2f}s' for name, elapsed in slowest[:3])})"
+            )
+            logger.debug(
+                "Storage initialization timings: "
+                + ", ".join(f"{name}={elapsed:.3f}s" for name, elapsed in slowest)
+            )
+
+    async def _initialize_storage_stage(
+        self, stage: list[tuple[str, StorageNameSpace]], timings: dict[str, float]
+    ) -> None:
+        """Initialize a group of storages concurrently, raising the first failure"""
+
+        async def _initialize(name: str, storage: StorageNameSpace) -> None:
+            started = time.perf_counter()
+            await storage.initialize()
+            timings[name] = time.perf_counter() - started
+
+        results = await asyncio.gather(
+            *(_initialize(name, storage) for name, storage in stage),
+            return_exceptions=True,
+        )
+        errors = []
+        for (name, _), result in zip(stage, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to initialize {name}: {result}")
+                errors.append(result)
+        if errors:
+            raise errors[0]
+
+    async def _warm_up_storages(self) -> None:
+        """Prefetch top-degree entities and recently processed chunks
+
+        Reads go through the regular storage APIs, so they populate whatever cache
+        the backend keeps (database buffer pools, shared-memory snapshots, lazy KV
+        record caches) before the first query arrives. Failures are only logged.
+        """
+        limit = self.storage_warmup_size
+        graph = self.chunk_entity_relation_graph
+
+        async def _warm_up_entities() -> int:
+            labels = await graph.get_popular_labels(limit)
+            if labels:
+                await asyncio.gather(
+                    graph.get_nodes_batch(labels),
+                    graph.node_degrees_batch(labels),
+                    graph.get_nodes_edges_batch(labels),
+                    self.entities_vdb.get_by_ids(
+                        [compute_mdhash_id(label, prefix="ent-") for label in labels]
+                    ),
+                    self.entity_chunks.get_by_ids(labels),
+                )
+            return len(labels)
+
+        async def _warm_up_chunks() -> int:
+            docs, _ = await self.doc_status.get_docs_paginated(
+                status_filter=DocStatus.PROCESSED, page_size=min(limit, 200)
+            )
+            chunk_ids = []
+            for _, doc in docs:
+                chunk_ids.extend(doc.chunks_list or [])
+                if len(chunk_ids) >= limit:
+                    break
+            chunk_ids = chunk_ids[:limit]
+            if chunk_ids:
+                await self.text_chunks.get_by_ids(chunk_ids)
+            return len(chunk_ids)
+
+        results = await asyncio.gather(
+            _warm_up_entities(), _warm_up_chunks(), return_exceptions=True
+        )
+        for target, result in zip(("entities", "chunks"), results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Storage warm-up of {target} failed: {result}")
+            else:
+                logger.info(f"Storage warm-up prefetched {result} {target}")
+
     async def finalize_storages(self):
         """Asynchronously finalize the storages with improved error handling"""
         if self._storages_status == StoragesStatus.INITIALIZED:
-            storages = [
-                ("full_docs", self.full_docs),
-                ("text_chunks", self.text_chunks),
-                ("full_entities", self.full_entities),
-                ("full_relations", self.full_relations),
-                ("entity_chunks", self.entity_chunks),
-                ("relation_chunks", self.relation_chunks),
-                ("entities_vdb", self.entities_vdb),
-                ("relationships_vdb", self.relationships_vdb),
-                ("chunks_vdb", self.chunks_vdb),
-                ("chunk_entity_relation_graph", self.chunk_entity_relation_graph),
-                ("llm_response_cache", self.llm_response_cache),
-                ("doc_status", self.doc_status),
-            ]
+            storages = self._get_named_storages()
 
             # Finalize each storage individually to ensure one failure doesn't prevent others from closing
             successful_finalizations = []
@@ -706,6 +1199,18 @@ class LightRAG:
             else:
                 logger.debug("All storages finalized successfully")
 
+            if self._chunking_pool is not None:
+                self._chunking_pool.shutdown(wait=False, cancel_futures=True)
+                self._chunking_pool = None
+
+            if self._rerank_session_acquired:
+                from lightrag.rerank import release_rerank_session
+
+                # Pooled HTTP session of the built-in rerank functions, shared by
+                # the instances of this event loop
+                await release_rerank_session()
+                self._rerank_session_acquired = False
+
             self._storages_status = StoragesStatus.FINALIZED
 
     async def check_and_migrate_data(self):
@@ -1135,6 +1640,143 @@ class LightRAG:
 
         return track_id
 
+    def insert_stream(
+        self,
+        documents: Iterable[str | dict[str, Any]],
+        split_by_character: str | None = None,
+        split_by_character_only: bool = False,
+        track_id: str | None = None,
+    ) -> str:
+        """Sync version of ainsert_stream, see there"""
+        loop = always_get_an_event_loop()
+        return loop.run_until_complete(
+            self.ainsert_stream(
+                documents, split_by_character, split_by_character_only, track_id
+            )
+        )
+
+    async def ainsert_stream(
+        self,
+        documents: AsyncIterable[str | dict[str, Any]] | Iterable[str | dict[str, Any]],
+        split_by_character: str | None = None,
+        split_by_character_only: bool = False,
+        track_id: str | None = None,
+        wait_for_completion: bool = True,
+    ) -> str:
+        """Insert documents from an (async) iterator with bounded memory
+
+        Documents are read and enqueued insert_stream_batch_size at a time, and the
+        pipeline processes them while the input is still being read. Reading pauses
+        while insert_stream_max_in_flight documents of this call are enqueued but not
+        yet processed (checked every second), so memory use does not grow with the
+        size of the input.
+
+        Args:
+            documents: Document strings, or dicts with "content" (or "text") and the
+                optional "id" and "file_path" (or "file_source") keys
+            split_by_character: see ainsert
+            split_by_character_only: see ainsert
+            track_id: tracking ID for monitoring processing status, if not provided, will be generated
+            wait_for_completion: wait for the pipeline to process the enqueued documents,
+                otherwise return once the whole input is enqueued
+
+        Returns:
+            str: tracking ID for monitoring processing status
+        """
+        if track_id is None:
+            track_id = generate_track_id("insert")
+
+        batch_size = max(self.insert_stream_batch_size, 1)
+        max_in_flight = max(self.insert_stream_max_in_flight, batch_size)
+        in_flight: set[str] = set()
+        pipeline_tasks: set[asyncio.Task] = set()
+
+        def start_pipeline() -> None:
+            # Returns at once when the pipeline is busy, which then picks the new
+            # documents up in its next round
+            task = asyncio.create_task(
+                self.apipeline_process_enqueue_documents(
+                    split_by_character, split_by_character_only
+                )
+            )
+            pipeline_tasks.add(task)
+            task.add_done_callback(pipeline_tasks.discard)
+            self._ingest_tasks.add(task)
+            task.add_done_callback(self._ingest_tasks.discard)
+
+        async def drain_to(limit: int) -> None:
+            while len(in_flight) > limit:
+                doc_ids = list(in_flight)
+                records = await self.doc_status.get_by_ids(doc_ids)
+                for doc_id, record in zip(doc_ids, records):
+                    status = record.get("status") if record else None
+                    if status not in (DocStatus.PENDING, DocStatus.PROCESSING):
+                        in_flight.discard(doc_id)
+                if len(in_flight) <= limit:
+                    break
+                if not pipeline_tasks:
+                    start_pipeline()
+                await asyncio.sleep(1)
+
+        async def enqueue(batch: dict[str, tuple[str, str]]) -> None:
+            await self.apipeline_enqueue_documents(
+                [content for content, _ in batch.values()],
+                ids=list(batch.keys()),
+                file_paths=[file_path for _, file_path in batch.values()],
+                track_id=track_id,
+            )
+            in_flight.update(batch.keys())
+            start_pipeline()
+
+        async def iterate():
+            if hasattr(documents, "__aiter__"):
+                async for item in documents:
+                    yield item
+            else:
+                for item in documents:
+                    yield item
+
+        total = 0
+        batch: dict[str, tuple[str, str]] = {}
+        try:
+            async for item in iterate():
+                if isinstance(item, str):
+                    content, doc_id, file_path = item, None, None
+                else:
+                    content = item.get("content", item.get("text"))
+                    doc_id = item.get("id")
+                    file_path = item.get("file_path", item.get("file_source"))
+                if not content:
+                    continue
+                if doc_id is None:
+                    # Same ID apipeline_enqueue_documents would generate
+                    doc_id = compute_mdhash_id(
+                        sanitize_text_for_encoding(content), prefix="doc-"
+                    )
+                if doc_id in batch:
+                    continue
+                batch[doc_id] = (content, file_path or "unknown_source")
+                total += 1
+
+                if len(batch) >= batch_size:
+                    await drain_to(max_in_flight - len(batch))
+                    await enqueue(batch)
+                    batch = {}
+        except Exception:
+            # Keep the documents read before the input failed
+            if batch:
+                await enqueue(batch)
+            raise
+
+        if batch:
+            await drain_to(max_in_flight - len(batch))
+            await enqueue(batch)
+
+        logger.info(f"Streamed {total} document(s) into the pipeline ({track_id})")
+        if wait_for_completion:
+            await drain_to(0)
+        return track_id
+
     # TODO: deprecated, use insert instead
     def insert_custom_chunks(
         self,
@@ -1253,7 +1895,7 @@ class LightRAG:
             # If no file paths provided, use placeholder
             file_paths = ["unknown_source"] * len(input)
 
-        # 1. Validate ids if provided or generate MD5 hash IDs and remove duplicate contents
+        # 1. Validate ids if provided, they replace the generated MD5 hash IDs
         if ids is not None:
             # Check if the number of IDs matches the number of documents
             if len(ids) != len(input):
@@ -1263,100 +1905,100 @@ class LightRAG:
             if len(ids) != len(set(ids)):
                 raise ValueError("IDs must be unique")
 
-            # Generate contents dict and remove duplicates in one pass
-            unique_contents = {}
-            for id_, doc, path in zip(ids, input, file_paths):
-                cleaned_content = sanitize_text_for_encoding(doc)
-                if cleaned_content not in unique_contents:
-                    unique_contents[cleaned_content] = (id_, path)
-
-            # Reconstruct contents with unique content
-            contents = {
-                id_: {"content": content, "file_path": file_path}
-                for content, (id_, file_path) in unique_contents.items()
-            }
-        else:
-            # Clean input text and remove duplicates in one pass
-            unique_content_with_paths = {}
-            for doc, path in zip(input, file_paths):
-                cleaned_content = sanitize_text_for_encoding(doc)
-                if cleaned_content not in unique_content_with_paths:
-                    unique_content_with_paths[cleaned_content] = path
-
-            # Generate contents dict of MD5 hash IDs and documents with paths
-            contents = {
-                compute_mdhash_id(content, prefix="doc-"): {
-                    "content": content,
-                    "file_path": path,
+        # Documents are handled in batches of enqueue_batch_size: hashed, checked against
+        # doc status and stored in full_docs with one bulk call per batch
+        batch_size = max(1, self.enqueue_batch_size)
+        total = len(input)
+        seen_content_ids: set[str] = set()
+        pending_docs: dict[str, Any] = {}
+        stored_count = 0
+        ignored_count = 0
+        for start in range(0, total, batch_size):
+            end = min(start + batch_size, total)
+            prepared = await self._prepare_documents(input[start:end])
+
+            # 2. Remove duplicate contents and generate document initial status (without content)
+            contents: dict[str, dict[str, str]] = {}
+            new_docs: dict[str, Any] = {}
+            current_time = datetime.now(timezone.utc).isoformat()
+            for offset, (content, content_id, summary) in enumerate(prepared):
+                if content_id in seen_content_ids:
+                    continue
+                seen_content_ids.add(content_id)
+                doc_id = ids[start + offset] if ids is not None else content_id
+                file_path = file_paths[start + offset]
+                contents[doc_id] = {"content": content, "file_path": file_path}
+                new_docs[doc_id] = {
+                    "status": DocStatus.PENDING,
+                    "content_summary": summary,
+                    "content_length": len(content),
+                    "created_at": current_time,
+                    "updated_at": current_time,
+                    "file_path": file_path,  # Store file path in document status
+                    "track_id": track_id,  # Store track_id in document status
                 }
-                for content, path in unique_content_with_paths.items()
-            }
 
-        # 2. Generate document initial status (without content)
-        new_docs: dict[str, Any] = {
-            id_: {
-                "status": DocStatus.PENDING,
-                "content_summary": get_content_summary(content_data["content"]),
-                "content_length": len(content_data["content"]),
-                "created_at": datetime.now(timezone.utc).isoformat(),
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "file_path": content_data[
-                    "file_path"
-                ],  # Store file path in document status
-                "track_id": track_id,  # Store track_id in document status
-            }
-            for id_, content_data in contents.items()
-        }
+            # 3. Filter out already processed documents
+            all_new_doc_ids = set(new_docs.keys())
+            # Exclude IDs of documents that are already enqueued
+            unique_new_doc_ids = await self.doc_status.filter_keys(all_new_doc_ids)
 
-        # 3. Filter out already processed documents
-        # Get docs ids
-        all_new_doc_ids = set(new_docs.keys())
-        # Exclude IDs of documents that are already enqueued
-        unique_new_doc_ids = await self.doc_status.filter_keys(all_new_doc_ids)
-
-        # Log ignored document IDs (documents that were filtered out because they already exist)
-        ignored_ids = list(all_new_doc_ids - unique_new_doc_ids)
-        if ignored_ids:
+            # Log ignored document IDs (documents that were filtered out because they already exist)
+            ignored_ids = list(all_new_doc_ids - unique_new_doc_ids)
             for doc_id in ignored_ids:
-                file_path = new_docs.get(doc_id, {}).get("file_path", "unknown_source")
                 logger.warning(
-                    f"Ignoring document ID (already exists): {doc_id} ({file_path})"
+                    f"Ignoring document ID (already exists): {doc_id} ({new_docs[doc_id]['file_path']})"
                 )
-            if len(ignored_ids) > 3:
-                logger.warning(
-                    f"Total Ignoring {len(ignored_ids)} document IDs that already exist in storage"
+            ignored_count += len(ignored_ids)
+
+            # Filter new_docs to only include documents with unique IDs
+            new_docs = {
+                doc_id: new_docs[doc_id]
+                for doc_id in unique_new_doc_ids
+                if doc_id in new_docs
+            }
+
+            # 4. Store document content in full_docs, the status is stored after all batches
+            if new_docs:
+                full_docs_data = {doc_id: contents[doc_id] for doc_id in new_docs}
+                await self.full_docs.upsert(full_docs_data)
+                pending_docs.update(new_docs)
+                stored_count += len(new_docs)
+
+            if total > batch_size:
+                await self._report_enqueue_progress(
+                    f"Enqueued {end}/{total} documents: {stored_count} new, {ignored_count} already exist"
                 )
 
-        # Filter new_docs to only include documents with unique IDs
-        new_docs = {
-            doc_id: new_docs[doc_id]
-            for doc_id in unique_new_doc_ids
-            if doc_id in new_docs
-        }
+        # The contents must be durable before their PENDING status: after a crash,
+        # documents in doc_status without content in full_docs are deleted. Both are
+        # written once for all batches, file based storages rewrite the whole file on
+        # every persist, which per batch is quadratic in the number of documents.
+        if pending_docs:
+            await self.full_docs.index_done_callback()
+            await self.doc_status.upsert(pending_docs)
 
-        if not new_docs:
+        if ignored_count > 3:
+            logger.warning(
+                f"Total Ignoring {ignored_count} document IDs that already exist in storage"
+            )
+
+        if not stored_count:
             logger.warning("No new unique documents were found.")
             return
 
-        # 4. Store document content in full_docs and status in doc_status
-        #    Store full document content separately
-        full_docs_data = {
-            doc_id: {
-                "content": contents[doc_id]["content"],
-                "file_path": contents[doc_id]["file_path"],
-            }
-            for doc_id in new_docs.keys()
-        }
-        await self.full_docs.upsert(full_docs_data)
-        # Persist data to disk immediately
-        await self.full_docs.index_done_callback()
-
-        # Store document status (without content)
-        await self.doc_status.upsert(new_docs)
-        logger.debug(f"Stored {len(new_docs)} new unique documents")
+        logger.debug(f"Stored {stored_count} new unique documents")
 
         return track_id
 
+    async def _report_enqueue_progress(self, message: str) -> None:
+        """Log enqueue progress and add it to the pipeline status history"""
+        logger.info(message)
+        pipeline_status = await get_namespace_data("pipeline_status")
+        pipeline_status_lock = get_pipeline_status_lock()
+        async with pipeline_status_lock:
+            pipeline_status["history_messages"].append(message)
+
     async def apipeline_enqueue_error_documents(
         self,
         error_files: list[dict[str, Any]],
@@ -1687,7 +2329,7 @@ class LightRAG:
                 # Create a counter to track the number of processed files
                 processed_count = 0
                 # Create a semaphore to limit the number of concurrent file processing
-                semaphore = asyncio.Semaphore(self.max_parallel_insert)
+                semaphore = asyncio.Semaphore(self._max_parallel_documents())
 
                 async def process_document(
                     doc_id: str,
@@ -1756,27 +2398,37 @@ class LightRAG:
                                 )
                             content = content_data["content"]
 
-                            # Generate chunks from document
+                            # Generate chunks from document, in the chunking executor
                             chunks: dict[str, Any] = {
-                                compute_mdhash_id(dp["content"], prefix="chunk-"): {
+                                chunk_id: {
                                     **dp,
                                     "full_doc_id": doc_id,
                                     "file_path": file_path,  # Add file path to each chunk
                                     "llm_cache_list": [],  # Initialize empty LLM cache list for each chunk
                                 }
-                                for dp in self.chunking_func(
-                                    self.tokenizer,
-                                    content,
-                                    split_by_character,
-                                    split_by_character_only,
-                                    self.chunk_overlap_token_size,
-                                    self.chunk_token_size,
-                                )
+                                for chunk_id, dp in (
+                                    await self._chunk_document(
+                                        content,
+                                        split_by_character,
+                                        split_by_character_only,
+                                    )
+                                ).items()
                             }
 
                             if not chunks:
                                 logger.warning("No document chunks to process")
 
+                            # An interrupted earlier run may have stored the chunks already
+                            chunks_stored = await self._chunks_already_stored(chunks)
+                            if chunks_stored:
+                                async with pipeline_status_lock:
+                                    log_message = f"Resuming d-id: {doc_id}, reusing {len(chunks)} stored chunks"
+                                    logger.info(log_message)
+                                    pipeline_status["latest_message"] = log_message
+                                    pipeline_status["history_messages"].append(
+                                        log_message
+                                    )
+
                             # Record processing start time
                             processing_start_time = int(time.time())
 
@@ -1811,19 +2463,16 @@ class LightRAG:
                                     }
                                 )
                             )
-                            chunks_vdb_task = asyncio.create_task(
-                                self.chunks_vdb.upsert(chunks)
-                            )
-                            text_chunks_task = asyncio.create_task(
-                                self.text_chunks.upsert(chunks)
-                            )
-
                             # First stage tasks (parallel execution)
-                            first_stage_tasks = [
-                                doc_status_task,
-                                chunks_vdb_task,
-                                text_chunks_task,
-                            ]
+                            first_stage_tasks = [doc_status_task]
+                            if not chunks_stored:
+                                chunks_vdb_task = asyncio.create_task(
+                                    self.chunks_vdb.upsert(chunks)
+                                )
+                                text_chunks_task = asyncio.create_task(
+                                    self.text_chunks.upsert(chunks)
+                                )
+                                first_stage_tasks += [chunks_vdb_task, text_chunks_task]
                             entity_relation_task = None
 
                             # Execute first stage tasks
@@ -1941,9 +2590,12 @@ class LightRAG:
                                 # Record processing end time
                                 processing_end_time = int(time.time())
 
-                                await self.doc_status.upsert(
-                                    {
-                                        doc_id: {
+                                # The document is marked processed by the group commit
+                                # persisting its data, it stays PROCESSING until then
+                                await self._processed_docs_commit.add(
+                                    (
+                                        doc_id,
+                                        {
                                             "status": DocStatus.PROCESSED,
                                             "chunks_count": len(chunks),
                                             "chunks_list": list(chunks.keys()),
@@ -1959,13 +2611,11 @@ class LightRAG:
                                                 "processing_start_time": processing_start_time,
                                                 "processing_end_time": processing_end_time,
                                             },
-                                        }
-                                    }
+                                        },
+                                    ),
+                                    size=status_doc.content_length or 0,
                                 )
 
-                                # Call _insert_done after processing each file
-                                await self._insert_done()
-
                                 async with pipeline_status_lock:
                                     log_message = f"Completed processing file {current_file_number}/{total_files}: {file_path}"
                                     logger.info(log_message)
@@ -2061,6 +2711,10 @@ class LightRAG:
                     # Exit directly (document statuses already updated in process_document)
                     return
 
+                # Commit the round before doc status is scanned for more documents,
+                # uncommitted documents would still be found as PROCESSING
+                await self._processed_docs_commit.flush()
+
                 # Check if there's a pending request to process more documents (with lock)
                 has_pending_request = False
                 async with pipeline_status_lock:
@@ -2090,6 +2744,12 @@ class LightRAG:
                 to_process_docs.update(pending_docs)
 
         finally:
+            # Final group commit, also persists data of failed and cancelled documents
+            try:
+                await self._processed_docs_commit.flush(force=True)
+            except Exception as e:
+                logger.error(f"Failed to persist processed documents: {e}")
+
             log_message = "Enqueued document processing pipeline stopped"
             logger.info(log_message)
             # Always reset busy status and cancellation flag when done or if an exception occurs (with lock)
@@ -2104,10 +2764,16 @@ class LightRAG:
     async def _process_extract_entities(
         self, chunk: dict[str, Any], pipeline_status=None, pipeline_status_lock=None
     ) -> list:
+        global_config = asdict(self)
+        global_config["extraction_batcher"] = self._extraction_batcher
+        if self.adaptive_gleaning:
+            global_config["gleaning_policy"] = self._adaptive_gleaning
+        if self.extraction_checkpoint:
+            global_config["extraction_checkpoints"] = self._extraction_checkpoints
         try:
             chunk_results = await extract_entities(
                 chunk,
-                global_config=asdict(self),
+                global_config=global_config,
                 pipeline_status=pipeline_status,
                 pipeline_status_lock=pipeline_status_lock,
                 llm_response_cache=self.llm_response_cache,
@@ -2122,14 +2788,40 @@ class LightRAG:
                 pipeline_status["history_messages"].append(error_msg)
             raise e
 
+    async def _commit_processed_docs(
+        self, processed_docs: list[tuple[str, dict[str, Any]]]
+    ) -> None:
+        """Group commit of the pipeline: persist all storages, then mark the documents processed"""
+        if self.extraction_checkpoint:
+            # Checkpoints are only needed until their document is processed
+            await self._extraction_checkpoints.delete(
+                [
+                    chunk_id
+                    for _, doc in processed_docs
+                    for chunk_id in doc.get("chunks_list", [])
+                ]
+            )
+        await self._insert_done(processed_docs=dict(processed_docs))
+        if processed_docs:
+            logger.info(f"Committed {len(processed_docs)} processed document(s)")
+
     async def _insert_done(
-        self, pipeline_status=None, pipeline_status_lock=None
+        self,
+        pipeline_status=None,
+        pipeline_status_lock=None,
+        processed_docs: dict[str, dict[str, Any]] | None = None,
     ) -> None:
+        """Persist all storages
+
+        Doc status is written after all other storages, together with the status
+        records in processed_docs. A document is therefore only persisted as processed
+        once its data is, and documents caught by a crash are still PROCESSING and
+        get processed again by the next pipeline run.
+        """
         tasks = [
             cast(StorageNameSpace, storage_inst).index_done_callback()
             for storage_inst in [  # type: ignore
                 self.full_docs,
-                self.doc_status,
                 self.text_chunks,
                 self.full_entities,
                 self.full_relations,
@@ -2144,6 +2836,9 @@ class LightRAG:
             if storage_inst is not None
         ]
         await asyncio.gather(*tasks)
+        if processed_docs:
+            await self.doc_status.upsert(processed_docs)
+        await self.doc_status.index_done_callback()
 
         log_message = "In memory DB persist to disk"
         logger.info(log_message)
@@ -2521,7 +3216,7 @@ class LightRAG:
             actual data is nested under the 'data' field, with 'status' and 'message'
             fields at the top level.
         """
-        global_config = asdict(self)
+        global_config = self._get_query_config()
 
         # Create a copy of param to avoid modifying the original
         data_param = QueryParam(
@@ -2645,17 +3340,29 @@ class LightRAG:
         Returns:
             dict[str, Any]: Complete response with structured data and LLM response.
         """
+        return await self._aquery_llm(query, param, system_prompt)
+
+    async def _aquery_llm(
+        self,
+        query: str,
+        param: QueryParam,
+        system_prompt: str | None = None,
+        check_empty_graph: bool = True,
+        persist_cache: bool = True,
+    ) -> dict[str, Any]:
+        """Implementation of aquery_llm, batch queries skip the per-query graph check and cache flush"""
         logger.debug(f"[aquery_llm] Query param: {param}")
 
-        global_config = asdict(self)
+        global_config = self._get_query_config()
 
         # Check if the graph is empty and force naive mode if necessary
-        all_entity_labels = await self.chunk_entity_relation_graph.get_all_labels()
-        if not all_entity_labels and param.mode != "naive":
-            logger.warning(
-                f"Knowledge graph is empty. Forcing query mode to 'naive' instead of '{param.mode}'."
-            )
-            param.mode = "naive"
+        if check_empty_graph:
+            all_entity_labels = await self.chunk_entity_relation_graph.get_all_labels()
+            if not all_entity_labels and param.mode != "naive":
+                logger.warning(
+                    f"Knowledge graph is empty. Forcing query mode to 'naive' instead of '{param.mode}'."
+                )
+                param.mode = "naive"
 
         try:
             query_result = None
@@ -2723,7 +3430,8 @@ class LightRAG:
             else:
                 raise ValueError(f"Unknown mode {param.mode}")
 
-            await self._query_done()
+            if persist_cache:
+                await self._query_done()
 
             # Check if query_result is None
             if query_result is None:
@@ -2771,6 +3479,167 @@ class LightRAG:
                 },
             }
 
+    async def aquery_batch(
+        self,
+        queries: list[tuple[str, QueryParam]],
+        system_prompt: str | None = None,
+        max_concurrency: int | None = None,
+    ) -> AsyncIterator[tuple[int, dict[str, Any]]]:
+        """
+        Answer many queries together, yielding (index, result) as each one completes.
+
+        Results have the aquery_llm format and LLM responses are never streamed. Work
+        shared by the batch is done once: the empty-graph check, keyword extraction
+        for each distinct query text, and the embedding of each distinct query text
+        and keyword string. Each query is answered as soon as its own keywords and
+        embeddings are ready; texts requested at the same time are embedded together
+        in embedding_batch_num sized calls. Keyword extraction and answering run at
+        most max_concurrency (default query_batch_max_concurrency) at a time each.
+
+        Args:
+            queries: (query text, query parameters) pairs, parameters are copied.
+            system_prompt: Optional custom system prompt for LLM generation.
+            max_concurrency: Maximum number of queries processed at the same time.
+        """
+        if not queries:
+            return
+
+        concurrency = max_concurrency or self.query_batch_max_concurrency
+        keyword_semaphore = asyncio.Semaphore(concurrency)
+        answer_semaphore = asyncio.Semaphore(concurrency)
+        items = [
+            (query.strip(), replace(param, stream=False)) for query, param in queries
+        ]
+        kg_modes = ("local", "global", "hybrid", "mix")
+
+        # Check if the graph is empty and force naive mode if necessary
+        if not await self.chunk_entity_relation_graph.get_all_labels():
+            for _, param in items:
+                param.mode = "naive"
+            logger.warning(
+                "Knowledge graph is empty. Forcing query batch to 'naive' mode."
+            )
+
+        loop = asyncio.get_running_loop()
+        background: list[asyncio.Task] = []
+        global_config = self._get_query_config()
+
+        # Embeddings of the batch, texts missing after a failed call are embedded
+        # by the query itself
+        embeddings: dict[str, Any] = {}
+        embedded: dict[str, asyncio.Future] = {}
+        queued: list[str] = []
+
+        async def _embed_batch(batch: list[str]) -> None:
+            try:
+                embeddings.update(
+                    zip(batch, await self.embedding_func(batch, _priority=5))
+                )
+            except Exception as e:
+                logger.warning(f"Batch query embedding failed: {e}")
+            finally:
+                for text in batch:
+                    embedded[text].set_result(None)
+
+        def _flush_embeddings() -> None:
+            batch_size = self.embedding_batch_num
+            for i in range(0, len(queued), batch_size):
+                background.append(
+                    asyncio.create_task(_embed_batch(queued[i : i + batch_size]))
+                )
+            queued.clear()
+
+        def _queue_embeddings(texts: list[str]) -> list[asyncio.Future]:
+            # Texts queued in the same event loop iteration share embedding calls
+            for text in texts:
+                if text not in embedded:
+                    embedded[text] = loop.create_future()
+                    if not queued:
+                        loop.call_soon(_flush_embeddings)
+                    queued.append(text)
+            return [embedded[text] for text in texts]
+
+        def _vector_texts(query: str, param: QueryParam) -> list[str]:
+            """Every distinct text the query sends to vector search"""
+            if param.mode == "bypass":
+                return []
+            texts = [query]
+            if param.mode not in kg_modes:
+                return texts
+            ll_keywords, hl_keywords = param.ll_keywords, param.hl_keywords
+            if not ll_keywords and not hl_keywords and len(query) < 50:
+                ll_keywords = [query]  # Same fallback as kg_query
+            if ll_keywords and param.mode != "global":
+                texts.append(", ".join(ll_keywords))
+            if hl_keywords and param.mode != "local":
+                texts.append(", ".join(hl_keywords))
+            return list(dict.fromkeys(texts))
+
+        async def _extract_keywords(query: str, param: QueryParam):
+            async with keyword_semaphore:
+                return await extract_keywords_only(
+                    query, param, global_config, self.llm_response_cache
+                )
+
+        # Extract keywords once per distinct query text
+        keyword_tasks: dict[tuple, asyncio.Task] = {}
+        for query, param in items:
+            key = (query, param.model_func)
+            if (
+                param.mode in kg_modes
+                and not (param.hl_keywords or param.ll_keywords)
+                and key not in keyword_tasks
+            ):
+                keyword_tasks[key] = asyncio.create_task(
+                    _extract_keywords(query, param)
+                )
+        background.extend(keyword_tasks.values())
+        # The query texts are embedded while keywords are extracted
+        _queue_embeddings([query for query, param in items if param.mode != "bypass"])
+
+        async def _answer(index: int, query: str, param: QueryParam):
+            keyword_task = keyword_tasks.get((query, param.model_func))
+            if keyword_task is not None:
+                try:
+                    # Shielded, the task is shared by the queries with this text
+                    hl_keywords, ll_keywords = await asyncio.shield(keyword_task)
+                except Exception as e:
+                    # Leave extraction (and error reporting) to the query itself
+                    logger.warning(f"Batch keyword extraction failed: {e}")
+                else:
+                    param.hl_keywords = list(hl_keywords)
+                    param.ll_keywords = list(ll_keywords)
+            pending = _queue_embeddings(_vector_texts(query, param))
+            if pending:
+                await asyncio.wait(pending)
+
+            # Set inside the task, so the embeddings stay scoped to this batch
+            precomputed_query_embeddings.set(embeddings)
+            async with answer_semaphore:
+                result = await self._aquery_llm(
+                    query,
+                    param,
+                    system_prompt,
+                    check_empty_graph=False,
+                    persist_cache=False,
+                )
+            return index, result
+
+        tasks = [
+            asyncio.create_task(_answer(index, query, param))
+            for index, (query, param) in enumerate(items)
+        ]
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                yield await next_completed
+        finally:
+            # Stop remaining work if the consumer goes away early
+            remaining = tasks + background
+            for task in remaining:
+                task.cancel()
+            await asyncio.gather(*remaining, return_exceptions=True)
+            await self._query_done()
+
     def query_llm(
         self,
         query: str,
@@ -2819,6 +3688,8 @@ class LightRAG:
                 logger.warning("Failed to clear all cache")
 
             await self.llm_response_cache.index_done_callback()
+            self._keyword_cache.clear()
+            self._rerank_cache.clear()
 
         except Exception as e:
             logger.error(f"Error while clearing cache: {e}")
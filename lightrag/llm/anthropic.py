@@ -62,10 +62,18 @@ async def anthropic_complete_if_cache(
     enable_cot: bool = False,
     base_url: str | None = None,
     api_key: str | None = None,
+    token_tracker: Any | None = None,
+    prompt_caching: bool | None = None,
     **kwargs: Any,
 ) -> Union[str, AsyncIterator[str]]:
     if history_messages is None:
         history_messages = []
+    if prompt_caching is None:
+        prompt_caching = os.environ.get("ANTHROPIC_PROMPT_CACHING", "true").lower() in (
+            "true",
+            "1",
+            "yes",
+        )
     if enable_cot:
         logger.debug(
             "enable_cot=True is not supported for the Anthropic API and will be ignored."
@@ -99,9 +107,16 @@ async def anthropic_complete_if_cache(
         )
     )
 
-    messages: list[dict[str, Any]] = []
+    # Anthropic takes the system prompt as a top-level parameter. Marking it with
+    # cache_control lets requests sharing the same system prompt (e.g. entity
+    # extraction instructions and examples) reuse the cached prefix.
     if system_prompt:
-        messages.append({"role": "system", "content": system_prompt})
+        system_block: dict[str, Any] = {"type": "text", "text": system_prompt}
+        if prompt_caching:
+            system_block["cache_control"] = {"type": "ephemeral"}
+        kwargs["system"] = [system_block]
+
+    messages: list[dict[str, Any]] = []
     messages.extend(history_messages)
     messages.append({"role": "user", "content": prompt})
 
@@ -131,8 +146,33 @@ async def anthropic_complete_if_cache(
         raise
 
     async def stream_response():
+        usage: dict[str, int] = {}
         try:
             async for event in response:
+                event_type = getattr(event, "type", None)
+                if event_type == "message_start":
+                    start_usage = getattr(event.message, "usage", None)
+                    if start_usage is not None:
+                        usage["input_tokens"] = (
+                            getattr(start_usage, "input_tokens", 0) or 0
+                        )
+                        usage["cache_read_input_tokens"] = (
+                            getattr(start_usage, "cache_read_input_tokens", 0) or 0
+                        )
+                        usage["cache_creation_input_tokens"] = (
+                            getattr(start_usage, "cache_creation_input_tokens", 0) or 0
+                        )
+                        usage["output_tokens"] = (
+                            getattr(start_usage, "output_tokens", 0) or 0
+                        )
+                    continue
+                if event_type == "message_delta":
+                    delta_usage = getattr(event, "usage", None)
+                    if delta_usage is not None:
+                        usage["output_tokens"] = (
+                            getattr(delta_usage, "output_tokens", 0) or 0
+                        )
+                    continue
                 content = (
                     event.delta.text
                     if hasattr(event, "delta") and event.delta.text
@@ -147,6 +187,24 @@ async def anthropic_complete_if_cache(
             logger.error(f"Error in stream response: {str(e)}")
             raise
 
+        if token_tracker and usage:
+            # input_tokens excludes tokens read from or written to the prompt cache
+            prompt_tokens = (
+                usage.get("input_tokens", 0)
+                + usage.get("cache_read_input_tokens", 0)
+                + usage.get("cache_creation_input_tokens", 0)
+            )
+            completion_tokens = usage.get("output_tokens", 0)
+            token_counts = {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+                "cached_tokens": usage.get("cache_read_input_tokens", 0),
+                "cache_creation_tokens": usage.get("cache_creation_input_tokens", 0),
+            }
+            token_tracker.add_usage(token_counts)
+            logger.debug(f"Anthropic token usage: {token_counts}")
+
     return stream_response()
 
 
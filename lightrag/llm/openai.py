@@ -93,6 +93,21 @@ def create_openai_async_client(
     return AsyncOpenAI(**merged_configs)
 
 
+def _usage_to_token_counts(usage: Any) -> dict[str, int]:
+    """Convert an OpenAI usage object to TokenTracker counts.
+
+    Prefix cache hits (OpenAI applies prompt caching automatically) are reported
+    in ``prompt_tokens_details.cached_tokens``.
+    """
+    prompt_details = getattr(usage, "prompt_tokens_details", None)
+    return {
+        "prompt_tokens": getattr(usage, "prompt_tokens", 0),
+        "completion_tokens": getattr(usage, "completion_tokens", 0),
+        "total_tokens": getattr(usage, "total_tokens", 0),
+        "cached_tokens": getattr(prompt_details, "cached_tokens", 0) or 0,
+    }
+
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=4, max=10),
@@ -319,13 +334,7 @@ async def openai_complete_if_cache(
                 # After streaming is complete, track token usage
                 if token_tracker and final_chunk_usage:
                     # Use actual usage from the API
-                    token_counts = {
-                        "prompt_tokens": getattr(final_chunk_usage, "prompt_tokens", 0),
-                        "completion_tokens": getattr(
-                            final_chunk_usage, "completion_tokens", 0
-                        ),
-                        "total_tokens": getattr(final_chunk_usage, "total_tokens", 0),
-                    }
+                    token_counts = _usage_to_token_counts(final_chunk_usage)
                     token_tracker.add_usage(token_counts)
                     logger.debug(f"Streaming token usage (from API): {token_counts}")
                 elif token_tracker:
@@ -454,13 +463,7 @@ async def openai_complete_if_cache(
                 final_content = safe_unicode_decode(final_content.encode("utf-8"))
 
             if token_tracker and hasattr(response, "usage"):
-                token_counts = {
-                    "prompt_tokens": getattr(response.usage, "prompt_tokens", 0),
-                    "completion_tokens": getattr(
-                        response.usage, "completion_tokens", 0
-                    ),
-                    "total_tokens": getattr(response.usage, "total_tokens", 0),
-                }
+                token_counts = _usage_to_token_counts(response.usage)
                 token_tracker.add_usage(token_counts)
 
             logger.debug(f"Response content len: {len(final_content)}")
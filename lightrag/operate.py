@@ -4,9 +4,11 @@ from pathlib import Path
 
 import asyncio
 import json
+import re
 import json_repair
-from typing import Any, AsyncIterator, overload, Literal
-from collections import Counter, defaultdict
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Awaitable, Callable, overload, Literal
+from collections import Counter, OrderedDict, defaultdict
 
 from lightrag.exceptions import PipelineCancelledException
 from lightrag.utils import (
@@ -25,6 +27,8 @@ from lightrag.utils import (
     use_llm_func_with_cache,
     update_chunk_cache_list,
     remove_think_tags,
+    sanitize_text_for_encoding,
+    get_content_summary,
     pick_by_weighted_polling,
     pick_by_vector_similarity,
     process_chunks_unified,
@@ -36,6 +40,8 @@ from lightrag.utils import (
     apply_source_ids_limit,
     merge_source_ids,
     make_relation_chunk_key,
+    generate_cache_key,
+    GroupCommit,
 )
 from lightrag.base import (
     BaseGraphStorage,
@@ -61,6 +67,18 @@ from lightrag.constants import (
     DEFAULT_FILE_PATH_MORE_PLACEHOLDER,
     DEFAULT_MAX_FILE_PATHS,
     DEFAULT_ENTITY_NAME_MAX_LENGTH,
+    DEFAULT_GRAPH_UPSERT_BATCH_SIZE,
+    DEFAULT_MAX_ASYNC,
+    DEFAULT_KEYWORD_CACHE_SIZE,
+    DEFAULT_KEYWORD_CACHE_TTL,
+    DEFAULT_KEYWORD_BATCH_SIZE,
+    DEFAULT_KEYWORD_BATCH_WAIT,
+    DEFAULT_EXTRACT_BATCH_SIZE,
+    DEFAULT_EXTRACT_BATCH_MAX_TOKENS,
+    DEFAULT_EXTRACT_BATCH_CHUNK_TOKENS,
+    DEFAULT_EXTRACT_BATCH_WAIT,
+    DEFAULT_GLEANING_MIN_CHUNK_TOKENS,
+    DEFAULT_EXTRACTION_CHECKPOINT_BATCH,
 )
 from lightrag.kg.shared_storage import get_storage_keyed_lock
 import time
@@ -71,6 +89,18 @@ from dotenv import load_dotenv
 # the OS environment variables take precedence over the .env file
 load_dotenv(dotenv_path=Path(__file__).resolve().parent / ".env", override=False)
 
+# Query and keyword embeddings computed ahead of time by LightRAG.aquery_batch, keyed
+# by the exact text sent to vector search. Only queries run inside the batch see them.
+precomputed_query_embeddings: ContextVar[dict[str, Any] | None] = ContextVar(
+    "precomputed_query_embeddings", default=None
+)
+
+
+def get_precomputed_query_embedding(text: str) -> Any | None:
+    """Return the pre-computed embedding of a query text, None if not available"""
+    embeddings = precomputed_query_embeddings.get()
+    return embeddings.get(text) if embeddings else None
+
 
 def _truncate_entity_identifier(
     identifier: str, limit: int, chunk_key: str, identifier_role: str
@@ -148,6 +178,68 @@ def chunking_by_token_size(
     return results
 
 
+# Chunking function and tokenizer of a chunking process pool worker, see init_chunking_worker
+_chunking_worker: tuple[Callable[..., list[dict[str, Any]]], Tokenizer] | None = None
+
+
+def init_chunking_worker(
+    chunking_func: Callable[..., list[dict[str, Any]]], tokenizer: Tokenizer
+) -> None:
+    """Process pool initializer, loads the chunking function and tokenizer once per worker"""
+    global _chunking_worker
+    _chunking_worker = (chunking_func, tokenizer)
+
+
+def chunk_and_hash(
+    content: str,
+    split_by_character: str | None,
+    split_by_character_only: bool,
+    overlap_token_size: int,
+    max_token_size: int,
+    chunking_func: Callable[..., list[dict[str, Any]]] | None = None,
+    tokenizer: Tokenizer | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Split content into chunks keyed by their chunk id (hash of the chunk content)
+
+    Runs in executor workers, so it only takes and returns picklable data. Without
+    chunking_func and tokenizer, those loaded by init_chunking_worker are used.
+    """
+    if chunking_func is None:
+        chunking_func, tokenizer = _chunking_worker
+    return {
+        compute_mdhash_id(dp["content"], prefix="chunk-"): dp
+        for dp in chunking_func(
+            tokenizer,
+            content,
+            split_by_character,
+            split_by_character_only,
+            overlap_token_size,
+            max_token_size,
+        )
+    }
+
+
+def prepare_documents(contents: list[str]) -> list[tuple[str, str, str]]:
+    """Sanitize documents and compute their content ids and summaries
+
+    Runs in executor workers like chunk_and_hash.
+
+    Returns:
+        (sanitized content, "doc-" content hash id, content summary) per document
+    """
+    results = []
+    for content in contents:
+        cleaned_content = sanitize_text_for_encoding(content)
+        results.append(
+            (
+                cleaned_content,
+                compute_mdhash_id(cleaned_content, prefix="doc-"),
+                get_content_summary(cleaned_content),
+            )
+        )
+    return results
+
+
 async def _handle_entity_relation_summary(
     description_type: str,
     entity_or_relation_name: str,
@@ -280,12 +372,166 @@ async def _handle_entity_relation_summary(
         current_list = new_summaries
 
 
+def _parse_summary_state(
+    summary_state: str | None, already_description: list[str], seperator: str
+) -> dict | None:
+    """Parse the incremental summary state stored on a node or edge.
+
+    Returns None when the state is missing, malformed or no longer matches the
+    stored description (e.g. the description was edited or rebuilt since).
+    """
+    if not summary_state:
+        return None
+    try:
+        state = json.loads(summary_state)
+    except (TypeError, ValueError):
+        return None
+    if not isinstance(state, dict):
+        return None
+    try:
+        summarized = int(state["summarized"])
+        summary_tokens = int(state["summary_tokens"])
+        pending_tokens = int(state["pending_tokens"])
+        fragments = int(state["fragments"])
+        chars = int(state["chars"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if fragments != len(already_description) or chars != len(
+        seperator.join(already_description)
+    ):
+        return None
+    if summarized > 0 and fragments < 1:
+        return None
+    return {
+        "summarized": summarized,
+        "summary_tokens": summary_tokens,
+        "pending_tokens": pending_tokens,
+    }
+
+
+async def _incremental_entity_relation_summary(
+    description_type: str,
+    entity_or_relation_name: str,
+    already_description: list[str],
+    summary_state: str | None,
+    new_descriptions: list[str],
+    seperator: str,
+    global_config: dict,
+    llm_response_cache: BaseKVStorage | None = None,
+) -> tuple[str, bool, str]:
+    """Fold new descriptions into an existing summary without re-summarizing history.
+
+    The stored description is kept as ``summary + pending fragments`` and the
+    token counts of both parts are persisted in ``summary_state``, so only the
+    new descriptions are tokenized on each merge. The LLM is called only when:
+    1. The number of pending fragments reaches max(force_llm_summary_on_merge,
+       fragments already folded into the summary). The threshold doubles after
+       every fold, so a frequently mentioned entity needs O(log n) LLM calls.
+    2. Pending tokens exceed half of the context left next to the summary
+       (summary_context_size - summary_tokens).
+    3. The whole description reaches summary_max_tokens, as in the non
+       incremental path.
+
+    Args:
+        description_type: "Entity" or "Relation"
+        entity_or_relation_name: Name of the entity or relation being summarized
+        already_description: Stored description split by seperator
+        summary_state: JSON state stored alongside the description, if any
+        new_descriptions: Descriptions to merge in this round
+        seperator: Separator used to join description fragments
+        global_config: Global configuration containing tokenizer and limits
+        llm_response_cache: Optional cache for LLM responses
+
+    Returns:
+        Tuple of (description, llm_was_used, summary_state)
+    """
+    tokenizer: Tokenizer = global_config["tokenizer"]
+    summary_context_size = global_config["summary_context_size"]
+    summary_max_tokens = global_config["summary_max_tokens"]
+    force_llm_summary_on_merge = global_config["force_llm_summary_on_merge"]
+
+    state = _parse_summary_state(summary_state, already_description, seperator)
+    if state is None:
+        # Unknown history: treat all stored fragments as pending (tokenized once)
+        summary = None
+        summarized = 0
+        summary_tokens = 0
+        pending = list(already_description)
+        pending_tokens = sum(len(tokenizer.encode(desc)) for desc in pending)
+    else:
+        summarized = state["summarized"]
+        summary_tokens = state["summary_tokens"]
+        pending_tokens = state["pending_tokens"]
+        if summarized > 0:
+            summary = already_description[0]
+            pending = list(already_description[1:])
+        else:
+            summary = None
+            pending = list(already_description)
+
+    pending.extend(new_descriptions)
+    pending_tokens += sum(len(tokenizer.encode(desc)) for desc in new_descriptions)
+    fragments = ([summary] if summary is not None else []) + pending
+
+    fold_count = max(force_llm_summary_on_merge, summarized, 2)
+    token_budget = max((summary_context_size - summary_tokens) // 2, 1)
+    need_fold = len(fragments) >= 2 and (
+        len(pending) >= fold_count
+        or pending_tokens >= token_budget
+        or summary_tokens + pending_tokens >= summary_max_tokens
+    )
+
+    llm_was_used = False
+    if need_fold:
+        if summary_tokens + pending_tokens <= summary_context_size:
+            # Token counts are already known, skip re-truncating the list
+            description = await _summarize_descriptions(
+                description_type,
+                entity_or_relation_name,
+                fragments,
+                global_config,
+                llm_response_cache,
+                truncate=False,
+            )
+            llm_was_used = True
+        else:
+            description, llm_was_used = await _handle_entity_relation_summary(
+                description_type,
+                entity_or_relation_name,
+                fragments,
+                seperator,
+                global_config,
+                llm_response_cache,
+            )
+
+    if llm_was_used:
+        summarized += len(pending)
+        summary_tokens = len(tokenizer.encode(description))
+        pending_tokens = 0
+        fragment_list = [description]
+    else:
+        description = seperator.join(fragments)
+        fragment_list = fragments
+
+    new_state = json.dumps(
+        {
+            "summarized": summarized,
+            "summary_tokens": summary_tokens,
+            "pending_tokens": pending_tokens,
+            "fragments": len(fragment_list),
+            "chars": len(description),
+        }
+    )
+    return description, llm_was_used, new_state
+
+
 async def _summarize_descriptions(
     description_type: str,
     description_name: str,
     description_list: list[str],
     global_config: dict,
     llm_response_cache: BaseKVStorage | None = None,
+    truncate: bool = True,
 ) -> str:
     """Helper function to summarize a list of descriptions using LLM.
 
@@ -294,6 +540,8 @@ async def _summarize_descriptions(
         descriptions: List of description strings to summarize
         global_config: Global configuration containing LLM function and settings
         llm_response_cache: Optional cache for LLM responses
+        truncate: Apply token-based truncation to the description list; callers
+            that already know the list fits summary_context_size can skip it
 
     Returns:
         Summarized description string
@@ -316,12 +564,15 @@ async def _summarize_descriptions(
     json_descriptions = [{"Description": desc} for desc in description_list]
 
     # Use truncate_list_by_token_size for length truncation
-    truncated_json_descriptions = truncate_list_by_token_size(
-        json_descriptions,
-        key=lambda x: json.dumps(x, ensure_ascii=False),
-        max_token_size=summary_context_size,
-        tokenizer=tokenizer,
-    )
+    if truncate:
+        truncated_json_descriptions = truncate_list_by_token_size(
+            json_descriptions,
+            key=lambda x: json.dumps(x, ensure_ascii=False),
+            max_token_size=summary_context_size,
+            tokenizer=tokenizer,
+        )
+    else:
+        truncated_json_descriptions = json_descriptions
 
     # Convert to JSONL format (one JSON object per line)
     joined_descriptions = "\n".join(
@@ -502,6 +753,69 @@ async def _handle_single_relationship_extraction(
         return None
 
 
+async def _run_in_locked_groups(
+    items: list,
+    lock_keys: Callable[[Any], list[str]],
+    worker: Callable[[Any], Awaitable[Any]],
+    namespace: str,
+    group_size: int,
+    before_release: Callable[[], Awaitable[None]] | None = None,
+) -> tuple[list, BaseException | None]:
+    """Run worker concurrently over items, one group of items after the other
+
+    The keyed locks of a whole group are taken in a single get_storage_keyed_lock
+    call (one IPC round trip in multi-process mode) instead of one call per item.
+    before_release (e.g. flushing buffered writes) runs while the group's keys are
+    still locked, also when an item failed. No group is started after a failure.
+
+    Returns:
+        Results of the items that completed and the first exception raised, if any
+    """
+    results = []
+    for start in range(0, len(items), max(1, group_size)):
+        group = items[start : start + max(1, group_size)]
+        keys = sorted({key for item in group for key in lock_keys(item)})
+        first_exception = None
+        async with get_storage_keyed_lock(
+            keys, namespace=namespace, enable_logging=False
+        ):
+            tasks = [asyncio.create_task(worker(item)) for item in group]
+            try:
+                done, pending = await asyncio.wait(
+                    tasks, return_when=asyncio.FIRST_EXCEPTION
+                )
+                if any(not task.cancelled() and task.exception() for task in done):
+                    for task in pending:
+                        task.cancel()
+                outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                if before_release is not None:
+                    await asyncio.shield(before_release())
+                raise
+
+            errors = []
+            for outcome in outcomes:
+                if isinstance(outcome, BaseException):
+                    errors.append(outcome)
+                else:
+                    results.append(outcome)
+            # Items cancelled because of the failure are not the cause of it
+            for error in errors:
+                if not isinstance(error, asyncio.CancelledError):
+                    first_exception = error
+                    break
+            else:
+                first_exception = errors[0] if errors else None
+            if before_release is not None:
+                await before_release()
+        if first_exception is not None:
+            break
+    return results, first_exception
+
+
 async def rebuild_knowledge_from_chunks(
     entities_to_rebuild: dict[str, list[str]],
     relationships_to_rebuild: dict[tuple[str, str], list[str]],
@@ -520,7 +834,9 @@ async def rebuild_knowledge_from_chunks(
 
     This method uses cached LLM extraction results instead of calling LLM again,
     following the same approach as the insert process. Now with parallel processing
-    controlled by llm_model_max_async and using get_storage_keyed_lock for data consistency.
+    controlled by llm_model_max_async and using get_storage_keyed_lock for data consistency:
+    entities, then relationships, are rebuilt in groups of graph_upsert_batch_size whose
+    keys are locked together.
 
     Args:
         entities_to_rebuild: Dict mapping entity_name -> list of remaining chunk_ids
@@ -657,91 +973,70 @@ async def rebuild_knowledge_from_chunks(
     failed_entities_count = 0
     failed_relationships_count = 0
 
-    async def _locked_rebuild_entity(entity_name, chunk_ids):
+    workspace = global_config.get("workspace", "")
+    namespace = f"{workspace}:GraphDB" if workspace else "GraphDB"
+    lock_group_size = global_config.get(
+        "graph_upsert_batch_size", DEFAULT_GRAPH_UPSERT_BATCH_SIZE
+    )
+
+    async def _rebuild_entity(item):
         nonlocal rebuilt_entities_count, failed_entities_count
+        entity_name, chunk_ids = item
         async with semaphore:
-            workspace = global_config.get("workspace", "")
-            namespace = f"{workspace}:GraphDB" if workspace else "GraphDB"
-            async with get_storage_keyed_lock(
-                [entity_name], namespace=namespace, enable_logging=False
-            ):
-                try:
-                    await _rebuild_single_entity(
-                        knowledge_graph_inst=knowledge_graph_inst,
-                        entities_vdb=entities_vdb,
-                        entity_name=entity_name,
-                        chunk_ids=chunk_ids,
-                        chunk_entities=chunk_entities,
-                        llm_response_cache=llm_response_cache,
-                        global_config=global_config,
-                        entity_chunks_storage=entity_chunks_storage,
-                    )
-                    rebuilt_entities_count += 1
-                    status_message = (
-                        f"Rebuild `{entity_name}` from {len(chunk_ids)} chunks"
-                    )
-                    logger.info(status_message)
-                    if pipeline_status is not None and pipeline_status_lock is not None:
-                        async with pipeline_status_lock:
-                            pipeline_status["latest_message"] = status_message
-                            pipeline_status["history_messages"].append(status_message)
-                except Exception as e:
-                    failed_entities_count += 1
-                    status_message = f"Failed to rebuild `{entity_name}`: {e}"
-                    logger.info(status_message)  # Per requirement, change to info
-                    if pipeline_status is not None and pipeline_status_lock is not None:
-                        async with pipeline_status_lock:
-                            pipeline_status["latest_message"] = status_message
-                            pipeline_status["history_messages"].append(status_message)
-
-    async def _locked_rebuild_relationship(src, tgt, chunk_ids):
+            try:
+                await _rebuild_single_entity(
+                    knowledge_graph_inst=knowledge_graph_inst,
+                    entities_vdb=entities_vdb,
+                    entity_name=entity_name,
+                    chunk_ids=chunk_ids,
+                    chunk_entities=chunk_entities,
+                    llm_response_cache=llm_response_cache,
+                    global_config=global_config,
+                    entity_chunks_storage=entity_chunks_storage,
+                )
+                rebuilt_entities_count += 1
+                status_message = f"Rebuild `{entity_name}` from {len(chunk_ids)} chunks"
+                logger.info(status_message)
+                if pipeline_status is not None and pipeline_status_lock is not None:
+                    async with pipeline_status_lock:
+                        pipeline_status["latest_message"] = status_message
+                        pipeline_status["history_messages"].append(status_message)
+            except Exception as e:
+                failed_entities_count += 1
+                status_message = f"Failed to rebuild `{entity_name}`: {e}"
+                logger.info(status_message)  # Per requirement, change to info
+                if pipeline_status is not None and pipeline_status_lock is not None:
+                    async with pipeline_status_lock:
+                        pipeline_status["latest_message"] = status_message
+                        pipeline_status["history_messages"].append(status_message)
+
+    async def _rebuild_relationship(item):
         nonlocal rebuilt_relationships_count, failed_relationships_count
+        (src, tgt), chunk_ids = item
         async with semaphore:
-            workspace = global_config.get("workspace", "")
-            namespace = f"{workspace}:GraphDB" if workspace else "GraphDB"
-            # Sort src and tgt to ensure order-independent lock key generation
-            sorted_key_parts = sorted([src, tgt])
-            async with get_storage_keyed_lock(
-                sorted_key_parts,
-                namespace=namespace,
-                enable_logging=False,
-            ):
-                try:
-                    await _rebuild_single_relationship(
-                        knowledge_graph_inst=knowledge_graph_inst,
-                        relationships_vdb=relationships_vdb,
-                        src=src,
-                        tgt=tgt,
-                        chunk_ids=chunk_ids,
-                        chunk_relationships=chunk_relationships,
-                        llm_response_cache=llm_response_cache,
-                        global_config=global_config,
-                        relation_chunks_storage=relation_chunks_storage,
-                        pipeline_status=pipeline_status,
-                        pipeline_status_lock=pipeline_status_lock,
-                    )
-                    rebuilt_relationships_count += 1
-                except Exception as e:
-                    failed_relationships_count += 1
-                    status_message = f"Failed to rebuild `{src}`~`{tgt}`: {e}"
-                    logger.info(status_message)  # Per requirement, change to info
-                    if pipeline_status is not None and pipeline_status_lock is not None:
-                        async with pipeline_status_lock:
-                            pipeline_status["latest_message"] = status_message
-                            pipeline_status["history_messages"].append(status_message)
-
-    # Create tasks for parallel processing
-    tasks = []
-
-    # Add entity rebuilding tasks
-    for entity_name, chunk_ids in entities_to_rebuild.items():
-        task = asyncio.create_task(_locked_rebuild_entity(entity_name, chunk_ids))
-        tasks.append(task)
-
-    # Add relationship rebuilding tasks
-    for (src, tgt), chunk_ids in relationships_to_rebuild.items():
-        task = asyncio.create_task(_locked_rebuild_relationship(src, tgt, chunk_ids))
-        tasks.append(task)
+            try:
+                await _rebuild_single_relationship(
+                    knowledge_graph_inst=knowledge_graph_inst,
+                    relationships_vdb=relationships_vdb,
+                    src=src,
+                    tgt=tgt,
+                    chunk_ids=chunk_ids,
+                    chunk_relationships=chunk_relationships,
+                    llm_response_cache=llm_response_cache,
+                    global_config=global_config,
+                    relation_chunks_storage=relation_chunks_storage,
+                    pipeline_status=pipeline_status,
+                    pipeline_status_lock=pipeline_status_lock,
+                )
+                rebuilt_relationships_count += 1
+            except Exception as e:
+                failed_relationships_count += 1
+                status_message = f"Failed to rebuild `{src}`~`{tgt}`: {e}"
+                logger.info(status_message)  # Per requirement, change to info
+                if pipeline_status is not None and pipeline_status_lock is not None:
+                    async with pipeline_status_lock:
+                        pipeline_status["latest_message"] = status_message
+                        pipeline_status["history_messages"].append(status_message)
 
     # Log parallel processing start
     status_message = f"Starting parallel rebuild of {len(entities_to_rebuild)} entities and {len(relationships_to_rebuild)} relationships (async: {graph_max_async})"
@@ -751,36 +1046,24 @@ async def rebuild_knowledge_from_chunks(
             pipeline_status["latest_message"] = status_message
             pipeline_status["history_messages"].append(status_message)
 
-    # Execute all tasks in parallel with semaphore control and early failure detection
-    done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
-
-    # Check if any task raised an exception and ensure all exceptions are retrieved
-    first_exception = None
-
-    for task in done:
-        try:
-            exception = task.exception()
-            if exception is not None:
-                if first_exception is None:
-                    first_exception = exception
-            else:
-                # Task completed successfully, retrieve result to mark as processed
-                task.result()
-        except Exception as e:
-            if first_exception is None:
-                first_exception = e
-
-    # If any task failed, cancel all pending tasks and raise the first exception
+    # Rebuild entities, then relationships, stopping at the first unexpected failure
+    _, first_exception = await _run_in_locked_groups(
+        list(entities_to_rebuild.items()),
+        lambda item: [item[0]],
+        _rebuild_entity,
+        namespace,
+        lock_group_size,
+    )
+    if first_exception is None:
+        _, first_exception = await _run_in_locked_groups(
+            list(relationships_to_rebuild.items()),
+            # Sort src and tgt to ensure order-independent lock key generation
+            lambda item: sorted(item[0]),
+            _rebuild_relationship,
+            namespace,
+            lock_group_size,
+        )
     if first_exception is not None:
-        # Cancel all pending tasks
-        for pending_task in pending:
-            pending_task.cancel()
-
-        # Wait for cancellation to complete
-        if pending:
-            await asyncio.wait(pending)
-
-        # Re-raise the first exception to notify the caller
         raise first_exception
 
     # Final status report
@@ -1506,10 +1789,163 @@ async def _rebuild_single_relationship(
             pipeline_status["history_messages"].append(status_message)
 
 
+class GraphUpsertBuffer:
+    """Write-behind buffer that batches graph upserts of the merge stage.
+
+    Node and edge upserts are collected and written through upsert_nodes_batch /
+    upsert_edges_batch once batch_size writes are pending or flush() is called.
+    Reads made through the buffer see pending writes first. Other graph writers
+    (entity edits, deletion) read the storage directly, so a buffer must only be
+    used while the keyed locks of the buffered nodes and edges are held, and be
+    flushed before they are released. Vector DB writes deferred with defer() run
+    once the graph writes made before them are stored.
+    """
+
+    def __init__(
+        self,
+        graph: BaseGraphStorage,
+        batch_size: int = DEFAULT_GRAPH_UPSERT_BATCH_SIZE,
+    ):
+        self._graph = graph
+        self._batch_size = max(1, batch_size)
+        self._nodes: dict[str, dict] = {}
+        self._edges: dict[tuple[str, str], tuple[str, str, dict]] = {}
+        # Writes handed to the storage but not yet acknowledged
+        self._flushing_nodes: dict[str, dict] = {}
+        self._flushing_edges: dict[tuple[str, str], tuple[str, str, dict]] = {}
+        self._deferred: list[Callable[[], Awaitable[Any]]] = []
+        self._flush_lock = asyncio.Lock()
+
+    @staticmethod
+    def _edge_key(src_id: str, tgt_id: str) -> tuple[str, str]:
+        # Graph storages treat edges as undirected
+        return (src_id, tgt_id) if src_id <= tgt_id else (tgt_id, src_id)
+
+    def _pending_node(self, node_id: str) -> dict | None:
+        if node_id in self._nodes:
+            return self._nodes[node_id]
+        return self._flushing_nodes.get(node_id)
+
+    def _pending_edge(self, src_id: str, tgt_id: str) -> tuple | None:
+        key = self._edge_key(src_id, tgt_id)
+        if key in self._edges:
+            return self._edges[key]
+        return self._flushing_edges.get(key)
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._nodes) + len(self._edges)
+
+    async def get_node(self, node_id: str) -> dict | None:
+        pending = self._pending_node(node_id)
+        if pending is not None:
+            return dict(pending)
+        return await self._graph.get_node(node_id)
+
+    async def has_node(self, node_id: str) -> bool:
+        if self._pending_node(node_id) is not None:
+            return True
+        return await self._graph.has_node(node_id)
+
+    async def get_edge(self, src_id: str, tgt_id: str) -> dict | None:
+        pending = self._pending_edge(src_id, tgt_id)
+        if pending is not None:
+            return dict(pending[2])
+        return await self._graph.get_edge(src_id, tgt_id)
+
+    async def has_edge(self, src_id: str, tgt_id: str) -> bool:
+        if self._pending_edge(src_id, tgt_id) is not None:
+            return True
+        return await self._graph.has_edge(src_id, tgt_id)
+
+    async def upsert_node(self, node_id: str, node_data: dict[str, str]) -> None:
+        self._nodes[node_id] = dict(node_data)
+        if self.pending_count >= self._batch_size:
+            await self.flush()
+
+    async def upsert_edge(
+        self, source_node_id: str, target_node_id: str, edge_data: dict[str, str]
+    ) -> None:
+        key = self._edge_key(source_node_id, target_node_id)
+        self._edges[key] = (source_node_id, target_node_id, dict(edge_data))
+        if self.pending_count >= self._batch_size:
+            await self.flush()
+
+    def defer(self, operation: Callable[[], Awaitable[Any]]) -> None:
+        """Run operation (a vector DB write) once the pending graph writes are stored"""
+        self._deferred.append(operation)
+
+    async def flush(self) -> None:
+        """Write all pending nodes, then all pending edges, in batches of batch_size.
+
+        Nodes go first because edge upserts only connect existing nodes. Pending nodes
+        and edges are taken together, so an edge added while the node batch is being
+        written never goes out before its endpoint nodes. Writes of a failed batch
+        stay pending (unless superseded) and are retried by the next flush, deferred
+        operations stay pending with them. Deferred operations run concurrently once
+        the graph writes succeeded; the first one failing is raised.
+        """
+        async with self._flush_lock:
+            if not self._nodes and not self._edges and not self._deferred:
+                return
+            self._flushing_nodes, self._nodes = self._nodes, {}
+            self._flushing_edges, self._edges = self._edges, {}
+            deferred, self._deferred = self._deferred, []
+            try:
+                try:
+                    items = list(self._flushing_nodes.items())
+                    for i in range(0, len(items), self._batch_size):
+                        await self._graph.upsert_nodes_batch(
+                            dict(items[i : i + self._batch_size])
+                        )
+                except BaseException:
+                    self._nodes = {**self._flushing_nodes, **self._nodes}
+                    self._edges = {**self._flushing_edges, **self._edges}
+                    self._deferred = deferred + self._deferred
+                    raise
+                finally:
+                    self._flushing_nodes = {}
+
+                try:
+                    edges = list(self._flushing_edges.values())
+                    for i in range(0, len(edges), self._batch_size):
+                        await self._graph.upsert_edges_batch(
+                            edges[i : i + self._batch_size]
+                        )
+                except BaseException:
+                    self._edges = {**self._flushing_edges, **self._edges}
+                    self._deferred = deferred + self._deferred
+                    raise
+            finally:
+                self._flushing_edges = {}
+
+            outcomes = await asyncio.gather(
+                *(operation() for operation in deferred), return_exceptions=True
+            )
+            for outcome in outcomes:
+                if isinstance(outcome, BaseException):
+                    raise outcome
+
+
+async def _after_graph_write(
+    knowledge_graph_inst: BaseGraphStorage | GraphUpsertBuffer,
+    operation: Callable[[], Awaitable[Any]],
+) -> None:
+    """Run a vector DB write once the graph writes made before it are stored
+
+    Keeps vector search from finding entities and relations that are still
+    waiting in a GraphUpsertBuffer.
+    """
+    if isinstance(knowledge_graph_inst, GraphUpsertBuffer):
+        knowledge_graph_inst.defer(operation)
+    else:
+        await operation()
+
+
 async def _merge_nodes_then_upsert(
     entity_name: str,
     nodes_data: list[dict],
-    knowledge_graph_inst: BaseGraphStorage,
+    knowledge_graph_inst: BaseGraphStorage | GraphUpsertBuffer,
     entity_vdb: BaseVectorStorage | None,
     global_config: dict,
     pipeline_status: dict = None,
@@ -1646,14 +2082,31 @@ async def _merge_nodes_then_upsert(
                 raise PipelineCancelledException("User cancelled during entity summary")
 
     # 8. Get summary description an LLM usage status
-    description, llm_was_used = await _handle_entity_relation_summary(
-        "Entity",
-        entity_name,
-        description_list,
-        GRAPH_FIELD_SEP,
-        global_config,
-        llm_response_cache,
-    )
+    summary_state = None
+    if global_config.get("summary_incremental"):
+        (
+            description,
+            llm_was_used,
+            summary_state,
+        ) = await _incremental_entity_relation_summary(
+            "Entity",
+            entity_name,
+            already_description,
+            already_node.get("summary_state") if already_node else None,
+            sorted_descriptions,
+            GRAPH_FIELD_SEP,
+            global_config,
+            llm_response_cache,
+        )
+    else:
+        description, llm_was_used = await _handle_entity_relation_summary(
+            "Entity",
+            entity_name,
+            description_list,
+            GRAPH_FIELD_SEP,
+            global_config,
+            llm_response_cache,
+        )
 
     # 9. Build file_path within MAX_FILE_PATHS
     file_paths_list = []
@@ -1757,6 +2210,8 @@ async def _merge_nodes_then_upsert(
         created_at=int(time.time()),
         truncate=truncation_info,
     )
+    if summary_state is not None:
+        node_data["summary_state"] = summary_state
     await knowledge_graph_inst.upsert_node(
         entity_name,
         node_data=node_data,
@@ -1774,12 +2229,15 @@ async def _merge_nodes_then_upsert(
                 "file_path": file_path,
             }
         }
-        await safe_vdb_operation_with_exception(
-            operation=lambda payload=data_for_vdb: entity_vdb.upsert(payload),
-            operation_name="entity_upsert",
-            entity_name=entity_name,
-            max_retries=3,
-            retry_delay=0.1,
+        await _after_graph_write(
+            knowledge_graph_inst,
+            lambda: safe_vdb_operation_with_exception(
+                operation=lambda payload=data_for_vdb: entity_vdb.upsert(payload),
+                operation_name="entity_upsert",
+                entity_name=entity_name,
+                max_retries=3,
+                retry_delay=0.1,
+            ),
         )
     return node_data
 
@@ -1788,7 +2246,7 @@ async def _merge_edges_then_upsert(
     src_id: str,
     tgt_id: str,
     edges_data: list[dict],
-    knowledge_graph_inst: BaseGraphStorage,
+    knowledge_graph_inst: BaseGraphStorage | GraphUpsertBuffer,
     relationships_vdb: BaseVectorStorage | None,
     entity_vdb: BaseVectorStorage | None,
     global_config: dict,
@@ -1974,14 +2432,31 @@ async def _merge_edges_then_upsert(
                 )
 
     # 8. Get summary description an LLM usage status
-    description, llm_was_used = await _handle_entity_relation_summary(
-        "Relation",
-        f"({src_id}, {tgt_id})",
-        description_list,
-        GRAPH_FIELD_SEP,
-        global_config,
-        llm_response_cache,
-    )
+    summary_state = None
+    if global_config.get("summary_incremental"):
+        (
+            description,
+            llm_was_used,
+            summary_state,
+        ) = await _incremental_entity_relation_summary(
+            "Relation",
+            f"({src_id}, {tgt_id})",
+            already_description,
+            already_edge.get("summary_state") if already_edge else None,
+            sorted_descriptions,
+            GRAPH_FIELD_SEP,
+            global_config,
+            llm_response_cache,
+        )
+    else:
+        description, llm_was_used = await _handle_entity_relation_summary(
+            "Relation",
+            f"({src_id}, {tgt_id})",
+            description_list,
+            GRAPH_FIELD_SEP,
+            global_config,
+            llm_response_cache,
+        )
 
     # 9. Build file_path within MAX_FILE_PATHS limit
     file_paths_list = []
@@ -2106,12 +2581,17 @@ async def _merge_edges_then_upsert(
                         "file_path": file_path,
                     }
                 }
-                await safe_vdb_operation_with_exception(
-                    operation=lambda payload=vdb_data: entity_vdb.upsert(payload),
-                    operation_name="added_entity_upsert",
-                    entity_name=need_insert_id,
-                    max_retries=3,
-                    retry_delay=0.1,
+                await _after_graph_write(
+                    knowledge_graph_inst,
+                    lambda payload=vdb_data, name=need_insert_id: (
+                        safe_vdb_operation_with_exception(
+                            operation=lambda: entity_vdb.upsert(payload),
+                            operation_name="added_entity_upsert",
+                            entity_name=name,
+                            max_retries=3,
+                            retry_delay=0.1,
+                        )
+                    ),
                 )
 
             # Track entities added during edge processing
@@ -2127,18 +2607,21 @@ async def _merge_edges_then_upsert(
                 added_entities.append(entity_data)
 
     edge_created_at = int(time.time())
+    graph_edge_data = dict(
+        weight=weight,
+        description=description,
+        keywords=keywords,
+        source_id=source_id,
+        file_path=file_path,
+        created_at=edge_created_at,
+        truncate=truncation_info,
+    )
+    if summary_state is not None:
+        graph_edge_data["summary_state"] = summary_state
     await knowledge_graph_inst.upsert_edge(
         src_id,
         tgt_id,
-        edge_data=dict(
-            weight=weight,
-            description=description,
-            keywords=keywords,
-            source_id=source_id,
-            file_path=file_path,
-            created_at=edge_created_at,
-            truncate=truncation_info,
-        ),
+        edge_data=graph_edge_data,
     )
 
     edge_data = dict(
@@ -2156,12 +2639,6 @@ async def _merge_edges_then_upsert(
     if relationships_vdb is not None:
         rel_vdb_id = compute_mdhash_id(src_id + tgt_id, prefix="rel-")
         rel_vdb_id_reverse = compute_mdhash_id(tgt_id + src_id, prefix="rel-")
-        try:
-            await relationships_vdb.delete([rel_vdb_id, rel_vdb_id_reverse])
-        except Exception as e:
-            logger.debug(
-                f"Could not delete old relationship vector records {rel_vdb_id}, {rel_vdb_id_reverse}: {e}"
-            )
         rel_content = f"{keywords}\t{src_id}\n{tgt_id}\n{description}"
         vdb_data = {
             rel_vdb_id: {
@@ -2175,13 +2652,23 @@ async def _merge_edges_then_upsert(
                 "file_path": file_path,
             }
         }
-        await safe_vdb_operation_with_exception(
-            operation=lambda payload=vdb_data: relationships_vdb.upsert(payload),
-            operation_name="relationship_upsert",
-            entity_name=f"{src_id}-{tgt_id}",
-            max_retries=3,
-            retry_delay=0.2,
-        )
+
+        async def _upsert_relationship_vdb():
+            try:
+                await relationships_vdb.delete([rel_vdb_id, rel_vdb_id_reverse])
+            except Exception as e:
+                logger.debug(
+                    f"Could not delete old relationship vector records {rel_vdb_id}, {rel_vdb_id_reverse}: {e}"
+                )
+            await safe_vdb_operation_with_exception(
+                operation=lambda payload=vdb_data: relationships_vdb.upsert(payload),
+                operation_name="relationship_upsert",
+                entity_name=f"{src_id}-{tgt_id}",
+                max_retries=3,
+                retry_delay=0.2,
+            )
+
+        await _after_graph_write(knowledge_graph_inst, _upsert_relationship_vdb)
 
     return edge_data
 
@@ -2209,6 +2696,10 @@ async def merge_nodes_and_edges(
     This approach ensures data consistency by:
     1. Phase 1: Process all entities concurrently
     2. Phase 2: Process all relationships concurrently (may add missing entities)
+    Both phases work through groups of up to graph_upsert_batch_size items, locking the
+    keys of a whole group in a single get_storage_keyed_lock call. Graph writes of a
+    group are batched and stored, followed by its vector DB writes, before the
+    group's keys are released.
     3. Phase 3: Update full_entities and full_relations storage with final results
 
     Args:
@@ -2230,6 +2721,13 @@ async def merge_nodes_and_edges(
         file_path: File path for logging
     """
 
+    # Graph writes are buffered and flushed through the batch upsert API before
+    # the keyed locks of each group are released
+    graph_upsert_buffer = GraphUpsertBuffer(
+        knowledge_graph_inst,
+        global_config.get("graph_upsert_batch_size", DEFAULT_GRAPH_UPSERT_BATCH_SIZE),
+    )
+
     # Check for cancellation at the start of merge
     if pipeline_status is not None and pipeline_status_lock is not None:
         async with pipeline_status_lock:
@@ -2270,7 +2768,14 @@ async def merge_nodes_and_edges(
         pipeline_status["latest_message"] = log_message
         pipeline_status["history_messages"].append(log_message)
 
-    async def _locked_process_entity_name(entity_name, entities):
+    workspace = global_config.get("workspace", "")
+    namespace = f"{workspace}:GraphDB" if workspace else "GraphDB"
+    lock_group_size = global_config.get(
+        "graph_upsert_batch_size", DEFAULT_GRAPH_UPSERT_BATCH_SIZE
+    )
+
+    async def _process_entity_name(item):
+        entity_name, entities = item
         async with semaphore:
             # Check for cancellation before processing entity
             if pipeline_status is not None and pipeline_status_lock is not None:
@@ -2280,87 +2785,51 @@ async def merge_nodes_and_edges(
                             "User cancelled during entity merge"
                         )
 
-            workspace = global_config.get("workspace", "")
-            namespace = f"{workspace}:GraphDB" if workspace else "GraphDB"
-            async with get_storage_keyed_lock(
-                [entity_name], namespace=namespace, enable_logging=False
-            ):
-                try:
-                    logger.debug(f"Processing entity {entity_name}")
-                    entity_data = await _merge_nodes_then_upsert(
-                        entity_name,
-                        entities,
-                        knowledge_graph_inst,
-                        entity_vdb,
-                        global_config,
-                        pipeline_status,
-                        pipeline_status_lock,
-                        llm_response_cache,
-                        entity_chunks_storage,
-                    )
+            try:
+                logger.debug(f"Processing entity {entity_name}")
+                entity_data = await _merge_nodes_then_upsert(
+                    entity_name,
+                    entities,
+                    graph_upsert_buffer,
+                    entity_vdb,
+                    global_config,
+                    pipeline_status,
+                    pipeline_status_lock,
+                    llm_response_cache,
+                    entity_chunks_storage,
+                )
 
-                    return entity_data
-
-                except Exception as e:
-                    error_msg = f"Error processing entity `{entity_name}`: {e}"
-                    logger.error(error_msg)
-
-                    # Try to update pipeline status, but don't let status update failure affect main exception
-                    try:
-                        if (
-                            pipeline_status is not None
-                            and pipeline_status_lock is not None
-                        ):
-                            async with pipeline_status_lock:
-                                pipeline_status["latest_message"] = error_msg
-                                pipeline_status["history_messages"].append(error_msg)
-                    except Exception as status_error:
-                        logger.error(
-                            f"Failed to update pipeline status: {status_error}"
-                        )
+                return entity_data
 
-                    # Re-raise the original exception with a prefix
-                    prefixed_exception = create_prefixed_exception(
-                        e, f"`{entity_name}`"
-                    )
-                    raise prefixed_exception from e
+            except Exception as e:
+                error_msg = f"Error processing entity `{entity_name}`: {e}"
+                logger.error(error_msg)
+
+                # Try to update pipeline status, but don't let status update failure affect main exception
+                try:
+                    if pipeline_status is not None and pipeline_status_lock is not None:
+                        async with pipeline_status_lock:
+                            pipeline_status["latest_message"] = error_msg
+                            pipeline_status["history_messages"].append(error_msg)
+                except Exception as status_error:
+                    logger.error(f"Failed to update pipeline status: {status_error}")
 
-    # Create entity processing tasks
-    entity_tasks = []
-    for entity_name, entities in all_nodes.items():
-        task = asyncio.create_task(_locked_process_entity_name(entity_name, entities))
-        entity_tasks.append(task)
+                # Re-raise the original exception with a prefix
+                prefixed_exception = create_prefixed_exception(e, f"`{entity_name}`")
+                raise prefixed_exception from e
 
-    # Execute entity tasks with error handling
+    # Entities are processed in groups whose keyed locks are taken in one call
     processed_entities = []
-    if entity_tasks:
-        done, pending = await asyncio.wait(
-            entity_tasks, return_when=asyncio.FIRST_EXCEPTION
+    if all_nodes:
+        processed_entities, first_exception = await _run_in_locked_groups(
+            list(all_nodes.items()),
+            lambda item: [item[0]],
+            _process_entity_name,
+            namespace,
+            lock_group_size,
+            # Persist the nodes merged so far, even if some entity failed
+            graph_upsert_buffer.flush,
         )
-
-        first_exception = None
-        processed_entities = []
-
-        for task in done:
-            try:
-                result = task.result()
-            except BaseException as e:
-                if first_exception is None:
-                    first_exception = e
-            else:
-                processed_entities.append(result)
-
-        if pending:
-            for task in pending:
-                task.cancel()
-            pending_results = await asyncio.gather(*pending, return_exceptions=True)
-            for result in pending_results:
-                if isinstance(result, BaseException):
-                    if first_exception is None:
-                        first_exception = result
-                else:
-                    processed_entities.append(result)
-
         if first_exception is not None:
             raise first_exception
 
@@ -2371,7 +2840,8 @@ async def merge_nodes_and_edges(
         pipeline_status["latest_message"] = log_message
         pipeline_status["history_messages"].append(log_message)
 
-    async def _locked_process_edges(edge_key, edges):
+    async def _process_edges(item):
+        edge_key, edges = item
         async with semaphore:
             # Check for cancellation before processing edges
             if pipeline_status is not None and pipeline_status_lock is not None:
@@ -2381,104 +2851,66 @@ async def merge_nodes_and_edges(
                             "User cancelled during relation merge"
                         )
 
-            workspace = global_config.get("workspace", "")
-            namespace = f"{workspace}:GraphDB" if workspace else "GraphDB"
             sorted_edge_key = sorted([edge_key[0], edge_key[1]])
+            try:
+                added_entities = []  # Track entities added during edge processing
+
+                logger.debug(f"Processing relation {sorted_edge_key}")
+                edge_data = await _merge_edges_then_upsert(
+                    edge_key[0],
+                    edge_key[1],
+                    edges,
+                    graph_upsert_buffer,
+                    relationships_vdb,
+                    entity_vdb,
+                    global_config,
+                    pipeline_status,
+                    pipeline_status_lock,
+                    llm_response_cache,
+                    added_entities,  # Pass list to collect added entities
+                    relation_chunks_storage,
+                )
 
-            async with get_storage_keyed_lock(
-                sorted_edge_key,
-                namespace=namespace,
-                enable_logging=False,
-            ):
-                try:
-                    added_entities = []  # Track entities added during edge processing
-
-                    logger.debug(f"Processing relation {sorted_edge_key}")
-                    edge_data = await _merge_edges_then_upsert(
-                        edge_key[0],
-                        edge_key[1],
-                        edges,
-                        knowledge_graph_inst,
-                        relationships_vdb,
-                        entity_vdb,
-                        global_config,
-                        pipeline_status,
-                        pipeline_status_lock,
-                        llm_response_cache,
-                        added_entities,  # Pass list to collect added entities
-                        relation_chunks_storage,
-                    )
+                if edge_data is None:
+                    return None, []
 
-                    if edge_data is None:
-                        return None, []
-
-                    return edge_data, added_entities
-
-                except Exception as e:
-                    error_msg = f"Error processing relation `{sorted_edge_key}`: {e}"
-                    logger.error(error_msg)
-
-                    # Try to update pipeline status, but don't let status update failure affect main exception
-                    try:
-                        if (
-                            pipeline_status is not None
-                            and pipeline_status_lock is not None
-                        ):
-                            async with pipeline_status_lock:
-                                pipeline_status["latest_message"] = error_msg
-                                pipeline_status["history_messages"].append(error_msg)
-                    except Exception as status_error:
-                        logger.error(
-                            f"Failed to update pipeline status: {status_error}"
-                        )
+                return edge_data, added_entities
 
-                    # Re-raise the original exception with a prefix
-                    prefixed_exception = create_prefixed_exception(
-                        e, f"{sorted_edge_key}"
-                    )
-                    raise prefixed_exception from e
+            except Exception as e:
+                error_msg = f"Error processing relation `{sorted_edge_key}`: {e}"
+                logger.error(error_msg)
+
+                # Try to update pipeline status, but don't let status update failure affect main exception
+                try:
+                    if pipeline_status is not None and pipeline_status_lock is not None:
+                        async with pipeline_status_lock:
+                            pipeline_status["latest_message"] = error_msg
+                            pipeline_status["history_messages"].append(error_msg)
+                except Exception as status_error:
+                    logger.error(f"Failed to update pipeline status: {status_error}")
 
-    # Create relationship processing tasks
-    edge_tasks = []
-    for edge_key, edges in all_edges.items():
-        task = asyncio.create_task(_locked_process_edges(edge_key, edges))
-        edge_tasks.append(task)
+                # Re-raise the original exception with a prefix
+                prefixed_exception = create_prefixed_exception(e, f"{sorted_edge_key}")
+                raise prefixed_exception from e
 
-    # Execute relationship tasks with error handling
+    # Relationships are processed in groups locking the endpoints of all their edges
     processed_edges = []
     all_added_entities = []
 
-    if edge_tasks:
-        done, pending = await asyncio.wait(
-            edge_tasks, return_when=asyncio.FIRST_EXCEPTION
+    if all_edges:
+        edge_results, first_exception = await _run_in_locked_groups(
+            list(all_edges.items()),
+            lambda item: sorted(item[0]),
+            _process_edges,
+            namespace,
+            lock_group_size,
+            # Persist added nodes and merged relations before reporting completion
+            graph_upsert_buffer.flush,
         )
-
-        first_exception = None
-
-        for task in done:
-            try:
-                edge_data, added_entities = task.result()
-            except BaseException as e:
-                if first_exception is None:
-                    first_exception = e
-            else:
-                if edge_data is not None:
-                    processed_edges.append(edge_data)
-                all_added_entities.extend(added_entities)
-
-        if pending:
-            for task in pending:
-                task.cancel()
-            pending_results = await asyncio.gather(*pending, return_exceptions=True)
-            for result in pending_results:
-                if isinstance(result, BaseException):
-                    if first_exception is None:
-                        first_exception = result
-                else:
-                    edge_data, added_entities = result
-                    if edge_data is not None:
-                        processed_edges.append(edge_data)
-                    all_added_entities.extend(added_entities)
+        for edge_data, added_entities in edge_results:
+            if edge_data is not None:
+                processed_edges.append(edge_data)
+            all_added_entities.extend(added_entities)
 
         if first_exception is not None:
             raise first_exception
@@ -2555,6 +2987,414 @@ async def merge_nodes_and_edges(
         pipeline_status["history_messages"].append(log_message)
 
 
+def _merge_gleaning_result(
+    maybe_nodes: dict, maybe_edges: dict, glean_nodes: dict, glean_edges: dict
+) -> None:
+    """Merge the result of a gleaning round into the first pass result in place"""
+    # Merge results - compare description lengths to choose better version
+    for entity_name, glean_entities in glean_nodes.items():
+        if entity_name in maybe_nodes:
+            # Compare description lengths and keep the better one
+            original_desc_len = len(
+                maybe_nodes[entity_name][0].get("description", "") or ""
+            )
+            glean_desc_len = len(glean_entities[0].get("description", "") or "")
+
+            if glean_desc_len > original_desc_len:
+                maybe_nodes[entity_name] = list(glean_entities)
+            # Otherwise keep original version
+        else:
+            # New entity from gleaning stage
+            maybe_nodes[entity_name] = list(glean_entities)
+
+    for edge_key, glean_edge_list in glean_edges.items():
+        if edge_key in maybe_edges:
+            # Compare description lengths and keep the better one
+            original_desc_len = len(
+                maybe_edges[edge_key][0].get("description", "") or ""
+            )
+            glean_desc_len = len(glean_edge_list[0].get("description", "") or "")
+
+            if glean_desc_len > original_desc_len:
+                maybe_edges[edge_key] = list(glean_edge_list)
+            # Otherwise keep original version
+        else:
+            # New edge from gleaning stage
+            maybe_edges[edge_key] = list(glean_edge_list)
+
+
+class ExtractionCheckpoints:
+    """Per-chunk extraction checkpoints kept in the LLM response cache storage.
+
+    The raw LLM results of every extracted chunk (first pass and gleaning) and its
+    LLM cache keys are saved under "default:extract_checkpoint:{chunk_id}", tagged
+    with a hash of the extraction prompt. They are written in groups of batch_size
+    chunks and the storage is persisted at most every persist_interval seconds.
+    When a cancelled, failed or crashed document is processed again, checkpointed
+    chunks are re-parsed instead of extracted and their stored chunks are reused.
+    Checkpoints are deleted once their document is committed as processed.
+
+    Checkpointing is best effort: storage errors are logged and never fail the
+    extraction or the commit of a document.
+    """
+
+    CACHE_TYPE = "extract_checkpoint"
+
+    def __init__(
+        self,
+        storage: BaseKVStorage,
+        batch_size: int = DEFAULT_EXTRACTION_CHECKPOINT_BATCH,
+        persist_interval: float = 60,
+    ):
+        self._storage = storage
+        self._persist_interval = persist_interval
+        self._last_persist = time.monotonic()
+        self._commit = GroupCommit(
+            self._write, max_items=batch_size, max_delay=persist_interval
+        )
+
+    @classmethod
+    def key(cls, chunk_id: str) -> str:
+        return generate_cache_key("default", cls.CACHE_TYPE, chunk_id)
+
+    async def has_any(self, chunk_ids: list[str]) -> bool:
+        """Whether a checkpoint exists for at least one of the chunks"""
+        keys = {self.key(chunk_id) for chunk_id in chunk_ids}
+        if not keys:
+            return False
+        try:
+            missing = await self._storage.filter_keys(keys)
+        except Exception as e:
+            logger.warning(f"Failed to read extraction checkpoints: {e}")
+            return False
+        return len(missing) < len(keys)
+
+    async def load(self, chunk_ids: list[str], prompt_hash: str) -> dict[str, dict]:
+        """Checkpoints of the chunks made with the same extraction prompt
+
+        Returns:
+            chunk_id -> {"results": [[result_text, timestamp], ...], "cache_keys": [...]}
+        """
+        if not chunk_ids:
+            return {}
+        try:
+            records = await self._storage.get_by_ids(
+                [self.key(cid) for cid in chunk_ids]
+            )
+        except Exception as e:
+            logger.warning(f"Failed to read extraction checkpoints: {e}")
+            return {}
+        checkpoints = {}
+        for chunk_id, record in zip(chunk_ids, records):
+            if not record or record.get("cache_type") != self.CACHE_TYPE:
+                continue
+            if record.get("original_prompt") != prompt_hash:
+                continue
+            try:
+                checkpoint = json.loads(record["return"])
+            except (KeyError, TypeError, ValueError):
+                continue
+            if checkpoint.get("results"):
+                checkpoints[chunk_id] = checkpoint
+        return checkpoints
+
+    async def save(
+        self,
+        chunk_id: str,
+        prompt_hash: str,
+        results: list[tuple[str, int]],
+        cache_keys: list[str],
+    ) -> None:
+        try:
+            await self._commit.add((chunk_id, prompt_hash, results, cache_keys))
+        except Exception as e:
+            # Failed groups stay pending and are retried by the next write
+            logger.warning(f"Failed to save extraction checkpoints: {e}")
+
+    async def flush(self) -> None:
+        try:
+            await self._commit.flush()
+        except Exception as e:
+            logger.warning(f"Failed to save extraction checkpoints: {e}")
+
+    async def delete(self, chunk_ids: list[str]) -> None:
+        """Drop the checkpoints of the chunks, including pending ones"""
+        await self.flush()
+        if not chunk_ids:
+            return
+        try:
+            await self._storage.delete([self.key(cid) for cid in chunk_ids])
+        except Exception as e:
+            logger.warning(f"Failed to delete extraction checkpoints: {e}")
+
+    async def _write(self, items: list[tuple]) -> None:
+        await self._storage.upsert(
+            {
+                self.key(chunk_id): {
+                    "return": json.dumps(
+                        {"results": results, "cache_keys": cache_keys},
+                        ensure_ascii=False,
+                    ),
+                    "cache_type": self.CACHE_TYPE,
+                    "chunk_id": chunk_id,
+                    "original_prompt": prompt_hash,
+                    "queryparam": None,
+                }
+                for chunk_id, prompt_hash, results, cache_keys in items
+            }
+        )
+        # Persist so that checkpoints survive a crash, not only a cancellation
+        if time.monotonic() - self._last_persist >= self._persist_interval:
+            self._last_persist = time.monotonic()
+            await self._storage.index_done_callback()
+
+
+class ExtractionBatcher:
+    """Packs the extraction requests of small chunks into multi-chunk LLM calls.
+
+    Chunks of at most chunk_tokens tokens, from any document being processed, that
+    arrive within batch_wait seconds of each other are sent in one request sharing
+    the same system prompt, up to batch_size chunks or max_tokens chunk tokens per
+    call. The response is split back per chunk on its `<|CHUNK_n|>` markers. Chunks
+    missing from the response, whose section does not end with the completion
+    delimiter, or from a failed call, fall back to a regular single-chunk request.
+
+    Only chunks extracted concurrently can share a request, the pipeline processes
+    more documents at once while batching is enabled to fill them.
+    """
+
+    _CHUNK_MARKER = re.compile(r"<\|CHUNK_(\d+)\|>", re.IGNORECASE)
+
+    def __init__(
+        self,
+        batch_size: int = DEFAULT_EXTRACT_BATCH_SIZE,
+        max_tokens: int = DEFAULT_EXTRACT_BATCH_MAX_TOKENS,
+        chunk_tokens: int = DEFAULT_EXTRACT_BATCH_CHUNK_TOKENS,
+        batch_wait: float = DEFAULT_EXTRACT_BATCH_WAIT,
+    ):
+        self._batch_size = max(batch_size, 1)
+        self._max_tokens = max(max_tokens, 1)
+        self._chunk_tokens = min(chunk_tokens, self._max_tokens)
+        self._batch_wait = max(batch_wait, 0)
+        # Pending chunks grouped by system prompt: (content, tokens, future)
+        self._pending: dict[str, list[tuple[str, int, asyncio.Future]]] = {}
+        self._pending_tokens: dict[str, int] = {}
+        self._requests: dict[str, tuple[Callable, dict]] = {}
+        self._flush_handles: dict[str, asyncio.TimerHandle] = {}
+        self._batch_tasks: set[asyncio.Task] = set()
+
+    def accepts(self, tokens: int) -> bool:
+        """Whether a chunk of this token size is packed with others"""
+        return self._batch_size > 1 and tokens <= self._chunk_tokens
+
+    async def extract(
+        self,
+        content: str,
+        tokens: int,
+        llm_func: Callable[..., Awaitable[str]],
+        prompt_context: dict[str, Any],
+        user_prompt: str,
+        system_prompt: str | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Stand-in for llm_func returning the extraction result of one chunk
+
+        Bound with partial() to the chunk and passed to use_llm_func_with_cache, so
+        cache lookup and saving stay per chunk and keyed by the single-chunk prompt.
+        """
+        result = await self._enqueue(
+            system_prompt or "", content, tokens, llm_func, prompt_context
+        )
+        if result is None:
+            return await llm_func(user_prompt, system_prompt=system_prompt, **kwargs)
+        return result
+
+    async def _enqueue(
+        self,
+        key: str,
+        content: str,
+        tokens: int,
+        llm_func: Callable[..., Awaitable[str]],
+        prompt_context: dict[str, Any],
+    ) -> str | None:
+        if (
+            self._pending.get(key)
+            and self._pending_tokens[key] + tokens > self._max_tokens
+        ):
+            self._flush(key)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(key, []).append((content, tokens, future))
+        self._pending_tokens[key] = self._pending_tokens.get(key, 0) + tokens
+        self._requests[key] = (llm_func, prompt_context)
+        if (
+            len(self._pending[key]) >= self._batch_size
+            or self._pending_tokens[key] >= self._max_tokens
+        ):
+            self._flush(key)
+        elif key not in self._flush_handles:
+            self._flush_handles[key] = loop.call_later(
+                self._batch_wait, self._flush, key
+            )
+        return await future
+
+    def _flush(self, key: str) -> None:
+        handle = self._flush_handles.pop(key, None)
+        if handle is not None:
+            handle.cancel()
+        batch = [item for item in self._pending.pop(key, []) if not item[2].done()]
+        self._pending_tokens.pop(key, None)
+        llm_func, prompt_context = self._requests.pop(key)
+        if len(batch) < 2:
+            # Nothing joined, send the regular single-chunk request
+            for _, _, future in batch:
+                future.set_result(None)
+            return
+
+        task = asyncio.create_task(
+            self._run_batch(batch, key or None, llm_func, prompt_context)
+        )
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(
+        self,
+        batch: list[tuple[str, int, asyncio.Future]],
+        system_prompt: str | None,
+        llm_func: Callable[..., Awaitable[str]],
+        prompt_context: dict[str, Any],
+    ) -> None:
+        sections: list[str | None] = [None] * len(batch)
+        try:
+            input_texts = "\n\n".join(
+                f"<|CHUNK_{i}|>\nText:\n```\n{content}\n```"
+                for i, (content, _, _) in enumerate(batch, start=1)
+            )
+            user_prompt = PROMPTS["entity_extraction_batch_user_prompt"].format(
+                **{
+                    **prompt_context,
+                    "chunk_count": len(batch),
+                    "input_texts": input_texts,
+                }
+            )
+            response = await llm_func(
+                sanitize_text_for_encoding(user_prompt), system_prompt=system_prompt
+            )
+            sections = self.split_response(
+                remove_think_tags(response),
+                len(batch),
+                prompt_context["completion_delimiter"],
+            )
+            missing = sections.count(None)
+            logger.debug(
+                f"Batched extraction: {len(batch)} chunks in one request"
+                + (f", {missing} missing from response" if missing else "")
+            )
+        except Exception as e:
+            logger.warning(f"Batched entity extraction failed: {e}")
+        finally:
+            for section, (_, _, future) in zip(sections, batch):
+                if not future.done():
+                    future.set_result(section)
+
+    @classmethod
+    def split_response(
+        cls, response: str, count: int, completion_delimiter: str
+    ) -> list[str | None]:
+        """Split a multi-chunk extraction response into per-chunk results
+
+        Sections not ending with completion_delimiter may have been cut off or run
+        into the next text, they are left out (None) like missing ones.
+        """
+        sections: list[str | None] = [None] * count
+        markers = list(cls._CHUNK_MARKER.finditer(response))
+        for i, marker in enumerate(markers):
+            index = int(marker.group(1)) - 1
+            end = markers[i + 1].start() if i + 1 < len(markers) else len(response)
+            if not 0 <= index < count or sections[index] is not None:
+                continue
+            section = response[marker.end() : end].strip()
+            if section.lower().endswith(completion_delimiter.lower()):
+                sections[index] = section
+        return sections
+
+
+class AdaptiveGleaning:
+    """Decides per chunk whether the gleaning round is worth its LLM call.
+
+    Gleaning always runs when the first pass did not end with the completion
+    delimiter, as the response was likely cut off. Otherwise it is skipped for
+    chunks shorter than min_chunk_tokens and, once enough rounds have been observed,
+    for chunks where the historical gleaning yield (new entities and relations per
+    chunk token) predicts less than one new item, unless the first pass found far
+    fewer entities per token than usual. Every SAMPLE_EVERY-th chunk skipped for low
+    yield is gleaned anyway so the estimate keeps following the corpus.
+    """
+
+    WARMUP_ROUNDS = 20
+    SAMPLE_EVERY = 10
+
+    def __init__(self, min_chunk_tokens: int = DEFAULT_GLEANING_MIN_CHUNK_TOKENS):
+        self._min_chunk_tokens = min_chunk_tokens
+        self._stats: Counter[str] = Counter()
+
+    def should_glean(self, chunk_tokens: int, found: int, completed: bool) -> bool:
+        """Record the first pass of a chunk and decide whether to glean it
+
+        Args:
+            chunk_tokens: Token count of the chunk
+            found: Entities and relations extracted by the first pass
+            completed: Whether the first response ended with the completion delimiter
+        """
+        stats = self._stats
+        stats["chunks"] += 1
+        stats["first_pass_tokens"] += chunk_tokens
+        stats["first_pass_items"] += found
+
+        if not completed:
+            stats["forced_incomplete"] += 1
+            return True
+        if chunk_tokens < self._min_chunk_tokens:
+            stats["skipped_short"] += 1
+            return False
+        if stats["rounds"] < self.WARMUP_ROUNDS or not stats["round_tokens"]:
+            return True
+
+        expected_gain = stats["round_items"] / stats["round_tokens"] * chunk_tokens
+        usual_density = stats["first_pass_items"] / max(stats["first_pass_tokens"], 1)
+        if expected_gain >= 1 or found / max(chunk_tokens, 1) < usual_density / 2:
+            return True
+
+        stats["low_yield"] += 1
+        if stats["low_yield"] % self.SAMPLE_EVERY == 0:
+            return True
+        stats["skipped_low_yield"] += 1
+        return False
+
+    def record_round(self, chunk_tokens: int, new_items: int) -> None:
+        """Record the entities and relations a gleaning round added"""
+        self._stats["rounds"] += 1
+        self._stats["round_tokens"] += chunk_tokens
+        self._stats["round_items"] += new_items
+
+    def stats(self) -> dict[str, Any]:
+        """Counters since creation, saved_calls is the number of skipped rounds"""
+        stats = self._stats
+        rounds = stats["rounds"]
+        return {
+            "chunks": stats["chunks"],
+            "rounds": rounds,
+            "saved_calls": stats["skipped_short"] + stats["skipped_low_yield"],
+            "skipped_short": stats["skipped_short"],
+            "skipped_low_yield": stats["skipped_low_yield"],
+            "forced_incomplete": stats["forced_incomplete"],
+            "avg_round_yield": round(stats["round_items"] / rounds, 2)
+            if rounds
+            else 0.0,
+        }
+
+
 async def extract_entities(
     chunks: dict[str, TextChunkSchema],
     global_config: dict[str, str],
@@ -2573,6 +3413,13 @@ async def extract_entities(
 
     use_llm_func: callable = global_config["llm_model_func"]
     entity_extract_max_gleaning = global_config["entity_extract_max_gleaning"]
+    extraction_batcher: ExtractionBatcher | None = global_config.get(
+        "extraction_batcher"
+    )
+    adaptive_gleaning: AdaptiveGleaning | None = global_config.get("gleaning_policy")
+    extraction_checkpoints: ExtractionCheckpoints | None = global_config.get(
+        "extraction_checkpoints"
+    )
 
     ordered_chunks = list(chunks.items())
     # add language and example number params to prompt
@@ -2600,31 +3447,44 @@ async def extract_entities(
         language=language,
     )
 
+    # The system prompt does not depend on the chunk, so every extraction request
+    # shares the same prefix and can hit provider-side prompt caches
+    entity_extraction_system_prompt = PROMPTS["entity_extraction_system_prompt"].format(
+        **context_base
+    )
+
+    # Results checkpointed by an interrupted earlier run need no LLM calls
+    checkpoint_prompt_hash = compute_args_hash(
+        entity_extraction_system_prompt,
+        PROMPTS["entity_extraction_user_prompt"],
+        PROMPTS["entity_continue_extraction_user_prompt"],
+        entity_extract_max_gleaning,
+    )
+    restored_checkpoints: dict[str, dict] = {}
+    if extraction_checkpoints is not None:
+        restored_checkpoints = await extraction_checkpoints.load(
+            [chunk_id for chunk_id, _ in ordered_chunks], checkpoint_prompt_hash
+        )
+        if restored_checkpoints:
+            log_message = f"Resuming extraction: {len(restored_checkpoints)}/{len(ordered_chunks)} chunks restored from checkpoints"
+            logger.info(log_message)
+            if pipeline_status is not None and pipeline_status_lock is not None:
+                async with pipeline_status_lock:
+                    pipeline_status["latest_message"] = log_message
+                    pipeline_status["history_messages"].append(log_message)
+
     processed_chunks = 0
     total_chunks = len(ordered_chunks)
 
-    async def _process_single_content(chunk_key_dp: tuple[str, TextChunkSchema]):
-        """Process a single chunk
-        Args:
-            chunk_key_dp (tuple[str, TextChunkSchema]):
-                ("chunk-xxxxxx", {"tokens": int, "content": str, "full_doc_id": str, "chunk_order_index": int})
-        Returns:
-            tuple: (maybe_nodes, maybe_edges) containing extracted entities and relationships
-        """
-        nonlocal processed_chunks
-        chunk_key = chunk_key_dp[0]
-        chunk_dp = chunk_key_dp[1]
+    async def _extract_single_content(
+        chunk_key: str, chunk_dp: TextChunkSchema, cache_keys_collector: list[str]
+    ) -> tuple[dict, dict]:
+        """Extract entities and relationships of a chunk with the LLM"""
         content = chunk_dp["content"]
         # Get file path from chunk data or use default
         file_path = chunk_dp.get("file_path", "unknown_source")
 
-        # Create cache keys collector for batch processing
-        cache_keys_collector = []
-
         # Get initial extraction
-        entity_extraction_system_prompt = PROMPTS[
-            "entity_extraction_system_prompt"
-        ].format(**{**context_base, "input_text": content})
         entity_extraction_user_prompt = PROMPTS["entity_extraction_user_prompt"].format(
             **{**context_base, "input_text": content}
         )
@@ -2632,9 +3492,25 @@ async def extract_entities(
             "entity_continue_extraction_user_prompt"
         ].format(**{**context_base, "input_text": content})
 
+        # Small chunks may share one multi-chunk request, cached per chunk all the same
+        extract_llm_func = use_llm_func
+        chunk_tokens = chunk_dp.get("tokens")
+        if (
+            extraction_batcher is not None
+            and chunk_tokens is not None
+            and extraction_batcher.accepts(chunk_tokens)
+        ):
+            extract_llm_func = partial(
+                extraction_batcher.extract,
+                content,
+                chunk_tokens,
+                use_llm_func,
+                context_base,
+            )
+
         final_result, timestamp = await use_llm_func_with_cache(
             entity_extraction_user_prompt,
-            use_llm_func,
+            extract_llm_func,
             system_prompt=entity_extraction_system_prompt,
             llm_response_cache=llm_response_cache,
             cache_type="extract",
@@ -2646,6 +3522,8 @@ async def extract_entities(
             entity_extraction_user_prompt, final_result
         )
 
+        raw_results = [(final_result, timestamp)]
+
         # Process initial extraction with file path
         maybe_nodes, maybe_edges = await _process_extraction_result(
             final_result,
@@ -2657,7 +3535,14 @@ async def extract_entities(
         )
 
         # Process additional gleaning results only 1 time when entity_extract_max_gleaning is greater than zero.
-        if entity_extract_max_gleaning > 0:
+        need_gleaning = entity_extract_max_gleaning > 0
+        if need_gleaning and adaptive_gleaning is not None and chunk_tokens:
+            need_gleaning = adaptive_gleaning.should_glean(
+                chunk_tokens,
+                len(maybe_nodes) + len(maybe_edges),
+                context_base["completion_delimiter"].lower() in final_result.lower(),
+            )
+        if need_gleaning:
             glean_result, timestamp = await use_llm_func_with_cache(
                 entity_continue_extraction_user_prompt,
                 use_llm_func,
@@ -2669,6 +3554,8 @@ async def extract_entities(
                 cache_keys_collector=cache_keys_collector,
             )
 
+            raw_results.append((glean_result, timestamp))
+
             # Process gleaning result separately with file path
             glean_nodes, glean_edges = await _process_extraction_result(
                 glean_result,
@@ -2679,36 +3566,67 @@ async def extract_entities(
                 completion_delimiter=context_base["completion_delimiter"],
             )
 
-            # Merge results - compare description lengths to choose better version
-            for entity_name, glean_entities in glean_nodes.items():
-                if entity_name in maybe_nodes:
-                    # Compare description lengths and keep the better one
-                    original_desc_len = len(
-                        maybe_nodes[entity_name][0].get("description", "") or ""
-                    )
-                    glean_desc_len = len(glean_entities[0].get("description", "") or "")
+            if adaptive_gleaning is not None and chunk_tokens:
+                adaptive_gleaning.record_round(
+                    chunk_tokens,
+                    len(glean_nodes.keys() - maybe_nodes.keys())
+                    + len(glean_edges.keys() - maybe_edges.keys()),
+                )
 
-                    if glean_desc_len > original_desc_len:
-                        maybe_nodes[entity_name] = list(glean_entities)
-                    # Otherwise keep original version
-                else:
-                    # New entity from gleaning stage
-                    maybe_nodes[entity_name] = list(glean_entities)
-
-            for edge_key, glean_edges in glean_edges.items():
-                if edge_key in maybe_edges:
-                    # Compare description lengths and keep the better one
-                    original_desc_len = len(
-                        maybe_edges[edge_key][0].get("description", "") or ""
-                    )
-                    glean_desc_len = len(glean_edges[0].get("description", "") or "")
+            _merge_gleaning_result(maybe_nodes, maybe_edges, glean_nodes, glean_edges)
 
-                    if glean_desc_len > original_desc_len:
-                        maybe_edges[edge_key] = list(glean_edges)
-                    # Otherwise keep original version
-                else:
-                    # New edge from gleaning stage
-                    maybe_edges[edge_key] = list(glean_edges)
+        if extraction_checkpoints is not None:
+            await extraction_checkpoints.save(
+                chunk_key, checkpoint_prompt_hash, raw_results, cache_keys_collector
+            )
+
+        return maybe_nodes, maybe_edges
+
+    async def _restore_single_content(
+        chunk_key: str, chunk_dp: TextChunkSchema, checkpoint: dict
+    ) -> tuple[dict, dict]:
+        """Re-parse the LLM results checkpointed for a chunk by an earlier run"""
+        file_path = chunk_dp.get("file_path", "unknown_source")
+        maybe_nodes = maybe_edges = None
+        for result, timestamp in checkpoint["results"]:
+            nodes, edges = await _process_extraction_result(
+                result,
+                chunk_key,
+                timestamp,
+                file_path,
+                tuple_delimiter=context_base["tuple_delimiter"],
+                completion_delimiter=context_base["completion_delimiter"],
+            )
+            if maybe_nodes is None:
+                maybe_nodes, maybe_edges = nodes, edges
+            else:
+                _merge_gleaning_result(maybe_nodes, maybe_edges, nodes, edges)
+        return maybe_nodes, maybe_edges
+
+    async def _process_single_content(chunk_key_dp: tuple[str, TextChunkSchema]):
+        """Process a single chunk
+        Args:
+            chunk_key_dp (tuple[str, TextChunkSchema]):
+                ("chunk-xxxxxx", {"tokens": int, "content": str, "full_doc_id": str, "chunk_order_index": int})
+        Returns:
+            tuple: (maybe_nodes, maybe_edges) containing extracted entities and relationships
+        """
+        nonlocal processed_chunks
+        chunk_key = chunk_key_dp[0]
+        chunk_dp = chunk_key_dp[1]
+
+        checkpoint = restored_checkpoints.get(chunk_key)
+        if checkpoint is not None:
+            cache_keys_collector = list(checkpoint.get("cache_keys") or [])
+            maybe_nodes, maybe_edges = await _restore_single_content(
+                chunk_key, chunk_dp, checkpoint
+            )
+        else:
+            # Create cache keys collector for batch processing
+            cache_keys_collector = []
+            maybe_nodes, maybe_edges = await _extract_single_content(
+                chunk_key, chunk_dp, cache_keys_collector
+            )
 
         # Batch update chunk's llm_cache_list with all collected cache keys
         if cache_keys_collector and text_chunks_storage:
@@ -2722,7 +3640,8 @@ async def extract_entities(
         processed_chunks += 1
         entities_count = len(maybe_nodes)
         relations_count = len(maybe_edges)
-        log_message = f"Chunk {processed_chunks} of {total_chunks} extracted {entities_count} Ent + {relations_count} Rel {chunk_key}"
+        action = "restored" if checkpoint is not None else "extracted"
+        log_message = f"Chunk {processed_chunks} of {total_chunks} {action} {entities_count} Ent + {relations_count} Rel {chunk_key}"
         logger.info(log_message)
         if pipeline_status is not None:
             async with pipeline_status_lock:
@@ -2760,7 +3679,12 @@ async def extract_entities(
 
     # Wait for tasks to complete or for the first exception to occur
     # This allows us to cancel remaining tasks if any task fails
-    done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    try:
+        done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    finally:
+        # Keep the checkpoints of completed chunks, also when the document fails
+        if extraction_checkpoints is not None:
+            await extraction_checkpoints.flush()
 
     # Check if any task raised an exception and ensure all exceptions are retrieved
     first_exception = None
@@ -2795,6 +3719,14 @@ async def extract_entities(
         prefixed_exception = create_prefixed_exception(first_exception, progress_prefix)
         raise prefixed_exception from first_exception
 
+    if (
+        adaptive_gleaning is not None
+        and pipeline_status is not None
+        and pipeline_status_lock is not None
+    ):
+        async with pipeline_status_lock:
+            pipeline_status["gleaning_stats"] = adaptive_gleaning.stats()
+
     # If all tasks completed successfully, chunk_results already contains the results
     # Return the chunk_results for later processing in merge_nodes_and_edges
     return chunk_results
@@ -2852,40 +3784,61 @@ async def kg_query(
         # Apply higher priority (5) to query relation LLM function
         use_model_func = partial(use_model_func, _priority=5)
 
-    hl_keywords, ll_keywords = await get_keywords_from_query(
-        query, query_param, global_config, hashing_kv
-    )
+    # Retrieval needing only the raw query overlaps with keyword extraction
+    speculative = None
+    if query_param.speculative_retrieval:
+        speculative = asyncio.create_task(
+            _speculative_retrieval(
+                query,
+                knowledge_graph_inst,
+                entities_vdb,
+                text_chunks_db,
+                query_param,
+                chunks_vdb,
+            )
+        )
 
-    logger.debug(f"High-level keywords: {hl_keywords}")
-    logger.debug(f"Low-level  keywords: {ll_keywords}")
-
-    # Handle empty keywords
-    if ll_keywords == [] and query_param.mode in ["local", "hybrid", "mix"]:
-        logger.warning("low_level_keywords is empty")
-    if hl_keywords == [] and query_param.mode in ["global", "hybrid", "mix"]:
-        logger.warning("high_level_keywords is empty")
-    if hl_keywords == [] and ll_keywords == []:
-        if len(query) < 50:
-            logger.warning(f"Forced low_level_keywords to origin query: {query}")
-            ll_keywords = [query]
-        else:
-            return QueryResult(content=PROMPTS["fail_response"])
+    try:
+        hl_keywords, ll_keywords = await get_keywords_from_query(
+            query, query_param, global_config, hashing_kv
+        )
 
-    ll_keywords_str = ", ".join(ll_keywords) if ll_keywords else ""
-    hl_keywords_str = ", ".join(hl_keywords) if hl_keywords else ""
+        logger.debug(f"High-level keywords: {hl_keywords}")
+        logger.debug(f"Low-level  keywords: {ll_keywords}")
+
+        # Handle empty keywords
+        if ll_keywords == [] and query_param.mode in ["local", "hybrid", "mix"]:
+            logger.warning("low_level_keywords is empty")
+        if hl_keywords == [] and query_param.mode in ["global", "hybrid", "mix"]:
+            logger.warning("high_level_keywords is empty")
+        if hl_keywords == [] and ll_keywords == []:
+            if len(query) < 50:
+                logger.warning(f"Forced low_level_keywords to origin query: {query}")
+                ll_keywords = [query]
+            else:
+                return QueryResult(content=PROMPTS["fail_response"])
 
-    # Build query context (unified interface)
-    context_result = await _build_query_context(
-        query,
-        ll_keywords_str,
-        hl_keywords_str,
-        knowledge_graph_inst,
-        entities_vdb,
-        relationships_vdb,
-        text_chunks_db,
-        query_param,
-        chunks_vdb,
-    )
+        ll_keywords_str = ", ".join(ll_keywords) if ll_keywords else ""
+        hl_keywords_str = ", ".join(hl_keywords) if hl_keywords else ""
+
+        # Build query context (unified interface)
+        context_result = await _build_query_context(
+            query,
+            ll_keywords_str,
+            hl_keywords_str,
+            knowledge_graph_inst,
+            entities_vdb,
+            relationships_vdb,
+            text_chunks_db,
+            query_param,
+            chunks_vdb,
+            speculative=speculative,
+        )
+    finally:
+        # Only still running if the query ended before retrieval
+        if speculative is not None:
+            speculative.cancel()
+            await asyncio.gather(speculative, return_exceptions=True)
 
     if context_result is None:
         logger.info("[kg_query] No query context could be built; returning no-result.")
@@ -3010,6 +3963,215 @@ async def kg_query(
         )
 
 
+KeywordPair = tuple[list[str], list[str]]
+
+
+class KeywordCache:
+    """In-memory TTL cache of query keywords with batched extraction under load.
+
+    Entries are keyed by the normalized query text and language and are independent
+    of the LLM response cache: they expire ttl seconds after being stored and the
+    least recently used ones are evicted beyond max_size. Concurrent extractions of
+    the same query share one LLM call. Once max_inflight keyword LLM calls are
+    running, further extractions wait up to batch_wait seconds for others to join
+    them and are sent together, up to batch_size queries per LLM call.
+    """
+
+    _STAT_NAMES = (
+        "hits",
+        "misses",
+        "expired",
+        "evictions",
+        "shared",
+        "store_hits",
+        "llm_calls",
+        "batch_calls",
+        "batched_queries",
+    )
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_KEYWORD_CACHE_SIZE,
+        ttl: float = DEFAULT_KEYWORD_CACHE_TTL,
+        batch_size: int = DEFAULT_KEYWORD_BATCH_SIZE,
+        batch_wait: float = DEFAULT_KEYWORD_BATCH_WAIT,
+        max_inflight: int = DEFAULT_MAX_ASYNC,
+    ):
+        self._max_size = max(max_size, 0)
+        self._ttl = ttl
+        self._batch_size = max(batch_size, 1)
+        self._batch_wait = max(batch_wait, 0)
+        self._max_inflight = max(max_inflight, 1)
+        self._entries: OrderedDict[str, tuple[float, KeywordPair]] = OrderedDict()
+        self._extracting: dict[str, asyncio.Future] = {}
+        self._pending: list[tuple[str, asyncio.Future]] = []
+        self._batch_extract: Callable[[list[str]], Awaitable[list]] | None = None
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._batch_tasks: set[asyncio.Task] = set()
+        self._inflight = 0
+        self._stats: Counter[str] = Counter()
+
+    @staticmethod
+    def make_key(query: str, language: str) -> str:
+        """Cache key of a query, ignoring differences in case and whitespace"""
+        return compute_args_hash(language, " ".join(query.split()).casefold())
+
+    def get(self, key: str) -> KeywordPair | None:
+        if not self._max_size:
+            return None
+        entry = self._entries.get(key)
+        if entry is not None and self._ttl > 0:
+            if time.monotonic() - entry[0] >= self._ttl:
+                del self._entries[key]
+                self._stats["expired"] += 1
+                entry = None
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        hl_keywords, ll_keywords = entry[1]
+        return list(hl_keywords), list(ll_keywords)
+
+    def put(self, key: str, hl_keywords: list[str], ll_keywords: list[str]) -> None:
+        if not self._max_size:
+            return
+        self._entries[key] = (time.monotonic(), (list(hl_keywords), list(ll_keywords)))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def count(self, stat: str) -> None:
+        self._stats[stat] += 1
+
+    def stats(self) -> dict[str, Any]:
+        """Counters since creation, hit_rate covers in-memory lookups only"""
+        lookups = self._stats["hits"] + self._stats["misses"]
+        batch_calls = self._stats["batch_calls"]
+        return {
+            "size": len(self._entries),
+            "max_size": self._max_size,
+            "ttl": self._ttl,
+            **{name: self._stats[name] for name in self._STAT_NAMES},
+            "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+            "avg_batch_size": round(self._stats["batched_queries"] / batch_calls, 2)
+            if batch_calls
+            else 0.0,
+        }
+
+    async def extract_once(
+        self, key: str, extract: Callable[[], Awaitable[KeywordPair]]
+    ) -> KeywordPair:
+        """Run extract() and cache its result, callers of the same key meanwhile share it"""
+        shared = self._extracting.get(key)
+        if shared is not None:
+            self._stats["shared"] += 1
+            result = await asyncio.shield(shared)
+            if result is not None:
+                return list(result[0]), list(result[1])
+            # The shared extraction failed, retry on our own
+            return await extract()
+
+        future = asyncio.get_running_loop().create_future()
+        self._extracting[key] = future
+        result = None
+        try:
+            result = await extract()
+            if result[0] or result[1]:
+                self.put(key, *result)
+            return result
+        finally:
+            del self._extracting[key]
+            future.set_result(result)
+
+    async def run_llm(
+        self,
+        query: str,
+        extract_single: Callable[[str], Awaitable[KeywordPair]],
+        extract_batch: Callable[[list[str]], Awaitable[list]] | None = None,
+    ) -> KeywordPair:
+        """Extract the keywords of a query with the LLM, batched with others under load
+
+        Args:
+            query: The query text
+            extract_single: Extracts the keywords of one query
+            extract_batch: Extracts the keywords of several queries in one LLM call,
+                returning a KeywordPair or None per query. None disables batching.
+        """
+        if (
+            extract_batch is not None
+            and self._batch_size > 1
+            and self._inflight >= self._max_inflight
+        ):
+            result = await self._enqueue(query, extract_batch)
+            if result is not None:
+                return result
+            # Batch failed or missed this query, fall back to a single call
+
+        self._inflight += 1
+        self._stats["llm_calls"] += 1
+        try:
+            return await extract_single(query)
+        finally:
+            self._inflight -= 1
+
+    async def _enqueue(
+        self, query: str, extract_batch: Callable[[list[str]], Awaitable[list]]
+    ) -> KeywordPair | None:
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((query, future))
+        self._batch_extract = extract_batch
+        if len(self._pending) >= self._batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._batch_wait, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch = [
+            (query, future) for query, future in self._pending if not future.done()
+        ]
+        self._pending = []
+        if len(batch) < 2:
+            # Nothing joined, a plain single-query call is cheaper
+            for _, future in batch:
+                future.set_result(None)
+            return
+
+        task = asyncio.create_task(self._run_batch(batch, self._batch_extract))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(
+        self,
+        batch: list[tuple[str, asyncio.Future]],
+        extract_batch: Callable[[list[str]], Awaitable[list]],
+    ) -> None:
+        self._inflight += 1
+        self._stats["llm_calls"] += 1
+        self._stats["batch_calls"] += 1
+        self._stats["batched_queries"] += len(batch)
+        results = None
+        try:
+            results = await extract_batch([query for query, _ in batch])
+        except Exception as e:
+            logger.warning(f"Batched keyword extraction failed: {e}")
+        finally:
+            self._inflight -= 1
+            for i, (_, future) in enumerate(batch):
+                if not future.done():
+                    future.set_result(results[i] if results else None)
+
+
 async def get_keywords_from_query(
     query: str,
     query_param: QueryParam,
@@ -3052,7 +4214,37 @@ async def extract_keywords_only(
     Extract high-level and low-level keywords from the given 'text' using the LLM.
     This method does NOT build the final RAG context or provide a final answer.
     It ONLY extracts keywords (hl_keywords, ll_keywords).
+
+    If global_config carries a KeywordCache under "keyword_cache", keywords are
+    served from it before the LLM cache is consulted, and LLM calls may be batched
+    with the extractions of other queries.
     """
+    keyword_cache: KeywordCache | None = global_config.get("keyword_cache")
+    if keyword_cache is None:
+        return await _extract_keywords(text, param, global_config, hashing_kv)
+
+    language = global_config["addon_params"].get("language", DEFAULT_SUMMARY_LANGUAGE)
+    cache_key = keyword_cache.make_key(text, language)
+    cached_keywords = keyword_cache.get(cache_key)
+    if cached_keywords is not None:
+        return cached_keywords
+
+    return await keyword_cache.extract_once(
+        cache_key,
+        partial(
+            _extract_keywords, text, param, global_config, hashing_kv, keyword_cache
+        ),
+    )
+
+
+async def _extract_keywords(
+    text: str,
+    param: QueryParam,
+    global_config: dict[str, str],
+    hashing_kv: BaseKVStorage | None = None,
+    keyword_cache: KeywordCache | None = None,
+) -> tuple[list[str], list[str]]:
+    """Extract keywords through the LLM response cache and the LLM"""
 
     # 1. Handle cache if needed - add cache type for keywords
     args_hash = compute_args_hash(
@@ -3066,6 +4258,8 @@ async def extract_keywords_only(
         cached_response, _ = cached_result  # Extract content, ignore timestamp
         try:
             keywords_data = json_repair.loads(cached_response)
+            if keyword_cache is not None:
+                keyword_cache.count("store_hits")
             return keywords_data.get("high_level_keywords", []), keywords_data.get(
                 "low_level_keywords", []
             )
@@ -3074,12 +4268,67 @@ async def extract_keywords_only(
                 "Invalid cache format for keywords, proceeding with extraction"
             )
 
-    # 2. Build the examples
+    # 2. Call the LLM, batched with other queries under load if possible
+    if keyword_cache is None:
+        hl_keywords, ll_keywords = await _llm_extract_keywords(
+            text, param, global_config
+        )
+    else:
+        hl_keywords, ll_keywords = await keyword_cache.run_llm(
+            text,
+            partial(_llm_extract_keywords, param=param, global_config=global_config),
+            # Batches share one model function, custom ones are called on their own
+            None
+            if param.model_func
+            else partial(_llm_extract_keywords_batch, global_config=global_config),
+        )
+
+    # 3. Cache only the processed keywords with cache type
+    if hl_keywords or ll_keywords:
+        cache_data = {
+            "high_level_keywords": hl_keywords,
+            "low_level_keywords": ll_keywords,
+        }
+        if hashing_kv.global_config.get("enable_llm_cache"):
+            # Save to cache with query parameters
+            queryparam_dict = {
+                "mode": param.mode,
+                "response_type": param.response_type,
+                "top_k": param.top_k,
+                "chunk_top_k": param.chunk_top_k,
+                "max_entity_tokens": param.max_entity_tokens,
+                "max_relation_tokens": param.max_relation_tokens,
+                "max_total_tokens": param.max_total_tokens,
+                "user_prompt": param.user_prompt or "",
+                "enable_rerank": param.enable_rerank,
+            }
+            await save_to_cache(
+                hashing_kv,
+                CacheData(
+                    args_hash=args_hash,
+                    content=json.dumps(cache_data),
+                    prompt=text,
+                    mode=param.mode,
+                    cache_type="keywords",
+                    queryparam=queryparam_dict,
+                ),
+            )
+
+    return hl_keywords, ll_keywords
+
+
+async def _llm_extract_keywords(
+    text: str,
+    param: QueryParam,
+    global_config: dict[str, str],
+) -> tuple[list[str], list[str]]:
+    """Extract the keywords of a single query with one LLM call"""
+    # 1. Build the examples
     examples = "\n".join(PROMPTS["keywords_extraction_examples"])
 
     language = global_config["addon_params"].get("language", DEFAULT_SUMMARY_LANGUAGE)
 
-    # 3. Build the keyword-extraction prompt
+    # 2. Build the keyword-extraction prompt
     kw_prompt = PROMPTS["keywords_extraction"].format(
         query=text,
         examples=examples,
@@ -3092,7 +4341,7 @@ async def extract_keywords_only(
         f"[extract_keywords] Sending to LLM: {len_of_prompts:,} tokens (Prompt: {len_of_prompts})"
     )
 
-    # 4. Call the LLM for keyword extraction
+    # 3. Call the LLM for keyword extraction
     if param.model_func:
         use_model_func = param.model_func
     else:
@@ -3102,7 +4351,7 @@ async def extract_keywords_only(
 
     result = await use_model_func(kw_prompt, keyword_extraction=True)
 
-    # 5. Parse out JSON from the LLM response
+    # 4. Parse out JSON from the LLM response
     result = remove_think_tags(result)
     try:
         keywords_data = json_repair.loads(result)
@@ -3114,41 +4363,58 @@ async def extract_keywords_only(
         logger.error(f"LLM respond: {result}")
         return [], []
 
-    hl_keywords = keywords_data.get("high_level_keywords", [])
-    ll_keywords = keywords_data.get("low_level_keywords", [])
+    return keywords_data.get("high_level_keywords", []), keywords_data.get(
+        "low_level_keywords", []
+    )
 
-    # 6. Cache only the processed keywords with cache type
-    if hl_keywords or ll_keywords:
-        cache_data = {
-            "high_level_keywords": hl_keywords,
-            "low_level_keywords": ll_keywords,
-        }
-        if hashing_kv.global_config.get("enable_llm_cache"):
-            # Save to cache with query parameters
-            queryparam_dict = {
-                "mode": param.mode,
-                "response_type": param.response_type,
-                "top_k": param.top_k,
-                "chunk_top_k": param.chunk_top_k,
-                "max_entity_tokens": param.max_entity_tokens,
-                "max_relation_tokens": param.max_relation_tokens,
-                "max_total_tokens": param.max_total_tokens,
-                "user_prompt": param.user_prompt or "",
-                "enable_rerank": param.enable_rerank,
-            }
-            await save_to_cache(
-                hashing_kv,
-                CacheData(
-                    args_hash=args_hash,
-                    content=json.dumps(cache_data),
-                    prompt=text,
-                    mode=param.mode,
-                    cache_type="keywords",
-                    queryparam=queryparam_dict,
-                ),
-            )
 
-    return hl_keywords, ll_keywords
+async def _llm_extract_keywords_batch(
+    queries: list[str],
+    global_config: dict[str, str],
+) -> list[tuple[list[str], list[str]] | None]:
+    """Extract the keywords of several queries with one LLM call
+
+    Returns:
+        The (high_level_keywords, low_level_keywords) of each query, None for queries
+        missing from the LLM response
+    """
+    numbered_queries = "\n".join(
+        f"{i}. {json.dumps(query, ensure_ascii=False)}"
+        for i, query in enumerate(queries, start=1)
+    )
+    kw_prompt = PROMPTS["keywords_extraction_batch"].format(queries=numbered_queries)
+
+    tokenizer: Tokenizer = global_config["tokenizer"]
+    logger.debug(
+        f"[extract_keywords] Sending batch of {len(queries)} queries to LLM: "
+        f"{len(tokenizer.encode(kw_prompt)):,} tokens"
+    )
+
+    # The structured keyword_extraction output format only fits a single query
+    use_model_func = partial(global_config["llm_model_func"], _priority=5)
+    result = remove_think_tags(await use_model_func(kw_prompt))
+    try:
+        keywords_data = json_repair.loads(result)
+    except json.JSONDecodeError as e:
+        logger.error(f"JSON parsing error in batched keyword extraction: {e}")
+        keywords_data = None
+    if not isinstance(keywords_data, dict):
+        logger.warning("No JSON object found in batched keyword extraction response")
+        return [None] * len(queries)
+
+    results = []
+    for i in range(1, len(queries) + 1):
+        keywords = keywords_data.get(str(i))
+        if isinstance(keywords, dict):
+            results.append(
+                (
+                    list(keywords.get("high_level_keywords") or []),
+                    list(keywords.get("low_level_keywords") or []),
+                )
+            )
+        else:
+            results.append(None)
+    return results
 
 
 async def _get_vector_context(
@@ -3208,6 +4474,92 @@ async def _get_vector_context(
         return []
 
 
+async def _compute_query_embedding(
+    query: str,
+    text_chunks_db: BaseKVStorage,
+    chunks_vdb: BaseVectorStorage = None,
+) -> Any | None:
+    """Embed the query once for all vector operations, None if not needed or failed"""
+    query_embedding = get_precomputed_query_embedding(query)
+    kg_chunk_pick_method = text_chunks_db.global_config.get(
+        "kg_chunk_pick_method", DEFAULT_KG_CHUNK_PICK_METHOD
+    )
+    if (
+        query_embedding is None
+        and query
+        and (kg_chunk_pick_method == "VECTOR" or chunks_vdb)
+    ):
+        embedding_func_config = text_chunks_db.embedding_func
+        if embedding_func_config and embedding_func_config.func:
+            try:
+                query_embedding = await embedding_func_config.func([query])
+                query_embedding = query_embedding[
+                    0
+                ]  # Extract first embedding from batch result
+                logger.debug("Pre-computed query embedding for all vector operations")
+            except Exception as e:
+                logger.warning(f"Failed to pre-compute query embedding: {e}")
+                query_embedding = None
+    return query_embedding
+
+
+async def _speculative_retrieval(
+    query: str,
+    knowledge_graph_inst: BaseGraphStorage,
+    entities_vdb: BaseVectorStorage,
+    text_chunks_db: BaseKVStorage,
+    query_param: QueryParam,
+    chunks_vdb: BaseVectorStorage = None,
+) -> dict[str, Any]:
+    """
+    Retrieval that only needs the raw query, run while keywords are being extracted.
+
+    Computes the query embedding and, concurrently, the chunk vector search of mix
+    mode and, if query_param.speculative_entity_lookup is set, an entity lookup by
+    the raw query. The latter only pays off for short queries, which fall back to
+    the query itself as low-level keywords when the LLM finds none.
+    Failures are logged and leave the affected results to the regular search.
+    """
+    result: dict[str, Any] = {}
+    try:
+        query_embedding = await _compute_query_embedding(
+            query, text_chunks_db, chunks_vdb
+        )
+        result["query_embedding"] = query_embedding
+        if query_embedding is not None:
+            # Task local, lets the raw-query entity lookup reuse the embedding
+            precomputed_query_embeddings.set(
+                {**(precomputed_query_embeddings.get() or {}), query: query_embedding}
+            )
+
+        searches = {}
+        if query_param.mode == "mix" and chunks_vdb:
+            searches["vector_chunks"] = _get_vector_context(
+                query, chunks_vdb, query_param, query_embedding
+            )
+        if (
+            query_param.speculative_entity_lookup
+            and query_param.mode in ("local", "hybrid", "mix")
+            and len(query) < 50
+        ):
+            searches["raw_query_entities"] = _get_node_data(
+                query, knowledge_graph_inst, entities_vdb, query_param
+            )
+        search_results = await asyncio.gather(
+            *searches.values(), return_exceptions=True
+        )
+        for name, search_result in zip(searches, search_results):
+            if isinstance(search_result, Exception):
+                logger.warning(
+                    f"Speculative retrieval of {name} failed: {search_result}"
+                )
+            else:
+                result[name] = search_result
+    except Exception as e:
+        logger.warning(f"Speculative retrieval failed: {e}")
+    return result
+
+
 async def _perform_kg_search(
     query: str,
     ll_keywords: str,
@@ -3218,10 +4570,14 @@ async def _perform_kg_search(
     text_chunks_db: BaseKVStorage,
     query_param: QueryParam,
     chunks_vdb: BaseVectorStorage = None,
+    speculative: asyncio.Task | None = None,
 ) -> dict[str, Any]:
     """
     Pure search logic that retrieves raw entities, relations, and vector chunks.
     No token truncation or formatting - just raw search results.
+
+    If speculative is a task of _speculative_retrieval, its query embedding, vector
+    chunks and raw-query entities are used instead of being searched again.
     """
 
     # Initialize result containers
@@ -3237,33 +4593,31 @@ async def _perform_kg_search(
     # Track chunk sources and metadata for final logging
     chunk_tracking = {}  # chunk_id -> {source, frequency, order}
 
-    # Pre-compute query embedding once for all vector operations
-    kg_chunk_pick_method = text_chunks_db.global_config.get(
-        "kg_chunk_pick_method", DEFAULT_KG_CHUNK_PICK_METHOD
-    )
+    # Pre-compute query embedding once for all vector operations, unless the
+    # speculative retrieval is already computing it
     query_embedding = None
-    if query and (kg_chunk_pick_method == "VECTOR" or chunks_vdb):
-        embedding_func_config = text_chunks_db.embedding_func
-        if embedding_func_config and embedding_func_config.func:
-            try:
-                query_embedding = await embedding_func_config.func([query])
-                query_embedding = query_embedding[
-                    0
-                ]  # Extract first embedding from batch result
-                logger.debug("Pre-computed query embedding for all vector operations")
-            except Exception as e:
-                logger.warning(f"Failed to pre-compute query embedding: {e}")
-                query_embedding = None
+    if speculative is None:
+        query_embedding = await _compute_query_embedding(
+            query, text_chunks_db, chunks_vdb
+        )
 
-    # Handle local and global modes
-    if query_param.mode == "local" and len(ll_keywords) > 0:
-        local_entities, local_relations = await _get_node_data(
+    async def _get_local_data():
+        # The raw-query entity lookup is only valid if the query became the keywords
+        if speculative is not None and ll_keywords == query:
+            raw_query_entities = (await speculative).get("raw_query_entities")
+            if raw_query_entities is not None:
+                return raw_query_entities
+        return await _get_node_data(
             ll_keywords,
             knowledge_graph_inst,
             entities_vdb,
             query_param,
         )
 
+    # Handle local and global modes
+    if query_param.mode == "local" and len(ll_keywords) > 0:
+        local_entities, local_relations = await _get_local_data()
+
     elif query_param.mode == "global" and len(hl_keywords) > 0:
         global_relations, global_entities = await _get_edge_data(
             hl_keywords,
@@ -3274,12 +4628,7 @@ async def _perform_kg_search(
 
     else:  # hybrid or mix mode
         if len(ll_keywords) > 0:
-            local_entities, local_relations = await _get_node_data(
-                ll_keywords,
-                knowledge_graph_inst,
-                entities_vdb,
-                query_param,
-            )
+            local_entities, local_relations = await _get_local_data()
         if len(hl_keywords) > 0:
             global_relations, global_entities = await _get_edge_data(
                 hl_keywords,
@@ -3288,25 +4637,32 @@ async def _perform_kg_search(
                 query_param,
             )
 
-        # Get vector chunks for mix mode
-        if query_param.mode == "mix" and chunks_vdb:
+    speculated = {}
+    if speculative is not None:
+        speculated = await speculative
+        query_embedding = speculated.get("query_embedding")
+
+    # Get vector chunks for mix mode
+    if query_param.mode == "mix" and chunks_vdb:
+        vector_chunks = speculated.get("vector_chunks")
+        if vector_chunks is None:
             vector_chunks = await _get_vector_context(
                 query,
                 chunks_vdb,
                 query_param,
                 query_embedding,
             )
-            # Track vector chunks with source metadata
-            for i, chunk in enumerate(vector_chunks):
-                chunk_id = chunk.get("chunk_id") or chunk.get("id")
-                if chunk_id:
-                    chunk_tracking[chunk_id] = {
-                        "source": "C",
-                        "frequency": 1,  # Vector chunks always have frequency 1
-                        "order": i + 1,  # 1-based order in vector search results
-                    }
-                else:
-                    logger.warning(f"Vector chunk missing chunk_id: {chunk}")
+        # Track vector chunks with source metadata
+        for i, chunk in enumerate(vector_chunks):
+            chunk_id = chunk.get("chunk_id") or chunk.get("id")
+            if chunk_id:
+                chunk_tracking[chunk_id] = {
+                    "source": "C",
+                    "frequency": 1,  # Vector chunks always have frequency 1
+                    "order": i + 1,  # 1-based order in vector search results
+                }
+            else:
+                logger.warning(f"Vector chunk missing chunk_id: {chunk}")
 
     # Round-robin merge entities
     final_entities = []
@@ -3843,12 +5199,15 @@ async def _build_query_context(
     text_chunks_db: BaseKVStorage,
     query_param: QueryParam,
     chunks_vdb: BaseVectorStorage = None,
+    speculative: asyncio.Task | None = None,
 ) -> QueryContextResult | None:
     """
     Main query context building function using the new 4-stage architecture:
     1. Search -> 2. Truncate -> 3. Merge chunks -> 4. Build LLM context
 
     Returns unified QueryContextResult containing both context and raw_data.
+    speculative is an optional _speculative_retrieval task whose results the
+    search stage reuses.
     """
 
     if not query:
@@ -3866,6 +5225,7 @@ async def _build_query_context(
         text_chunks_db,
         query_param,
         chunks_vdb,
+        speculative=speculative,
     )
 
     if not search_result["final_entities"] and not search_result["final_relations"]:
@@ -3964,7 +5324,11 @@ async def _get_node_data(
         f"Query nodes: {query} (top_k:{query_param.top_k}, cosine:{entities_vdb.cosine_better_than_threshold})"
     )
 
-    results = await entities_vdb.query(query, top_k=query_param.top_k)
+    results = await entities_vdb.query(
+        query,
+        top_k=query_param.top_k,
+        query_embedding=get_precomputed_query_embedding(query),
+    )
 
     if not len(results):
         return [], []
@@ -4240,7 +5604,11 @@ async def _get_edge_data(
         f"Query edges: {keywords} (top_k:{query_param.top_k}, cosine:{relationships_vdb.cosine_better_than_threshold})"
     )
 
-    results = await relationships_vdb.query(keywords, top_k=query_param.top_k)
+    results = await relationships_vdb.query(
+        keywords,
+        top_k=query_param.top_k,
+        query_embedding=get_precomputed_query_embedding(keywords),
+    )
 
     if not len(results):
         return [], []
@@ -4593,7 +5961,9 @@ async def naive_query(
         logger.error("Tokenizer not found in global configuration.")
         return QueryResult(content=PROMPTS["fail_response"])
 
-    chunks = await _get_vector_context(query, chunks_vdb, query_param, None)
+    chunks = await _get_vector_context(
+        query, chunks_vdb, query_param, get_precomputed_query_embedding(query)
+    )
 
     if chunks is None or len(chunks) == 0:
         logger.info(
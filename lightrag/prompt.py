@@ -38,17 +38,19 @@ You are a Knowledge Graph Specialist responsible for extracting entities from th
 
 ---Examples---
 {examples}
+"""
 
----Real Data to be Processed---
+# Chunk text is kept out of the system prompt so that instructions and examples
+# form an identical prefix for every chunk (provider-side prompt caching)
+PROMPTS["entity_extraction_user_prompt"] = """---Real Data to be Processed---
 <Input>
 Entity_types: [{entity_types}]
 Text:
 ```
 {input_text}
 ```
-"""
 
-PROMPTS["entity_extraction_user_prompt"] = """---Task---
+---Task---
 Extract entities and relationships from the input text to be processed.
 
 ---Instructions---
@@ -60,6 +62,26 @@ Extract entities and relationships from the input text to be processed.
 <Output>
 """
 
+PROMPTS["entity_extraction_batch_user_prompt"] = """---Real Data to be Processed---
+<Input>
+Entity_types: [{entity_types}]
+The input consists of {chunk_count} independent texts. Each text starts with its own marker line `<|CHUNK_n|>`.
+
+{input_texts}
+
+---Task---
+Extract entities and relationships from each of the input texts independently.
+
+---Instructions---
+1.  **One Section per Text:** For every input text, in the original order, output its marker line `<|CHUNK_n|>` on a line by itself, followed by the extraction list of that text only, and finish that section with `{completion_delimiter}` on its own line. Output a section for every text, even if it contains no entities.
+2.  **No Cross-Text Inference:** Entities, relationships and descriptions of a section must be derived solely from the corresponding text, never from the other texts.
+3.  **Strict Adherence to Format:** Strictly adhere to all format requirements for entity and relationship lists, including output order, field delimiters, and proper noun handling, as specified in the system prompt.
+4.  **Output Content Only:** Output *only* the marker lines and the extracted lists. Do not include any introductory or concluding remarks, explanations, or additional text.
+5.  **Output Language:** Ensure the output language is {language}. Proper nouns (e.g., personal names, place names, organization names) must be kept in their original language and not translated.
+
+<Output>
+"""
+
 PROMPTS["entity_continue_extraction_user_prompt"] = """---Task---
 Based on the last extraction task, identify and extract any **missed or incorrectly formatted** entities from the input text.
 
@@ -398,3 +420,41 @@ Output:
 
 """,
 ]
+
+PROMPTS["keywords_extraction_batch"] = """---Role---
+You are an expert keyword extractor, specializing in analyzing user queries for a Retrieval-Augmented Generation (RAG) system. Your purpose is to identify both high-level and low-level keywords in each of the user queries below that will be used for effective document retrieval.
+
+---Goal---
+Given a numbered list of user queries, extract two distinct types of keywords for every query independently:
+1. **high_level_keywords**: for overarching concepts or themes, capturing user's core intent, the subject area, or the type of question being asked.
+2. **low_level_keywords**: for specific entities or details, identifying the specific entities, proper nouns, technical jargon, product names, or concrete items.
+
+---Instructions & Constraints---
+1. **Output Format**: Your output MUST be a valid JSON object and nothing else. Its keys are the query numbers as strings ("1", "2", ...) and each value is an object with the `high_level_keywords` and `low_level_keywords` lists of that query. Include every query number exactly once. Do not include any explanatory text, markdown code fences (like ```json), or any other text before or after the JSON. It will be parsed directly by a JSON parser.
+2. **Source of Truth**: All keywords of a query must be explicitly derived from that query alone, never from the other queries in the list.
+3. **Concise & Meaningful**: Keywords should be concise words or meaningful phrases. Prioritize multi-word phrases when they represent a single concept. For example, from "latest financial report of Apple Inc.", you should extract "latest financial report" and "Apple Inc." rather than "latest", "financial", "report", and "Apple".
+4. **Handle Edge Cases**: For queries that are too simple, vague, or nonsensical (e.g., "hello", "ok", "asdfghjkl"), return empty lists for both keyword types of that query.
+
+---Example---
+Queries:
+1. "How does international trade influence global economic stability?"
+2. "hello"
+
+Output:
+{{
+  "1": {{
+    "high_level_keywords": ["International trade", "Global economic stability", "Economic impact"],
+    "low_level_keywords": ["Trade agreements", "Tariffs", "Currency exchange", "Imports", "Exports"]
+  }},
+  "2": {{
+    "high_level_keywords": [],
+    "low_level_keywords": []
+  }}
+}}
+
+---Real Data---
+Queries:
+{queries}
+
+---Output---
+Output:"""
@@ -11,7 +11,8 @@ import os
 import re
 import time
 import uuid
-from dataclasses import dataclass
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime
 from functools import wraps
 from hashlib import md5
@@ -38,6 +39,10 @@ from lightrag.constants import (
     DEFAULT_SOURCE_IDS_LIMIT_METHOD,
     VALID_SOURCE_IDS_LIMIT_METHODS,
     SOURCE_IDS_LIMIT_METHOD_FIFO,
+    DEFAULT_RERANK_CACHE_SIZE,
+    DEFAULT_RERANK_CACHE_TTL,
+    DEFAULT_RERANK_BATCH_SIZE,
+    DEFAULT_RERANK_BATCH_WAIT,
 )
 
 # Initialize logger with basic configuration
@@ -348,6 +353,83 @@ class TaskState:
     cleanup_done: bool = False
 
 
+class GroupCommit:
+    """Commit completed work items in groups instead of one by one
+
+    Items passed to add() are held until max_items of them are pending, their sizes
+    add up to max_bytes, or max_delay seconds have passed since the first of them.
+    A single flush_func call then receives all pending items. Items added while a
+    flush is running wait for the next one. If flush_func raises, its items stay
+    pending and are passed again by the next flush. Errors of flushes triggered by
+    add() or the timer are only logged, the caller adding an item is not responsible
+    for the other items of its group; explicit flush() calls raise them.
+    """
+
+    def __init__(
+        self,
+        flush_func: Callable[[list[Any]], Any],
+        max_items: int = 1,
+        max_delay: float = 0,
+        max_bytes: int = 0,
+    ):
+        self._flush_func = flush_func
+        self._max_items = max(max_items, 1)
+        self._max_delay = max_delay
+        self._max_bytes = max_bytes
+        self._pending: list[Any] = []
+        self._pending_bytes = 0
+        self._flush_lock = asyncio.Lock()
+        self._timer: asyncio.Task | None = None
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def add(self, item: Any, size: int = 0) -> None:
+        """Queue an item, flushing if this completes a group"""
+        self._pending.append(item)
+        self._pending_bytes += size
+        if len(self._pending) >= self._max_items or (
+            self._max_bytes > 0 and self._pending_bytes >= self._max_bytes
+        ):
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Group commit failed, retrying with the next flush: {e}")
+        elif self._max_delay > 0 and self._timer is None:
+            self._timer = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self._max_delay)
+        self._timer = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Scheduled group commit failed: {e}")
+
+    async def flush(self, force: bool = False) -> None:
+        """Pass all pending items to flush_func
+
+        Args:
+            force: Call flush_func even if no item is pending
+        """
+        async with self._flush_lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._pending and not force:
+                return
+            items, self._pending = self._pending, []
+            items_bytes, self._pending_bytes = self._pending_bytes, 0
+            try:
+                await self._flush_func(items)
+            except BaseException:
+                # Keep the items for the next flush, ahead of those added meanwhile
+                self._pending = items + self._pending
+                self._pending_bytes += items_bytes
+                raise
+
+
 @dataclass
 class EmbeddingFunc:
     embedding_dim: int
@@ -2244,6 +2326,8 @@ class TokenTracker:
         self.prompt_tokens = 0
         self.completion_tokens = 0
         self.total_tokens = 0
+        self.cached_tokens = 0
+        self.cache_creation_tokens = 0
         self.call_count = 0
 
     def add_usage(self, token_counts):
@@ -2251,9 +2335,13 @@ class TokenTracker:
 
         Args:
             token_counts: A dictionary containing prompt_tokens, completion_tokens, total_tokens
+                and optionally cached_tokens (prompt tokens served from the provider's
+                prompt cache) and cache_creation_tokens (prompt tokens written to it)
         """
         self.prompt_tokens += token_counts.get("prompt_tokens", 0)
         self.completion_tokens += token_counts.get("completion_tokens", 0)
+        self.cached_tokens += token_counts.get("cached_tokens", 0) or 0
+        self.cache_creation_tokens += token_counts.get("cache_creation_tokens", 0) or 0
 
         # If total_tokens is provided, use it directly; otherwise calculate the sum
         if "total_tokens" in token_counts:
@@ -2271,6 +2359,8 @@ class TokenTracker:
             "prompt_tokens": self.prompt_tokens,
             "completion_tokens": self.completion_tokens,
             "total_tokens": self.total_tokens,
+            "cached_tokens": self.cached_tokens,
+            "cache_creation_tokens": self.cache_creation_tokens,
             "call_count": self.call_count,
         }
 
@@ -2280,10 +2370,259 @@ class TokenTracker:
             f"LLM call count: {usage['call_count']}, "
             f"Prompt tokens: {usage['prompt_tokens']}, "
             f"Completion tokens: {usage['completion_tokens']}, "
-            f"Total tokens: {usage['total_tokens']}"
+            f"Total tokens: {usage['total_tokens']}, "
+            f"Cached tokens: {usage['cached_tokens']}"
         )
 
 
+@dataclass
+class _RerankBatch:
+    model: str
+    query: str
+    future: asyncio.Future
+    documents: dict[str, str] = field(default_factory=dict)
+    open: bool = True
+
+
+class RerankCache:
+    """In-memory TTL cache of rerank scores with coalesced rerank calls.
+
+    Scores are keyed by rerank model, normalized query text and chunk id: they expire
+    ttl seconds after being stored and the least recently used ones are evicted beyond
+    max_size. Only documents without a cached score are sent to the reranker, which
+    scores all of them so every score can be cached. Concurrent reranks of the same
+    model and query wait up to batch_wait seconds for each other and are sent as one
+    rerank call of up to batch_size documents. Documents already being scored by a
+    running call are awaited instead of being sent again.
+    """
+
+    _STAT_NAMES = (
+        "hits",
+        "misses",
+        "expired",
+        "evictions",
+        "shared",
+        "rerank_calls",
+        "reranked_docs",
+    )
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_RERANK_CACHE_SIZE,
+        ttl: float = DEFAULT_RERANK_CACHE_TTL,
+        batch_size: int = DEFAULT_RERANK_BATCH_SIZE,
+        batch_wait: float = DEFAULT_RERANK_BATCH_WAIT,
+    ):
+        self._max_size = max(max_size, 0)
+        self._ttl = ttl
+        self._batch_size = max(batch_size, 1)
+        self._batch_wait = max(batch_wait, 0)
+        self._entries: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._batches: dict[str, list[_RerankBatch]] = {}
+        self._batch_tasks: set[asyncio.Task] = set()
+        # Models whose rerank function does not return index based results
+        self._unsupported: set[str] = set()
+        self._stats: Counter[str] = Counter()
+
+    @property
+    def enabled(self) -> bool:
+        return self._max_size > 0
+
+    @staticmethod
+    def make_query_key(model: str, query: str) -> str:
+        """Cache key of a query, ignoring differences in case and whitespace"""
+        return compute_args_hash(model, " ".join(query.split()).casefold())
+
+    def get(self, key: str) -> float | None:
+        if not self._max_size:
+            return None
+        entry = self._entries.get(key)
+        if entry is not None and self._ttl > 0:
+            if time.monotonic() - entry[0] >= self._ttl:
+                del self._entries[key]
+                self._stats["expired"] += 1
+                entry = None
+        if entry is None:
+            self._stats["misses"] += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return entry[1]
+
+    def put(self, key: str, score: float) -> None:
+        if not self._max_size:
+            return
+        self._entries[key] = (time.monotonic(), score)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+            self._stats["evictions"] += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Counters since creation, hit_rate counts (query, chunk) score lookups"""
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            "size": len(self._entries),
+            "max_size": self._max_size,
+            "ttl": self._ttl,
+            **{name: self._stats[name] for name in self._STAT_NAMES},
+            "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+    async def score(
+        self,
+        rerank_func: Callable[..., Any],
+        model: str,
+        query: str,
+        documents: list[str],
+        doc_keys: list[str],
+    ) -> list[float] | None:
+        """Return the rerank score of each document, reranking only uncached ones
+
+        Returns:
+            Scores in document order, an empty list if the reranker returned no
+            scores, or None if rerank_func does not return index based results, in
+            which case the caller should rerank without the cache
+        """
+        if model in self._unsupported:
+            return None
+
+        query_key = self.make_query_key(model, query)
+        scores: dict[str, float] = {}
+        missing: dict[str, str] = {}
+        for key, text in zip(doc_keys, documents):
+            if key in scores or key in missing:
+                continue
+            cached = self.get(f"{query_key}:{key}")
+            if cached is None:
+                missing[key] = text
+            else:
+                scores[key] = cached
+
+        if missing:
+            scores.update(
+                await self._fetch(rerank_func, model, query_key, query, missing)
+            )
+            if model in self._unsupported:
+                return None
+            unscored = sum(1 for key in missing if key not in scores)
+            if unscored == len(missing):
+                # Reranking again without the cache would not get scores either
+                return []
+            if unscored:
+                return None
+        return [scores[key] for key in doc_keys]
+
+    async def _fetch(
+        self,
+        rerank_func: Callable[..., Any],
+        model: str,
+        query_key: str,
+        query: str,
+        missing: dict[str, str],
+    ) -> dict[str, float]:
+        batches = self._batches.setdefault(query_key, [])
+        waiting: list[asyncio.Future] = []
+        remaining = dict(missing)
+        for batch in batches:
+            shared = [key for key in remaining if key in batch.documents]
+            if shared:
+                self._stats["shared"] += len(shared)
+                for key in shared:
+                    del remaining[key]
+                waiting.append(batch.future)
+
+        if remaining:
+            batch = next(
+                (
+                    batch
+                    for batch in batches
+                    if batch.open
+                    and len(batch.documents) + len(remaining) <= self._batch_size
+                ),
+                None,
+            )
+            if batch is None:
+                loop = asyncio.get_running_loop()
+                batch = _RerankBatch(
+                    model=model, query=query, future=loop.create_future()
+                )
+                batches.append(batch)
+                loop.call_later(
+                    self._batch_wait, self._flush, rerank_func, query_key, batch
+                )
+            batch.documents.update(remaining)
+            if batch.future not in waiting:
+                waiting.append(batch.future)
+
+        fetched: dict[str, float] = {}
+        for scores, error in await asyncio.gather(
+            *(asyncio.shield(future) for future in waiting)
+        ):
+            if error is not None:
+                raise error
+            fetched.update(scores)
+        return fetched
+
+    def _flush(
+        self, rerank_func: Callable[..., Any], query_key: str, batch: _RerankBatch
+    ) -> None:
+        batch.open = False
+        task = asyncio.create_task(self._run_batch(rerank_func, query_key, batch))
+        self._batch_tasks.add(task)
+        task.add_done_callback(self._batch_tasks.discard)
+
+    async def _run_batch(
+        self, rerank_func: Callable[..., Any], query_key: str, batch: _RerankBatch
+    ) -> None:
+        keys = list(batch.documents)
+        fetched: dict[str, float] = {}
+        error = None
+        self._stats["rerank_calls"] += 1
+        self._stats["reranked_docs"] += len(keys)
+        try:
+            results = await rerank_func(
+                query=batch.query,
+                documents=[batch.documents[key] for key in keys],
+                top_n=len(keys),
+            )
+            for result in results or []:
+                if not isinstance(result, dict) or "index" not in result:
+                    logger.info("Rerank results are not index based, rerank cache off")
+                    self._unsupported.add(batch.model)
+                    fetched = {}
+                    break
+                if 0 <= result["index"] < len(keys):
+                    fetched[keys[result["index"]]] = result["relevance_score"]
+        except Exception as e:
+            error = e
+        finally:
+            batches = self._batches.get(query_key)
+            if batches is not None:
+                batches.remove(batch)
+                if not batches:
+                    del self._batches[query_key]
+            for key, score in fetched.items():
+                self.put(f"{query_key}:{key}", score)
+            batch.future.set_result((fetched, error))
+
+
+def _rerank_model_id(rerank_func: Callable[..., Any]) -> str:
+    """Identify a rerank function in rerank cache keys
+
+    Uses the qualified function name, plus the model keyword if it was bound
+    with functools.partial.
+    """
+    func = getattr(rerank_func, "func", rerank_func)
+    name = f"{getattr(func, '__module__', '')}.{getattr(func, '__qualname__', type(func).__name__)}"
+    model = (getattr(rerank_func, "keywords", None) or {}).get("model")
+    return f"{name}:{model}" if model else name
+
+
 async def apply_rerank_if_enabled(
     query: str,
     retrieved_docs: list[dict],
@@ -2328,6 +2667,38 @@ async def apply_rerank_if_enabled(
             )
             document_texts.append(content)
 
+        # Rerank only chunks without a cached score for this query
+        rerank_cache = global_config.get("rerank_cache")
+        if rerank_cache is not None and rerank_cache.enabled:
+            doc_keys = [
+                doc.get("chunk_id") or compute_mdhash_id(text, prefix="chunk-")
+                for doc, text in zip(retrieved_docs, document_texts)
+            ]
+            scores = await rerank_cache.score(
+                rerank_func,
+                _rerank_model_id(rerank_func),
+                query,
+                document_texts,
+                doc_keys,
+            )
+            if scores is not None and not scores:
+                logger.warning("Rerank returned empty results, using original chunks")
+                return retrieved_docs
+            if scores is not None:
+                ranking = sorted(
+                    range(len(retrieved_docs)), key=lambda i: scores[i], reverse=True
+                )
+                reranked_docs = []
+                for index in ranking[:top_n] if top_n else ranking:
+                    doc = retrieved_docs[index].copy()
+                    doc["rerank_score"] = scores[index]
+                    reranked_docs.append(doc)
+
+                logger.info(
+                    f"Successfully reranked: {len(reranked_docs)} chunks from {len(retrieved_docs)} original chunks"
+                )
+                return reranked_docs
+
         # Call the new rerank function that returns index-based results
         rerank_results = await rerank_func(
             query=query,
@@ -5,6 +5,7 @@ import asyncio
 import httpx
 import re
 import itertools
+import functools
 from openai import AsyncOpenAI
 from lightrag.lightrag import LightRAG
 from lightrag.utils import EmbeddingFunc
@@ -45,54 +46,53 @@ def get_embedding_func():
     return EmbeddingFunc(embedding_dim=1024, func=sf_embed_func)
 
 # 3. Reranker function using SiliconFlow's API
+RERANK_MODEL = "BAAI/bge-reranker-v2-m3"
+
 async def get_siliconflow_reranker_func():
+    """Returns the rerank function and its HTTP client, which the caller closes"""
     if not SILICONFLOW_API_KEY:
         raise ValueError("SILICONFLOW_API_KEY environment variable is not set for reranking.")
 
-    async def rerank_func(query: str, documents: list[dict], top_n: int = None) -> list[dict]:
+    # One pooled client for all rerank calls instead of a new connection per query
+    client = httpx.AsyncClient(
+        base_url="https://api.siliconflow.cn/v1",
+        headers={
+            "accept": "application/json",
+            "content-type": "application/json",
+            "authorization": f"Bearer {SILICONFLOW_API_KEY}"
+        },
+        timeout=30.0
+    )
+
+    async def rerank_func(query: str, documents: list[str], top_n: int = None, model: str = RERANK_MODEL) -> list[dict]:
+        """Returns [{"index": ..., "relevance_score": ...}] so LightRAG can cache the scores"""
         if not documents:
             return []
 
-        doc_texts = [doc.get('text', '') for doc in documents]
-
+        payload = {
+            "model": model,
+            "query": query,
+            "documents": documents,
+            "top_n": top_n or len(documents),
+            "return_documents": False
+        }
         try:
-            rerank_url = "https://api.siliconflow.cn/v1/rerank"
-            headers = {
-                "accept": "application/json",
-                "content-type": "application/json",
-                "authorization": f"Bearer {SILICONFLOW_API_KEY}"
-            }
-            payload = {
-                "model": "BAAI/bge-reranker-v2-m3",
-                "query": query,
-                "documents": doc_texts,
-                "top_n": top_n or len(doc_texts),
-                "return_documents": False
-            }
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.post(rerank_url, headers=headers, json=payload)
-                response.raise_for_status()
-                results = response.json().get("results", [])
-
-                reranked_docs = []
-                for result in results:
-                    original_doc = documents[result['index']]
-                    if 'metadata' not in original_doc:
-                        original_doc['metadata'] = {}
-                    original_doc['metadata']['rerank_score'] = result['relevance_score']
-                    reranked_docs.append(original_doc)
-                
-                return reranked_docs
-
+            response = await client.post("/rerank", json=payload)
+            response.raise_for_status()
+            return [
+                {"index": result["index"], "relevance_score": result["relevance_score"]}
+                for result in response.json().get("results", [])
+            ]
         except httpx.HTTPStatusError as e:
             print(f"Error during reranking with SiliconFlow API: {e}")
             print(f"Response body: {e.response.text}")
-            return documents[:top_n] if top_n else documents
+            raise
         except Exception as e:
             print(f"An unexpected error occurred during reranking with SiliconFlow API: {e}")
-            return documents[:top_n] if top_n else documents
-            
-    return rerank_func
+            raise
+
+    # The model keyword is part of the rerank cache key
+    return functools.partial(rerank_func, model=RERANK_MODEL), client
 
 
 async def no_op_llm_func(*args, **kwargs):
@@ -103,7 +103,7 @@ async def initialize_rag():
     """Initializes the LightRAG instance for a vector-only setup."""
 
     embedder = get_embedding_func()
-    reranker = await get_siliconflow_reranker_func()
+    reranker, rerank_client = await get_siliconflow_reranker_func()
 
     rag = LightRAG(
         working_dir=WORKING_DIR,
@@ -115,9 +115,13 @@ async def initialize_rag():
         max_parallel_insert=128,
         max_graph_nodes=16  # This parameter is now effectively ignored
     )
-    await rag.initialize_storages()
-    await initialize_pipeline_status()
-    return rag
+    try:
+        await rag.initialize_storages()
+        await initialize_pipeline_status()
+    except Exception:
+        await rerank_client.aclose()
+        raise
+    return rag, rerank_client
 
 # --- Data Processing ---
 async def process_data(rag: LightRAG):
@@ -161,13 +165,14 @@ async def process_data(rag: LightRAG):
 # --- Main Execution ---
 async def main():
     rag_instance = None
+    rerank_client = None
     try:
         print("Starting DEV data preprocessing (using SiliconFlow Reranker)...")
         if not SILICONFLOW_API_KEY: # This is the change
             print("Error: SILICONFLOW_API_KEY environment variable is not set.")
             exit(1)
 
-        rag_instance = await initialize_rag()
+        rag_instance, rerank_client = await initialize_rag()
         await process_data(rag_instance)
         print("Preprocessing finished successfully.")
     except Exception as e:
@@ -176,6 +181,8 @@ async def main():
         if rag_instance:
             await rag_instance.finalize_storages()
             print("Storage connections finalized.")
+        if rerank_client is not None:
+            await rerank_client.aclose()
 
 if __name__ == "__main__":
     asyncio.run(main())
@@ -0,0 +1,57 @@
+"""
+Shared fixtures for the unit tests.
+
+make_rag builds LightRAG instances with a character tokenizer and mock model
+functions in pytest's temporary directory, so no model, network access or
+manual cleanup is needed.
+"""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from lightrag import LightRAG
+from lightrag.kg.shared_storage import finalize_share_data, initialize_share_data
+from lightrag.utils import EmbeddingFunc, Tokenizer
+
+
+class CharTokenizer:
+    def encode(self, content: str) -> list[int]:
+        return [ord(ch) for ch in content]
+
+    def decode(self, tokens: list[int]) -> str:
+        return "".join(chr(token) for token in tokens)
+
+
+async def mock_embedding(texts: list[str]) -> np.ndarray:
+    return np.ones((len(texts), 8))
+
+
+async def mock_llm(*args, **kwargs) -> str:
+    return ""
+
+
+@pytest.fixture
+def make_rag(tmp_path):
+    """Factory for LightRAG instances, each in its own working directory"""
+    counter = itertools.count()
+
+    def _make_rag(**kwargs) -> LightRAG:
+        kwargs.setdefault(
+            "embedding_func", EmbeddingFunc(embedding_dim=8, func=mock_embedding)
+        )
+        kwargs.setdefault("llm_model_func", mock_llm)
+        kwargs.setdefault("tokenizer", Tokenizer("char", CharTokenizer()))
+        working_dir = tmp_path / f"rag_{next(counter)}"
+        return LightRAG(working_dir=str(working_dir), **kwargs)
+
+    return _make_rag
+
+
+@pytest.fixture
+def shared_data():
+    """Single process shared data, required by initialize_storages"""
+    initialize_share_data(workers=1)
+    yield
+    finalize_share_data()
@@ -0,0 +1,64 @@
+"""
+Unit tests for AdaptiveGleaning, the per-chunk gleaning decision.
+"""
+
+from lightrag.operate import AdaptiveGleaning
+
+
+def warm_up(policy: AdaptiveGleaning, new_items: int, chunk_tokens: int = 1000):
+    for _ in range(AdaptiveGleaning.WARMUP_ROUNDS):
+        assert policy.should_glean(chunk_tokens, 10, True)
+        policy.record_round(chunk_tokens, new_items)
+
+
+def test_incomplete_first_pass_is_always_gleaned():
+    policy = AdaptiveGleaning(min_chunk_tokens=100)
+    assert policy.should_glean(10, 0, False)
+    assert policy.stats()["forced_incomplete"] == 1
+
+
+def test_short_chunks_are_skipped():
+    policy = AdaptiveGleaning(min_chunk_tokens=100)
+    assert not policy.should_glean(99, 3, True)
+    assert policy.should_glean(100, 3, True)
+    stats = policy.stats()
+    assert stats["skipped_short"] == 1
+    assert stats["saved_calls"] == 1
+
+
+def test_gleaning_during_warmup():
+    policy = AdaptiveGleaning(min_chunk_tokens=0)
+    # No round observed yet, the yield is unknown
+    for _ in range(AdaptiveGleaning.WARMUP_ROUNDS):
+        assert policy.should_glean(1000, 10, True)
+        policy.record_round(1000, 0)
+    assert policy.stats()["rounds"] == AdaptiveGleaning.WARMUP_ROUNDS
+
+
+def test_high_yield_keeps_gleaning():
+    policy = AdaptiveGleaning(min_chunk_tokens=0)
+    warm_up(policy, new_items=2)
+    assert policy.should_glean(1000, 10, True)
+    assert policy.stats()["skipped_low_yield"] == 0
+
+
+def test_low_yield_is_skipped_and_sampled():
+    policy = AdaptiveGleaning(min_chunk_tokens=0)
+    warm_up(policy, new_items=0)
+    decisions = [
+        policy.should_glean(1000, 10, True)
+        for _ in range(AdaptiveGleaning.SAMPLE_EVERY)
+    ]
+    # Every SAMPLE_EVERY-th low yield chunk is gleaned to keep the estimate fresh
+    assert decisions == [False] * (AdaptiveGleaning.SAMPLE_EVERY - 1) + [True]
+    stats = policy.stats()
+    assert stats["skipped_low_yield"] == AdaptiveGleaning.SAMPLE_EVERY - 1
+    assert stats["avg_round_yield"] == 0.0
+
+
+def test_sparse_first_pass_is_gleaned_despite_low_yield():
+    policy = AdaptiveGleaning(min_chunk_tokens=0)
+    warm_up(policy, new_items=0)
+    # Far fewer entities per token than the first passes seen so far
+    assert policy.should_glean(1000, 1, True)
+    assert policy.stats()["skipped_low_yield"] == 0
@@ -0,0 +1,103 @@
+"""
+Unit tests for the chunking executor of LightRAG.
+
+Chunking and document preparation run inline, in a thread pool or in a spawned
+process pool. A chunking function or tokenizer that cannot be pickled, and a
+process pool whose workers die, must fall back to threads.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from lightrag import LightRAG
+from lightrag.operate import chunk_and_hash, chunking_by_token_size, prepare_documents
+
+CONTENT = "LightRAG splits documents into overlapping chunks. " * 40
+
+
+def crashing_chunking_func(*args, **kwargs):
+    # Kills the worker process, the parent then sees a BrokenProcessPool
+    os._exit(1)
+
+
+@pytest.fixture
+def make_rag(make_rag):
+    def _make_rag(**kwargs) -> LightRAG:
+        kwargs.setdefault("chunk_token_size", 200)
+        kwargs.setdefault("chunk_overlap_token_size", 20)
+        return make_rag(**kwargs)
+
+    return _make_rag
+
+
+def expected_chunks(rag: LightRAG) -> dict:
+    return chunk_and_hash(
+        CONTENT,
+        None,
+        False,
+        rag.chunk_overlap_token_size,
+        rag.chunk_token_size,
+        chunking_by_token_size,
+        rag.tokenizer,
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor", ["none", "thread"])
+async def test_inline_and_thread_chunking(make_rag, executor):
+    rag = make_rag(chunking_executor=executor)
+    chunks = await rag._chunk_document(CONTENT, None, False)
+    assert len(chunks) > 1
+    assert chunks == expected_chunks(rag)
+    if executor == "none":
+        assert rag._chunking_pool is None
+    else:
+        assert isinstance(rag._chunking_pool, ThreadPoolExecutor)
+        rag._chunking_pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_unpicklable_chunking_func_falls_back_to_threads(make_rag):
+    def local_chunking_func(*args, **kwargs):
+        return chunking_by_token_size(*args, **kwargs)
+
+    rag = make_rag(chunking_executor="process", chunking_func=local_chunking_func)
+    chunks = await rag._chunk_document(CONTENT, None, False)
+    assert chunks == expected_chunks(rag)
+    assert rag.chunking_executor == "thread"
+    assert isinstance(rag._chunking_pool, ThreadPoolExecutor)
+    rag._chunking_pool.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_broken_process_pool_falls_back_to_threads(make_rag, monkeypatch):
+    rag = make_rag(
+        chunking_executor="process",
+        chunking_func=crashing_chunking_func,
+        chunking_max_workers=1,
+    )
+    pool = rag._get_chunking_pool()
+    assert isinstance(pool, ProcessPoolExecutor)
+
+    # Thread workers get chunking_func passed in, use a working one there
+    monkeypatch.setattr(rag, "chunking_func", chunking_by_token_size)
+    chunks = await rag._chunk_document(CONTENT, None, False)
+    assert chunks == expected_chunks(rag)
+    assert rag.chunking_executor == "thread"
+    assert isinstance(rag._chunking_pool, ThreadPoolExecutor)
+    rag._chunking_pool.shutdown()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor", ["none", "thread"])
+async def test_prepare_documents_keeps_input_order(make_rag, executor):
+    rag = make_rag(chunking_executor=executor, chunking_max_workers=3)
+    contents = [f"document {i}\x00 body" for i in range(7)] + ["document 0\x00 body"]
+    prepared = await rag._prepare_documents(contents)
+    assert prepared == prepare_documents(contents)
+    assert [doc_id for _, doc_id, _ in prepared][0] == prepared[-1][1]
+    assert len({doc_id for _, doc_id, _ in prepared}) == 7
+    if rag._chunking_pool is not None:
+        rag._chunking_pool.shutdown()
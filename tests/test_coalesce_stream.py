@@ -0,0 +1,85 @@
+"""
+Unit tests for coalesce_stream, which merges small LLM stream chunks before
+they are sent to API clients.
+"""
+
+import asyncio
+import sys
+from unittest.mock import patch
+
+import pytest
+
+# The API config parses the command line on import
+with patch.object(sys, "argv", ["lightrag-server"]):
+    from lightrag.api.utils_api import coalesce_stream
+
+
+async def stream(chunks, release: asyncio.Event | None = None, events=None):
+    try:
+        for chunk in chunks:
+            yield chunk
+        if release is not None:
+            await release.wait()
+            yield "late"
+    except asyncio.CancelledError:
+        if events is not None:
+            events.append("cancelled")
+        raise
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_merged_up_to_min_chars():
+    merged = [
+        chunk
+        async for chunk in coalesce_stream(
+            stream(["ab", "", "cd", "e"]), min_chars=4, max_delay=10
+        )
+    ]
+    assert merged == ["abcd", "e"]
+
+
+@pytest.mark.asyncio
+async def test_buffer_is_flushed_while_the_stream_is_silent():
+    release = asyncio.Event()
+    merged = coalesce_stream(stream(["a", "b"], release), min_chars=100, max_delay=0.05)
+    # The next chunk only comes once released, the buffer must not wait for it
+    assert await asyncio.wait_for(anext(merged), timeout=2) == "ab"
+    release.set()
+    assert [chunk async for chunk in merged] == ["late"]
+
+
+@pytest.mark.asyncio
+async def test_buffered_text_is_delivered_before_an_error():
+    async def failing():
+        yield "partial"
+        raise RuntimeError("stream failed")
+
+    merged = coalesce_stream(failing(), min_chars=100, max_delay=10)
+    assert await anext(merged) == "partial"
+    with pytest.raises(RuntimeError):
+        await anext(merged)
+
+
+@pytest.mark.asyncio
+async def test_closing_early_stops_reading_the_stream():
+    release = asyncio.Event()
+    events = []
+    merged = coalesce_stream(
+        stream(["a"], release, events), min_chars=100, max_delay=0.01
+    )
+    assert await asyncio.wait_for(anext(merged), timeout=2) == "a"
+    # The read of the next chunk is pending when the consumer goes away
+    await asyncio.sleep(0.01)
+    await merged.aclose()
+    assert events == ["cancelled"]
+
+
+@pytest.mark.asyncio
+async def test_disabled_coalescing_passes_chunks_through():
+    merged = [
+        chunk
+        async for chunk in coalesce_stream(
+            stream(["a", "", "b"]), min_chars=0, max_delay=10
+        )
+    ]
+    assert merged == ["a", "b"]
@@ -0,0 +1,258 @@
+"""
+Unit tests for batched document enqueueing.
+
+apipeline_enqueue_documents stores contents in full_docs in batches of
+enqueue_batch_size, deduplicates contents across batches, persists full_docs
+once per call and only then writes the status of all documents at once. Also
+covers the bulk writes of the PostgreSQL and MongoDB doc storages against fake
+clients.
+"""
+
+from contextlib import asynccontextmanager
+
+import pytest
+import pytest_asyncio
+
+from lightrag.base import DocStatus
+from lightrag.kg.shared_storage import initialize_pipeline_status
+from lightrag.utils import compute_mdhash_id
+
+
+@pytest_asyncio.fixture
+async def rag(make_rag, shared_data):
+    await initialize_pipeline_status()
+    rag = make_rag(enqueue_batch_size=2, chunking_executor="none")
+    await rag.initialize_storages()
+    yield rag
+    await rag.finalize_storages()
+
+
+def count_calls(monkeypatch, storage, method: str) -> list:
+    calls = []
+    original = getattr(storage, method)
+
+    async def wrapper(*args, **kwargs):
+        calls.append(args)
+        return await original(*args, **kwargs)
+
+    monkeypatch.setattr(storage, method, wrapper)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_documents_are_stored_in_batches(rag, monkeypatch):
+    upserts = count_calls(monkeypatch, rag.full_docs, "upsert")
+    persists = count_calls(monkeypatch, rag.full_docs, "index_done_callback")
+    contents = [f"document {i}" for i in range(5)]
+    track_id = await rag.apipeline_enqueue_documents(
+        contents, file_paths=[f"{i}.txt" for i in range(5)], track_id="track"
+    )
+    assert track_id == "track"
+
+    assert [len(data) for (data,) in upserts] == [2, 2, 1]
+    assert len(persists) == 1
+    for i, content in enumerate(contents):
+        doc_id = compute_mdhash_id(content, prefix="doc-")
+        status = await rag.doc_status.get_by_id(doc_id)
+        assert status["status"] == DocStatus.PENDING
+        assert status["file_path"] == f"{i}.txt"
+        assert status["track_id"] == "track"
+        assert (await rag.full_docs.get_by_id(doc_id))["content"] == content
+
+
+@pytest.mark.asyncio
+async def test_contents_are_durable_before_their_status(rag, monkeypatch):
+    events = []
+    for storage, name in [(rag.full_docs, "full_docs"), (rag.doc_status, "doc_status")]:
+        for method in ("upsert", "index_done_callback"):
+            original = getattr(storage, method)
+
+            async def wrapper(*args, event=(name, method), original=original):
+                events.append(event)
+                return await original(*args)
+
+            monkeypatch.setattr(storage, method, wrapper)
+
+    await rag.apipeline_enqueue_documents([f"document {i}" for i in range(5)])
+    # doc_status persists on upsert, once for all batches
+    assert events == [
+        ("full_docs", "upsert"),
+        ("full_docs", "upsert"),
+        ("full_docs", "upsert"),
+        ("full_docs", "index_done_callback"),
+        ("doc_status", "upsert"),
+        ("doc_status", "index_done_callback"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_duplicates_across_batches_and_calls(rag, monkeypatch):
+    persists = count_calls(monkeypatch, rag.full_docs, "index_done_callback")
+    # The duplicate is in the third batch, the first copy in the first one
+    await rag.apipeline_enqueue_documents(["a", "b", "c", "d", "a"])
+    assert len(await rag.doc_status.get_docs_by_status(DocStatus.PENDING)) == 4
+
+    # Already enqueued documents are ignored, nothing new to persist
+    assert await rag.apipeline_enqueue_documents(["b", "c"]) is None
+    assert len(persists) == 1
+
+
+@pytest.mark.asyncio
+async def test_custom_ids_follow_their_batch(rag):
+    await rag.apipeline_enqueue_documents(
+        ["one", "two", "three"], ids=["id-1", "id-2", "id-3"]
+    )
+    for doc_id, content in [("id-1", "one"), ("id-2", "two"), ("id-3", "three")]:
+        assert (await rag.full_docs.get_by_id(doc_id))["content"] == content
+    with pytest.raises(ValueError):
+        await rag.apipeline_enqueue_documents(["x", "y"], ids=["same", "same"])
+
+
+class FakeConnection:
+    def __init__(self):
+        self.executemany_calls = []
+        self.transactions = 0
+
+    @asynccontextmanager
+    async def transaction(self):
+        self.transactions += 1
+        yield
+
+    async def executemany(self, sql, args):
+        self.executemany_calls.append((sql, args))
+
+
+@pytest.mark.asyncio
+async def test_postgres_executemany(monkeypatch):
+    pytest.importorskip("asyncpg")
+    from lightrag.kg.postgres_impl import ClientManager, PostgreSQLDB
+
+    db = PostgreSQLDB(
+        {
+            **ClientManager.get_config(),
+            "user": "user",
+            "password": "password",
+            "database": "db",
+        }
+    )
+    connection = FakeConnection()
+
+    async def run_with_retry(operation, **kwargs):
+        return await operation(connection)
+
+    monkeypatch.setattr(db, "_run_with_retry", run_with_retry)
+    await db.executemany(
+        "INSERT ...", [{"id": "a", "content": "x"}, {"id": "b", "content": "y"}]
+    )
+    await db.executemany("INSERT ...", [])
+    assert connection.executemany_calls == [("INSERT ...", [("a", "x"), ("b", "y")])]
+    assert connection.transactions == 1
+
+
+class FakePostgresDB:
+    def __init__(self):
+        self.executemany_calls = []
+
+    async def executemany(self, sql, data):
+        self.executemany_calls.append((sql, data))
+
+    async def execute(self, sql, data):
+        raise AssertionError("rows must be written with executemany")
+
+
+@pytest.mark.asyncio
+async def test_postgres_doc_storages_write_one_batch():
+    pytest.importorskip("asyncpg")
+    from lightrag.kg.postgres_impl import PGDocStatusStorage, PGKVStorage
+
+    db = FakePostgresDB()
+    full_docs = PGKVStorage(
+        namespace="full_docs",
+        workspace="ws",
+        global_config={"embedding_batch_num": 10},
+        embedding_func=None,
+        db=db,
+    )
+    await full_docs.upsert(
+        {
+            "doc-1": {"content": "one", "file_path": "1.txt"},
+            "doc-2": {"content": "two"},
+        }
+    )
+    doc_status = PGDocStatusStorage(
+        namespace="doc_status",
+        workspace="ws",
+        global_config={},
+        embedding_func=None,
+        db=db,
+    )
+    await doc_status.upsert(
+        {
+            doc_id: {
+                "status": DocStatus.PENDING,
+                "content_summary": "summary",
+                "content_length": 3,
+                "file_path": "f.txt",
+                "created_at": "2025-01-01T00:00:00+00:00",
+                "updated_at": "2025-01-01T00:00:00+00:00",
+            }
+            for doc_id in ("doc-1", "doc-2")
+        }
+    )
+
+    (_, doc_rows), (_, status_rows) = db.executemany_calls
+    assert [row["id"] for row in doc_rows] == ["doc-1", "doc-2"]
+    assert [row["doc_name"] for row in doc_rows] == ["1.txt", ""]
+    assert [row["id"] for row in status_rows] == ["doc-1", "doc-2"]
+    assert all(row["workspace"] == "ws" for row in doc_rows + status_rows)
+
+
+class FakeCollection:
+    def __init__(self):
+        self.bulk_writes = []
+
+    async def bulk_write(self, operations, ordered=True):
+        self.bulk_writes.append((operations, ordered))
+
+    async def update_one(self, *args, **kwargs):
+        raise AssertionError("documents must be written with bulk_write")
+
+
+@pytest.mark.asyncio
+async def test_mongo_doc_status_bulk_write():
+    pytest.importorskip("pymongo")
+    from pymongo import UpdateOne
+
+    from lightrag.kg.mongo_impl import MongoDocStatusStorage
+
+    storage = MongoDocStatusStorage(
+        namespace="doc_status", global_config={}, embedding_func=None, workspace="ws"
+    )
+    storage._data = FakeCollection()
+    await storage.upsert(
+        {
+            "doc-1": {"status": DocStatus.PENDING},
+            "doc-2": {"status": DocStatus.PENDING, "chunks_list": ["chunk-1"]},
+        }
+    )
+
+    ((operations, ordered),) = storage._data.bulk_writes
+    assert not ordered
+    assert operations == [
+        UpdateOne(
+            {"_id": "doc-1"},
+            {"$set": {"status": DocStatus.PENDING, "chunks_list": [], "_id": "doc-1"}},
+            upsert=True,
+        ),
+        UpdateOne(
+            {"_id": "doc-2"},
+            {
+                "$set": {
+                    "status": DocStatus.PENDING,
+                    "chunks_list": ["chunk-1"],
+                    "_id": "doc-2",
+                }
+            },
+            upsert=True,
+        ),
+    ]
@@ -0,0 +1,151 @@
+"""
+Unit tests for ExtractionBatcher, which packs small chunks into multi-chunk
+entity extraction requests.
+
+Covers splitting the response back per chunk, the fallback to single-chunk
+requests for chunks whose section is missing or was not completed, and the
+document concurrency of the pipeline while batching is enabled.
+"""
+
+import asyncio
+
+import pytest
+
+from lightrag.operate import ExtractionBatcher
+from lightrag.prompt import PROMPTS
+
+DONE = PROMPTS["DEFAULT_COMPLETION_DELIMITER"]
+PROMPT_CONTEXT = {
+    "tuple_delimiter": PROMPTS["DEFAULT_TUPLE_DELIMITER"],
+    "completion_delimiter": DONE,
+    "entity_types": "person,organization",
+    "language": "English",
+}
+
+
+class TestSplitResponse:
+    def test_sections_in_order(self):
+        response = f"<|CHUNK_1|>\nentity one\n{DONE}\n<|CHUNK_2|>\nentity two\n{DONE}"
+        assert ExtractionBatcher.split_response(response, 2, DONE) == [
+            f"entity one\n{DONE}",
+            f"entity two\n{DONE}",
+        ]
+
+    def test_out_of_order_and_unknown_markers(self):
+        response = (
+            f"<|chunk_2|>\ntwo\n{DONE}\n<|CHUNK_1|>\none\n{DONE}\n"
+            f"<|CHUNK_7|>\nseven\n{DONE}\n<|CHUNK_1|>\nagain\n{DONE}"
+        )
+        assert ExtractionBatcher.split_response(response, 2, DONE) == [
+            f"one\n{DONE}",
+            f"two\n{DONE}",
+        ]
+
+    def test_sections_without_completion_delimiter_are_dropped(self):
+        # Chunk 1 ran into the next marker, chunk 3 was cut off
+        response = f"<|CHUNK_1|>\none\n<|CHUNK_2|>\ntwo\n{DONE}\n<|CHUNK_3|>\nthr"
+        assert ExtractionBatcher.split_response(response, 3, DONE) == [
+            None,
+            f"two\n{DONE}",
+            None,
+        ]
+
+    def test_completion_delimiter_is_case_insensitive(self):
+        response = f"<|CHUNK_1|>\none\n{DONE.lower()}"
+        assert ExtractionBatcher.split_response(response, 1, DONE) == [
+            f"one\n{DONE.lower()}"
+        ]
+
+
+class FakeLLM:
+    def __init__(self, batch_response=None, fail_batch=False):
+        self.batch_response = batch_response
+        self.fail_batch = fail_batch
+        self.batch_prompts: list[str] = []
+        self.single_prompts: list[str] = []
+
+    async def __call__(self, prompt, system_prompt=None, **kwargs) -> str:
+        if "<|CHUNK_1|>" in prompt:
+            self.batch_prompts.append(prompt)
+            if self.fail_batch:
+                raise RuntimeError("batch request failed")
+            return self.batch_response
+        self.single_prompts.append(prompt)
+        return f"single {prompt}\n{DONE}"
+
+
+async def extract_all(batcher: ExtractionBatcher, llm: FakeLLM, contents: list[str]):
+    return await asyncio.gather(
+        *(
+            batcher.extract(
+                content,
+                5,
+                llm,
+                PROMPT_CONTEXT,
+                content,
+                system_prompt="system",
+            )
+            for content in contents
+        )
+    )
+
+
+@pytest.mark.asyncio
+async def test_batched_request_splits_results():
+    llm = FakeLLM(f"<|CHUNK_1|>\nfirst\n{DONE}\n<|CHUNK_2|>\nsecond\n{DONE}")
+    batcher = ExtractionBatcher(batch_size=2, max_tokens=100, chunk_tokens=10)
+    results = await extract_all(batcher, llm, ["text one", "text two"])
+    assert results == [f"first\n{DONE}", f"second\n{DONE}"]
+    assert len(llm.batch_prompts) == 1
+    assert llm.single_prompts == []
+
+
+@pytest.mark.asyncio
+async def test_incomplete_section_falls_back_to_single_request():
+    llm = FakeLLM(f"<|CHUNK_1|>\nfirst\n{DONE}\n<|CHUNK_2|>\nsecond, cut off")
+    batcher = ExtractionBatcher(batch_size=2, max_tokens=100, chunk_tokens=10)
+    results = await extract_all(batcher, llm, ["text one", "text two"])
+    assert results == [f"first\n{DONE}", f"single text two\n{DONE}"]
+    assert llm.single_prompts == ["text two"]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_falls_back_to_single_requests():
+    llm = FakeLLM(fail_batch=True)
+    batcher = ExtractionBatcher(batch_size=2, max_tokens=100, chunk_tokens=10)
+    results = await extract_all(batcher, llm, ["text one", "text two"])
+    assert results == [f"single text one\n{DONE}", f"single text two\n{DONE}"]
+    assert len(llm.batch_prompts) == 1
+
+
+@pytest.mark.asyncio
+async def test_lone_chunk_is_sent_alone_after_batch_wait():
+    llm = FakeLLM()
+    batcher = ExtractionBatcher(
+        batch_size=4, max_tokens=100, chunk_tokens=10, batch_wait=0.01
+    )
+    results = await extract_all(batcher, llm, ["text one"])
+    assert results == [f"single text one\n{DONE}"]
+    assert llm.batch_prompts == []
+    assert not batcher.accepts(11)
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_without_waiting():
+    llm = FakeLLM(f"<|CHUNK_1|>\nfirst\n{DONE}\n<|CHUNK_2|>\nsecond\n{DONE}")
+    # Far below the token cap, the batch size alone triggers the request
+    batcher = ExtractionBatcher(
+        batch_size=2, max_tokens=1000, chunk_tokens=10, batch_wait=60
+    )
+    results = await asyncio.wait_for(
+        extract_all(batcher, llm, ["text one", "text two"]), timeout=5
+    )
+    assert results == [f"first\n{DONE}", f"second\n{DONE}"]
+
+
+def test_batching_raises_document_concurrency(make_rag):
+    assert make_rag(max_parallel_insert=2)._max_parallel_documents() == 2
+    rag = make_rag(max_parallel_insert=2, extract_batch_size=8, llm_model_max_async=4)
+    assert rag._max_parallel_documents() == 32
+    rag = make_rag(max_parallel_insert=64, extract_batch_size=8, llm_model_max_async=4)
+    assert rag._max_parallel_documents() == 64
@@ -0,0 +1,174 @@
+"""
+Unit tests for per-chunk extraction checkpoints.
+
+Covers the save/load/delete cycle, resuming an extraction from checkpoints,
+best-effort handling of storage errors and LightRAG._chunks_already_stored.
+"""
+
+from dataclasses import asdict
+
+import pytest
+
+from lightrag.operate import ExtractionCheckpoints, extract_entities
+from lightrag.prompt import PROMPTS
+
+TUPLE = PROMPTS["DEFAULT_TUPLE_DELIMITER"]
+DONE = PROMPTS["DEFAULT_COMPLETION_DELIMITER"]
+
+
+class FakeKVStorage:
+    def __init__(self):
+        self.data: dict[str, dict] = {}
+        self.fail = False
+
+    def _check(self):
+        if self.fail:
+            raise ConnectionError("storage unavailable")
+
+    async def upsert(self, data: dict[str, dict]) -> None:
+        self._check()
+        self.data.update(data)
+
+    async def get_by_ids(self, ids: list[str]) -> list[dict | None]:
+        self._check()
+        return [self.data.get(id_) for id_ in ids]
+
+    async def filter_keys(self, keys: set[str]) -> set[str]:
+        self._check()
+        return {key for key in keys if key not in self.data}
+
+    async def delete(self, ids: list[str]) -> None:
+        self._check()
+        for id_ in ids:
+            self.data.pop(id_, None)
+
+    async def index_done_callback(self) -> None:
+        self._check()
+
+
+class TestCheckpointStore:
+    @pytest.mark.asyncio
+    async def test_save_load_delete(self):
+        storage = FakeKVStorage()
+        checkpoints = ExtractionCheckpoints(storage, batch_size=10)
+        await checkpoints.save("chunk-1", "hash", [("result", 1)], ["cache-key"])
+        # Written in groups, nothing stored before the flush
+        assert not await checkpoints.has_any(["chunk-1"])
+        await checkpoints.flush()
+
+        assert await checkpoints.has_any(["chunk-1", "chunk-2"])
+        assert await checkpoints.load(["chunk-1", "chunk-2"], "hash") == {
+            "chunk-1": {"results": [["result", 1]], "cache_keys": ["cache-key"]}
+        }
+        # Made with another extraction prompt
+        assert await checkpoints.load(["chunk-1"], "other hash") == {}
+
+        await checkpoints.save("chunk-2", "hash", [("result", 2)], [])
+        await checkpoints.delete(["chunk-1", "chunk-2"])
+        assert storage.data == {}
+
+    @pytest.mark.asyncio
+    async def test_storage_errors_are_not_raised(self):
+        storage = FakeKVStorage()
+        checkpoints = ExtractionCheckpoints(storage, batch_size=1)
+        storage.fail = True
+        await checkpoints.save("chunk-1", "hash", [("result", 1)], [])
+        await checkpoints.flush()
+        await checkpoints.delete(["chunk-1"])
+        assert storage.data == {}
+
+        # The failed checkpoint is kept and written once the storage is back
+        storage.fail = False
+        await checkpoints.flush()
+        assert await checkpoints.load(["chunk-1"], "hash")
+
+
+class ExtractionLLM:
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self, prompt, **kwargs) -> str:
+        self.calls += 1
+        return f"entity{TUPLE}Alice{TUPLE}person{TUPLE}Alice is a person.\n{DONE}"
+
+
+@pytest.mark.asyncio
+async def test_extraction_resumes_from_checkpoints(make_rag, monkeypatch):
+    rag = make_rag(entity_extract_max_gleaning=1)
+    storage = FakeKVStorage()
+    global_config = asdict(rag)
+    global_config["extraction_checkpoints"] = ExtractionCheckpoints(storage)
+    llm = ExtractionLLM()
+    global_config["llm_model_func"] = llm
+    chunks = {
+        "chunk-1": {"content": "Alice works at Acme.", "tokens": 20},
+        "chunk-2": {"content": "Alice met Bob.", "tokens": 14},
+    }
+
+    first = await extract_entities(chunks, global_config)
+    assert llm.calls == 4  # first pass and gleaning of both chunks
+
+    # Reprocessing re-parses the checkpointed results without LLM calls
+    resumed = await extract_entities(chunks, global_config)
+    assert llm.calls == 4
+    assert [set(nodes) for nodes, _ in resumed] == [set(nodes) for nodes, _ in first]
+
+    # A changed gleaning prompt invalidates the checkpoints
+    monkeypatch.setitem(
+        PROMPTS,
+        "entity_continue_extraction_user_prompt",
+        PROMPTS["entity_continue_extraction_user_prompt"] + "\n",
+    )
+    await extract_entities(chunks, global_config)
+    assert llm.calls == 8
+
+
+@pytest.mark.asyncio
+async def test_failing_checkpoint_storage_does_not_fail_extraction(make_rag):
+    rag = make_rag(entity_extract_max_gleaning=0)
+    storage = FakeKVStorage()
+    storage.fail = True
+    global_config = asdict(rag)
+    global_config["extraction_checkpoints"] = ExtractionCheckpoints(
+        storage, batch_size=1
+    )
+    llm = ExtractionLLM()
+    global_config["llm_model_func"] = llm
+    chunks = {"chunk-1": {"content": "Alice works at Acme.", "tokens": 20}}
+
+    results = await extract_entities(chunks, global_config)
+    assert "Alice" in results[0][0]
+    assert llm.calls == 1
+    assert storage.data == {}
+
+
+@pytest.mark.asyncio
+async def test_chunks_already_stored(make_rag, shared_data):
+    rag = make_rag()
+    await rag.initialize_storages()
+    try:
+        chunks = {
+            "chunk-1": {"content": "Alice works at Acme.", "full_doc_id": "doc-1"},
+            "chunk-2": {"content": "Alice met Bob.", "full_doc_id": "doc-1"},
+        }
+        # Nothing stored yet
+        assert not await rag._chunks_already_stored(chunks)
+
+        await rag.text_chunks.upsert(chunks)
+        await rag.chunks_vdb.upsert({"chunk-1": chunks["chunk-1"]})
+        await rag._extraction_checkpoints.save("chunk-1", "hash", [("r", 1)], [])
+        await rag._extraction_checkpoints.flush()
+        # The vector of chunk-2 is missing
+        assert not await rag._chunks_already_stored(chunks)
+
+        await rag.chunks_vdb.upsert({"chunk-2": chunks["chunk-2"]})
+        assert await rag._chunks_already_stored(chunks)
+
+        # Without a checkpoint the earlier run did not get past storing chunks
+        await rag._extraction_checkpoints.delete(["chunk-1"])
+        assert not await rag._chunks_already_stored(chunks)
+
+        rag.extraction_checkpoint = False
+        assert not await rag._chunks_already_stored(chunks)
+    finally:
+        await rag.finalize_storages()
@@ -16,6 +16,7 @@
 import asyncio
 import os
 import sys
+import time
 import importlib
 import numpy as np
 from dotenv import load_dotenv
@@ -838,6 +839,116 @@ async def test_graph_batch_operations(storage):
         return False
 
 
+async def test_graph_batch_read_latency(storage, node_count: int = 200):
+    """
+    批量读取延迟基准测试:
+    对比逐个读取(get_node/node_degree/get_edge/get_node_edges)与批量读取
+    (get_nodes_batch/node_degrees_batch/get_edges_batch/get_nodes_edges_batch)的耗时。
+
+    本地 Memgraph 容器示例: docker run -p 7687:7687 memgraph/memgraph
+    """
+    try:
+        # 1. 使用批量写入接口构造星形+链式图
+        node_ids = [f"bench_node_{i}" for i in range(node_count)]
+        nodes = {
+            node_id: {
+                "entity_id": node_id,
+                "description": f"benchmark node {i}",
+                "entity_type": "benchmark",
+                "source_id": "bench",
+            }
+            for i, node_id in enumerate(node_ids)
+        }
+        await storage.upsert_nodes_batch(nodes)
+        edges = [
+            (node_ids[0], node_id, {"weight": 1.0, "description": "hub"})
+            for node_id in node_ids[1:]
+        ]
+        edges += [
+            (node_ids[i], node_ids[i + 1], {"weight": 0.5, "description": "chain"})
+            for i in range(1, node_count - 1)
+        ]
+        await storage.upsert_edges_batch(edges)
+        pairs = [{"src": src, "tgt": tgt} for src, tgt, _ in edges]
+        print(f"已写入 {len(nodes)} 个节点和 {len(edges)} 条边")
+
+        async def timed(coro_factory):
+            start = time.perf_counter()
+            result = await coro_factory()
+            return result, (time.perf_counter() - start) * 1000
+
+        async def nodes_one_by_one():
+            return {node_id: await storage.get_node(node_id) for node_id in node_ids}
+
+        async def degrees_one_by_one():
+            return {node_id: await storage.node_degree(node_id) for node_id in node_ids}
+
+        async def edges_one_by_one():
+            return {
+                (pair["src"], pair["tgt"]): await storage.get_edge(
+                    pair["src"], pair["tgt"]
+                )
+                for pair in pairs
+            }
+
+        async def node_edges_one_by_one():
+            return {
+                node_id: await storage.get_node_edges(node_id) or []
+                for node_id in node_ids
+            }
+
+        cases = [
+            (
+                "get_nodes_batch",
+                nodes_one_by_one,
+                lambda: storage.get_nodes_batch(node_ids),
+            ),
+            (
+                "node_degrees_batch",
+                degrees_one_by_one,
+                lambda: storage.node_degrees_batch(node_ids),
+            ),
+            (
+                "get_edges_batch",
+                edges_one_by_one,
+                lambda: storage.get_edges_batch(pairs),
+            ),
+            (
+                "get_nodes_edges_batch",
+                node_edges_one_by_one,
+                lambda: storage.get_nodes_edges_batch(node_ids),
+            ),
+        ]
+
+        # 2. 逐项与批量读取对比，并校验结果一致
+        for name, single_factory, batch_factory in cases:
+            single_result, single_ms = await timed(single_factory)
+            batch_result, batch_ms = await timed(batch_factory)
+            assert len(batch_result) == len(
+                single_result
+            ), f"{name} 返回数量不一致: {len(batch_result)} != {len(single_result)}"
+            if name == "node_degrees_batch":
+                assert (
+                    batch_result == single_result
+                ), f"{name} 返回的度数与逐个查询不一致"
+            if name == "get_nodes_edges_batch":
+                for node_id in node_ids:
+                    assert sorted(batch_result[node_id]) == sorted(
+                        single_result[node_id]
+                    ), f"{name} 中节点 {node_id} 的边与逐个查询不一致"
+            speedup = single_ms / batch_ms if batch_ms > 0 else float("inf")
+            ASCIIColors.white(
+                f"{name:<24} 逐个: {single_ms:9.1f} ms | 批量: {batch_ms:9.1f} ms | 加速: {speedup:6.1f}x"
+            )
+
+        print("\n批量读取延迟基准测试完成")
+        return True
+
+    except Exception as e:
+        ASCIIColors.red(f"测试过程中发生错误: {str(e)}")
+        return False
+
+
 async def test_graph_special_characters(storage):
     """
     测试图数据库对特殊字符的处理:
@@ -1202,11 +1313,12 @@ async def main():
         ASCIIColors.white("4. 无向图特性测试 (验证存储的无向图特性)")
         ASCIIColors.white("5. 特殊字符测试 (验证单引号、双引号和反斜杠等特殊字符)")
         ASCIIColors.white("6. 全部测试")
+        ASCIIColors.white("7. 批量读取延迟基准测试 (逐个读取与批量读取耗时对比)")
 
-        choice = input("\n请输入选项 (1/2/3/4/5/6): ")
+        choice = input("\n请输入选项 (1/2/3/4/5/6/7): ")
 
         # 在执行测试前清理数据
-        if choice in ["1", "2", "3", "4", "5", "6"]:
+        if choice in ["1", "2", "3", "4", "5", "6", "7"]:
             ASCIIColors.yellow("\n执行测试前清理数据...")
             await storage.drop()
             ASCIIColors.green("数据清理完成\n")
@@ -1242,6 +1354,8 @@ async def main():
                         if undirected_result:
                             ASCIIColors.cyan("\n=== 开始特殊字符测试 ===")
                             await test_graph_special_characters(storage)
+        elif choice == "7":
+            await test_graph_batch_read_latency(storage)
         else:
             ASCIIColors.red("无效的选项")
 
@@ -0,0 +1,211 @@
+"""
+Unit tests for GraphUpsertBuffer, the write-behind buffer of the merge stage.
+
+The fake graph mimics Neo4j/Memgraph upsert_edges_batch, which MATCHes both
+endpoints and silently skips edges whose nodes do not exist yet. The merge
+stage must store its graph writes before their vector DB writes and before
+releasing the keyed locks of the merged entities.
+"""
+
+import asyncio
+from dataclasses import asdict
+
+import pytest
+
+from lightrag import operate
+from lightrag.operate import GraphUpsertBuffer, extract_entities, merge_nodes_and_edges
+from lightrag.prompt import PROMPTS
+
+
+class FakeGraph:
+    def __init__(self):
+        self.nodes: dict[str, dict] = {}
+        self.edges: dict[tuple[str, str], dict] = {}
+        self.dropped_edges: list[tuple[str, str]] = []
+        self.node_write_started = asyncio.Event()
+        self.release_node_write = asyncio.Event()
+        self.release_node_write.set()
+        self.fail_node_write = False
+
+    async def upsert_nodes_batch(self, nodes: dict[str, dict]) -> None:
+        self.node_write_started.set()
+        await self.release_node_write.wait()
+        if self.fail_node_write:
+            raise RuntimeError("node write failed")
+        self.nodes.update(nodes)
+
+    async def upsert_edges_batch(self, edges: list[tuple[str, str, dict]]) -> None:
+        for src, tgt, data in edges:
+            if src in self.nodes and tgt in self.nodes:
+                self.edges[(src, tgt)] = data
+            else:
+                # edge dropped (endpoint missing)
+                self.dropped_edges.append((src, tgt))
+
+    async def get_node(self, node_id: str) -> dict | None:
+        return self.nodes.get(node_id)
+
+    async def has_node(self, node_id: str) -> bool:
+        return node_id in self.nodes
+
+
+@pytest.mark.asyncio
+async def test_edge_added_during_node_write_keeps_its_endpoint():
+    graph = FakeGraph()
+    buffer = GraphUpsertBuffer(graph, batch_size=100)
+    await buffer.upsert_node("A", {"entity_id": "A"})
+
+    graph.release_node_write.clear()
+    flush_task = asyncio.create_task(buffer.flush())
+    await graph.node_write_started.wait()
+
+    # Added while the node batch is being written
+    await buffer.upsert_node("B", {"entity_id": "B"})
+    await buffer.upsert_edge("A", "B", {"weight": "1.0"})
+    assert await buffer.has_node("B")
+
+    graph.release_node_write.set()
+    await flush_task
+    await buffer.flush()
+
+    assert graph.dropped_edges == []
+    assert set(graph.nodes) == {"A", "B"}
+    assert ("A", "B") in graph.edges
+    assert buffer.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_node_write_keeps_nodes_and_edges_pending():
+    graph = FakeGraph()
+    buffer = GraphUpsertBuffer(graph, batch_size=100)
+    await buffer.upsert_node("A", {"entity_id": "A"})
+    await buffer.upsert_node("B", {"entity_id": "B"})
+    await buffer.upsert_edge("A", "B", {"weight": "1.0"})
+
+    graph.fail_node_write = True
+    with pytest.raises(RuntimeError):
+        await buffer.flush()
+    assert buffer.pending_count == 3
+    assert graph.edges == {}
+    assert graph.dropped_edges == []
+
+    graph.fail_node_write = False
+    await buffer.flush()
+    assert set(graph.nodes) == {"A", "B"}
+    assert ("A", "B") in graph.edges
+    assert buffer.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_reads_see_pending_writes_and_batch_size_flushes():
+    graph = FakeGraph()
+    buffer = GraphUpsertBuffer(graph, batch_size=2)
+    await buffer.upsert_node("A", {"entity_id": "A", "description": "new"})
+    assert (await buffer.get_node("A"))["description"] == "new"
+    assert graph.nodes == {}
+
+    # Reaching batch_size pending writes flushes
+    await buffer.upsert_node("B", {"entity_id": "B"})
+    assert set(graph.nodes) == {"A", "B"}
+    assert buffer.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_deferred_operations_run_after_graph_writes():
+    graph = FakeGraph()
+    buffer = GraphUpsertBuffer(graph, batch_size=100)
+    seen = []
+
+    async def vdb_write():
+        seen.append(set(graph.nodes))
+
+    await buffer.upsert_node("A", {"entity_id": "A"})
+    buffer.defer(vdb_write)
+    assert seen == []
+
+    graph.fail_node_write = True
+    with pytest.raises(RuntimeError):
+        await buffer.flush()
+    # Kept with the failed writes instead of running ahead of them
+    assert seen == []
+
+    graph.fail_node_write = False
+    await buffer.flush()
+    assert seen == [{"A"}]
+
+
+TUPLE = PROMPTS["DEFAULT_TUPLE_DELIMITER"]
+DONE = PROMPTS["DEFAULT_COMPLETION_DELIMITER"]
+
+
+async def extraction_llm(prompt, **kwargs) -> str:
+    return (
+        f"entity{TUPLE}Alice{TUPLE}person{TUPLE}Alice is a person.\n"
+        f"entity{TUPLE}Acme{TUPLE}organization{TUPLE}Acme is a company.\n"
+        f"relation{TUPLE}Alice{TUPLE}Acme{TUPLE}employment{TUPLE}Alice works at Acme.\n"
+        f"{DONE}"
+    )
+
+
+@pytest.mark.asyncio
+async def test_merge_stores_graph_before_vectors_and_lock_release(
+    make_rag, shared_data, monkeypatch
+):
+    rag = make_rag(llm_model_func=extraction_llm, entity_extract_max_gleaning=0)
+    await rag.initialize_storages()
+    graph = rag.chunk_entity_relation_graph
+    global_config = asdict(rag)
+    chunks = {"chunk-1": {"content": "Alice works at Acme.", "tokens": 20}}
+    chunk_results = await extract_entities(chunks, global_config)
+
+    checks = []
+    entity_upsert = rag.entities_vdb.upsert
+    relation_upsert = rag.relationships_vdb.upsert
+
+    async def checked_entity_upsert(data):
+        for item in data.values():
+            checks.append(("vector", await graph.has_node(item["entity_name"])))
+        await entity_upsert(data)
+
+    async def checked_relation_upsert(data):
+        for item in data.values():
+            checks.append(
+                ("vector", await graph.has_edge(item["src_id"], item["tgt_id"]))
+            )
+        await relation_upsert(data)
+
+    monkeypatch.setattr(rag.entities_vdb, "upsert", checked_entity_upsert)
+    monkeypatch.setattr(rag.relationships_vdb, "upsert", checked_relation_upsert)
+
+    keyed_lock = operate.get_storage_keyed_lock
+
+    class CheckedLock:
+        def __init__(self, keys, namespace, enable_logging):
+            self.keys = keys
+            self.lock = keyed_lock(keys, namespace, enable_logging)
+
+        async def __aenter__(self):
+            await self.lock.__aenter__()
+
+        async def __aexit__(self, *exc):
+            for key in self.keys:
+                checks.append(("release", await graph.has_node(key)))
+            await self.lock.__aexit__(*exc)
+
+    monkeypatch.setattr(operate, "get_storage_keyed_lock", CheckedLock)
+    try:
+        await merge_nodes_and_edges(
+            chunk_results=chunk_results,
+            knowledge_graph_inst=graph,
+            entity_vdb=rag.entities_vdb,
+            relationships_vdb=rag.relationships_vdb,
+            global_config=global_config,
+            pipeline_status={"history_messages": []},
+            pipeline_status_lock=asyncio.Lock(),
+        )
+    finally:
+        await rag.finalize_storages()
+
+    assert checks
+    assert all(stored for _, stored in checks)
+    assert await graph.has_edge("Alice", "Acme")
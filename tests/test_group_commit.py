@@ -0,0 +1,113 @@
+"""
+Unit tests for GroupCommit, the group commit helper of the document pipeline.
+"""
+
+import asyncio
+
+import pytest
+
+from lightrag.utils import GroupCommit
+
+
+class Recorder:
+    def __init__(self, fail_times: int = 0):
+        self.groups: list[list] = []
+        self.fail_times = fail_times
+
+    async def __call__(self, items: list) -> None:
+        if self.fail_times:
+            self.fail_times -= 1
+            raise RuntimeError("commit failed")
+        self.groups.append(list(items))
+
+
+@pytest.mark.asyncio
+async def test_count_trigger():
+    recorder = Recorder()
+    commit = GroupCommit(recorder, max_items=3)
+    await commit.add("a")
+    await commit.add("b")
+    assert recorder.groups == []
+    assert commit.pending_count == 2
+    await commit.add("c")
+    assert recorder.groups == [["a", "b", "c"]]
+    assert commit.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_byte_trigger():
+    recorder = Recorder()
+    commit = GroupCommit(recorder, max_items=100, max_bytes=10)
+    await commit.add("a", size=6)
+    assert recorder.groups == []
+    await commit.add("b", size=4)
+    assert recorder.groups == [["a", "b"]]
+
+
+@pytest.mark.asyncio
+async def test_interval_trigger():
+    recorder = Recorder()
+    commit = GroupCommit(recorder, max_items=100, max_delay=0.05)
+    await commit.add("a")
+    await commit.add("b")
+    assert recorder.groups == []
+    await asyncio.sleep(0.1)
+    assert recorder.groups == [["a", "b"]]
+    assert commit.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_explicit_and_forced_flush():
+    recorder = Recorder()
+    commit = GroupCommit(recorder, max_items=100, max_delay=10)
+    await commit.flush()
+    assert recorder.groups == []
+    await commit.flush(force=True)
+    assert recorder.groups == [[]]
+    await commit.add("a")
+    await commit.flush()
+    assert recorder.groups == [[], ["a"]]
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_items():
+    recorder = Recorder(fail_times=1)
+    commit = GroupCommit(recorder, max_items=2, max_bytes=100)
+    await commit.add("a", size=30)
+    # The error is only logged, it is not about the item being added
+    await commit.add("b", size=30)
+    # Items of the failed group stay pending, bytes included
+    assert commit.pending_count == 2
+
+    await commit.add("c", size=50)
+    assert recorder.groups == [["a", "b", "c"]]
+    assert commit.pending_count == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_items_ahead_of_new_ones():
+    started = asyncio.Event()
+    release = asyncio.Event()
+    groups = []
+    calls = 0
+
+    async def flush_func(items):
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            started.set()
+            await release.wait()
+            raise RuntimeError("commit failed")
+        groups.append(list(items))
+
+    commit = GroupCommit(flush_func, max_items=100)
+    await commit.add("a")
+    failing = asyncio.create_task(commit.flush())
+    await started.wait()
+    await commit.add("b")  # added while the failing flush is running
+    release.set()
+    with pytest.raises(RuntimeError):
+        await failing
+
+    await commit.flush()
+    assert groups == [["a", "b"]]
@@ -0,0 +1,158 @@
+"""
+Unit tests for incremental entity/relation description summaries.
+
+The stored description is kept as summary + pending fragments with the token
+counts of both parts in summary_state. Covers state parsing, detection of a
+state that no longer matches the description and the fold thresholds.
+"""
+
+import json
+
+import pytest
+
+from lightrag.operate import _incremental_entity_relation_summary, _parse_summary_state
+from lightrag.utils import Tokenizer
+
+SEP = "<SEP>"
+
+
+class WordTokenizer:
+    def encode(self, content: str) -> list[int]:
+        return list(range(len(content.split())))
+
+    def decode(self, tokens: list[int]) -> str:
+        return ""
+
+
+class SummaryLLM:
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self, prompt, **kwargs) -> str:
+        self.calls += 1
+        return f"summary {self.calls}"
+
+
+def make_config(llm, **overrides) -> dict:
+    config = {
+        "llm_model_func": llm,
+        "tokenizer": Tokenizer("word", WordTokenizer()),
+        "addon_params": {},
+        "summary_length_recommended": 100,
+        "summary_context_size": 1000,
+        "summary_max_tokens": 500,
+        "force_llm_summary_on_merge": 4,
+    }
+    config.update(overrides)
+    return config
+
+
+def make_state(fragments: list[str], **counts) -> str:
+    return json.dumps(
+        {
+            "summarized": counts.get("summarized", 0),
+            "summary_tokens": counts.get("summary_tokens", 0),
+            "pending_tokens": counts.get("pending_tokens", 0),
+            "fragments": len(fragments),
+            "chars": len(SEP.join(fragments)),
+        }
+    )
+
+
+async def merge(llm, already, state, new, **overrides):
+    return await _incremental_entity_relation_summary(
+        "Entity", "LightRAG", already, state, new, SEP, make_config(llm, **overrides)
+    )
+
+
+class TestParseSummaryState:
+    def test_valid_state(self):
+        fragments = ["summary", "pending one"]
+        state = make_state(fragments, summarized=3, summary_tokens=1, pending_tokens=2)
+        assert _parse_summary_state(state, fragments, SEP) == {
+            "summarized": 3,
+            "summary_tokens": 1,
+            "pending_tokens": 2,
+        }
+
+    @pytest.mark.parametrize(
+        "state", [None, "", "not json", "[1, 2]", json.dumps({"summarized": 1})]
+    )
+    def test_missing_or_malformed_state(self, state):
+        assert _parse_summary_state(state, ["a"], SEP) is None
+
+    def test_stale_state_is_ignored(self):
+        state = make_state(["summary", "pending"], summarized=2)
+        # Fragment added outside the incremental path
+        assert _parse_summary_state(state, ["summary", "pending", "x"], SEP) is None
+        # Description edited, same fragment count but different length
+        assert _parse_summary_state(state, ["summary", "edited text"], SEP) is None
+
+
+@pytest.mark.asyncio
+async def test_no_fold_below_thresholds():
+    llm = SummaryLLM()
+    description, llm_used, state = await merge(llm, ["one"], None, ["two"])
+    assert not llm_used
+    assert llm.calls == 0
+    assert description == f"one{SEP}two"
+    assert json.loads(state)["pending_tokens"] == 2
+
+
+@pytest.mark.asyncio
+async def test_fragment_count_fold_threshold_doubles():
+    llm = SummaryLLM()
+    description, llm_used, state = await merge(llm, [], None, ["a", "b", "c", "d"])
+    assert llm_used
+    assert description == "summary 1"
+    assert json.loads(state)["summarized"] == 4
+
+    # Four fragments are folded in, the next fold waits for four pending ones
+    already = [description]
+    for new in ["e", "f", "g"]:
+        description, llm_used, state = await merge(llm, already, state, [new])
+        assert not llm_used
+        already = description.split(SEP)
+    description, llm_used, state = await merge(llm, already, state, ["h"])
+    assert llm_used
+    assert json.loads(state)["summarized"] == 8
+    assert llm.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_pending_tokens_fold_threshold():
+    llm = SummaryLLM()
+    # Half of summary_context_size left next to the summary
+    long_fragment = " ".join(["word"] * 40)
+    _, llm_used, _ = await merge(
+        llm, ["one"], None, [long_fragment], summary_context_size=80
+    )
+    assert llm_used
+
+
+@pytest.mark.asyncio
+async def test_summary_max_tokens_fold_threshold():
+    llm = SummaryLLM()
+    summary = " ".join(["word"] * 8)
+    state = make_state([summary], summarized=10, summary_tokens=8)
+    # Fragment count and context budget are far away, the total size is not
+    description, llm_used, new_state = await merge(
+        llm, [summary], state, ["two more"], summary_max_tokens=10
+    )
+    assert llm_used
+    assert description == "summary 1"
+    assert json.loads(new_state)["summarized"] == 11
+
+    _, llm_used, _ = await merge(llm, [summary], state, ["one"], summary_max_tokens=10)
+    assert not llm_used
+
+
+@pytest.mark.asyncio
+async def test_stale_state_treats_description_as_pending():
+    llm = SummaryLLM()
+    state = make_state(["summary"], summarized=100, summary_tokens=1)
+    # The state no longer matches, so the stored fragments count as pending
+    # and the doubled threshold of 100 folded fragments does not apply
+    description, llm_used, new_state = await merge(llm, ["a", "b", "c"], state, ["d"])
+    assert llm_used
+    assert json.loads(new_state)["summarized"] == 4
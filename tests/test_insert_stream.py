@@ -0,0 +1,175 @@
+"""
+Unit tests for streaming document ingestion.
+
+Covers the backpressure of LightRAG.ainsert_stream, which pauses reading the
+input while too many of its documents wait for the pipeline, and parsing of
+NDJSON request bodies by iter_ndjson_texts.
+"""
+
+import asyncio
+import sys
+from unittest.mock import patch
+
+import pytest
+
+from lightrag import LightRAG
+from lightrag.base import DocStatus
+from lightrag.utils import compute_mdhash_id
+
+# The API config parses the command line on import
+with patch.object(sys, "argv", ["lightrag-server"]):
+    from lightrag.api.routers.document_routes import iter_ndjson_texts
+
+
+class FakePipeline:
+    """Stands in for the enqueue and processing stages and the doc storages"""
+
+    def __init__(self):
+        self.status: dict[str, DocStatus] = {}
+        self.enqueued: list[tuple[str, str, str]] = []
+        self.release = asyncio.Event()
+
+    async def enqueue(self, contents, ids=None, file_paths=None, track_id=None):
+        for content, doc_id, file_path in zip(contents, ids, file_paths):
+            self.status[doc_id] = DocStatus.PENDING
+            self.enqueued.append((doc_id, content, file_path))
+
+    async def process(self, *args, **kwargs):
+        await self.release.wait()
+        for doc_id in self.status:
+            self.status[doc_id] = DocStatus.PROCESSED
+
+    async def get_by_ids(self, ids):
+        return [
+            {"status": self.status[doc_id]} if doc_id in self.status else None
+            for doc_id in ids
+        ]
+
+
+@pytest.fixture
+def make_pipeline_rag(make_rag, monkeypatch):
+    def _make_rag(pipeline: FakePipeline, **kwargs) -> LightRAG:
+        rag = make_rag(**kwargs)
+        monkeypatch.setattr(rag, "apipeline_enqueue_documents", pipeline.enqueue)
+        monkeypatch.setattr(
+            rag, "apipeline_process_enqueue_documents", pipeline.process
+        )
+        monkeypatch.setattr(rag, "doc_status", pipeline)
+        return rag
+
+    return _make_rag
+
+
+@pytest.mark.asyncio
+async def test_reading_pauses_while_documents_are_in_flight(make_pipeline_rag):
+    pipeline = FakePipeline()
+    rag = make_pipeline_rag(
+        pipeline,
+        insert_stream_batch_size=2,
+        insert_stream_max_in_flight=4,
+    )
+    read = 0
+
+    async def documents():
+        nonlocal read
+        for i in range(10):
+            read += 1
+            yield f"document {i}"
+
+    insert = asyncio.create_task(rag.ainsert_stream(documents()))
+    await asyncio.sleep(0.2)
+    # Two batches are in flight, the third one is read but waits to be enqueued
+    assert len(pipeline.enqueued) == 4
+    assert read == 6
+    assert not insert.done()
+
+    pipeline.release.set()
+    await asyncio.wait_for(insert, timeout=10)
+    assert read == 10
+    assert len(pipeline.enqueued) == 10
+    assert set(pipeline.status.values()) == {DocStatus.PROCESSED}
+
+
+@pytest.mark.asyncio
+async def test_documents_ids_and_duplicates(make_pipeline_rag):
+    pipeline = FakePipeline()
+    pipeline.release.set()
+    rag = make_pipeline_rag(pipeline, insert_stream_batch_size=10)
+    await rag.ainsert_stream(
+        [
+            "plain text",
+            {"text": "with id", "id": "doc-custom", "file_source": "a.txt"},
+            {"content": "content key", "file_path": "b.txt"},
+            {"text": ""},
+            "plain text",
+        ],
+        wait_for_completion=False,
+    )
+    assert pipeline.enqueued == [
+        (
+            compute_mdhash_id("plain text", prefix="doc-"),
+            "plain text",
+            "unknown_source",
+        ),
+        ("doc-custom", "with id", "a.txt"),
+        (compute_mdhash_id("content key", prefix="doc-"), "content key", "b.txt"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_failing_input_keeps_documents_read(make_pipeline_rag):
+    pipeline = FakePipeline()
+    pipeline.release.set()
+    rag = make_pipeline_rag(pipeline, insert_stream_batch_size=10)
+
+    async def documents():
+        yield "first"
+        yield "second"
+        raise ValueError("broken input")
+
+    with pytest.raises(ValueError):
+        await rag.ainsert_stream(documents())
+    assert [content for _, content, _ in pipeline.enqueued] == ["first", "second"]
+
+
+class FakeRequest:
+    def __init__(self, parts: list[bytes]):
+        self._parts = parts
+
+    async def stream(self):
+        for part in self._parts:
+            yield part
+
+
+async def read_ndjson(parts: list[bytes]) -> list[dict]:
+    return [item async for item in iter_ndjson_texts(FakeRequest(parts))]
+
+
+@pytest.mark.asyncio
+async def test_ndjson_lines_split_across_reads():
+    items = await read_ndjson(
+        [
+            b'"first doc',
+            b'ument"\n\n{"text": " second ", "file_source": " b.txt ", "id": "d',
+            b'oc-2"}\n{"text": "last"}',
+        ]
+    )
+    assert items == [
+        {"text": "first document"},
+        {"text": "second", "file_source": "b.txt", "id": "doc-2"},
+        {"text": "last"},
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "body, message",
+    [
+        (b'"ok"\n{not json}\n', "Invalid JSON on line 2"),
+        (b'"ok"\n"ok"\n{"file_source": "a.txt"}', "Line 3 has no text"),
+        (b"[1, 2]\n", "Line 1 has no text"),
+    ],
+)
+async def test_ndjson_invalid_lines(body, message):
+    with pytest.raises(ValueError, match=message):
+        await read_ndjson([body])
@@ -0,0 +1,151 @@
+"""
+Unit tests for the lazy (on-disk, memory-mapped) mode of JsonKVStorage.
+
+Covers the _LazyJsonKVStore mapping operations, flushing and remapping after
+another process rewrote the file, and JsonKVStorage running on a lazy namespace.
+"""
+
+import pytest
+
+from lightrag.kg import json_kv_impl
+from lightrag.kg.json_kv_impl import JsonKVStorage, _LazyJsonKVStore
+from lightrag.kg.shared_storage import finalize_share_data, initialize_share_data
+from lightrag.utils import load_json, write_json
+
+
+@pytest.fixture
+def kv_file(tmp_path):
+    file_name = str(tmp_path / "kv_store_full_docs.json")
+    write_json(
+        {"doc-1": {"content": "one"}, "doc-2": {"content": "two"}},
+        file_name,
+    )
+    return file_name
+
+
+def open_store(file_name: str, cache_size: int = 2) -> _LazyJsonKVStore:
+    store = _LazyJsonKVStore(file_name, cache_size)
+    if not store.open():
+        store.rebuild(load_json(file_name) or {})
+        assert store.open()
+    return store
+
+
+class TestLazyJsonKVStore:
+    def test_get(self, kv_file):
+        store = open_store(kv_file)
+        assert store.get("doc-1") == {"content": "one"}
+        assert store.get("missing") is None
+        assert store.get("missing", {}) == {}
+        assert "doc-2" in store
+        assert len(store) == 2
+        assert store.keys() == {"doc-1", "doc-2"}
+        store.close()
+
+    def test_upsert_and_flush(self, kv_file):
+        store = open_store(kv_file)
+        store.update({"doc-2": {"content": "TWO"}, "doc-3": {"content": "three"}})
+        assert store.dirty
+        assert store.get("doc-2") == {"content": "TWO"}
+        assert len(store) == 3
+
+        assert store.flush() == 3
+        assert not store.dirty
+        # The file is plain JSON, readable by the eager mode
+        assert load_json(kv_file) == {
+            "doc-1": {"content": "one"},
+            "doc-2": {"content": "TWO"},
+            "doc-3": {"content": "three"},
+        }
+        store.close()
+
+        reopened = open_store(kv_file)
+        assert reopened.get("doc-3") == {"content": "three"}
+        reopened.close()
+
+    def test_delete(self, kv_file):
+        store = open_store(kv_file)
+        assert store.pop("doc-1", None) == {"content": "one"}
+        assert store.pop("doc-1", None) is None
+        assert store.pop("missing") is None
+        assert store.pop("missing", "default") == "default"
+        assert "doc-1" not in store
+        assert len(store) == 1
+
+        store.update({"doc-4": {"content": "four"}})
+        assert store.pop("doc-4") == {"content": "four"}
+        assert "doc-4" not in store
+
+        store.flush()
+        assert load_json(kv_file) == {"doc-2": {"content": "two"}}
+        store.close()
+
+    def test_reload_after_other_process_write(self, kv_file):
+        ours = open_store(kv_file)
+        theirs = open_store(kv_file)
+        # Warm the record cache so a stale decoded record would be noticed
+        assert ours.get("doc-1") == {"content": "one"}
+
+        ours.update({"doc-local": {"content": "local"}})
+        ours.pop("doc-2")
+
+        theirs.update({"doc-1": {"content": "ONE"}, "doc-5": {"content": "five"}})
+        theirs.flush()
+
+        ours.reload()
+        assert ours.get("doc-1") == {"content": "ONE"}
+        assert ours.get("doc-5") == {"content": "five"}
+        # Local pending changes survive the remap
+        assert ours.get("doc-local") == {"content": "local"}
+        assert "doc-2" not in ours
+
+        ours.flush()
+        assert load_json(kv_file) == {
+            "doc-1": {"content": "ONE"},
+            "doc-5": {"content": "five"},
+            "doc-local": {"content": "local"},
+        }
+        ours.close()
+        theirs.close()
+
+    def test_stale_index_is_rebuilt(self, kv_file):
+        store = open_store(kv_file)
+        store.close()
+        # Rewritten without the lazy store, the offset index no longer matches
+        write_json({"doc-9": {"content": "nine"}}, kv_file)
+        store = _LazyJsonKVStore(kv_file, 2)
+        assert not store.open()
+        store.reload()
+        assert store.get("doc-9") == {"content": "nine"}
+        store.close()
+
+
+@pytest.fixture
+def shared_data():
+    initialize_share_data()
+    yield
+    finalize_share_data()
+
+
+@pytest.mark.asyncio
+async def test_lazy_storage_get_upsert_delete(tmp_path, monkeypatch, shared_data):
+    monkeypatch.setattr(json_kv_impl, "JSON_KV_LAZY_NAMESPACES", {"full_docs"})
+    storage = JsonKVStorage(
+        namespace="full_docs",
+        workspace="",
+        global_config={"working_dir": str(tmp_path)},
+        embedding_func=None,
+    )
+    await storage.initialize()
+    assert isinstance(storage._data, _LazyJsonKVStore)
+
+    await storage.upsert({"doc-1": {"content": "one"}, "doc-2": {"content": "two"}})
+    await storage.index_done_callback()
+    assert (await storage.get_by_id("doc-1"))["content"] == "one"
+
+    await storage.delete(["doc-1", "missing"])
+    assert await storage.get_by_id("doc-1") is None
+    assert await storage.filter_keys({"doc-1", "doc-2"}) == {"doc-1"}
+
+    await storage.index_done_callback()
+    assert set(load_json(storage._file_name)) == {"doc-2"}
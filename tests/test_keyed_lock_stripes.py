@@ -0,0 +1,219 @@
+"""
+Unit tests for striped keyed locks in multi-process mode.
+
+Keys are hashed onto lock stripes reserved in the Manager served lock table.
+Covers contention between coroutines and with other processes, cancellation
+while waiting, nested locks and child tasks whose stripes collide with a stripe
+already held, and the grouped lock acquisition of the merge stage.
+"""
+
+import asyncio
+
+import pytest
+
+from lightrag.kg import shared_storage
+from lightrag.kg.shared_storage import (
+    finalize_share_data,
+    get_storage_keyed_lock,
+    initialize_share_data,
+)
+
+
+@pytest.fixture
+def multiprocess_shared_data():
+    initialize_share_data(workers=2)
+    yield
+    finalize_share_data()
+
+
+def held_stripes() -> int:
+    return shared_storage._keyed_lock_table.held_count()
+
+
+@pytest.mark.asyncio
+async def test_contended_key_is_serialized(multiprocess_shared_data):
+    events = []
+    first_holds = asyncio.Event()
+
+    async def first():
+        async with get_storage_keyed_lock(["entity-a"], namespace="GraphDB"):
+            events.append("first acquired")
+            first_holds.set()
+            await asyncio.sleep(0.05)
+            events.append("first released")
+
+    async def second():
+        await first_holds.wait()
+        async with get_storage_keyed_lock(
+            ["entity-a", "entity-b"], namespace="GraphDB"
+        ):
+            events.append("second acquired")
+
+    await asyncio.wait_for(asyncio.gather(first(), second()), timeout=5)
+    assert events == ["first acquired", "first released", "second acquired"]
+    assert held_stripes() == 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_while_waiting_releases_nothing_held(multiprocess_shared_data):
+    holder_ready = asyncio.Event()
+    release_holder = asyncio.Event()
+
+    async def holder():
+        async with get_storage_keyed_lock(["entity-a"], namespace="GraphDB"):
+            holder_ready.set()
+            await release_holder.wait()
+
+    async def waiter():
+        async with get_storage_keyed_lock(["entity-a"], namespace="GraphDB"):
+            pytest.fail("waiter must not acquire a held key")
+
+    holder_task = asyncio.create_task(holder())
+    await holder_ready.wait()
+    waiter_task = asyncio.create_task(waiter())
+    await asyncio.sleep(0.02)
+    waiter_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter_task
+
+    release_holder.set()
+    await holder_task
+    assert held_stripes() == 0
+
+    # The key is free again after the cancelled wait
+    async with get_storage_keyed_lock(["entity-a"], namespace="GraphDB"):
+        assert held_stripes() == 1
+    assert held_stripes() == 0
+
+
+@pytest.mark.asyncio
+async def test_nested_lock_on_colliding_stripe(multiprocess_shared_data, monkeypatch):
+    # A single stripe makes every key of every namespace collide
+    monkeypatch.setattr(shared_storage, "KEYED_LOCK_STRIPES", 1)
+
+    async def nested():
+        async with get_storage_keyed_lock(["a->b"], namespace="relation"):
+            async with get_storage_keyed_lock(["a"], namespace="entity"):
+                assert held_stripes() == 1
+            # Leaving the inner lock keeps the stripe of the outer one
+            assert held_stripes() == 1
+
+    await asyncio.wait_for(nested(), timeout=5)
+    assert held_stripes() == 0
+
+
+@pytest.mark.asyncio
+async def test_colliding_stripe_only_excludes_the_same_key(
+    multiprocess_shared_data, monkeypatch
+):
+    monkeypatch.setattr(shared_storage, "KEYED_LOCK_STRIPES", 1)
+    events = []
+    outer_holds = asyncio.Event()
+
+    async def outer():
+        async with get_storage_keyed_lock(["a", "b"], namespace="entity"):
+            outer_holds.set()
+            await asyncio.sleep(0.05)
+            events.append("outer released")
+
+    async def other_key():
+        await outer_holds.wait()
+        async with get_storage_keyed_lock(["c"], namespace="entity"):
+            events.append("other key acquired")
+
+    async def same_key():
+        await outer_holds.wait()
+        async with get_storage_keyed_lock(["b"], namespace="entity"):
+            events.append("same key acquired")
+
+    await asyncio.wait_for(asyncio.gather(outer(), other_key(), same_key()), 5)
+    assert events == ["other key acquired", "outer released", "same key acquired"]
+    assert held_stripes() == 0
+
+
+@pytest.mark.asyncio
+async def test_child_task_on_colliding_stripe(multiprocess_shared_data, monkeypatch):
+    monkeypatch.setattr(shared_storage, "KEYED_LOCK_STRIPES", 1)
+
+    async def child(key):
+        async with get_storage_keyed_lock([key], namespace="data_init"):
+            return key
+
+    async def parent():
+        async with get_storage_keyed_lock(["a", "b"], namespace="GraphDB"):
+            # Children awaited by the holder lock other keys on the same stripe
+            return await asyncio.gather(child("x"), child("y"))
+
+    assert await asyncio.wait_for(parent(), timeout=5) == ["x", "y"]
+    assert held_stripes() == 0
+
+
+@pytest.mark.asyncio
+async def test_stripe_held_by_other_process(multiprocess_shared_data, monkeypatch):
+    monkeypatch.setattr(shared_storage, "KEYED_LOCK_STRIPES", 1)
+    other_process = -1
+    table = shared_storage._keyed_lock_table
+    assert table.acquire([0], other_process, False)
+
+    acquired = asyncio.Event()
+
+    async def waiter():
+        async with get_storage_keyed_lock(["a"], namespace="GraphDB"):
+            acquired.set()
+
+    waiter_task = asyncio.create_task(waiter())
+    await asyncio.sleep(0.05)
+    assert not acquired.is_set()
+
+    table.release([0], other_process)
+    await asyncio.wait_for(waiter_task, timeout=5)
+    assert acquired.is_set()
+    assert held_stripes() == 0
+
+
+@pytest.mark.asyncio
+async def test_groups_lock_their_keys_in_one_call(monkeypatch):
+    from lightrag import operate
+
+    lock_calls = []
+    events = []
+
+    class RecordingLock:
+        def __init__(self, keys):
+            self.keys = keys
+
+        async def __aenter__(self):
+            lock_calls.append(self.keys)
+            events.append("locked")
+
+        async def __aexit__(self, *exc):
+            events.append("released")
+
+    monkeypatch.setattr(
+        operate,
+        "get_storage_keyed_lock",
+        lambda keys, namespace, enable_logging: RecordingLock(keys),
+    )
+
+    async def worker(item):
+        if item == ("c", "d"):
+            raise ValueError("merge failed")
+        return item
+
+    async def before_release():
+        events.append("flushed")
+
+    results, error = await operate._run_in_locked_groups(
+        [("b", "a"), ("a", "c"), ("c", "d"), ("e", "f")],
+        lambda item: sorted(item),
+        worker,
+        "GraphDB",
+        2,
+        before_release,
+    )
+    assert lock_calls == [["a", "b", "c"], ["c", "d", "e", "f"]]
+    # Writes are flushed before each group's keys are released
+    assert events == ["locked", "flushed", "released"] * 2
+    assert isinstance(error, ValueError)
+    assert ("b", "a") in results and ("a", "c") in results
+    assert ("c", "d") not in results
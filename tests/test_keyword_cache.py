@@ -0,0 +1,151 @@
+"""
+Unit tests for KeywordCache, the in-memory query keyword cache.
+
+Covers key normalization, TTL expiry, LRU eviction, sharing of concurrent
+extractions of the same query and batched extraction under load.
+"""
+
+import asyncio
+
+import pytest
+
+from lightrag.operate import KeywordCache
+
+
+class TestKeywordCacheEntries:
+    def test_key_ignores_case_and_whitespace(self):
+        assert KeywordCache.make_key(
+            "What  is\tLightRAG?", "English"
+        ) == KeywordCache.make_key("what is lightrag?", "English")
+        assert KeywordCache.make_key("query", "English") != KeywordCache.make_key(
+            "query", "Chinese"
+        )
+
+    def test_get_returns_copies(self):
+        cache = KeywordCache(max_size=10, ttl=0)
+        cache.put("k", ["high"], ["low"])
+        hl_keywords, ll_keywords = cache.get("k")
+        hl_keywords.append("mutated")
+        assert cache.get("k") == (["high"], ["low"])
+        assert cache.get("missing") is None
+        stats = cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+
+    def test_ttl_expiry(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("lightrag.operate.time.monotonic", lambda: now[0])
+        cache = KeywordCache(max_size=10, ttl=60)
+        cache.put("k", ["high"], ["low"])
+        now[0] += 59
+        assert cache.get("k") is not None
+        now[0] += 1
+        assert cache.get("k") is None
+        assert cache.stats()["expired"] == 1
+
+    def test_lru_eviction(self):
+        cache = KeywordCache(max_size=2, ttl=0)
+        cache.put("a", ["a"], [])
+        cache.put("b", ["b"], [])
+        assert cache.get("a") is not None  # "b" is now least recently used
+        cache.put("c", ["c"], [])
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.stats()["evictions"] == 1
+
+    def test_disabled_cache(self):
+        cache = KeywordCache(max_size=0)
+        cache.put("k", ["high"], ["low"])
+        assert cache.get("k") is None
+        assert cache.stats()["size"] == 0
+
+
+@pytest.mark.asyncio
+async def test_concurrent_extractions_share_one_call():
+    cache = KeywordCache(max_size=10, ttl=0)
+    calls = 0
+
+    async def extract():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return ["high"], ["low"]
+
+    results = await asyncio.gather(
+        *(cache.extract_once("k", extract) for _ in range(3))
+    )
+    assert calls == 1
+    assert all(result == (["high"], ["low"]) for result in results)
+    assert cache.get("k") == (["high"], ["low"])
+    assert cache.stats()["shared"] == 2
+
+
+@pytest.mark.asyncio
+async def test_empty_result_is_not_cached():
+    cache = KeywordCache(max_size=10, ttl=0)
+
+    async def extract():
+        return [], []
+
+    assert await cache.extract_once("k", extract) == ([], [])
+    assert cache.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_batched_extraction_under_load():
+    cache = KeywordCache(max_size=10, batch_size=4, batch_wait=0.01, max_inflight=1)
+    single_started = asyncio.Event()
+    release_single = asyncio.Event()
+    batches = []
+
+    async def extract_single(query):
+        single_started.set()
+        await release_single.wait()
+        return [f"hl-{query}"], []
+
+    async def extract_batch(queries):
+        batches.append(list(queries))
+        return [([f"hl-{query}"], []) for query in queries]
+
+    # The first call takes the only LLM slot, the next ones are batched together
+    first = asyncio.create_task(cache.run_llm("q0", extract_single, extract_batch))
+    await single_started.wait()
+    batched = await asyncio.gather(
+        *(cache.run_llm(f"q{i}", extract_single, extract_batch) for i in (1, 2, 3))
+    )
+    release_single.set()
+
+    assert await first == (["hl-q0"], [])
+    assert batched == [(["hl-q1"], []), (["hl-q2"], []), (["hl-q3"], [])]
+    assert batches == [["q1", "q2", "q3"]]
+    stats = cache.stats()
+    assert stats["batch_calls"] == 1
+    assert stats["batched_queries"] == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_falls_back_to_single_calls():
+    cache = KeywordCache(max_size=10, batch_size=4, batch_wait=0.01, max_inflight=1)
+    release_first = asyncio.Event()
+    single_queries = []
+
+    async def extract_single(query):
+        single_queries.append(query)
+        if query == "q0":
+            await release_first.wait()
+        return [f"hl-{query}"], []
+
+    async def extract_batch(queries):
+        raise RuntimeError("batch call failed")
+
+    first = asyncio.create_task(cache.run_llm("q0", extract_single, extract_batch))
+    await asyncio.sleep(0)
+    results = await asyncio.gather(
+        *(cache.run_llm(f"q{i}", extract_single, extract_batch) for i in (1, 2))
+    )
+    release_first.set()
+    await first
+
+    assert results == [(["hl-q1"], []), (["hl-q2"], [])]
+    assert sorted(single_queries) == ["q0", "q1", "q2"]
@@ -0,0 +1,93 @@
+"""
+Unit tests for shared-memory namespace snapshots in shared_storage.
+
+Snapshots are published through the Manager backed registry in multiprocess mode
+and must be invalidated by a data version bump; in single process mode they are
+disabled and reads go through the namespace dict.
+"""
+
+import pytest
+
+from lightrag.kg.shared_storage import (
+    finalize_share_data,
+    get_namespace_snapshot,
+    get_update_flag,
+    initialize_share_data,
+    publish_namespace_snapshot,
+    register_namespace_snapshot,
+    set_all_update_flags,
+)
+
+NAMESPACE = "test_snapshot_docs"
+
+
+@pytest.fixture
+def multiprocess_shared_data():
+    initialize_share_data(workers=2)
+    yield
+    finalize_share_data()
+
+
+@pytest.fixture
+def single_process_shared_data():
+    initialize_share_data(workers=1)
+    yield
+    finalize_share_data()
+
+
+@pytest.mark.asyncio
+async def test_publish_and_get(multiprocess_shared_data):
+    assert await register_namespace_snapshot(NAMESPACE)
+    await get_update_flag(NAMESPACE)
+    # Nothing published yet
+    assert get_namespace_snapshot(NAMESPACE) is None
+
+    assert await publish_namespace_snapshot(
+        NAMESPACE, {"doc-1": {"content": "one"}, "doc-2": {"content": "two"}}
+    )
+    snapshot = get_namespace_snapshot(NAMESPACE)
+    assert snapshot is not None
+    assert len(snapshot) == 2
+    assert "doc-1" in snapshot
+    assert snapshot.get("doc-2") == {"content": "two"}
+    assert snapshot.get("missing") is None
+    snapshot.close()
+
+
+@pytest.mark.asyncio
+async def test_current_snapshot_is_reused(multiprocess_shared_data):
+    await register_namespace_snapshot(NAMESPACE)
+    await get_update_flag(NAMESPACE)
+    await publish_namespace_snapshot(NAMESPACE, {"doc-1": {"content": "one"}})
+
+    snapshot = get_namespace_snapshot(NAMESPACE)
+    # Same data version, the mapped snapshot is kept without attaching again
+    assert get_namespace_snapshot(NAMESPACE, snapshot) is snapshot
+    snapshot.close()
+
+
+@pytest.mark.asyncio
+async def test_version_bump_invalidates_snapshot(multiprocess_shared_data):
+    await register_namespace_snapshot(NAMESPACE)
+    await get_update_flag(NAMESPACE)
+    await publish_namespace_snapshot(NAMESPACE, {"doc-1": {"content": "one"}})
+    snapshot = get_namespace_snapshot(NAMESPACE)
+    first_version = snapshot.version
+
+    # A write bumps the data version, the stale snapshot must not be served
+    await set_all_update_flags(NAMESPACE)
+    assert get_namespace_snapshot(NAMESPACE, snapshot) is None
+
+    await publish_namespace_snapshot(NAMESPACE, {"doc-1": {"content": "ONE"}})
+    fresh = get_namespace_snapshot(NAMESPACE)
+    assert fresh is not None
+    assert fresh.version > first_version
+    assert fresh.get("doc-1") == {"content": "ONE"}
+    fresh.close()
+
+
+@pytest.mark.asyncio
+async def test_snapshots_disabled_in_single_process(single_process_shared_data):
+    assert not await register_namespace_snapshot(NAMESPACE)
+    assert not await publish_namespace_snapshot(NAMESPACE, {"doc-1": {}})
+    assert get_namespace_snapshot(NAMESPACE) is None
@@ -0,0 +1,192 @@
+"""
+Unit tests for provider prompt caching support.
+
+The entity extraction system prompt must not depend on the chunk so that every
+extraction request shares a cacheable prefix, and cached prompt tokens reported
+by OpenAI and Anthropic must reach the TokenTracker.
+"""
+
+from dataclasses import asdict
+from types import SimpleNamespace
+
+import pytest
+
+from lightrag.operate import extract_entities
+from lightrag.prompt import PROMPTS
+from lightrag.utils import TokenTracker
+
+
+def test_chunk_text_is_only_in_user_prompt():
+    assert "{input_text}" not in PROMPTS["entity_extraction_system_prompt"]
+    assert "{input_text}" in PROMPTS["entity_extraction_user_prompt"]
+
+
+@pytest.mark.asyncio
+async def test_extraction_requests_share_system_prompt(make_rag):
+    calls = []
+
+    async def recording_llm(prompt, system_prompt=None, **kwargs):
+        calls.append((prompt, system_prompt))
+        return PROMPTS["DEFAULT_COMPLETION_DELIMITER"]
+
+    rag = make_rag(entity_extract_max_gleaning=1)
+    global_config = asdict(rag)
+    global_config["llm_model_func"] = recording_llm
+    chunks = {
+        "chunk-1": {"content": "Alice works at Acme.", "tokens": 5},
+        "chunk-2": {"content": "Bob founded Initech.", "tokens": 5},
+    }
+    await extract_entities(chunks, global_config)
+
+    # Initial extraction and gleaning for both chunks
+    assert len(calls) == 4
+    system_prompts = {system_prompt for _, system_prompt in calls}
+    assert len(system_prompts) == 1
+    system_prompt = system_prompts.pop()
+    assert "Alice" not in system_prompt and "Bob" not in system_prompt
+    assert any("Alice works at Acme." in prompt for prompt, _ in calls)
+
+
+class TestOpenAIUsage:
+    def test_cached_tokens_are_reported(self):
+        from lightrag.llm.openai import _usage_to_token_counts
+
+        usage = SimpleNamespace(
+            prompt_tokens=1200,
+            completion_tokens=80,
+            total_tokens=1280,
+            prompt_tokens_details=SimpleNamespace(cached_tokens=1024),
+        )
+        assert _usage_to_token_counts(usage) == {
+            "prompt_tokens": 1200,
+            "completion_tokens": 80,
+            "total_tokens": 1280,
+            "cached_tokens": 1024,
+        }
+
+    @pytest.mark.parametrize(
+        "details", [None, SimpleNamespace(cached_tokens=None), SimpleNamespace()]
+    )
+    def test_missing_cache_details(self, details):
+        from lightrag.llm.openai import _usage_to_token_counts
+
+        usage = SimpleNamespace(
+            prompt_tokens=10,
+            completion_tokens=5,
+            total_tokens=15,
+            prompt_tokens_details=details,
+        )
+        assert _usage_to_token_counts(usage)["cached_tokens"] == 0
+
+
+class FakeAnthropicStream:
+    def __init__(self, events):
+        self._events = iter(events)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._events)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+@pytest.mark.asyncio
+async def test_anthropic_usage_and_system_prompt(monkeypatch):
+    pytest.importorskip("anthropic")
+    pytest.importorskip("voyageai")
+    from lightrag.llm import anthropic as anthropic_llm
+
+    requests = []
+    events = [
+        SimpleNamespace(
+            type="message_start",
+            message=SimpleNamespace(
+                usage=SimpleNamespace(
+                    input_tokens=20,
+                    cache_read_input_tokens=1000,
+                    cache_creation_input_tokens=0,
+                    output_tokens=1,
+                )
+            ),
+        ),
+        SimpleNamespace(
+            type="content_block_delta", delta=SimpleNamespace(text="entities")
+        ),
+        SimpleNamespace(
+            type="message_delta",
+            delta=SimpleNamespace(text=None),
+            usage=SimpleNamespace(output_tokens=42),
+        ),
+    ]
+
+    class FakeMessages:
+        async def create(self, **kwargs):
+            requests.append(kwargs)
+            return FakeAnthropicStream(events)
+
+    class FakeAsyncAnthropic:
+        def __init__(self, **kwargs):
+            self.messages = FakeMessages()
+
+    monkeypatch.setattr(anthropic_llm, "AsyncAnthropic", FakeAsyncAnthropic)
+    tracker = TokenTracker()
+    stream = await anthropic_llm.anthropic_complete_if_cache(
+        "claude-model",
+        "user prompt",
+        system_prompt="system prompt",
+        api_key="test",
+        token_tracker=tracker,
+    )
+    assert "".join([chunk async for chunk in stream]) == "entities"
+
+    request = requests[0]
+    assert request["system"] == [
+        {
+            "type": "text",
+            "text": "system prompt",
+            "cache_control": {"type": "ephemeral"},
+        }
+    ]
+    assert request["messages"] == [{"role": "user", "content": "user prompt"}]
+    assert tracker.get_usage() == {
+        "prompt_tokens": 1020,
+        "completion_tokens": 42,
+        "total_tokens": 1062,
+        "cached_tokens": 1000,
+        "cache_creation_tokens": 0,
+        "call_count": 1,
+    }
+
+
+def test_token_tracker_accumulates_cache_counts():
+    tracker = TokenTracker()
+    tracker.add_usage(
+        {
+            "prompt_tokens": 100,
+            "completion_tokens": 10,
+            "cached_tokens": 0,
+            "cache_creation_tokens": 90,
+        }
+    )
+    tracker.add_usage(
+        {
+            "prompt_tokens": 100,
+            "completion_tokens": 10,
+            "total_tokens": 110,
+            "cached_tokens": 90,
+        }
+    )
+    # Providers without prompt caching leave the fields out or set them to None
+    tracker.add_usage(
+        {"prompt_tokens": 5, "completion_tokens": 5, "cached_tokens": None}
+    )
+    usage = tracker.get_usage()
+    assert usage["total_tokens"] == 230
+    assert usage["cached_tokens"] == 90
+    assert usage["cache_creation_tokens"] == 90
+    assert usage["call_count"] == 3
+    tracker.reset()
+    assert tracker.get_usage()["cached_tokens"] == 0
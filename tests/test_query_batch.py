@@ -0,0 +1,120 @@
+"""
+Unit tests for LightRAG.aquery_batch against a fake LLM.
+
+Covers answering each query as soon as its own keywords are ready, sharing
+keyword extraction and embeddings across the batch, and stopping the remaining
+work when the consumer leaves early.
+"""
+
+import asyncio
+import json
+
+import numpy as np
+import pytest
+import pytest_asyncio
+
+from lightrag import QueryParam
+from lightrag.utils import EmbeddingFunc
+
+
+class FakeLLM:
+    """Answers keyword extraction prompts, blocking those of slow queries"""
+
+    def __init__(self):
+        self.release_slow = asyncio.Event()
+        self.keyword_prompts: list[str] = []
+        self.cancelled = 0
+
+    async def __call__(self, prompt, system_prompt=None, **kwargs) -> str:
+        if not kwargs.get("keyword_extraction"):
+            return "answer"
+        self.keyword_prompts.append(prompt)
+        if "slow" in prompt:
+            try:
+                await self.release_slow.wait()
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+        return json.dumps(
+            {"high_level_keywords": ["topic"], "low_level_keywords": ["detail"]}
+        )
+
+
+class RecordingEmbedding:
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    async def __call__(self, texts: list[str]) -> np.ndarray:
+        self.calls.append(list(texts))
+        return np.ones((len(texts), 8))
+
+
+@pytest_asyncio.fixture
+async def rag(make_rag, shared_data):
+    llm = FakeLLM()
+    embedding = RecordingEmbedding()
+
+    # Plain functions, the query config is a deep copy of the LightRAG fields
+    async def llm_func(*args, **kwargs):
+        return await llm(*args, **kwargs)
+
+    async def embedding_func(texts):
+        return await embedding(texts)
+
+    rag = make_rag(
+        embedding_func=EmbeddingFunc(embedding_dim=8, func=embedding_func),
+        enable_llm_cache=False,
+    )
+    # Bypasses the priority queue, whose workers finish calls of cancelled callers
+    rag.llm_model_func = llm_func
+    await rag.initialize_storages()
+    # A non-empty graph keeps the queries in their keyword based modes
+    await rag.chunk_entity_relation_graph.upsert_node(
+        "Alice", {"entity_id": "Alice", "description": "Alice", "entity_type": "person"}
+    )
+    rag.fake_llm = llm
+    rag.fake_embedding = embedding
+    yield rag
+    llm.release_slow.set()
+    await rag.finalize_storages()
+
+
+def param() -> QueryParam:
+    return QueryParam(mode="hybrid", enable_rerank=False)
+
+
+@pytest.mark.asyncio
+async def test_query_is_answered_before_slower_keywords_resolve(rag):
+    results = rag.aquery_batch([("slow question", param()), ("fast question", param())])
+    index, _ = await asyncio.wait_for(anext(results), timeout=5)
+    assert index == 1
+    assert not rag.fake_llm.release_slow.is_set()
+
+    rag.fake_llm.release_slow.set()
+    index, _ = await asyncio.wait_for(anext(results), timeout=5)
+    assert index == 0
+    await results.aclose()
+
+
+@pytest.mark.asyncio
+async def test_keywords_and_embeddings_are_shared(rag):
+    rag.fake_llm.release_slow.set()
+    queries = [("same question", param()) for _ in range(3)]
+    results = [result async for result in rag.aquery_batch(queries)]
+    assert sorted(index for index, _ in results) == [0, 1, 2]
+    assert len(rag.fake_llm.keyword_prompts) == 1
+
+    embedded = [text for call in rag.fake_embedding.calls for text in call]
+    assert "same question" in embedded
+    assert len(embedded) == len(set(embedded))
+
+
+@pytest.mark.asyncio
+async def test_closing_early_stops_remaining_work(rag):
+    results = rag.aquery_batch([("fast question", param()), ("slow question", param())])
+    index, _ = await asyncio.wait_for(anext(results), timeout=5)
+    assert index == 0
+
+    await results.aclose()
+    # The slow keyword extraction was cancelled and awaited before aclose returned
+    assert rag.fake_llm.cancelled == 1
@@ -0,0 +1,206 @@
+"""
+Unit tests for RerankCache, the in-memory rerank score cache.
+
+Covers TTL expiry, LRU eviction, coalescing of concurrent reranks of the same
+query, sharing of documents already being scored, the fallback for rerank
+functions without index based results and empty rerank results.
+"""
+
+import asyncio
+
+import pytest
+
+from lightrag.utils import RerankCache, apply_rerank_if_enabled
+
+
+class FakeReranker:
+    """Scores documents by length, optionally blocking until released"""
+
+    def __init__(self, results=None):
+        self.calls: list[list[str]] = []
+        self.results = results
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, query, documents, top_n=None):
+        self.calls.append(list(documents))
+        self.started.set()
+        await self.release.wait()
+        if self.results is not None:
+            return self.results
+        return [
+            {"index": i, "relevance_score": float(len(doc))}
+            for i, doc in enumerate(documents)
+        ]
+
+
+class TestRerankCacheEntries:
+    def test_query_key_ignores_case_and_whitespace(self):
+        assert RerankCache.make_query_key(
+            "model", "What  is LightRAG?"
+        ) == RerankCache.make_query_key("model", "what is lightrag?")
+        assert RerankCache.make_query_key("a", "q") != RerankCache.make_query_key(
+            "b", "q"
+        )
+
+    def test_ttl_expiry(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("lightrag.utils.time.monotonic", lambda: now[0])
+        cache = RerankCache(max_size=10, ttl=60)
+        cache.put("k", 0.5)
+        now[0] += 59
+        assert cache.get("k") == 0.5
+        now[0] += 1
+        assert cache.get("k") is None
+        assert cache.stats()["expired"] == 1
+
+    def test_lru_eviction(self):
+        cache = RerankCache(max_size=2, ttl=0)
+        cache.put("a", 1.0)
+        cache.put("b", 2.0)
+        assert cache.get("a") == 1.0  # "b" is now least recently used
+        cache.put("c", 3.0)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1.0
+        assert cache.stats()["evictions"] == 1
+
+    def test_disabled_cache(self):
+        cache = RerankCache(max_size=0)
+        assert not cache.enabled
+        cache.put("k", 1.0)
+        assert cache.get("k") is None
+
+
+@pytest.mark.asyncio
+async def test_only_uncached_documents_are_reranked():
+    cache = RerankCache(max_size=100, ttl=0, batch_wait=0)
+    reranker = FakeReranker()
+    assert await cache.score(reranker, "m", "q", ["a", "bb"], ["c1", "c2"]) == [
+        1.0,
+        2.0,
+    ]
+    assert await cache.score(
+        reranker, "m", "q", ["bb", "ccc", "a"], ["c2", "c3", "c1"]
+    ) == [2.0, 3.0, 1.0]
+    assert reranker.calls == [["a", "bb"], ["ccc"]]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_reranks_are_coalesced():
+    cache = RerankCache(max_size=100, ttl=0, batch_size=10, batch_wait=0.01)
+    reranker = FakeReranker()
+    first, second = await asyncio.gather(
+        cache.score(reranker, "m", "q", ["a", "bb"], ["c1", "c2"]),
+        cache.score(reranker, "m", "Q ", ["ccc", "a"], ["c3", "c1"]),
+    )
+    assert first == [1.0, 2.0]
+    assert second == [3.0, 1.0]
+    assert reranker.calls == [["a", "bb", "ccc"]]
+    assert cache.stats()["rerank_calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_documents_in_flight_are_shared():
+    cache = RerankCache(max_size=100, ttl=0, batch_size=10, batch_wait=0)
+    reranker = FakeReranker()
+    reranker.release.clear()
+    first = asyncio.create_task(
+        cache.score(reranker, "m", "q", ["a", "bb"], ["c1", "c2"])
+    )
+    await reranker.started.wait()
+
+    # c2 is being scored by the running call, only c3 is sent again
+    second = asyncio.create_task(
+        cache.score(reranker, "m", "q", ["bb", "ccc"], ["c2", "c3"])
+    )
+    await asyncio.sleep(0.01)
+    reranker.release.set()
+    assert await first == [1.0, 2.0]
+    assert await second == [2.0, 3.0]
+    assert reranker.calls == [["a", "bb"], ["ccc"]]
+    assert cache.stats()["shared"] == 1
+
+
+@pytest.mark.asyncio
+async def test_rerank_errors_reach_every_waiter():
+    cache = RerankCache(max_size=100, ttl=0, batch_wait=0.01)
+
+    async def failing_reranker(query, documents, top_n=None):
+        raise RuntimeError("rerank failed")
+
+    results = await asyncio.gather(
+        cache.score(failing_reranker, "m", "q", ["a"], ["c1"]),
+        cache.score(failing_reranker, "m", "q", ["bb"], ["c2"]),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert cache.stats()["size"] == 0
+
+
+def rerank_config(reranker) -> dict:
+    return {
+        "rerank_model_func": reranker,
+        "rerank_cache": RerankCache(max_size=100, ttl=0, batch_wait=0),
+    }
+
+
+DOCS = [
+    {"chunk_id": "c1", "content": "a"},
+    {"chunk_id": "c2", "content": "ccc"},
+    {"chunk_id": "c3", "content": "bb"},
+]
+
+
+@pytest.mark.asyncio
+async def test_apply_rerank_with_cache():
+    reranker = FakeReranker()
+    config = rerank_config(reranker)
+    reranked = await apply_rerank_if_enabled("q", DOCS, config, top_n=2)
+    assert [doc["chunk_id"] for doc in reranked] == ["c2", "c3"]
+    assert [doc["rerank_score"] for doc in reranked] == [3.0, 2.0]
+
+    await apply_rerank_if_enabled("q", DOCS, config, top_n=2)
+    assert len(reranker.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_results_without_index_fall_back_to_uncached_rerank():
+    legacy_results = [{"content": "ccc"}, {"content": "a"}]
+    reranker = FakeReranker(results=legacy_results)
+    config = rerank_config(reranker)
+    assert await apply_rerank_if_enabled("q", DOCS, config) == legacy_results
+    # The cache is bypassed for this reranker from now on
+    assert await apply_rerank_if_enabled("q", DOCS, config) == legacy_results
+    assert len(reranker.calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_empty_results_are_not_retried_without_cache():
+    reranker = FakeReranker(results=[])
+    config = rerank_config(reranker)
+    assert await apply_rerank_if_enabled("q", DOCS, config) == DOCS
+    assert len(reranker.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_rerank_session_is_closed_by_the_last_instance(make_rag, shared_data):
+    from lightrag.rerank import _get_session
+
+    first = make_rag(rerank_model_func=FakeReranker())
+    second = make_rag(rerank_model_func=FakeReranker())
+    await first.initialize_storages()
+    await second.initialize_storages()
+    session = _get_session()
+
+    await first.finalize_storages()
+    # Still used by the other instance
+    assert not session.closed
+    assert _get_session() is session
+
+    await second.finalize_storages()
+    assert session.closed
+    # A new session is opened on the next use
+    next_session = _get_session()
+    assert next_session is not session
+    await next_session.close()
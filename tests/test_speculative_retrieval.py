@@ -0,0 +1,137 @@
+"""
+Unit tests for speculative retrieval in kg_query.
+
+Speculation must not change the query context, and its task must be stopped
+when the query ends before retrieval.
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+
+from lightrag import QueryParam
+from lightrag.prompt import PROMPTS
+
+CHUNKS = {
+    "chunk-1": {
+        "content": "Alice works at Acme.",
+        "full_doc_id": "doc-1",
+        "tokens": 5,
+        "chunk_order_index": 0,
+        "file_path": "a.txt",
+    },
+    # Only found by the chunk vector search of mix mode
+    "chunk-2": {
+        "content": "Acme sells anvils.",
+        "full_doc_id": "doc-1",
+        "tokens": 4,
+        "chunk_order_index": 1,
+        "file_path": "a.txt",
+    },
+}
+
+
+@pytest_asyncio.fixture
+async def rag(make_rag, shared_data):
+    rag = make_rag(enable_llm_cache=False)
+    await rag.initialize_storages()
+    graph = rag.chunk_entity_relation_graph
+    for name, entity_type in (("Alice", "person"), ("Acme", "organization")):
+        await graph.upsert_node(
+            name,
+            {
+                "entity_id": name,
+                "entity_type": entity_type,
+                "description": f"{name} description",
+                "source_id": "chunk-1",
+                "file_path": "a.txt",
+            },
+        )
+        await rag.entities_vdb.upsert(
+            {
+                f"ent-{name}": {
+                    "entity_name": name,
+                    "content": f"{name}\n{name} description",
+                    "source_id": "chunk-1",
+                    "file_path": "a.txt",
+                }
+            }
+        )
+    await graph.upsert_edge(
+        "Alice",
+        "Acme",
+        {
+            "description": "Alice works at Acme",
+            "keywords": "employment",
+            "weight": 1.0,
+            "source_id": "chunk-1",
+            "file_path": "a.txt",
+        },
+    )
+    await rag.relationships_vdb.upsert(
+        {
+            "rel-1": {
+                "src_id": "Alice",
+                "tgt_id": "Acme",
+                "content": "employment\tAlice\nAcme\nAlice works at Acme",
+                "source_id": "chunk-1",
+                "file_path": "a.txt",
+            }
+        }
+    )
+    await rag.text_chunks.upsert(CHUNKS)
+    await rag.chunks_vdb.upsert(CHUNKS)
+    yield rag
+    await rag.finalize_storages()
+
+
+def context_param(**kwargs) -> QueryParam:
+    return QueryParam(only_need_context=True, enable_rerank=False, **kwargs)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("mode", ["local", "global", "hybrid", "mix"])
+async def test_speculation_does_not_change_the_context(rag, mode):
+    # The mock LLM finds no keywords, so the short query becomes the keywords
+    query = "Where does Alice work?"
+    baseline = await rag.aquery(query, context_param(mode=mode))
+    speculative = await rag.aquery(
+        query, context_param(mode=mode, speculative_retrieval=True)
+    )
+    with_entity_lookup = await rag.aquery(
+        query,
+        context_param(
+            mode=mode, speculative_retrieval=True, speculative_entity_lookup=True
+        ),
+    )
+    assert "Alice" in baseline
+    assert ("anvils" in baseline) == (mode == "mix")
+    assert speculative == baseline
+    assert with_entity_lookup == baseline
+
+
+@pytest.mark.asyncio
+async def test_speculation_is_stopped_when_the_query_ends_early(rag, monkeypatch):
+    started = asyncio.Event()
+    events = []
+
+    async def slow_speculative_retrieval(*args, **kwargs):
+        started.set()
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            events.append("cancelled")
+            raise
+
+    monkeypatch.setattr(
+        "lightrag.operate._speculative_retrieval", slow_speculative_retrieval
+    )
+    # No keywords and too long to be used as keywords: no retrieval at all
+    query = "What is the relationship between all of the people and companies here?"
+    result = await rag.aquery(
+        query, context_param(mode="mix", speculative_retrieval=True)
+    )
+    assert started.is_set()
+    assert result == PROMPTS["fail_response"]
+    assert events == ["cancelled"]
@@ -0,0 +1,182 @@
+"""
+Unit tests for the concurrent storage initialization of LightRAG.
+
+The first storage of each backend is initialized before the other storages of
+that backend, all backends in parallel; the remaining storages then initialize
+concurrently. Also covers failures and the optional warm-up.
+"""
+
+import asyncio
+
+import pytest
+
+from lightrag.base import DocStatus, StoragesStatus
+
+
+def record_initialization(monkeypatch, rag, events: list, started: dict):
+    """Replace storage.initialize with a recording one waiting for its stage"""
+    for name, storage in rag._get_named_storages():
+        original = storage.initialize
+
+        async def initialize(name=name, original=original):
+            events.append(("start", name))
+            started[name].set()
+            # Returns only once the whole stage is running, which hangs if run serially
+            await asyncio.gather(*(started[other].wait() for other in stage_of[name]))
+            await original()
+            events.append(("end", name))
+
+        monkeypatch.setattr(storage, "initialize", initialize)
+
+    stage_of: dict[str, list[str]] = {}
+    return stage_of
+
+
+@pytest.mark.asyncio
+async def test_first_storage_of_each_backend_goes_first(
+    make_rag, shared_data, monkeypatch
+):
+    rag = make_rag()
+    names = [name for name, _ in rag._get_named_storages()]
+    events = []
+    started = {name: asyncio.Event() for name in names}
+    stage_of = record_initialization(monkeypatch, rag, events, started)
+
+    backends = {}
+    for name, storage in rag._get_named_storages():
+        backends.setdefault(type(storage).__module__, []).append(name)
+    bootstrap = [storages[0] for storages in backends.values()]
+    remaining = [name for name in names if name not in bootstrap]
+    for name in names:
+        stage_of[name] = bootstrap if name in bootstrap else remaining
+
+    await asyncio.wait_for(rag.initialize_storages(), timeout=30)
+    try:
+        assert rag._storages_status == StoragesStatus.INITIALIZED
+        assert len(bootstrap) > 1 and remaining
+        # Every storage of the bootstrap stage ends before any other one starts
+        last_bootstrap_end = max(events.index(("end", name)) for name in bootstrap)
+        first_remaining_start = min(events.index(("start", name)) for name in remaining)
+        assert last_bootstrap_end < first_remaining_start
+        assert {name for kind, name in events if kind == "end"} == set(names)
+    finally:
+        await rag.finalize_storages()
+
+
+@pytest.mark.asyncio
+async def test_failure_is_raised_after_the_stage_finishes(
+    make_rag, shared_data, monkeypatch
+):
+    rag = make_rag()
+    initialized = []
+    for name, storage in rag._get_named_storages():
+        original = storage.initialize
+
+        async def initialize(name=name, original=original):
+            if name == "entities_vdb":
+                raise ConnectionError("vector database unavailable")
+            await original()
+            initialized.append(name)
+
+        monkeypatch.setattr(storage, "initialize", initialize)
+
+    with pytest.raises(ConnectionError):
+        await rag.initialize_storages()
+    assert rag._storages_status == StoragesStatus.CREATED
+    # The other storages of the failing stage were still initialized
+    assert "full_docs" in initialized
+    assert "chunk_entity_relation_graph" in initialized
+
+
+async def add_graph_and_chunks(rag):
+    graph = rag.chunk_entity_relation_graph
+    for name in ("Alice", "Acme", "Bob"):
+        await graph.upsert_node(name, {"entity_id": name, "description": name})
+    await graph.upsert_edge("Alice", "Acme", {"weight": 1.0})
+    await graph.upsert_edge("Alice", "Bob", {"weight": 1.0})
+    await rag.text_chunks.upsert(
+        {"chunk-1": {"content": "Alice works at Acme.", "full_doc_id": "doc-1"}}
+    )
+    await rag.doc_status.upsert(
+        {
+            "doc-1": {
+                "status": DocStatus.PROCESSED,
+                "content_summary": "Alice",
+                "content_length": 20,
+                "chunks_count": 1,
+                "chunks_list": ["chunk-1"],
+                "file_path": "a.txt",
+                "created_at": "2025-01-01T00:00:00+00:00",
+                "updated_at": "2025-01-01T00:00:00+00:00",
+            }
+        }
+    )
+
+
+def spy(monkeypatch, storage, method: str) -> list:
+    calls = []
+    original = getattr(storage, method)
+
+    async def wrapper(*args, **kwargs):
+        calls.append(args)
+        return await original(*args, **kwargs)
+
+    monkeypatch.setattr(storage, method, wrapper)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_warm_up_prefetches_popular_entities_and_recent_chunks(
+    make_rag, shared_data, monkeypatch
+):
+    rag = make_rag(storage_warmup_size=2)
+    await rag.initialize_storages()
+    try:
+        await add_graph_and_chunks(rag)
+        node_reads = spy(
+            monkeypatch, rag.chunk_entity_relation_graph, "get_nodes_batch"
+        )
+        chunk_reads = spy(monkeypatch, rag.text_chunks, "get_by_ids")
+
+        await rag._warm_up_storages()
+        ((labels,),) = node_reads
+        assert labels[0] == "Alice" and len(labels) == 2
+        assert chunk_reads == [(["chunk-1"],)]
+    finally:
+        await rag.finalize_storages()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_failures_are_only_logged(make_rag, shared_data, monkeypatch):
+    rag = make_rag()
+    await rag.initialize_storages()
+    try:
+        await add_graph_and_chunks(rag)
+
+        async def failing_labels(*args, **kwargs):
+            raise RuntimeError("graph unavailable")
+
+        monkeypatch.setattr(
+            rag.chunk_entity_relation_graph, "get_popular_labels", failing_labels
+        )
+        chunk_reads = spy(monkeypatch, rag.text_chunks, "get_by_ids")
+        await rag._warm_up_storages()
+        assert chunk_reads == [(["chunk-1"],)]
+    finally:
+        await rag.finalize_storages()
+
+
+@pytest.mark.asyncio
+async def test_warm_up_runs_when_enabled(make_rag, shared_data, monkeypatch):
+    rag = make_rag(storage_warmup=True)
+    warm_ups = []
+
+    async def warm_up():
+        warm_ups.append(rag._storages_status)
+
+    monkeypatch.setattr(rag, "_warm_up_storages", warm_up)
+    await rag.initialize_storages()
+    try:
+        assert warm_ups == [StoragesStatus.INITIALIZED]
+    finally:
+        await rag.finalize_storages()
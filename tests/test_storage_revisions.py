@@ -0,0 +1,95 @@
+"""
+Unit tests for the storage revisions behind the API server's ETags.
+
+Graph and doc status storages bump their revision from their own write
+methods, so every writer invalidates cached views without bumping by hand.
+"""
+
+import pytest
+import pytest_asyncio
+
+from lightrag.base import BaseGraphStorage, DocStatus
+
+
+@pytest_asyncio.fixture
+async def rag(make_rag, shared_data):
+    rag = make_rag()
+    await rag.initialize_storages()
+    yield rag
+    await rag.finalize_storages()
+
+
+def doc_status_record() -> dict:
+    return {
+        "status": DocStatus.PENDING,
+        "content_summary": "Alice",
+        "content_length": 20,
+        "file_path": "a.txt",
+        "created_at": "2025-01-01T00:00:00+00:00",
+        "updated_at": "2025-01-01T00:00:00+00:00",
+    }
+
+
+@pytest.mark.asyncio
+async def test_graph_writes_bump_the_revision(rag):
+    graph = rag.chunk_entity_relation_graph
+    revisions = [graph.get_revision()]
+
+    await graph.upsert_node("Alice", {"entity_id": "Alice"})
+    revisions.append(graph.get_revision())
+    await graph.upsert_edge("Alice", "Alice", {"weight": 1.0})
+    revisions.append(graph.get_revision())
+    await graph.remove_nodes(["Alice"])
+    revisions.append(graph.get_revision())
+    await graph.drop()
+    revisions.append(graph.get_revision())
+
+    assert len(set(revisions)) == len(revisions)
+
+
+@pytest.mark.asyncio
+async def test_doc_status_writes_bump_only_their_revision(rag):
+    graph_revision = rag.chunk_entity_relation_graph.get_revision()
+    revisions = [rag.doc_status.get_revision()]
+
+    await rag.doc_status.upsert({"doc-1": doc_status_record()})
+    revisions.append(rag.doc_status.get_revision())
+    await rag.doc_status.index_done_callback()
+    revisions.append(rag.doc_status.get_revision())
+    await rag.doc_status.delete(["doc-1"])
+    revisions.append(rag.doc_status.get_revision())
+
+    assert len(set(revisions)) == len(revisions)
+    assert rag.chunk_entity_relation_graph.get_revision() == graph_revision
+
+
+@pytest.mark.asyncio
+async def test_nested_writes_bump_once(rag, monkeypatch):
+    graph = rag.chunk_entity_relation_graph
+    bumps = []
+    original = graph.bump_revision
+
+    async def bump_revision():
+        bumps.append(graph.get_revision())
+        await original()
+
+    monkeypatch.setattr(graph, "bump_revision", bump_revision)
+    # The default batch upsert writes node by node
+    await BaseGraphStorage.upsert_nodes_batch(
+        graph, {"Alice": {"entity_id": "Alice"}, "Bob": {"entity_id": "Bob"}}
+    )
+    assert len(bumps) == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_write_still_bumps(rag, monkeypatch):
+    graph = rag.chunk_entity_relation_graph
+    revision = graph.get_revision()
+
+    def failing_add_node(*args, **kwargs):
+        raise RuntimeError("write failed")
+
+    monkeypatch.setattr(await graph._get_graph(), "add_node", failing_add_node)
+    with pytest.raises(RuntimeError):
+        await graph.upsert_node("Alice", {"entity_id": "Alice"})
+    assert graph.get_revision() != revision